@@ -5,11 +5,15 @@ from typing import Optional, Dict
 from django.conf import settings
 from django.http import HttpResponse
 
+from ui_web.utils.url_utils import django_normalized_base_url
+
 
 class BasicAuthMiddleware:
 
     def __init__(self, get_response):
         self.get_response = get_response
+        # Webhook senders authenticate with their own signature or credentials, see webhooks.app.domain
+        self._exempt_path_prefix = '/' + django_normalized_base_url(settings.METRICS_BASE_URL) + 'webhooks/'
 
     def _load_users(self) -> Optional[Dict[str, str]]:
         users = settings.METRICS_BASIC_AUTH_USERS
@@ -31,7 +35,7 @@ class BasicAuthMiddleware:
 
     def __call__(self, request):
         users = self._load_users()
-        if not users:
+        if not users or request.path_info.startswith(self._exempt_path_prefix):
             return self.get_response(request)
 
         auth = request.META.get('HTTP_AUTHORIZATION')
@@ -38,6 +38,7 @@ CUSTOM_APP = (
     'forecast',
     'velocity',
     'pull_requests',
+    'webhooks',
     'ui_web',
 )
 
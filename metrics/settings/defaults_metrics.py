@@ -9,10 +9,16 @@ METRICS_TASK_TRACKER = env.str('METRICS_TASK_TRACKER', default='jira')
 
 METRICS_AZURE_ORGANIZATION_URL = env.str('METRICS_AZURE_ORGANIZATION_URL', default=None)
 METRICS_AZURE_PAT = env.str('METRICS_AZURE_PAT', default=None)
+METRICS_AZURE_CHANGELOG_SOURCE = env.str('METRICS_AZURE_CHANGELOG_SOURCE', default='revisions')
+METRICS_AZURE_BULK_REVISIONS_MIN_TASKS = env.int('METRICS_AZURE_BULK_REVISIONS_MIN_TASKS', default=50)
+METRICS_AZURE_BULK_REVISIONS_MAX_SPAN_DAYS = env.int('METRICS_AZURE_BULK_REVISIONS_MAX_SPAN_DAYS', default=180)
+METRICS_AZURE_BULK_REVISIONS_MAX_SCANNED_PER_ITEM = env.int('METRICS_AZURE_BULK_REVISIONS_MAX_SCANNED_PER_ITEM',
+                                                            default=100)
 
 METRICS_JIRA_SERVER_URL = env.str('METRICS_JIRA_SERVER_URL', default=None)
 METRICS_JIRA_EMAIL = env.str('METRICS_JIRA_EMAIL', default=None)
 METRICS_JIRA_API_TOKEN = env.str('METRICS_JIRA_API_TOKEN', default=None)
+METRICS_JIRA_SEARCH_CONCURRENCY = env.int('METRICS_JIRA_SEARCH_CONCURRENCY', default=4)
 
 # Pull request source (Bitbucket, used when the tracker is JIRA)
 METRICS_BITBUCKET_URL = env.str('METRICS_BITBUCKET_URL', default='https://api.bitbucket.org/')
@@ -20,10 +26,18 @@ METRICS_BITBUCKET_WORKSPACE = env.str('METRICS_BITBUCKET_WORKSPACE', default=Non
 METRICS_BITBUCKET_USERNAME = env.str('METRICS_BITBUCKET_USERNAME', default=None)
 METRICS_BITBUCKET_APP_PASSWORD = env.str('METRICS_BITBUCKET_APP_PASSWORD', default=None)
 METRICS_BITBUCKET_REPOSITORIES = env.list('METRICS_BITBUCKET_REPOSITORIES', default=None)
+METRICS_BITBUCKET_MAX_CONCURRENT_REQUESTS = env.int('METRICS_BITBUCKET_MAX_CONCURRENT_REQUESTS', default=8)
 
 # Pull request review gate configuration
 METRICS_PR_MAIN_REVIEWER_LEVELS = env.list('METRICS_PR_MAIN_REVIEWER_LEVELS', default=['lead', 'arch'])
 METRICS_PR_MIN_DEVELOPER_APPROVALS = env.int('METRICS_PR_MIN_DEVELOPER_APPROVALS', default=2)
+METRICS_PR_SNAPSHOT_TTL = env.int('METRICS_PR_SNAPSHOT_TTL', default=60)
+METRICS_PR_SNAPSHOT_STALE_TTL = env.int('METRICS_PR_SNAPSHOT_STALE_TTL', default=600)
+METRICS_PR_REVIEW_CONCURRENCY = env.int('METRICS_PR_REVIEW_CONCURRENCY', default=8)
+METRICS_PR_REVIEW_CACHE_TIMEOUT = env.int('METRICS_PR_REVIEW_CACHE_TIMEOUT', default=86400)
+METRICS_PR_BUILD_STATUS_CACHE_TIMEOUT = env.int('METRICS_PR_BUILD_STATUS_CACHE_TIMEOUT', default=604800)
+METRICS_PR_INCREMENTAL_POLLING = env.bool('METRICS_PR_INCREMENTAL_POLLING', default=True)
+METRICS_PR_FULL_RESYNC_SECONDS = env.int('METRICS_PR_FULL_RESYNC_SECONDS', default=900)
 
 # Status codes
 
@@ -53,6 +67,8 @@ METRICS_JIRA_ITERATION_FIELD = env.str('METRICS_JIRA_ITERATION_FIELD', default='
 METRICS_AZURE_ITERATION_FIELD = env.str('METRICS_AZURE_ITERATION_FIELD', default='System.IterationPath')
 
 METRICS_WORKING_DAYS_PER_MONTH = env.int('METRICS_WORKING_DAYS_PER_MONTH', default=22)
+METRICS_WORKING_DAYS_PER_WEEK = env.int('METRICS_WORKING_DAYS_PER_WEEK', default=5)
+METRICS_HOLIDAYS = env.list('METRICS_HOLIDAYS', default=[])
 METRICS_IDEAL_HOURS_PER_DAY = env.float('METRICS_IDEAL_HOURS_PER_DAY', default=4.0)
 METRICS_STORY_POINTS_TO_IDEAL_HOURS_CONVERTION_RATIO = env.float('METRICS_STORY_POINTS_TO_IDEAL_HOURS_CONVERTION_RATIO',
                                                                  default=1.0)
@@ -66,6 +82,13 @@ METRICS_MEMBER_GROUP_WHEN_MISSING = env.str('METRICS_MEMBER_GROUP_WHEN_MISSING',
 METRICS_MERGE_UNASSIGNED_INTO_FILTERED_GROUP = env.bool('METRICS_MERGE_UNASSIGNED_INTO_FILTERED_GROUP', default=False)
 
 METRICS_CURRENT_TASKS_LAZY_LOADING = env.bool('METRICS_CURRENT_TASKS_LAZY_LOADING', default=True)
+METRICS_CURRENT_TASKS_SECTIONED_LOADING = env.bool('METRICS_CURRENT_TASKS_SECTIONED_LOADING', default=False)
+
+METRICS_ETAG_WINDOW_SECONDS = env.int('METRICS_ETAG_WINDOW_SECONDS', default=60)
+
+METRICS_TASK_EVENTS_POLL_SECONDS = env.int('METRICS_TASK_EVENTS_POLL_SECONDS', default=0)
+METRICS_TASK_EVENTS_RESYNC_SECONDS = env.int('METRICS_TASK_EVENTS_RESYNC_SECONDS', default=60)
+METRICS_TASK_EVENTS_MAX_SECONDS = env.int('METRICS_TASK_EVENTS_MAX_SECONDS', default=300)
 
 METRICS_AVAILABLE_MEMBER_STAGES_FILTER = env.list('METRICS_AVAILABLE_MEMBER_STAGES_FILTER', default=[])
 
@@ -75,6 +98,12 @@ METRICS_TASK_FILTER_FIELDS = env.list('METRICS_TASK_FILTER_FIELDS',
 # Velocity time unit configuration
 METRICS_DEFAULT_VELOCITY_TIME_UNIT = env.str('METRICS_DEFAULT_VELOCITY_TIME_UNIT', default='DAY')
 
+# Tracker result conversion: 'none' converts inline, 'thread' or 'process' dispatches chunks to a pool
+METRICS_TASK_CONVERSION_EXECUTOR = env.str('METRICS_TASK_CONVERSION_EXECUTOR', default='thread')
+METRICS_TASK_CONVERSION_MAX_WORKERS = env.int('METRICS_TASK_CONVERSION_MAX_WORKERS', default=None)
+METRICS_TASK_CONVERSION_CHUNK_SIZE = env.int('METRICS_TASK_CONVERSION_CHUNK_SIZE', default=250)
+METRICS_TASK_CONVERSION_MIN_PARALLEL_TASKS = env.int('METRICS_TASK_CONVERSION_MIN_PARALLEL_TASKS', default=1000)
+
 CACHES['task_search_results'] = {
     'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
     'LOCATION': '/tmp/metrics_task_search_cache',
@@ -82,6 +111,77 @@ CACHES['task_search_results'] = {
     'TIMEOUT': 300
 }
 
+CACHES['velocity_period_tasks'] = {
+    'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+    'LOCATION': '/tmp/metrics_velocity_period_tasks_cache',
+    "OPTIONS": {"MAX_ENTRIES": 10000},
+    'TIMEOUT': 300
+}
+
+METRICS_PARENT_TITLE_CACHE_TIMEOUT = env.int('METRICS_PARENT_TITLE_CACHE_TIMEOUT', default=3600)
+CACHES['parent_titles'] = {
+    'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+    'LOCATION': '/tmp/metrics_parent_titles_cache',
+    "OPTIONS": {"MAX_ENTRIES": 50000},
+    'TIMEOUT': METRICS_PARENT_TITLE_CACHE_TIMEOUT
+}
+
+METRICS_JIRA_CHANGELOG_CACHE_TIMEOUT = env.int('METRICS_JIRA_CHANGELOG_CACHE_TIMEOUT', default=604800)
+CACHES['jira_changelogs'] = {
+    'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+    'LOCATION': '/tmp/metrics_jira_changelogs_cache',
+    "OPTIONS": {"MAX_ENTRIES": 200000},
+    'TIMEOUT': METRICS_JIRA_CHANGELOG_CACHE_TIMEOUT
+}
+
+METRICS_FRAGMENT_CACHE_TIMEOUT = env.int('METRICS_FRAGMENT_CACHE_TIMEOUT', default=3600)
+CACHES['rendered_fragments'] = {
+    'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    'LOCATION': 'metrics_rendered_fragments',
+    "OPTIONS": {"MAX_ENTRIES": 20000},
+    'TIMEOUT': METRICS_FRAGMENT_CACHE_TIMEOUT
+}
+
+CACHES['task_board_snapshots'] = {
+    'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+    'LOCATION': '/tmp/metrics_task_board_snapshots_cache',
+    "OPTIONS": {"MAX_ENTRIES": 1000},
+    'TIMEOUT': 3600
+}
+
+CACHES['pull_request_snapshots'] = {
+    'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+    'LOCATION': '/tmp/metrics_pull_request_snapshots_cache',
+    "OPTIONS": {"MAX_ENTRIES": 100},
+    'TIMEOUT': METRICS_PR_SNAPSHOT_TTL + METRICS_PR_SNAPSHOT_STALE_TTL
+}
+
+CACHES['pull_request_review_inputs'] = {
+    'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+    'LOCATION': '/tmp/metrics_pull_request_review_inputs_cache',
+    "OPTIONS": {"MAX_ENTRIES": 20000},
+    'TIMEOUT': METRICS_PR_REVIEW_CACHE_TIMEOUT
+}
+
+CACHES['pull_request_build_statuses'] = {
+    'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+    'LOCATION': '/tmp/metrics_pull_request_build_statuses_cache',
+    "OPTIONS": {"MAX_ENTRIES": 50000},
+    'TIMEOUT': METRICS_PR_BUILD_STATUS_CACHE_TIMEOUT
+}
+
+CACHES['version_stamps'] = {
+    'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+    'LOCATION': '/tmp/metrics_version_stamps_cache',
+    "OPTIONS": {"MAX_ENTRIES": 100000},
+    'TIMEOUT': None
+}
+
+METRICS_WEBHOOK_JIRA_SECRET = env.str('METRICS_WEBHOOK_JIRA_SECRET', default=None)
+METRICS_WEBHOOK_BITBUCKET_SECRET = env.str('METRICS_WEBHOOK_BITBUCKET_SECRET', default=None)
+METRICS_WEBHOOK_AZURE_USERNAME = env.str('METRICS_WEBHOOK_AZURE_USERNAME', default=None)
+METRICS_WEBHOOK_AZURE_PASSWORD = env.str('METRICS_WEBHOOK_AZURE_PASSWORD', default=None)
+
 METRICS_SENIORITY_LEVELS = env.dict('METRICS_SENIORITY_LEVELS', default={
     'arch': 1.0,
     'lead': 1.0,
@@ -15,3 +15,59 @@ CACHES['task_search_results'] = {
     "OPTIONS": {"MAX_ENTRIES": 100000},
     'TIMEOUT': 900
 }
+
+CACHES['velocity_period_tasks'] = {
+    'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+    'LOCATION': '/tmp/metrics_velocity_period_tasks_cache_prod',
+    "OPTIONS": {"MAX_ENTRIES": 10000},
+    'TIMEOUT': 300
+}
+
+CACHES['parent_titles'] = {
+    'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+    'LOCATION': '/tmp/metrics_parent_titles_cache_prod',
+    "OPTIONS": {"MAX_ENTRIES": 50000},
+    'TIMEOUT': METRICS_PARENT_TITLE_CACHE_TIMEOUT
+}
+
+CACHES['jira_changelogs'] = {
+    'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+    'LOCATION': '/tmp/metrics_jira_changelogs_cache_prod',
+    "OPTIONS": {"MAX_ENTRIES": 200000},
+    'TIMEOUT': METRICS_JIRA_CHANGELOG_CACHE_TIMEOUT
+}
+
+CACHES['pull_request_snapshots'] = {
+    'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+    'LOCATION': '/tmp/metrics_pull_request_snapshots_cache_prod',
+    "OPTIONS": {"MAX_ENTRIES": 100},
+    'TIMEOUT': METRICS_PR_SNAPSHOT_TTL + METRICS_PR_SNAPSHOT_STALE_TTL
+}
+
+CACHES['pull_request_review_inputs'] = {
+    'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+    'LOCATION': '/tmp/metrics_pull_request_review_inputs_cache_prod',
+    "OPTIONS": {"MAX_ENTRIES": 20000},
+    'TIMEOUT': METRICS_PR_REVIEW_CACHE_TIMEOUT
+}
+
+CACHES['pull_request_build_statuses'] = {
+    'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+    'LOCATION': '/tmp/metrics_pull_request_build_statuses_cache_prod',
+    "OPTIONS": {"MAX_ENTRIES": 50000},
+    'TIMEOUT': METRICS_PR_BUILD_STATUS_CACHE_TIMEOUT
+}
+
+CACHES['task_board_snapshots'] = {
+    'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+    'LOCATION': '/tmp/metrics_task_board_snapshots_cache_prod',
+    "OPTIONS": {"MAX_ENTRIES": 1000},
+    'TIMEOUT': 3600
+}
+
+CACHES['version_stamps'] = {
+    'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+    'LOCATION': '/tmp/metrics_version_stamps_cache_prod',
+    "OPTIONS": {"MAX_ENTRIES": 100000},
+    'TIMEOUT': None
+}
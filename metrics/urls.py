@@ -19,5 +19,6 @@ from django.urls import path, include
 
 urlpatterns = [
     path('admin/', admin.site.urls),
+    path('', include('webhooks.urls')),
     path('', include('ui_web.urls')),
 ]
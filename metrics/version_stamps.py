@@ -0,0 +1,37 @@
+import hashlib
+import time
+from typing import Dict, Iterable, Mapping
+
+PROJECT = "project"
+MEMBER_GROUP = "member_group"
+ISSUE = "issue"
+PULL_REQUESTS = "pull_requests"
+ALL = "all"
+
+
+class VersionStamps:
+    KEY_PREFIX = "version-stamp||"
+
+    def __init__(self, cache):
+        self._cache = cache
+
+    def current(self, scope: str, keys: Iterable[str]) -> Dict[str, int]:
+        cache_keys_by_key = {key: self._cache_key(scope, key) for key in keys}
+        stored = self._cache.get_many(list(cache_keys_by_key.values()))
+        return {key: stored.get(cache_key, 0) for key, cache_key in cache_keys_by_key.items()}
+
+    def token(self, dependencies: Mapping[str, Iterable[str]]) -> str:
+        cache_keys = sorted({self._cache_key(scope, key) for scope, keys in dependencies.items() for key in keys})
+        if not cache_keys:
+            return "v0"
+        stored = self._cache.get_many(cache_keys)
+        stamps = "|".join(f"{cache_key}={stored.get(cache_key, 0)}" for cache_key in cache_keys)
+        return "v" + hashlib.sha256(stamps.encode("utf-8")).hexdigest()[:16]
+
+    def bump(self, scope: str, keys: Iterable[str]) -> None:
+        # A fresh timestamp rather than an increment keeps stamps unique even after a stamp entry is evicted
+        stamp = time.time_ns()
+        self._cache.set_many({self._cache_key(scope, key): stamp for key in keys})
+
+    def _cache_key(self, scope: str, key: str) -> str:
+        return f"{self.KEY_PREFIX}{scope}||{key}"
@@ -1,7 +1,7 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional
 
-from ..domain.model.pull_request import PullRequest, PullRequestProjection, PullRequestSearchCriteria
+from ..domain.model.pull_request import PullRequest, PullRequestProjection, PullRequestRef, PullRequestSearchCriteria
 
 
 class ApiForPullRequestSearch(ABC):
@@ -10,3 +10,15 @@ class ApiForPullRequestSearch(ABC):
     async def search(self, criteria: Optional[PullRequestSearchCriteria] = None,
                      projection: PullRequestProjection = PullRequestProjection.SUMMARY) -> List[PullRequest]:
         pass
+
+    @abstractmethod
+    async def find_linked_pull_requests(self, task_ids: Iterable[str]) -> Dict[str, PullRequest]:
+        pass
+
+    @abstractmethod
+    async def find_review_details(self, refs: List[PullRequestRef]) -> List[PullRequest]:
+        pass
+
+    @abstractmethod
+    def invalidate_snapshot(self) -> None:
+        pass
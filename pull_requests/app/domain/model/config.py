@@ -1,4 +1,4 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional
 
 
@@ -16,6 +16,7 @@ class BitbucketConfig:
     username: Optional[str]
     app_password: Optional[str]
     repositories: List[str]
+    max_concurrent_requests: int = 8
 
 
 @dataclass(slots=True)
@@ -24,6 +25,18 @@ class ReviewGateConfig:
     min_developer_approvals: int
 
 
+@dataclass(slots=True)
+class SnapshotConfig:
+    fresh_seconds: int = 60
+    stale_seconds: int = 600
+
+
+@dataclass(slots=True)
+class PollingConfig:
+    incremental: bool = True
+    full_resync_seconds: int = 900
+
+
 @dataclass(slots=True)
 class PullRequestsConfig:
     task_tracker: str
@@ -32,6 +45,9 @@ class PullRequestsConfig:
     members: Dict[str, Dict[str, Any]]
     seniority_levels: Dict[str, float]
     review_gate: ReviewGateConfig
+    snapshot: SnapshotConfig = field(default_factory=SnapshotConfig)
+    review_concurrency: int = 8
+    polling: PollingConfig = field(default_factory=PollingConfig)
 
     def is_azure_tracker(self) -> bool:
         return self.task_tracker == 'azure'
@@ -1,7 +1,7 @@
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 
 class ApprovalVote(Enum):
@@ -107,3 +107,10 @@ class PullRequestProjection(Enum):
 class PullRequestSearchCriteria:
     status_filter: str = "active"
     target: Optional[PullRequestRef] = None
+
+
+@dataclass(slots=True)
+class PullRequestSnapshot:
+    pull_requests: List[PullRequest]
+    latest_by_linked_task_id: Dict[str, PullRequest]
+    fetched_at: float
@@ -47,3 +47,7 @@ class ReviewInputs:
     vote_events: List[VoteEvent] = field(default_factory=list)
     policy_evaluations: List[RawPolicyEvaluation] = field(default_factory=list)
     has_merge_conflict: bool = False
+
+    def is_settled(self) -> bool:
+        return all(evaluation.status not in (PolicyEvaluationStatus.QUEUED, PolicyEvaluationStatus.RUNNING)
+                   for evaluation in self.policy_evaluations)
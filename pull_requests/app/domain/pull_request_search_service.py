@@ -1,26 +1,57 @@
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional
 
 from ..api.api_for_pull_request_search import ApiForPullRequestSearch
 from ..spi.pull_request_repository import PullRequestRepository
 from .model.pull_request import (
     PullRequest, PullRequestProjection, PullRequestRef, PullRequestSearchCriteria, ReviewState
 )
+from .model.review import ReviewInputs
+from .pull_request_snapshot_registry import PullRequestSnapshotRegistry
+from .review_inputs_registry import ReviewInputsRegistry
 from .review.pull_request_review_enricher import PullRequestReviewEnricher
 
 
 class PullRequestSearchService(ApiForPullRequestSearch):
 
-    def __init__(self, repository: PullRequestRepository, review_enricher: PullRequestReviewEnricher):
+    def __init__(self, repository: PullRequestRepository, review_enricher: PullRequestReviewEnricher,
+                 snapshot_registry: Optional[PullRequestSnapshotRegistry] = None,
+                 review_inputs_registry: Optional[ReviewInputsRegistry] = None):
         self._repository = repository
         self._review_enricher = review_enricher
+        self._snapshot_registry = snapshot_registry
+        self._review_inputs_registry = review_inputs_registry or ReviewInputsRegistry(repository)
 
     async def search(self, criteria: Optional[PullRequestSearchCriteria] = None,
                      projection: PullRequestProjection = PullRequestProjection.SUMMARY) -> List[PullRequest]:
         search_criteria = criteria or PullRequestSearchCriteria()
         if projection is PullRequestProjection.REVIEW_DETAILS:
             return await self._search_review_details(search_criteria.target)
+        if self._snapshot_registry is not None and search_criteria == PullRequestSearchCriteria():
+            snapshot = await self._snapshot_registry.get(self._search_default_summary)
+            return list(snapshot.pull_requests)
         return await self._search_summary(search_criteria)
 
+    async def find_linked_pull_requests(self, task_ids: Iterable[str]) -> Dict[str, PullRequest]:
+        if self._snapshot_registry is not None:
+            snapshot = await self._snapshot_registry.get(self._search_default_summary)
+        else:
+            snapshot = PullRequestSnapshotRegistry.build_snapshot(await self._search_default_summary(), 0)
+        latest_by_linked_task_id = snapshot.latest_by_linked_task_id
+        return {task_id: latest_by_linked_task_id[task_id]
+                for task_id in task_ids if task_id in latest_by_linked_task_id}
+
+    async def find_review_details(self, refs: List[PullRequestRef]) -> List[PullRequest]:
+        review_inputs_per_ref = await self._review_inputs_registry.fetch_many(refs)
+        return [self._build_review_details(ref, review_inputs)
+                for ref, review_inputs in zip(refs, review_inputs_per_ref) if review_inputs is not None]
+
+    def invalidate_snapshot(self) -> None:
+        if self._snapshot_registry is not None:
+            self._snapshot_registry.invalidate()
+
+    async def _search_default_summary(self) -> List[PullRequest]:
+        return await self._search_summary(PullRequestSearchCriteria())
+
     async def _search_summary(self, criteria: PullRequestSearchCriteria) -> List[PullRequest]:
         pull_requests = await self._repository.find_all(criteria)
         for pull_request in pull_requests:
@@ -28,10 +59,13 @@ class PullRequestSearchService(ApiForPullRequestSearch):
         return pull_requests
 
     async def _search_review_details(self, target: PullRequestRef) -> List[PullRequest]:
-        review_inputs = await self._repository.fetch_review_inputs(target)
+        review_inputs = await self._review_inputs_registry.fetch(target)
+        return [self._build_review_details(target, review_inputs)]
+
+    def _build_review_details(self, target: PullRequestRef, review_inputs: ReviewInputs) -> PullRequest:
         pull_request = PullRequest(
             id=target.pull_request_id,
-            review=ReviewState(approvals=review_inputs.current_approvals)
+            review=ReviewState(approvals=list(review_inputs.current_approvals))
         )
         self._review_enricher.enrich_details(pull_request, review_inputs)
-        return [pull_request]
+        return pull_request
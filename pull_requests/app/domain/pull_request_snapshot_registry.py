@@ -0,0 +1,99 @@
+import asyncio
+import logging
+import threading
+import time
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Awaitable, Callable, Dict, List, Optional
+
+from ..spi.pull_request_snapshot_store import PullRequestSnapshotStore
+from .model.pull_request import PullRequest, PullRequestSnapshot
+
+logger = logging.getLogger(__name__)
+
+SnapshotLoader = Callable[[], Awaitable[List[PullRequest]]]
+
+
+class PullRequestSnapshotRegistry:
+
+    def __init__(self, store: PullRequestSnapshotStore, fresh_seconds: int, stale_seconds: int,
+                 revalidation_executor: Optional[Executor] = None,
+                 clock: Callable[[], float] = time.time):
+        self._store = store
+        self._fresh_seconds = fresh_seconds
+        self._stale_seconds = stale_seconds
+        self._revalidation_executor = revalidation_executor
+        self._clock = clock
+        self._revalidation_lock = threading.Lock()
+        self._revalidating = False
+
+    async def get(self, loader: SnapshotLoader) -> PullRequestSnapshot:
+        snapshot = self._store.get()
+        if snapshot is None:
+            return await self._refresh(loader)
+
+        age = self._clock() - snapshot.fetched_at
+        if age < self._fresh_seconds:
+            return snapshot
+        if age < self._fresh_seconds + self._stale_seconds:
+            self._revalidate_in_background(loader)
+            return snapshot
+        return await self._refresh(loader)
+
+    def invalidate(self) -> None:
+        self._store.delete()
+
+    async def _refresh(self, loader: SnapshotLoader) -> PullRequestSnapshot:
+        snapshot = self.build_snapshot(await loader(), self._clock())
+        self._store.put(snapshot)
+        return snapshot
+
+    def _revalidate_in_background(self, loader: SnapshotLoader) -> None:
+        with self._revalidation_lock:
+            if self._revalidating:
+                return
+            self._revalidating = True
+        self._get_revalidation_executor().submit(self._revalidate, loader)
+
+    def _revalidate(self, loader: SnapshotLoader) -> None:
+        try:
+            asyncio.run(self._refresh(loader))
+        except Exception:
+            logger.exception("Pull request snapshot revalidation failed")
+        finally:
+            self._finish_revalidation()
+
+    def _finish_revalidation(self) -> None:
+        with self._revalidation_lock:
+            self._revalidating = False
+
+    def _get_revalidation_executor(self) -> Executor:
+        if self._revalidation_executor is None:
+            self._revalidation_executor = ThreadPoolExecutor(max_workers=1,
+                                                             thread_name_prefix="pull-request-snapshot")
+        return self._revalidation_executor
+
+    @staticmethod
+    def build_snapshot(pull_requests: List[PullRequest], fetched_at: float) -> PullRequestSnapshot:
+        return PullRequestSnapshot(
+            pull_requests=pull_requests,
+            latest_by_linked_task_id=PullRequestSnapshotRegistry._index_latest_by_linked_task_id(pull_requests),
+            fetched_at=fetched_at
+        )
+
+    @staticmethod
+    def _index_latest_by_linked_task_id(pull_requests: List[PullRequest]) -> Dict[str, PullRequest]:
+        latest_pull_request_by_task_id: Dict[str, PullRequest] = {}
+        for pull_request in pull_requests:
+            if not pull_request.linked_task_id:
+                continue
+
+            current = latest_pull_request_by_task_id.get(pull_request.linked_task_id)
+            if current is None or PullRequestSnapshotRegistry._is_more_recent(pull_request, current):
+                latest_pull_request_by_task_id[pull_request.linked_task_id] = pull_request
+        return latest_pull_request_by_task_id
+
+    @staticmethod
+    def _is_more_recent(candidate: PullRequest, current: PullRequest) -> bool:
+        if not candidate.created_date or not current.created_date:
+            return False
+        return candidate.created_date > current.created_date
@@ -0,0 +1,38 @@
+import asyncio
+import logging
+from typing import List, Optional
+
+from ..spi.pull_request_repository import PullRequestRepository
+from .model.pull_request import PullRequestRef
+from .model.review import ReviewInputs
+
+logger = logging.getLogger(__name__)
+
+
+class ReviewInputsRegistry:
+
+    def __init__(self, repository: PullRequestRepository, max_concurrency: int = 8):
+        self._repository = repository
+        self._max_concurrency = max(1, max_concurrency)
+
+    async def fetch(self, ref: PullRequestRef) -> ReviewInputs:
+        return await self._repository.fetch_review_inputs(ref)
+
+    async def fetch_many(self, refs: List[PullRequestRef]) -> List[Optional[ReviewInputs]]:
+        semaphore = asyncio.Semaphore(self._max_concurrency)
+
+        async def fetch_bounded(ref: PullRequestRef) -> ReviewInputs:
+            async with semaphore:
+                return await self._repository.fetch_review_inputs(ref)
+
+        fetched = await asyncio.gather(*[fetch_bounded(ref) for ref in refs], return_exceptions=True)
+
+        results: List[Optional[ReviewInputs]] = []
+        for ref, review_inputs in zip(refs, fetched):
+            if isinstance(review_inputs, Exception):
+                logger.warning("Review inputs for pull request %s unavailable: %s",
+                               ref.pull_request_id, review_inputs)
+                results.append(None)
+                continue
+            results.append(review_inputs)
+        return results
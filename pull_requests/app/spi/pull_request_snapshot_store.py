@@ -0,0 +1,19 @@
+from abc import ABC, abstractmethod
+from typing import Optional
+
+from ..domain.model.pull_request import PullRequestSnapshot
+
+
+class PullRequestSnapshotStore(ABC):
+
+    @abstractmethod
+    def get(self) -> Optional[PullRequestSnapshot]:
+        pass
+
+    @abstractmethod
+    def put(self, snapshot: PullRequestSnapshot) -> None:
+        pass
+
+    @abstractmethod
+    def delete(self) -> None:
+        pass
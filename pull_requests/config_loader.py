@@ -1,7 +1,7 @@
 from django.conf import settings
 
 from .app.domain.model.config import (
-    AzureRepoConfig, BitbucketConfig, PullRequestsConfig, ReviewGateConfig
+    AzureRepoConfig, BitbucketConfig, PollingConfig, PullRequestsConfig, ReviewGateConfig, SnapshotConfig
 )
 
 
@@ -17,7 +17,8 @@ def load_pull_requests_config() -> PullRequestsConfig:
         workspace=settings.METRICS_BITBUCKET_WORKSPACE or None,
         username=settings.METRICS_BITBUCKET_USERNAME or None,
         app_password=settings.METRICS_BITBUCKET_APP_PASSWORD or None,
-        repositories=settings.METRICS_BITBUCKET_REPOSITORIES or []
+        repositories=settings.METRICS_BITBUCKET_REPOSITORIES or [],
+        max_concurrent_requests=settings.METRICS_BITBUCKET_MAX_CONCURRENT_REQUESTS
     )
 
     review_gate = ReviewGateConfig(
@@ -25,11 +26,24 @@ def load_pull_requests_config() -> PullRequestsConfig:
         min_developer_approvals=settings.METRICS_PR_MIN_DEVELOPER_APPROVALS
     )
 
+    snapshot = SnapshotConfig(
+        fresh_seconds=settings.METRICS_PR_SNAPSHOT_TTL,
+        stale_seconds=settings.METRICS_PR_SNAPSHOT_STALE_TTL
+    )
+
+    polling = PollingConfig(
+        incremental=settings.METRICS_PR_INCREMENTAL_POLLING,
+        full_resync_seconds=settings.METRICS_PR_FULL_RESYNC_SECONDS
+    )
+
     return PullRequestsConfig(
         task_tracker=settings.METRICS_TASK_TRACKER,
         azure=azure,
         bitbucket=bitbucket,
         members=settings.METRICS_MEMBERS,
         seniority_levels=settings.METRICS_SENIORITY_LEVELS,
-        review_gate=review_gate
+        review_gate=review_gate,
+        snapshot=snapshot,
+        review_concurrency=settings.METRICS_PR_REVIEW_CONCURRENCY,
+        polling=polling
     )
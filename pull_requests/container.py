@@ -1,5 +1,14 @@
+from datetime import timedelta
+from typing import Optional
+
+from django.core.cache import caches
+
+from metrics.version_stamps import VersionStamps
+
 from .app.api.api_for_pull_request_search import ApiForPullRequestSearch
 from .app.domain.pull_request_search_service import PullRequestSearchService
+from .app.domain.pull_request_snapshot_registry import PullRequestSnapshotRegistry
+from .app.domain.review_inputs_registry import ReviewInputsRegistry
 from .app.domain.review.policy_gateway_evaluator import PolicyGatewayEvaluator
 from .app.domain.review.pull_request_review_enricher import PullRequestReviewEnricher
 from .app.domain.review.reset_approval_detector import ResetApprovalDetector
@@ -9,6 +18,9 @@ from .app.spi.pull_request_repository import PullRequestRepository
 from .config_loader import load_pull_requests_config
 from .out.azure_pull_request_repository import AzurePullRequestRepository
 from .out.bitbucket_pull_request_repository import BitbucketPullRequestRepository
+from .out.django_cache_pull_request_snapshot_store import DjangoCachePullRequestSnapshotStore
+from .out.incremental_poll_states import IncrementalPollStates
+from .out.review_input_caches import BuildStatusCache, VersionedReviewInputsCache
 
 
 class PullRequestsContainer:
@@ -23,7 +35,9 @@ class PullRequestsContainer:
         if self._service is None:
             self._service = PullRequestSearchService(
                 repository=self._get_repository(),
-                review_enricher=self._build_review_enricher()
+                review_enricher=self._build_review_enricher(),
+                snapshot_registry=self._build_snapshot_registry(),
+                review_inputs_registry=self._build_review_inputs_registry()
             )
         return self._service
 
@@ -35,6 +49,20 @@ class PullRequestsContainer:
             policy_gateway_evaluator=PolicyGatewayEvaluator()
         )
 
+    def _build_snapshot_registry(self) -> PullRequestSnapshotRegistry:
+        return PullRequestSnapshotRegistry(
+            store=DjangoCachePullRequestSnapshotStore(caches['pull_request_snapshots'],
+                                                      VersionStamps(caches['version_stamps'])),
+            fresh_seconds=self._config.snapshot.fresh_seconds,
+            stale_seconds=self._config.snapshot.stale_seconds
+        )
+
+    def _build_review_inputs_registry(self) -> ReviewInputsRegistry:
+        return ReviewInputsRegistry(
+            repository=self._get_repository(),
+            max_concurrency=self._config.review_concurrency
+        )
+
     def is_supported(self) -> bool:
         if self._config.is_azure_tracker():
             return self._config.is_azure_configured()
@@ -48,12 +76,24 @@ class PullRequestsContainer:
         return self._repository
 
     def _create_repository(self) -> PullRequestRepository:
+        review_inputs_cache = VersionedReviewInputsCache(caches['pull_request_review_inputs'])
         if self._config.is_azure_tracker():
-            return AzurePullRequestRepository(self._config)
+            return AzurePullRequestRepository(self._config, review_inputs_cache=review_inputs_cache,
+                                              poll_states=self._build_poll_states())
         if self._config.is_jira_tracker():
-            return BitbucketPullRequestRepository(self._config)
+            return BitbucketPullRequestRepository(
+                self._config,
+                review_inputs_cache=review_inputs_cache,
+                build_status_cache=BuildStatusCache(caches['pull_request_build_statuses']),
+                poll_states=self._build_poll_states()
+            )
         raise ValueError("Pull request data source not configured.")
 
+    def _build_poll_states(self) -> Optional[IncrementalPollStates]:
+        if not self._config.polling.incremental:
+            return None
+        return IncrementalPollStates(timedelta(seconds=self._config.polling.full_resync_seconds))
+
     def _build_reviewer_seniority(self) -> ReviewerSeniority:
         return ReviewerSeniority(
             members=self._config.members,
@@ -1,5 +1,5 @@
 import asyncio
-from typing import List
+from typing import Iterable, List, Optional
 
 from azure.devops.connection import Connection
 from azure.devops.v7_1.git.models import GitPullRequestSearchCriteria
@@ -7,6 +7,8 @@ from msrest.authentication import BasicAuthentication
 
 from .convertors.azure import AzurePullRequestConverter
 from .convertors.azure_review import AzureReviewConverter
+from .incremental_poll_states import IncrementalPollStates
+from .review_input_caches import VersionedReviewInputsCache
 from ..app.domain.model.config import PullRequestsConfig
 from ..app.domain.model.pull_request import PullRequest, PullRequestRef, PullRequestSearchCriteria
 from ..app.domain.model.review import ReviewInputs
@@ -15,7 +17,9 @@ from ..app.spi.pull_request_repository import PullRequestRepository
 
 class AzurePullRequestRepository(PullRequestRepository):
 
-    def __init__(self, config: PullRequestsConfig):
+    def __init__(self, config: PullRequestsConfig,
+                 review_inputs_cache: Optional[VersionedReviewInputsCache] = None,
+                 poll_states: Optional[IncrementalPollStates] = None):
         azure_config = config.azure
         if not config.is_azure_configured():
             raise ValueError("Missing Azure authentication configuration")
@@ -25,6 +29,8 @@ class AzurePullRequestRepository(PullRequestRepository):
         self._project_keys = azure_config.project_keys
         self._converter = AzurePullRequestConverter(azure_config)
         self._review_converter = AzureReviewConverter()
+        self._review_inputs_cache = review_inputs_cache
+        self._poll_states = poll_states
 
     async def find_all(self, criteria: PullRequestSearchCriteria) -> List[PullRequest]:
         pull_requests_by_project = await asyncio.gather(
@@ -35,11 +41,58 @@ class AzurePullRequestRepository(PullRequestRepository):
 
     async def _fetch_project_pull_requests(self, project_key: str,
                                            criteria: PullRequestSearchCriteria) -> List[PullRequest]:
-        azure_pull_requests = await asyncio.to_thread(self._query_project_pull_requests, project_key, criteria)
+        if self._poll_states is None or criteria.status_filter != 'active':
+            azure_pull_requests = await asyncio.to_thread(self._query_project_pull_requests, project_key, criteria)
+            return self._convert_all(azure_pull_requests)
+
+        started_at = self._poll_states.now()
+        poll_state = self._poll_states.get(project_key)
+        listed_azure_pull_requests = None
+        if poll_state is not None:
+            listed_azure_pull_requests = await asyncio.to_thread(
+                self._query_project_pull_requests_since, project_key, poll_state.pull_requests_by_id
+            )
+        if listed_azure_pull_requests is None:
+            azure_pull_requests = await asyncio.to_thread(self._query_project_pull_requests, project_key, criteria)
+            pull_requests = self._convert_all(azure_pull_requests)
+            self._poll_states.remember_full(project_key, pull_requests, started_at)
+            return pull_requests
+
+        active_azure_pull_requests = [azure_pull_request for azure_pull_request in listed_azure_pull_requests
+                                      if azure_pull_request.status == criteria.status_filter]
+        closed_ids = [str(azure_pull_request.pull_request_id) for azure_pull_request in listed_azure_pull_requests
+                      if azure_pull_request.status != criteria.status_filter]
+        return self._poll_states.merge(project_key, poll_state, self._convert_all(active_azure_pull_requests),
+                                       closed_ids, started_at)
+
+    def _convert_all(self, azure_pull_requests) -> List[PullRequest]:
         return [self._converter.convert_to_pull_request(azure_pull_request)
                 for azure_pull_request in azure_pull_requests]
 
     async def fetch_review_inputs(self, ref: PullRequestRef) -> ReviewInputs:
+        if self._review_inputs_cache is None:
+            return await self._fetch_review_inputs_in_parallel(ref)
+
+        pull_request_detail, threads = await asyncio.gather(
+            asyncio.to_thread(self._query_pull_request_detail, ref),
+            asyncio.to_thread(self._query_threads, ref)
+        )
+        version = self._converter.build_review_version(pull_request_detail, threads)
+        cached = self._review_inputs_cache.get(ref, version)
+        if cached is not None:
+            return cached
+
+        reviewers, policy_evaluations = await asyncio.gather(
+            asyncio.to_thread(self._query_reviewers, ref),
+            asyncio.to_thread(self._query_policy_evaluations, ref)
+        )
+        review_inputs = self._review_converter.to_review_inputs(
+            reviewers, threads, policy_evaluations, getattr(pull_request_detail, 'merge_status', None)
+        )
+        self._review_inputs_cache.put(ref, version, review_inputs)
+        return review_inputs
+
+    async def _fetch_review_inputs_in_parallel(self, ref: PullRequestRef) -> ReviewInputs:
         reviewers, threads, policy_evaluations, pull_request_detail = await asyncio.gather(
             asyncio.to_thread(self._query_reviewers, ref),
             asyncio.to_thread(self._query_threads, ref),
@@ -73,6 +126,7 @@ class AzurePullRequestRepository(PullRequestRepository):
         return policy_client.get_policy_evaluations(project=ref.project_name, artifact_id=artifact_id)
 
     _PAGE_SIZE = 1000
+    _INCREMENTAL_PAGE_SIZE = 100
 
     def _query_project_pull_requests(self, project_key: str, criteria: PullRequestSearchCriteria):
         git_client = self._connection.clients.get_git_client()
@@ -93,3 +147,28 @@ class AzurePullRequestRepository(PullRequestRepository):
                 pull_requests_by_id[pull_request.pull_request_id] = pull_request
             skip += self._PAGE_SIZE
         return list(pull_requests_by_id.values())
+
+    def _query_project_pull_requests_since(self, project_key: str, known_ids: Iterable[str]):
+        oldest_known_id = min((int(known_id) for known_id in known_ids), default=None)
+        if oldest_known_id is None:
+            return None
+        git_client = self._connection.clients.get_git_client()
+        search_criteria = GitPullRequestSearchCriteria(status='all')
+
+        # Pull requests of every status are listed newest first, so everything created since the oldest known
+        # one covers new, edited and closed pull requests of the snapshot; a longer scan than a full relisting
+        # gives up and lets the caller relist the active ones instead
+        listed_pull_requests = []
+        skip = 0
+        while skip < self._PAGE_SIZE:
+            page = git_client.get_pull_requests_by_project(
+                project=project_key, search_criteria=search_criteria, top=self._INCREMENTAL_PAGE_SIZE, skip=skip
+            )
+            for pull_request in page or []:
+                if pull_request.pull_request_id < oldest_known_id:
+                    return listed_pull_requests
+                listed_pull_requests.append(pull_request)
+            if not page or len(page) < self._INCREMENTAL_PAGE_SIZE:
+                return listed_pull_requests
+            skip += self._INCREMENTAL_PAGE_SIZE
+        return None
@@ -1,10 +1,14 @@
 import asyncio
-from typing import Any, Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Set
 
 from atlassian.bitbucket import Cloud
 
 from .convertors.bitbucket import BitbucketPullRequestConverter
 from .convertors.bitbucket_review import BitbucketReviewConverter
+from .incremental_poll_states import IncrementalPollStates
+from .review_input_caches import BuildStatusCache, VersionedReviewInputsCache
 from ..app.domain.model.config import PullRequestsConfig
 from ..app.domain.model.pull_request import PullRequest, PullRequestRef, PullRequestSearchCriteria
 from ..app.domain.model.review import ReviewInputs
@@ -15,10 +19,19 @@ _BITBUCKET_STATE_BY_CRITERIA = {
     'open': 'OPEN',
 }
 
+_CLOSED_STATES = ['MERGED', 'DECLINED', 'SUPERSEDED']
+
+# The list endpoint omits participants unless they are requested explicitly
+_PULL_REQUEST_LIST_FIELDS = '+values.participants,+values.draft,+values.source.commit.hash'
+_CLOSED_PULL_REQUEST_FIELDS = 'values.id,next'
+
 
 class BitbucketPullRequestRepository(PullRequestRepository):
 
-    def __init__(self, config: PullRequestsConfig):
+    def __init__(self, config: PullRequestsConfig,
+                 review_inputs_cache: Optional[VersionedReviewInputsCache] = None,
+                 build_status_cache: Optional[BuildStatusCache] = None,
+                 poll_states: Optional[IncrementalPollStates] = None):
         bitbucket_config = config.bitbucket
         if not config.is_bitbucket_configured():
             raise ValueError("Missing Bitbucket authentication configuration")
@@ -27,12 +40,17 @@ class BitbucketPullRequestRepository(PullRequestRepository):
         self._repositories = bitbucket_config.repositories
         self._converter = BitbucketPullRequestConverter()
         self._review_converter = BitbucketReviewConverter()
+        self._review_inputs_cache = review_inputs_cache
+        self._build_status_cache = build_status_cache
+        self._poll_states = poll_states
         self._cloud = Cloud(
             url=bitbucket_config.url or "https://api.bitbucket.org/",
             username=bitbucket_config.username,
             password=bitbucket_config.app_password,
             cloud=True
         )
+        self._executor = ThreadPoolExecutor(max_workers=bitbucket_config.max_concurrent_requests,
+                                            thread_name_prefix="bitbucket-fetch")
 
     async def find_all(self, criteria: PullRequestSearchCriteria) -> List[PullRequest]:
         state = _BITBUCKET_STATE_BY_CRITERIA.get(criteria.status_filter, 'OPEN')
@@ -44,17 +62,43 @@ class BitbucketPullRequestRepository(PullRequestRepository):
 
     async def fetch_review_inputs(self, ref: PullRequestRef) -> ReviewInputs:
         repository = ref.repository_id
-        detail, activity = await asyncio.gather(
-            asyncio.to_thread(self._get_pull_request_detail, repository, ref.pull_request_id),
-            asyncio.to_thread(self._list_activity, repository, ref.pull_request_id)
+        if self._review_inputs_cache is None:
+            detail, activity = await asyncio.gather(
+                self._run_bounded(self._get_pull_request_detail, repository, ref.pull_request_id),
+                self._run_bounded(self._list_activity, repository, ref.pull_request_id)
+            )
+            build_statuses = await self._run_bounded(self._list_cached_build_statuses, repository,
+                                                     self._source_commit(detail))
+            return self._review_converter.to_review_inputs(detail.get('participants'), activity, build_statuses)
+
+        detail = await self._run_bounded(self._get_pull_request_detail, repository, ref.pull_request_id)
+        version = self._converter.build_version(detail)
+        cached = self._review_inputs_cache.get(ref, version)
+        if cached is not None:
+            return cached
+
+        activity, build_statuses = await asyncio.gather(
+            self._run_bounded(self._list_activity, repository, ref.pull_request_id),
+            self._run_bounded(self._list_cached_build_statuses, repository, self._source_commit(detail))
         )
-        build_statuses = await asyncio.to_thread(self._list_build_statuses, repository, self._source_commit(detail))
-        return self._review_converter.to_review_inputs(detail.get('participants'), activity, build_statuses)
+        review_inputs = self._review_converter.to_review_inputs(detail.get('participants'), activity, build_statuses)
+        self._review_inputs_cache.put(ref, version, review_inputs)
+        return review_inputs
 
     def _list_activity(self, repository: str, pull_request_id: str) -> List[Dict[str, Any]]:
         path = f"repositories/{self._workspace}/{repository}/pullrequests/{pull_request_id}/activity"
         return self._collect_paged_values(path)
 
+    def _list_cached_build_statuses(self, repository: str, commit_hash: Optional[str]) -> List[Dict[str, Any]]:
+        if not commit_hash or self._build_status_cache is None:
+            return self._list_build_statuses(repository, commit_hash)
+        cached = self._build_status_cache.get(repository, commit_hash)
+        if cached is not None:
+            return cached
+        build_statuses = self._list_build_statuses(repository, commit_hash)
+        self._build_status_cache.put(repository, commit_hash, build_statuses)
+        return build_statuses
+
     def _list_build_statuses(self, repository: str, commit_hash: Optional[str]) -> List[Dict[str, Any]]:
         if not commit_hash:
             return []
@@ -69,17 +113,62 @@ class BitbucketPullRequestRepository(PullRequestRepository):
         return commit.get('hash')
 
     async def _fetch_repository_pull_requests(self, repository: str, state: str) -> List[PullRequest]:
-        raw_pull_requests = await asyncio.to_thread(self._query_repository_pull_requests, repository, state)
+        if self._poll_states is None or state != 'OPEN':
+            return await self._fetch_listed_pull_requests(repository, state)
+
+        started_at = self._poll_states.now()
+        poll_state = self._poll_states.get(repository)
+        if poll_state is None:
+            pull_requests = await self._fetch_listed_pull_requests(repository, state)
+            self._poll_states.remember_full(repository, pull_requests, started_at)
+            return pull_requests
+
+        changed_since = self._poll_states.changed_since(poll_state)
+        changed, closed_ids = await asyncio.gather(
+            self._fetch_listed_pull_requests(repository, state, changed_since),
+            self._run_bounded(self._list_closed_pull_request_ids, repository, changed_since)
+        )
+        return self._poll_states.merge(repository, poll_state, changed, closed_ids, started_at)
+
+    async def _fetch_listed_pull_requests(self, repository: str, state: str,
+                                          updated_since: Optional[datetime] = None) -> List[PullRequest]:
+        summaries = await self._run_bounded(self._list_pull_requests, repository, state, updated_since)
+        raw_pull_requests = await self._complete_missing_details(repository, summaries)
         return [self._converter.convert_to_pull_request(raw_pull_request, repository)
                 for raw_pull_request in raw_pull_requests]
 
-    def _query_repository_pull_requests(self, repository: str, state: str) -> List[Dict[str, Any]]:
-        summaries = self._list_pull_requests(repository, state)
-        return [self._get_pull_request_detail(repository, summary['id']) for summary in summaries]
+    async def _complete_missing_details(self, repository: str,
+                                        summaries: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        incomplete_summaries = [summary for summary in summaries if 'participants' not in summary]
+        if not incomplete_summaries:
+            return summaries
+        details = await asyncio.gather(
+            *[self._run_bounded(self._get_pull_request_detail, repository, summary['id'])
+              for summary in incomplete_summaries]
+        )
+        details_by_id = {detail.get('id'): detail for detail in details if detail}
+        return [details_by_id.get(summary['id'], summary) for summary in summaries]
 
-    def _list_pull_requests(self, repository: str, state: str) -> List[Dict[str, Any]]:
+    def _run_bounded(self, function, *args):
+        return asyncio.get_running_loop().run_in_executor(self._executor, function, *args)
+
+    def _list_pull_requests(self, repository: str, state: str,
+                            updated_since: Optional[datetime] = None) -> List[Dict[str, Any]]:
+        path = f"repositories/{self._workspace}/{repository}/pullrequests"
+        params = {'state': state, 'pagelen': 50, 'fields': _PULL_REQUEST_LIST_FIELDS}
+        if updated_since is not None:
+            params.update(self._updated_since_params(updated_since))
+        return self._collect_paged_values(path, params=params)
+
+    def _list_closed_pull_request_ids(self, repository: str, updated_since: datetime) -> Set[str]:
         path = f"repositories/{self._workspace}/{repository}/pullrequests"
-        return self._collect_paged_values(path, params={'state': state, 'pagelen': 50})
+        params = {'state': _CLOSED_STATES, 'pagelen': 50, 'fields': _CLOSED_PULL_REQUEST_FIELDS,
+                  **self._updated_since_params(updated_since)}
+        return {str(raw_pull_request.get('id')) for raw_pull_request in self._collect_paged_values(path, params)}
+
+    @staticmethod
+    def _updated_since_params(updated_since: datetime) -> Dict[str, str]:
+        return {'q': f"updated_on > {updated_since.isoformat()}", 'sort': '-updated_on'}
 
     def _collect_paged_values(self, path: str, params: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
         response = self._cloud.get(path, params=params)
@@ -42,6 +42,28 @@ class AzurePullRequestConverter:
             linked_task_id=WorkItemIdParser.parse_azure_work_item_id(source_branch, azure_pull_request.title)
         )
 
+    @staticmethod
+    def build_version(azure_pull_request) -> Optional[str]:
+        last_merge_source_commit = getattr(azure_pull_request, 'last_merge_source_commit', None)
+        commit_id = getattr(last_merge_source_commit, 'commit_id', None)
+        if not commit_id:
+            return None
+        votes = sorted(f"{azure_reviewer.id}:{azure_reviewer.vote or 0}"
+                       for azure_reviewer in azure_pull_request.reviewers or [])
+        merge_status = getattr(azure_pull_request, 'merge_status', None) or ''
+        return "|".join([commit_id, merge_status] + votes)
+
+    @classmethod
+    def build_review_version(cls, azure_pull_request, azure_threads) -> Optional[str]:
+        version = cls.build_version(azure_pull_request)
+        if not version:
+            return None
+        # New comments and replies only move thread timestamps, so the commit and votes alone miss them
+        thread_dates = [thread.last_updated_date for thread in azure_threads or []
+                        if getattr(thread, 'last_updated_date', None) is not None]
+        latest_thread_update = max(thread_dates).isoformat() if thread_dates else ''
+        return f"{version}|threads:{len(azure_threads or [])}:{latest_thread_update}"
+
     def _convert_reviewers(self, azure_reviewers) -> List[Approval]:
         if not azure_reviewers:
             return []
@@ -28,6 +28,14 @@ class BitbucketPullRequestConverter:
             linked_task_id=WorkItemIdParser.parse_jira_issue_key(source_branch, title)
         )
 
+    @staticmethod
+    def build_version(raw_pull_request: Dict[str, Any]) -> Optional[str]:
+        updated_on = raw_pull_request.get('updated_on')
+        if not updated_on:
+            return None
+        commit = (raw_pull_request.get('source') or {}).get('commit') or {}
+        return f"{updated_on}|{commit.get('hash') or ''}"
+
     def convert_participants(self, participants: Optional[List[Dict[str, Any]]]) -> List[Approval]:
         if not participants:
             return []
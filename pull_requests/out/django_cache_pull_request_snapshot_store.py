@@ -0,0 +1,28 @@
+from typing import Optional
+
+from metrics import version_stamps
+from metrics.version_stamps import VersionStamps
+from pull_requests.app.domain.model.pull_request import PullRequestSnapshot
+from pull_requests.app.spi.pull_request_snapshot_store import PullRequestSnapshotStore
+
+
+class DjangoCachePullRequestSnapshotStore(PullRequestSnapshotStore):
+    KEY = "pull-request-snapshot"
+
+    def __init__(self, cache, stamps: Optional[VersionStamps] = None):
+        self._cache = cache
+        self._stamps = stamps
+
+    def get(self) -> Optional[PullRequestSnapshot]:
+        return self._cache.get(self._key())
+
+    def put(self, snapshot: PullRequestSnapshot) -> None:
+        self._cache.set(self._key(), snapshot)
+
+    def delete(self) -> None:
+        self._cache.delete(self._key())
+
+    def _key(self) -> str:
+        if self._stamps is None:
+            return self.KEY
+        return f"{self.KEY}||{self._stamps.token({version_stamps.PULL_REQUESTS: [version_stamps.ALL]})}"
@@ -0,0 +1,61 @@
+import threading
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Dict, Iterable, List, Optional
+
+from ..app.domain.model.pull_request import PullRequest
+
+
+@dataclass(slots=True)
+class PollState:
+    pull_requests_by_id: Dict[str, PullRequest]
+    polled_at: datetime
+    full_synced_at: datetime
+
+
+class IncrementalPollStates:
+    OVERLAP = timedelta(minutes=1)
+
+    def __init__(self, full_resync_interval: timedelta,
+                 clock: Callable[[], datetime] = lambda: datetime.now(timezone.utc)):
+        self._full_resync_interval = full_resync_interval
+        self._clock = clock
+        self._states: Dict[str, PollState] = {}
+        self._lock = threading.Lock()
+
+    def now(self) -> datetime:
+        return self._clock()
+
+    def get(self, scope: str) -> Optional[PollState]:
+        with self._lock:
+            state = self._states.get(scope)
+        if state is None or self._clock() - state.full_synced_at >= self._full_resync_interval:
+            return None
+        return state
+
+    def changed_since(self, state: PollState) -> datetime:
+        return state.polled_at - self.OVERLAP
+
+    def remember_full(self, scope: str, pull_requests: List[PullRequest], started_at: datetime) -> None:
+        with self._lock:
+            self._states[scope] = PollState(
+                pull_requests_by_id={pull_request.id: pull_request for pull_request in pull_requests},
+                polled_at=started_at,
+                full_synced_at=started_at
+            )
+
+    def merge(self, scope: str, state: PollState, changed: List[PullRequest],
+              removed_ids: Iterable[str], started_at: datetime) -> List[PullRequest]:
+        pull_requests_by_id = dict(state.pull_requests_by_id)
+        for pull_request_id in removed_ids:
+            pull_requests_by_id.pop(pull_request_id, None)
+        for pull_request in changed:
+            pull_requests_by_id[pull_request.id] = pull_request
+
+        with self._lock:
+            self._states[scope] = PollState(
+                pull_requests_by_id=pull_requests_by_id,
+                polled_at=started_at,
+                full_synced_at=state.full_synced_at
+            )
+        return list(pull_requests_by_id.values())
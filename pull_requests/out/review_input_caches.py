@@ -0,0 +1,43 @@
+from typing import Any, Dict, List, Optional
+
+from ..app.domain.model.pull_request import PullRequestRef
+from ..app.domain.model.review import ReviewInputs
+
+_TERMINAL_BUILD_STATES = {'SUCCESSFUL', 'FAILED', 'STOPPED'}
+
+
+class VersionedReviewInputsCache:
+    KEY_PREFIX = "repository-review-inputs||"
+
+    def __init__(self, cache):
+        self._cache = cache
+
+    def get(self, ref: PullRequestRef, version: Optional[str]) -> Optional[ReviewInputs]:
+        if not version:
+            return None
+        return self._cache.get(self._key(ref, version))
+
+    def put(self, ref: PullRequestRef, version: Optional[str], review_inputs: ReviewInputs) -> None:
+        if version and review_inputs.is_settled():
+            self._cache.set(self._key(ref, version), review_inputs)
+
+    def _key(self, ref: PullRequestRef, version: str) -> str:
+        return f"{self.KEY_PREFIX}{ref.repository_id}||{ref.pull_request_id}||{version}"
+
+
+class BuildStatusCache:
+    KEY_PREFIX = "build-statuses||"
+
+    def __init__(self, cache):
+        self._cache = cache
+
+    def get(self, repository: str, commit_hash: str) -> Optional[List[Dict[str, Any]]]:
+        return self._cache.get(self._key(repository, commit_hash))
+
+    def put(self, repository: str, commit_hash: str, build_statuses: List[Dict[str, Any]]) -> None:
+        if build_statuses and all(build_status.get('state') in _TERMINAL_BUILD_STATES
+                                  for build_status in build_statuses):
+            self._cache.set(self._key(repository, commit_hash), build_statuses)
+
+    def _key(self, repository: str, commit_hash: str) -> str:
+        return f"{self.KEY_PREFIX}{repository}||{commit_hash}"
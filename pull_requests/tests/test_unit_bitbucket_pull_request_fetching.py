@@ -0,0 +1,152 @@
+import asyncio
+import json
+import re
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+from pull_requests.app.domain.model.config import (
+    AzureRepoConfig, BitbucketConfig, PullRequestsConfig, ReviewGateConfig
+)
+from pull_requests.app.domain.model.pull_request import ApprovalVote, PullRequestSearchCriteria
+from pull_requests.out.bitbucket_pull_request_repository import BitbucketPullRequestRepository
+
+REPOSITORIES = [f"repo-{index}" for index in range(1, 11)]
+PULL_REQUESTS_PER_REPOSITORY = 4
+
+
+def _pull_request(repository: str, pull_request_id: int, with_participants: bool) -> dict:
+    pull_request = {
+        "id": pull_request_id,
+        "title": f"PROJ-{pull_request_id} change in {repository}",
+        "state": "OPEN",
+        "author": {"account_id": "author-1", "display_name": "Author"},
+        "source": {"branch": {"name": f"feature/PROJ-{pull_request_id}"}, "commit": {"hash": "abc"}},
+        "links": {"html": {"href": f"https://bitbucket.example/{repository}/{pull_request_id}"}},
+        "created_on": "2025-01-06T09:00:00+00:00"
+    }
+    if with_participants:
+        pull_request["participants"] = [{"role": "REVIEWER", "state": "approved",
+                                         "user": {"account_id": "reviewer-1", "display_name": "Reviewer"}}]
+    return pull_request
+
+
+class FakeBitbucketServer:
+
+    def __init__(self, honours_field_selection: bool):
+        self.honours_field_selection = honours_field_selection
+        self.list_calls = 0
+        self.detail_calls = 0
+        self.max_in_flight = 0
+        self._in_flight = 0
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._create_handler())
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self._server.server_address[1]}/"
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def handle(self, path: str, query: dict) -> dict:
+        with self._lock:
+            self._in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self._in_flight)
+        try:
+            time.sleep(0.005)
+            detail = re.fullmatch(r"/2\.0/repositories/ws/([^/]+)/pullrequests/(\d+)", path)
+            if detail:
+                with self._lock:
+                    self.detail_calls += 1
+                return _pull_request(detail.group(1), int(detail.group(2)), with_participants=True)
+
+            listing = re.fullmatch(r"/2\.0/repositories/ws/([^/]+)/pullrequests", path)
+            with self._lock:
+                self.list_calls += 1
+            with_participants = self.honours_field_selection and "participants" in query.get("fields", [""])[0]
+            return {"values": [_pull_request(listing.group(1), pull_request_id, with_participants)
+                               for pull_request_id in range(1, PULL_REQUESTS_PER_REPOSITORY + 1)]}
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+
+    def _create_handler(self):
+        fake_server = self
+
+        class Handler(BaseHTTPRequestHandler):
+
+            def do_GET(self):
+                parsed = urlparse(self.path)
+                body = json.dumps(fake_server.handle(parsed.path, parse_qs(parsed.query))).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        return Handler
+
+
+def _build_config(url: str, max_concurrent_requests: int) -> PullRequestsConfig:
+    return PullRequestsConfig(
+        task_tracker='jira',
+        azure=AzureRepoConfig(organization_url=None, pat=None, project_keys=[]),
+        bitbucket=BitbucketConfig(url=url, workspace="ws", username="user", app_password="secret",
+                                  repositories=REPOSITORIES, max_concurrent_requests=max_concurrent_requests),
+        members={},
+        seniority_levels={},
+        review_gate=ReviewGateConfig(main_reviewer_levels=[], min_developer_approvals=1)
+    )
+
+
+class TestBitbucketPullRequestFetching(unittest.TestCase):
+
+    def _start_server(self, honours_field_selection: bool) -> FakeBitbucketServer:
+        server = FakeBitbucketServer(honours_field_selection)
+        server.start()
+        self.addCleanup(server.stop)
+        return server
+
+    def test_shouldListPullRequestsWithParticipantsWithoutDetailCalls(self):
+        # given
+        server = self._start_server(honours_field_selection=True)
+        repository = BitbucketPullRequestRepository(_build_config(server.url, max_concurrent_requests=4))
+
+        # when
+        pull_requests = asyncio.run(repository.find_all(PullRequestSearchCriteria(status_filter='active')))
+
+        # then
+        self.assertEqual(len(REPOSITORIES) * PULL_REQUESTS_PER_REPOSITORY, len(pull_requests))
+        self.assertEqual(len(REPOSITORIES), server.list_calls)
+        self.assertEqual(0, server.detail_calls)
+        self.assertTrue(all(pull_request.review.approvals[0].vote == ApprovalVote.APPROVED
+                            for pull_request in pull_requests))
+
+    def test_shouldFetchMissingDetailsConcurrentlyWithinLimit(self):
+        # given
+        server = self._start_server(honours_field_selection=False)
+        repository = BitbucketPullRequestRepository(_build_config(server.url, max_concurrent_requests=3))
+
+        # when
+        pull_requests = asyncio.run(repository.find_all(PullRequestSearchCriteria(status_filter='active')))
+
+        # then
+        self.assertEqual(len(REPOSITORIES) * PULL_REQUESTS_PER_REPOSITORY, server.detail_calls)
+        self.assertGreater(server.max_in_flight, 1)
+        self.assertLessEqual(server.max_in_flight, 3)
+        self.assertTrue(all(pull_request.review.approvals for pull_request in pull_requests))
+
+
+if __name__ == '__main__':
+    unittest.main()
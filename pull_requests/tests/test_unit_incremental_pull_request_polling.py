@@ -0,0 +1,176 @@
+import asyncio
+import unittest
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+from pull_requests.app.domain.model.pull_request import PullRequestSearchCriteria
+from pull_requests.out.azure_pull_request_repository import AzurePullRequestRepository
+from pull_requests.out.bitbucket_pull_request_repository import BitbucketPullRequestRepository
+from pull_requests.out.incremental_poll_states import IncrementalPollStates
+from pull_requests.tests.test_unit_review_input_caches import _build_config
+
+ACTIVE = PullRequestSearchCriteria(status_filter='active')
+
+
+class FakeClock:
+
+    def __init__(self):
+        self.now = datetime(2026, 6, 1, 10, 0, tzinfo=timezone.utc)
+
+    def __call__(self) -> datetime:
+        return self.now
+
+
+def _raw_bitbucket_pull_request(pull_request_id: int, title: str = None) -> dict:
+    return {
+        "id": pull_request_id,
+        "title": title or f"PROJ-{pull_request_id} change",
+        "state": "OPEN",
+        "updated_on": "2026-06-01T09:00:00+00:00",
+        "source": {"branch": {"name": f"feature/PROJ-{pull_request_id}"}, "commit": {"hash": "abc"}},
+        "participants": []
+    }
+
+
+class FakeBitbucketCloud:
+
+    def __init__(self):
+        self.open_pull_requests = [_raw_bitbucket_pull_request(pull_request_id) for pull_request_id in (1, 2, 3)]
+        self.changed_pull_requests = []
+        self.closed_ids = []
+        self.list_params = []
+
+    def get(self, path, params=None, absolute=False):
+        self.list_params.append(params or {})
+        if params.get('state') == 'OPEN' and 'q' not in params:
+            return {"values": self.open_pull_requests}
+        if params.get('state') == 'OPEN':
+            return {"values": self.changed_pull_requests}
+        return {"values": [{"id": closed_id} for closed_id in self.closed_ids]}
+
+
+def _azure_pull_request(pull_request_id: int, status: str = "active", title: str = None) -> SimpleNamespace:
+    return SimpleNamespace(pull_request_id=pull_request_id, title=title or f"{pull_request_id} change",
+                           created_by=None, status=status, repository=None, source_ref_name=None,
+                           is_draft=False, creation_date=None, reviewers=[])
+
+
+class FakeAzureGitClient:
+
+    def __init__(self, pull_requests):
+        self.pull_requests = pull_requests
+        self.pages = []
+
+    def get_pull_requests_by_project(self, project, search_criteria, top=None, skip=None):
+        self.pages.append((search_criteria.status, top, skip))
+        listed = [pull_request for pull_request in self.pull_requests
+                  if search_criteria.status == 'all' or pull_request.status == search_criteria.status]
+        return listed[skip:skip + top]
+
+
+class TestBitbucketIncrementalPolling(unittest.TestCase):
+
+    def setUp(self):
+        self.clock = FakeClock()
+        self.cloud = FakeBitbucketCloud()
+        self.repository = BitbucketPullRequestRepository(
+            _build_config('jira'), poll_states=IncrementalPollStates(timedelta(minutes=15), clock=self.clock)
+        )
+        self.repository._cloud = self.cloud
+
+    def test_shouldMergeChangedAndClosedPullRequestsIntoSnapshot(self):
+        # given
+        asyncio.run(self.repository.find_all(ACTIVE))
+        self.clock.now += timedelta(minutes=2)
+        self.cloud.changed_pull_requests = [_raw_bitbucket_pull_request(2, "PROJ-2 renamed"),
+                                            _raw_bitbucket_pull_request(4)]
+        self.cloud.closed_ids = [3]
+
+        # when
+        pull_requests = asyncio.run(self.repository.find_all(ACTIVE))
+
+        # then
+        self.assertEqual({"1": "PROJ-1 change", "2": "PROJ-2 renamed", "4": "PROJ-4 change"},
+                         {pull_request.id: pull_request.title for pull_request in pull_requests})
+
+    def test_shouldAskOnlyForPullRequestsUpdatedSinceLastPoll(self):
+        # given
+        asyncio.run(self.repository.find_all(ACTIVE))
+        self.clock.now += timedelta(minutes=2)
+
+        # when
+        asyncio.run(self.repository.find_all(ACTIVE))
+
+        # then
+        incremental_params = self.cloud.list_params[1:]
+        self.assertEqual(2, len(incremental_params))
+        self.assertTrue(all(params['q'] == "updated_on > 2026-06-01T09:59:00+00:00"
+                            for params in incremental_params))
+        self.assertIn(['MERGED', 'DECLINED', 'SUPERSEDED'], [params['state'] for params in incremental_params])
+
+    def test_shouldRelistEverythingAfterResyncInterval(self):
+        # given
+        asyncio.run(self.repository.find_all(ACTIVE))
+        self.clock.now += timedelta(minutes=16)
+
+        # when
+        asyncio.run(self.repository.find_all(ACTIVE))
+
+        # then
+        self.assertEqual(2, len(self.cloud.list_params))
+        self.assertNotIn('q', self.cloud.list_params[1])
+
+
+class TestAzureIncrementalPolling(unittest.TestCase):
+
+    def setUp(self):
+        self.git_client = FakeAzureGitClient([])
+        self.repository = AzurePullRequestRepository(
+            _build_config('azure'), poll_states=IncrementalPollStates(timedelta(minutes=15), clock=FakeClock())
+        )
+        self.repository._connection = SimpleNamespace(clients=SimpleNamespace(get_git_client=lambda: self.git_client))
+
+    def test_shouldMergeNewEditedAndClosedPullRequestsFromScanDownToOldestKnown(self):
+        # given
+        self.git_client.pull_requests = (
+            [_azure_pull_request(pull_request_id) for pull_request_id in range(150, 100, -1)]
+            + [_azure_pull_request(pull_request_id, "completed") for pull_request_id in range(100, 0, -1)]
+        )
+        asyncio.run(self.repository.find_all(ACTIVE))
+        self.git_client.pull_requests = [_azure_pull_request(152), _azure_pull_request(151)] + [
+            _azure_pull_request(pull_request_id, "abandoned" if pull_request_id == 120 else "active",
+                                "renamed" if pull_request_id == 130 else None)
+            for pull_request_id in range(150, 100, -1)
+        ] + [_azure_pull_request(pull_request_id, "completed") for pull_request_id in range(100, 0, -1)]
+        self.git_client.pages.clear()
+
+        # when
+        pull_requests = asyncio.run(self.repository.find_all(ACTIVE))
+
+        # then
+        titles_by_id = {pull_request.id: pull_request.title for pull_request in pull_requests}
+        self.assertEqual([("all", 100, 0)], self.git_client.pages)
+        self.assertEqual(51, len(titles_by_id))
+        self.assertNotIn("120", titles_by_id)
+        self.assertEqual("renamed", titles_by_id["130"])
+        self.assertIn("152", titles_by_id)
+
+    def test_shouldRelistActivePullRequestsWhenScanWouldExceedFullListing(self):
+        # given
+        self.git_client.pull_requests = [_azure_pull_request(1)]
+        asyncio.run(self.repository.find_all(ACTIVE))
+        self.git_client.pull_requests = ([_azure_pull_request(pull_request_id, "completed")
+                                          for pull_request_id in range(1200, 1, -1)] + [_azure_pull_request(1)])
+        self.git_client.pages.clear()
+
+        # when
+        pull_requests = asyncio.run(self.repository.find_all(ACTIVE))
+
+        # then
+        self.assertEqual(10, len([page for page in self.git_client.pages if page[0] == "all"]))
+        self.assertEqual(("active", 1000, 0), self.git_client.pages[10])
+        self.assertEqual(["1"], [pull_request.id for pull_request in pull_requests])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,175 @@
+import asyncio
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import List, Optional
+
+from pull_requests.app.domain.model.pull_request import PullRequest, PullRequestSearchCriteria, PullRequestSnapshot
+from pull_requests.app.domain.pull_request_search_service import PullRequestSearchService
+from pull_requests.app.domain.pull_request_snapshot_registry import PullRequestSnapshotRegistry
+from pull_requests.app.domain.review.policy_gateway_evaluator import PolicyGatewayEvaluator
+from pull_requests.app.domain.review.pull_request_review_enricher import PullRequestReviewEnricher
+from pull_requests.app.domain.review.reset_approval_detector import ResetApprovalDetector
+from pull_requests.app.domain.review.review_gate_evaluator import ReviewGateEvaluator
+from pull_requests.app.domain.review.reviewer_seniority import ReviewerSeniority
+from pull_requests.app.spi.pull_request_snapshot_store import PullRequestSnapshotStore
+from pull_requests.tests.mocks.mock_pull_request_repository import MockPullRequestRepository
+
+
+class InMemoryPullRequestSnapshotStore(PullRequestSnapshotStore):
+
+    def __init__(self):
+        self.snapshot: Optional[PullRequestSnapshot] = None
+
+    def get(self) -> Optional[PullRequestSnapshot]:
+        return self.snapshot
+
+    def put(self, snapshot: PullRequestSnapshot) -> None:
+        self.snapshot = snapshot
+
+    def delete(self) -> None:
+        self.snapshot = None
+
+
+class CountingPullRequestRepository(MockPullRequestRepository):
+
+    def __init__(self, pull_requests: List[PullRequest]):
+        super().__init__(pull_requests)
+        self.find_all_calls = 0
+
+    async def find_all(self, criteria: PullRequestSearchCriteria) -> List[PullRequest]:
+        self.find_all_calls += 1
+        return list(self._pull_requests)
+
+
+class FakeClock:
+
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestPullRequestSnapshotRegistry(unittest.TestCase):
+
+    def setUp(self):
+        self.store = InMemoryPullRequestSnapshotStore()
+        self.clock = FakeClock()
+        self.revalidation_executor = ThreadPoolExecutor(max_workers=1)
+        self.repository = CountingPullRequestRepository([
+            PullRequest(id="1", linked_task_id="TASK-1", created_date=datetime(2026, 6, 1)),
+            PullRequest(id="2", linked_task_id="TASK-1", created_date=datetime(2026, 6, 3)),
+            PullRequest(id="3", linked_task_id="TASK-2", created_date=datetime(2026, 6, 2)),
+            PullRequest(id="4")
+        ])
+        registry = PullRequestSnapshotRegistry(
+            store=self.store, fresh_seconds=60, stale_seconds=600,
+            revalidation_executor=self.revalidation_executor, clock=self.clock
+        )
+        self.service = PullRequestSearchService(
+            repository=self.repository,
+            review_enricher=_review_enricher(),
+            snapshot_registry=registry
+        )
+
+    def tearDown(self):
+        self.revalidation_executor.shutdown(wait=True)
+
+    def test_shouldServeRepeatedSearchesFromFreshSnapshot(self):
+        # given
+        asyncio.run(self.service.search())
+        self.clock.now += 30
+
+        # when
+        pull_requests = asyncio.run(self.service.search())
+
+        # then
+        self.assertEqual(1, self.repository.find_all_calls)
+        self.assertEqual(["1", "2", "3", "4"], [pull_request.id for pull_request in pull_requests])
+
+    def test_shouldReturnStaleSnapshotAndRefreshItInBackground(self):
+        # given
+        asyncio.run(self.service.search())
+        self.repository._pull_requests.append(PullRequest(id="5", linked_task_id="TASK-3"))
+        self.clock.now += 120
+
+        # when
+        pull_requests = asyncio.run(self.service.search())
+        self.revalidation_executor.shutdown(wait=True)
+
+        # then
+        self.assertEqual(["1", "2", "3", "4"], [pull_request.id for pull_request in pull_requests])
+        self.assertEqual(2, self.repository.find_all_calls)
+        self.assertEqual(["1", "2", "3", "4", "5"],
+                         [pull_request.id for pull_request in self.store.snapshot.pull_requests])
+        self.assertEqual(1120.0, self.store.snapshot.fetched_at)
+
+    def test_shouldReloadSynchronouslyWhenSnapshotOutlivedStaleWindow(self):
+        # given
+        asyncio.run(self.service.search())
+        self.repository._pull_requests.append(PullRequest(id="5"))
+        self.clock.now += 700
+
+        # when
+        pull_requests = asyncio.run(self.service.search())
+
+        # then
+        self.assertEqual(2, self.repository.find_all_calls)
+        self.assertEqual(["1", "2", "3", "4", "5"], [pull_request.id for pull_request in pull_requests])
+
+    def test_shouldBypassSnapshotForNonDefaultCriteria(self):
+        # given
+        asyncio.run(self.service.search())
+
+        # when
+        asyncio.run(self.service.search(PullRequestSearchCriteria(status_filter="completed")))
+
+        # then
+        self.assertEqual(2, self.repository.find_all_calls)
+
+    def test_shouldResolveLatestLinkedPullRequestFromIndex(self):
+        # when
+        linked = asyncio.run(self.service.find_linked_pull_requests(["TASK-1", "TASK-2", "TASK-9"]))
+
+        # then
+        self.assertEqual({"TASK-1": "2", "TASK-2": "3"},
+                         {task_id: pull_request.id for task_id, pull_request in linked.items()})
+        self.assertEqual(["TASK-1", "TASK-2"], sorted(self.store.snapshot.latest_by_linked_task_id))
+
+    def test_shouldShareSnapshotBetweenSearchAndLinkedLookups(self):
+        # given
+        asyncio.run(self.service.search())
+
+        # when
+        asyncio.run(self.service.find_linked_pull_requests(["TASK-1"]))
+        asyncio.run(self.service.find_linked_pull_requests(["TASK-2"]))
+
+        # then
+        self.assertEqual(1, self.repository.find_all_calls)
+
+    def test_shouldReloadFreshSnapshotAfterInvalidation(self):
+        # given
+        asyncio.run(self.service.search())
+        self.repository._pull_requests.append(PullRequest(id="5"))
+
+        # when
+        self.service.invalidate_snapshot()
+        pull_requests = asyncio.run(self.service.search())
+
+        # then
+        self.assertEqual(2, self.repository.find_all_calls)
+        self.assertEqual(["1", "2", "3", "4", "5"], [pull_request.id for pull_request in pull_requests])
+
+
+def _review_enricher() -> PullRequestReviewEnricher:
+    return PullRequestReviewEnricher(
+        reviewer_seniority=ReviewerSeniority(members={}, main_reviewer_levels=["lead", "arch"], seniority_levels={}),
+        review_gate_evaluator=ReviewGateEvaluator(min_developer_approvals=2),
+        reset_approval_detector=ResetApprovalDetector(),
+        policy_gateway_evaluator=PolicyGatewayEvaluator()
+    )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,200 @@
+import asyncio
+import unittest
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+from django.core.cache.backends.locmem import LocMemCache
+
+from pull_requests.app.domain.model.config import (
+    AzureRepoConfig, BitbucketConfig, PullRequestsConfig, ReviewGateConfig
+)
+from pull_requests.app.domain.model.pull_request import PullRequestRef
+from pull_requests.app.domain.model.review import PolicyEvaluationStatus
+from pull_requests.out.azure_pull_request_repository import AzurePullRequestRepository
+from pull_requests.out.bitbucket_pull_request_repository import BitbucketPullRequestRepository
+from pull_requests.out.review_input_caches import BuildStatusCache, VersionedReviewInputsCache
+
+
+def _build_config(task_tracker: str) -> PullRequestsConfig:
+    return PullRequestsConfig(
+        task_tracker=task_tracker,
+        azure=AzureRepoConfig(organization_url="https://dev.azure.example/org", pat="secret", project_keys=["PROJ"]),
+        bitbucket=BitbucketConfig(url="https://bitbucket.example/", workspace="ws", username="user",
+                                  app_password="secret", repositories=["repo"]),
+        members={},
+        seniority_levels={},
+        review_gate=ReviewGateConfig(main_reviewer_levels=[], min_developer_approvals=1)
+    )
+
+
+def _new_cache(name: str) -> LocMemCache:
+    cache = LocMemCache(name, {})
+    cache.clear()
+    return cache
+
+
+class FakeBitbucketCloud:
+
+    def __init__(self):
+        self.updated_on = "2026-06-01T10:00:00+00:00"
+        self.commit_hash = "abc"
+        self.build_state = "SUCCESSFUL"
+        self.requested_paths = []
+
+    def get(self, path, params=None, absolute=False):
+        self.requested_paths.append(path)
+        if path.endswith("/activity"):
+            return {"values": []}
+        if path.endswith("/statuses"):
+            return {"values": [{"type": "build", "key": "ci", "name": "CI", "state": self.build_state}]}
+        return {
+            "id": 7,
+            "updated_on": self.updated_on,
+            "source": {"commit": {"hash": self.commit_hash}},
+            "participants": [{"role": "REVIEWER", "state": "approved",
+                              "user": {"account_id": "reviewer-1", "display_name": "Reviewer"}}]
+        }
+
+    def calls_to(self, suffix: str) -> int:
+        return len([path for path in self.requested_paths if path.endswith(suffix)])
+
+
+class FakeAzureGitClient:
+
+    def __init__(self):
+        self.commit_id = "c1"
+        self.threads = []
+        self.calls = []
+
+    def get_pull_request_by_id(self, pull_request_id, project=None):
+        self.calls.append("detail")
+        return SimpleNamespace(last_merge_source_commit=SimpleNamespace(commit_id=self.commit_id),
+                               merge_status="succeeded", reviewers=[])
+
+    def get_pull_request_reviewers(self, repository_id, pull_request_id, project=None):
+        self.calls.append("reviewers")
+        return []
+
+    def get_threads(self, repository_id, pull_request_id, project=None):
+        self.calls.append("threads")
+        return self.threads
+
+
+class FakeAzurePolicyClient:
+
+    def __init__(self):
+        self.calls = 0
+
+    def get_policy_evaluations(self, project, artifact_id):
+        self.calls += 1
+        return []
+
+
+def _ref() -> PullRequestRef:
+    return PullRequestRef(pull_request_id="7", repository_id="repo", project_id="project-id", project_name="PROJ")
+
+
+class TestBitbucketReviewInputCaches(unittest.TestCase):
+
+    def setUp(self):
+        self.cloud = FakeBitbucketCloud()
+        self.repository = BitbucketPullRequestRepository(
+            _build_config('jira'),
+            review_inputs_cache=VersionedReviewInputsCache(_new_cache("bitbucket-review-inputs")),
+            build_status_cache=BuildStatusCache(_new_cache("bitbucket-build-statuses"))
+        )
+        self.repository._cloud = self.cloud
+
+    def test_shouldOnlyRequestDetailWhenPullRequestUnchanged(self):
+        # given
+        asyncio.run(self.repository.fetch_review_inputs(_ref()))
+
+        # when
+        review_inputs = asyncio.run(self.repository.fetch_review_inputs(_ref()))
+
+        # then
+        self.assertEqual(2, self.cloud.calls_to("/pullrequests/7"))
+        self.assertEqual(1, self.cloud.calls_to("/activity"))
+        self.assertEqual(1, self.cloud.calls_to("/statuses"))
+        self.assertEqual(PolicyEvaluationStatus.APPROVED, review_inputs.policy_evaluations[0].status)
+
+    def test_shouldReuseFinishedBuildStatusesForSameCommit(self):
+        # given
+        asyncio.run(self.repository.fetch_review_inputs(_ref()))
+        self.cloud.updated_on = "2026-06-01T11:00:00+00:00"
+
+        # when
+        asyncio.run(self.repository.fetch_review_inputs(_ref()))
+
+        # then
+        self.assertEqual(2, self.cloud.calls_to("/activity"))
+        self.assertEqual(1, self.cloud.calls_to("/statuses"))
+
+    def test_shouldRefetchWhileBuildIsInProgress(self):
+        # given
+        self.cloud.build_state = "INPROGRESS"
+        asyncio.run(self.repository.fetch_review_inputs(_ref()))
+
+        # when
+        asyncio.run(self.repository.fetch_review_inputs(_ref()))
+
+        # then
+        self.assertEqual(2, self.cloud.calls_to("/activity"))
+        self.assertEqual(2, self.cloud.calls_to("/statuses"))
+
+
+class TestAzureReviewInputCaches(unittest.TestCase):
+
+    def setUp(self):
+        self.git_client = FakeAzureGitClient()
+        self.policy_client = FakeAzurePolicyClient()
+        self.repository = AzurePullRequestRepository(
+            _build_config('azure'),
+            review_inputs_cache=VersionedReviewInputsCache(_new_cache("azure-review-inputs"))
+        )
+        self.repository._connection = SimpleNamespace(clients=SimpleNamespace(
+            get_git_client=lambda: self.git_client,
+            get_policy_client=lambda: self.policy_client
+        ))
+
+    def test_shouldSkipReviewCallsWhileSourceCommitAndThreadsUnchanged(self):
+        # given
+        asyncio.run(self.repository.fetch_review_inputs(_ref()))
+
+        # when
+        asyncio.run(self.repository.fetch_review_inputs(_ref()))
+
+        # then
+        self.assertEqual(2, self.git_client.calls.count("detail"))
+        self.assertEqual(2, self.git_client.calls.count("threads"))
+        self.assertEqual(1, self.git_client.calls.count("reviewers"))
+        self.assertEqual(1, self.policy_client.calls)
+
+    def test_shouldRefetchAfterNewCommentOnSameCommit(self):
+        # given
+        self.git_client.threads = [SimpleNamespace(last_updated_date=datetime(2026, 6, 1, 10, 0, tzinfo=timezone.utc))]
+        asyncio.run(self.repository.fetch_review_inputs(_ref()))
+        self.git_client.threads = [SimpleNamespace(last_updated_date=datetime(2026, 6, 1, 11, 0, tzinfo=timezone.utc))]
+
+        # when
+        asyncio.run(self.repository.fetch_review_inputs(_ref()))
+
+        # then
+        self.assertEqual(2, self.git_client.calls.count("reviewers"))
+        self.assertEqual(2, self.policy_client.calls)
+
+    def test_shouldRefetchAfterNewCommit(self):
+        # given
+        asyncio.run(self.repository.fetch_review_inputs(_ref()))
+        self.git_client.commit_id = "c2"
+
+        # when
+        asyncio.run(self.repository.fetch_review_inputs(_ref()))
+
+        # then
+        self.assertEqual(2, self.git_client.calls.count("reviewers"))
+        self.assertEqual(2, self.policy_client.calls)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,80 @@
+import asyncio
+import unittest
+from typing import Dict, Iterable, List
+
+from pull_requests.app.domain.model.pull_request import ApprovalVote, PullRequestRef
+from pull_requests.app.domain.model.review import ReviewInputs
+from pull_requests.app.domain.review_inputs_registry import ReviewInputsRegistry
+from pull_requests.tests.fixtures.pull_request_builders import reviewer_vote
+from pull_requests.tests.mocks.mock_pull_request_repository import MockPullRequestRepository
+
+
+class RecordingPullRequestRepository(MockPullRequestRepository):
+
+    def __init__(self, review_inputs_by_id: Dict[str, ReviewInputs], failing_ids: Iterable[str] = ()):
+        super().__init__()
+        self._review_inputs_by_id = review_inputs_by_id
+        self._failing_ids = set(failing_ids)
+        self.fetched_ids: List[str] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def fetch_review_inputs(self, ref: PullRequestRef) -> ReviewInputs:
+        self.fetched_ids.append(ref.pull_request_id)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        if ref.pull_request_id in self._failing_ids:
+            raise RuntimeError("service unavailable")
+        return self._review_inputs_by_id[ref.pull_request_id]
+
+
+def ref(pull_request_id: str) -> PullRequestRef:
+    return PullRequestRef(pull_request_id=pull_request_id, repository_id="repo", project_id="project-id",
+                          project_name="Project")
+
+
+def approved_inputs() -> ReviewInputs:
+    return ReviewInputs(current_approvals=[reviewer_vote("alice", ApprovalVote.APPROVED)])
+
+
+class TestReviewInputsRegistry(unittest.TestCase):
+
+    def test_shouldFetchBatchConcurrentlyWithinLimit(self):
+        # given
+        repository = RecordingPullRequestRepository({str(number): approved_inputs() for number in range(10)})
+        registry = ReviewInputsRegistry(repository, max_concurrency=3)
+
+        # when
+        review_inputs = asyncio.run(registry.fetch_many([ref(str(number)) for number in range(10)]))
+
+        # then
+        self.assertEqual(10, len([inputs for inputs in review_inputs if inputs is not None]))
+        self.assertEqual(3, repository.max_in_flight)
+
+    def test_shouldSkipFailedPullRequestAndKeepOthers(self):
+        # given
+        repository = RecordingPullRequestRepository({"1": approved_inputs()}, failing_ids=["2"])
+        registry = ReviewInputsRegistry(repository)
+
+        # when
+        with self.assertLogs("pull_requests.app.domain.review_inputs_registry", level="WARNING"):
+            review_inputs = asyncio.run(registry.fetch_many([ref("1"), ref("2")]))
+
+        # then
+        self.assertIsNotNone(review_inputs[0])
+        self.assertIsNone(review_inputs[1])
+
+    def test_shouldRaiseForFailedSinglePullRequest(self):
+        # given
+        repository = RecordingPullRequestRepository({}, failing_ids=["2"])
+        registry = ReviewInputsRegistry(repository)
+
+        # when / then
+        with self.assertRaises(RuntimeError):
+            asyncio.run(registry.fetch(ref("2")))
+
+
+if __name__ == '__main__':
+    unittest.main()
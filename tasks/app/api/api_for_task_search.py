@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import AsyncIterator, List, Optional
 
 from ..domain.model.task import TaskSearchCriteria, Task, EnrichmentOptions
 
@@ -13,3 +13,7 @@ class ApiForTaskSearch(ABC):
     @abstractmethod
     async def search_by_ids(self, task_ids: List[str], enrichment: Optional[EnrichmentOptions] = None) -> List[Task]:
         pass
+
+    @abstractmethod
+    def stream(self, criteria: Optional[TaskSearchCriteria] = None, enrichment: Optional[EnrichmentOptions] = None) -> AsyncIterator[List[Task]]:
+        pass
@@ -1,4 +1,5 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from datetime import date
 from typing import Dict, List, Optional, Any, Set
 
 
@@ -10,6 +11,7 @@ class JiraConfig:
     story_point_custom_field_id: str
     release_field: Optional[str] = None
     iteration_field: Optional[str] = None
+    search_concurrency: int = 4
 
 @dataclass(slots=True)
 class AzureConfig:
@@ -17,6 +19,10 @@ class AzureConfig:
     azure_pat: Optional[str]
     release_field: Optional[str] = None
     iteration_field: Optional[str] = None
+    changelog_source: str = 'revisions'
+    bulk_revisions_min_tasks: int = 50
+    bulk_revisions_max_span_days: int = 180
+    bulk_revisions_max_scanned_per_item: int = 100
 
 @dataclass(slots=True)
 class ProjectConfig:
@@ -92,6 +98,18 @@ class SortingConfig:
                     field_names.append(field_name)
         return field_names
 
+@dataclass(slots=True)
+class ConversionConfig:
+    executor_type: str = 'thread'
+    max_workers: Optional[int] = None
+    chunk_size: int = 250
+    min_parallel_tasks: int = 1000
+
+@dataclass(slots=True)
+class WorkingCalendarConfig:
+    working_days_per_week: int = 5
+    holidays: List[date] = field(default_factory=list)
+
 @dataclass(slots=True)
 class TasksConfig:
     jira: JiraConfig
@@ -102,6 +120,8 @@ class TasksConfig:
     member_group: MemberGroupConfig
     estimation: EstimationConfig
     sorting: SortingConfig
+    conversion: ConversionConfig = field(default_factory=ConversionConfig)
+    working_calendar: WorkingCalendarConfig = field(default_factory=WorkingCalendarConfig)
 
     def get_available_member_group_ids(self) -> List[str]:
         return sorted(self.member_group.get_available_member_groups().keys())
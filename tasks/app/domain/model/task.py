@@ -83,6 +83,7 @@ class Task:
     parent: Optional['Task'] = None
     releases: Optional[List[Release]] = None
     custom_sort_fields: Optional[Dict[str, str]] = None
+    resolved_at: Optional[datetime] = None
 
     forecast: Optional['Forecast'] = None
 
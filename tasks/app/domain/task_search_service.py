@@ -1,4 +1,4 @@
-from typing import List, Optional, Callable
+from typing import AsyncIterator, List, Optional, Callable
 
 from .assignee_search_service import AssigneeSearchService
 from .convertors.task_metadata_convertor import TaskMetadataPopulator
@@ -31,6 +31,17 @@ class TaskSearchService(ApiForTaskSearch):
 
         return tasks
 
+    async def stream(self, criteria: Optional[TaskSearchCriteria] = None,
+                     enrichment: Optional[EnrichmentOptions] = None) -> AsyncIterator[List[Task]]:
+        worktime_extractor_type = self._determine_worktime_extractor_type(enrichment)
+        repository = self._repository_factory(worktime_extractor_type)
+        async for tasks in repository.stream_all(search_criteria=criteria, enrichment=enrichment):
+            tasks = self._metadata_convertor.populate_metadata_for_tasks(tasks)
+
+            self._assignee_search_api.populate_assignee_cache_from_tasks(tasks)
+
+            yield tasks
+
     async def search_by_ids(self, task_ids: List[str], enrichment: Optional[EnrichmentOptions] = None) -> List[Task]:
         worktime_extractor_type = self._determine_worktime_extractor_type(enrichment)
         repository = self._repository_factory(worktime_extractor_type)
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import AsyncIterator, List, Optional
 
 from ..domain.model.task import TaskSearchCriteria, Task, EnrichmentOptions
 
@@ -12,3 +12,10 @@ class TaskRepository(ABC):
                        enrichment: Optional[EnrichmentOptions] = None
                        ) -> List[Task]:
         pass
+
+    @abstractmethod
+    def stream_all(self,
+                   search_criteria: Optional[TaskSearchCriteria] = None,
+                   enrichment: Optional[EnrichmentOptions] = None
+                   ) -> AsyncIterator[List[Task]]:
+        pass
@@ -1,8 +1,11 @@
+from datetime import date
+
 from django.conf import settings
 
 from .app.domain.model.config import (
     TasksConfig, JiraConfig, AzureConfig, ProjectConfig, WorkflowConfig,
-    TaskFilterConfig, MemberGroupConfig, EstimationConfig, SortingConfig
+    TaskFilterConfig, MemberGroupConfig, EstimationConfig, SortingConfig, ConversionConfig,
+    WorkingCalendarConfig
 )
 
 
@@ -13,14 +16,19 @@ def load_tasks_config() -> TasksConfig:
         jira_api_token=settings.METRICS_JIRA_API_TOKEN,
         story_point_custom_field_id=settings.METRICS_STORY_POINT_CUSTOM_FIELD_ID,
         release_field=settings.METRICS_JIRA_RELEASE_FIELD or None,
-        iteration_field=settings.METRICS_JIRA_ITERATION_FIELD or None
+        iteration_field=settings.METRICS_JIRA_ITERATION_FIELD or None,
+        search_concurrency=settings.METRICS_JIRA_SEARCH_CONCURRENCY
     )
 
     azure = AzureConfig(
         azure_organization_url=settings.METRICS_AZURE_ORGANIZATION_URL,
         azure_pat=settings.METRICS_AZURE_PAT,
         release_field=settings.METRICS_AZURE_RELEASE_FIELD or None,
-        iteration_field=settings.METRICS_AZURE_ITERATION_FIELD or None
+        iteration_field=settings.METRICS_AZURE_ITERATION_FIELD or None,
+        changelog_source=settings.METRICS_AZURE_CHANGELOG_SOURCE,
+        bulk_revisions_min_tasks=settings.METRICS_AZURE_BULK_REVISIONS_MIN_TASKS,
+        bulk_revisions_max_span_days=settings.METRICS_AZURE_BULK_REVISIONS_MAX_SPAN_DAYS,
+        bulk_revisions_max_scanned_per_item=settings.METRICS_AZURE_BULK_REVISIONS_MAX_SCANNED_PER_ITEM
     )
     
     project = ProjectConfig(
@@ -62,6 +70,18 @@ def load_tasks_config() -> TasksConfig:
         default_sort_criteria=settings.METRICS_DEFAULT_SORT_CRITERIA
     )
 
+    conversion = ConversionConfig(
+        executor_type=settings.METRICS_TASK_CONVERSION_EXECUTOR,
+        max_workers=settings.METRICS_TASK_CONVERSION_MAX_WORKERS,
+        chunk_size=settings.METRICS_TASK_CONVERSION_CHUNK_SIZE,
+        min_parallel_tasks=settings.METRICS_TASK_CONVERSION_MIN_PARALLEL_TASKS
+    )
+
+    working_calendar = WorkingCalendarConfig(
+        working_days_per_week=settings.METRICS_WORKING_DAYS_PER_WEEK,
+        holidays=[date.fromisoformat(holiday) for holiday in settings.METRICS_HOLIDAYS]
+    )
+
     return TasksConfig(
         jira=jira,
         azure=azure,
@@ -70,5 +90,7 @@ def load_tasks_config() -> TasksConfig:
         task_filter=task_filter,
         member_group=member_group,
         estimation=estimation,
-        sorting=sorting
+        sorting=sorting,
+        conversion=conversion,
+        working_calendar=working_calendar
     )
\ No newline at end of file
@@ -1,7 +1,10 @@
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 from typing import List, Optional, Dict
 
 from django.core.cache import caches
 
+from metrics.version_stamps import VersionStamps
+
 from .app.api.api_for_assignee_search import ApiForAssigneeSearch
 from .app.api.api_for_task_hierarchy import ApiForTaskHierarchy
 from .app.api.api_for_task_search import ApiForTaskSearch
@@ -14,7 +17,10 @@ from .app.domain.task_search_service import TaskSearchService
 from .app.spi.task_repository import TaskRepository
 from .config_loader import load_tasks_config
 from .out.azure_task_repository import AzureTaskRepository
+from .out.jira_changelog_history import JiraChangelogStore
 from .out.jira_task_repository import JiraTaskRepository
+from .out.parent_title_cache import ParentTitleCache
+from .out.version_stamped_cache import TaskCacheVersioning
 
 
 class TasksContainer:
@@ -24,6 +30,10 @@ class TasksContainer:
         self._repository_with_simple_worktime_extractor = None
         self._repositories: Dict[WorkTimeExtractorType, TaskRepository] = {}
         self._cache = None
+        self._conversion_executor = None
+        self._parent_title_cache = None
+        self._cache_versioning = None
+        self._jira_changelog_store = None
         self._service = None
         self._hierarchy_service = None
         self._assignee_search_service = None
@@ -59,9 +69,13 @@ class TasksContainer:
 
         cache = self._get_cache()
         if self._has_jira_config():
-            repository = JiraTaskRepository(self._config, worktime_extractor_type, cache)
+            repository = JiraTaskRepository(self._config, worktime_extractor_type, cache,
+                                            self._get_conversion_executor(), self._get_jira_changelog_store(),
+                                            self._get_cache_versioning())
         elif self._has_azure_config():
-            repository = AzureTaskRepository(self._config, worktime_extractor_type, cache)
+            repository = AzureTaskRepository(self._config, worktime_extractor_type, cache,
+                                             self._get_conversion_executor(), self._get_parent_title_cache(),
+                                             self._get_cache_versioning())
         else:
             raise ValueError("Task data source not configured.")
 
@@ -73,6 +87,31 @@ class TasksContainer:
             self._cache = caches['task_search_results']
         return self._cache
 
+    def _get_jira_changelog_store(self) -> JiraChangelogStore:
+        if self._jira_changelog_store is None:
+            self._jira_changelog_store = JiraChangelogStore(caches['jira_changelogs'])
+        return self._jira_changelog_store
+
+    def _get_parent_title_cache(self) -> ParentTitleCache:
+        if self._parent_title_cache is None:
+            self._parent_title_cache = ParentTitleCache(caches['parent_titles'])
+        return self._parent_title_cache
+
+    def _get_cache_versioning(self) -> TaskCacheVersioning:
+        if self._cache_versioning is None:
+            self._cache_versioning = TaskCacheVersioning(VersionStamps(caches['version_stamps']), self._config)
+        return self._cache_versioning
+
+    def _get_conversion_executor(self) -> Optional[Executor]:
+        if self._conversion_executor is None:
+            conversion_config = self._config.conversion
+            if conversion_config.executor_type == 'thread':
+                self._conversion_executor = ThreadPoolExecutor(max_workers=conversion_config.max_workers,
+                                                               thread_name_prefix="task-conversion")
+            elif conversion_config.executor_type == 'process':
+                self._conversion_executor = ProcessPoolExecutor(max_workers=conversion_config.max_workers)
+        return self._conversion_executor
+
     def _get_task_search_service(self) -> TaskSearchService:
         if self._service is None:
             self._service = TaskSearchService(
@@ -110,11 +149,17 @@ class TasksContainer:
             if self._has_jira_config():
                 self._repository_with_simple_worktime_extractor = JiraTaskRepository(self._config,
                                                                                      WorkTimeExtractorType.SIMPLE,
-                                                                                     cache)
+                                                                                     cache,
+                                                                                     self._get_conversion_executor(),
+                                                                                     self._get_jira_changelog_store(),
+                                                                                     self._get_cache_versioning())
             elif self._has_azure_config():
                 self._repository_with_simple_worktime_extractor = AzureTaskRepository(self._config,
                                                                                       WorkTimeExtractorType.SIMPLE,
-                                                                                      cache)
+                                                                                      cache,
+                                                                                      self._get_conversion_executor(),
+                                                                                      self._get_parent_title_cache(),
+                                                                                      self._get_cache_versioning())
             else:
                 raise ValueError("Task data source not configured.")
         return self._repository_with_simple_worktime_extractor
@@ -177,6 +222,9 @@ class TasksContainer:
     def get_member_group_config(self):
         return self._config.member_group
 
+    def get_project_keys(self) -> List[str]:
+        return list(self._config.project.project_keys)
+
     def get_workflow_config(self):
         return self._config.workflow
 
@@ -0,0 +1,136 @@
+from collections import defaultdict
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterable, List, Optional
+
+from azure.devops.v7_1.work_item_tracking.models import (
+    ReportingWorkItemRevisionsFilter, WorkItemFieldUpdate, WorkItemUpdate
+)
+
+from .convertors.task_conversion_utils import TaskConversionUtils
+
+
+class AzureRevisionHistoryFetcher:
+    REVISION_FIELDS = [
+        'System.State',
+        'System.AssignedTo',
+        'System.ChangedDate',
+        'System.ChangedBy',
+        'Microsoft.VSTS.Common.StateChangeDate'
+    ]
+    PER_REVISION_FIELDS = {'System.ChangedDate', 'System.ChangedBy'}
+    START_DATE_MARGIN = timedelta(days=1)
+
+    def __init__(self, azure_client, max_span_days: int = 180, max_scanned_per_item: int = 100):
+        self.azure_client = azure_client
+        self.max_span = timedelta(days=max_span_days)
+        self.max_scanned_per_item = max_scanned_per_item
+
+    def fetch_updates(self, work_items: Iterable[Any]) -> Dict[int, List[WorkItemUpdate]]:
+        work_items_by_project: Dict[Optional[str], List[Any]] = defaultdict(list)
+        oldest_streamed_date = datetime.now(timezone.utc) - self.max_span
+        for work_item in work_items:
+            created_date = self._created_date(work_item)
+            # Long-lived items would pull the project's whole revision history, they are left to per-item updates
+            if created_date is not None and created_date >= oldest_streamed_date:
+                work_items_by_project[work_item.fields.get('System.TeamProject')].append(work_item)
+
+        updates_by_id: Dict[int, List[WorkItemUpdate]] = {}
+        for project, project_work_items in work_items_by_project.items():
+            wanted_ids = {work_item.id for work_item in project_work_items}
+            revisions_by_id = self._stream_revisions(project, wanted_ids, self._work_item_types(project_work_items),
+                                                     self._earliest_created_date(project_work_items))
+            if revisions_by_id is None:
+                continue
+            for work_item_id in wanted_ids:
+                updates_by_id[work_item_id] = self._revisions_to_updates(revisions_by_id.get(work_item_id, []))
+        return updates_by_id
+
+    def _stream_revisions(self, project: Optional[str], wanted_ids: set, work_item_types: Optional[List[str]],
+                          start_date_time: datetime) -> Optional[Dict[int, List[dict]]]:
+        revisions_filter = ReportingWorkItemRevisionsFilter(
+            fields=self.REVISION_FIELDS,
+            include_identity_ref=True,
+            include_latest_only=False,
+            types=work_item_types
+        )
+        revisions_by_id: Dict[int, List[dict]] = defaultdict(list)
+        scanned_budget = self.max_scanned_per_item * len(wanted_ids)
+        scanned = 0
+        continuation_token = None
+        while True:
+            batch = self.azure_client.read_reporting_revisions_post(
+                revisions_filter,
+                project=project,
+                continuation_token=continuation_token,
+                start_date_time=start_date_time if continuation_token is None else None
+            )
+            revisions = self._batch_attribute(batch, 'values', 'values') or []
+            scanned += len(revisions)
+            if scanned > scanned_budget:
+                # Unrelated items dominate the stream, per-item updates are cheaper from here on
+                return None
+            for revision in revisions:
+                if revision.get('id') in wanted_ids:
+                    revisions_by_id[revision['id']].append(revision)
+
+            next_token = self._batch_attribute(batch, 'continuation_token', 'continuationToken')
+            if self._batch_attribute(batch, 'is_last_batch', 'isLastBatch') or not next_token \
+                    or next_token == continuation_token:
+                return revisions_by_id
+            continuation_token = next_token
+
+    def _revisions_to_updates(self, revisions: List[dict]) -> List[WorkItemUpdate]:
+        updates = []
+        previous_fields: Dict[str, Any] = {}
+        for revision in sorted(revisions, key=lambda item: item.get('rev', 0)):
+            current_fields = revision.get('fields') or {}
+            changed_fields = {}
+            for field_name in self.REVISION_FIELDS:
+                old_value = previous_fields.get(field_name)
+                new_value = current_fields.get(field_name)
+                changed = self._comparable(old_value) != self._comparable(new_value)
+                if changed or field_name in self.PER_REVISION_FIELDS:
+                    changed_fields[field_name] = WorkItemFieldUpdate(new_value=new_value, old_value=old_value)
+            updates.append(WorkItemUpdate(
+                id=revision.get('rev'),
+                rev=revision.get('rev'),
+                fields=changed_fields,
+                work_item_id=revision.get('id')
+            ))
+            previous_fields = current_fields
+        return updates
+
+    def _earliest_created_date(self, work_items: List[Any]) -> datetime:
+        return min(self._created_date(work_item) for work_item in work_items) - self.START_DATE_MARGIN
+
+    @staticmethod
+    def _created_date(work_item) -> Optional[datetime]:
+        created_date = work_item.fields.get('System.CreatedDate')
+        if created_date is None:
+            return None
+        created_date = TaskConversionUtils.parse_date(created_date)
+        if created_date.tzinfo is None:
+            return created_date.replace(tzinfo=timezone.utc)
+        return created_date
+
+    @staticmethod
+    def _work_item_types(work_items: List[Any]) -> Optional[List[str]]:
+        work_item_types = {work_item.fields.get('System.WorkItemType') for work_item in work_items}
+        if None in work_item_types:
+            return None
+        return sorted(work_item_types)
+
+    @staticmethod
+    def _comparable(value):
+        if isinstance(value, dict):
+            return value.get('id') or value.get('uniqueName') or value.get('displayName')
+        return value
+
+    @staticmethod
+    def _batch_attribute(batch, attribute: str, wire_key: str):
+        value = getattr(batch, attribute, None)
+        if value is not None:
+            return value
+        # ReportingWorkItemRevisionsBatch declares no attribute map, so msrest leaves the payload unmapped
+        additional_properties = getattr(batch, 'additional_properties', None) or {}
+        return additional_properties.get(wire_key)
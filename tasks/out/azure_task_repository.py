@@ -1,26 +1,35 @@
-from concurrent.futures import ThreadPoolExecutor
-from typing import Dict, List, Optional
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import AsyncIterator, Dict, List, Optional
 
 from azure.devops.connection import Connection
 from msrest.authentication import BasicAuthentication
 from sd_metrics_lib.sources.azure.query import AzureSearchQueryBuilder
 from sd_metrics_lib.sources.azure.tasks import AzureTaskProvider
-from sd_metrics_lib.sources.azure.worklog import AzureStatusChangeWorklogExtractor
 from sd_metrics_lib.sources.story_points import FunctionStoryPointExtractor
 from sd_metrics_lib.sources.tasks import CachingTaskProvider
-from sd_metrics_lib.utils.worktime import WorkTimeExtractor, SIMPLE_WORKTIME_EXTRACTOR, BoundarySimpleWorkTimeExtractor
+from sd_metrics_lib.utils.worktime import WorkTimeExtractor
 
+from .azure_revision_history import AzureRevisionHistoryFetcher
+from .batched_worklog_extractors import BatchedAzureStatusChangeWorklogExtractor
+from .chunked_task_conversion import ChunkedTaskConversion
 from .convertors.azure import AzureTaskConverter
+from .paged_task_providers import PagedAzureTaskProvider, iterate_pages
+from .parent_title_cache import ParentTitleCache
 from .story_point_extractors import extract_azure_story_points
+from .version_stamped_cache import TaskCacheVersioning
+from .working_time_calculator import WorkingTimeCalculator, BusinessCalendar
 from ..app.domain.model.config import TasksConfig
 from ..app.domain.model.task import TaskSearchCriteria, Task, EnrichmentOptions, WorkTimeExtractorType
 from ..app.spi.task_repository import TaskRepository
 
 
 class AzureTaskRepository(TaskRepository):
+    PARENT_LEVEL_WORK_ITEM_TYPES = frozenset({'Epic', 'Feature'})
 
     def __init__(self, config: TasksConfig, worktime_extractor_type: Optional[WorkTimeExtractorType] = None,
-                 cache=None):
+                 cache=None, conversion_executor: Optional[Executor] = None,
+                 parent_title_cache: Optional[ParentTitleCache] = None,
+                 cache_versioning: Optional[TaskCacheVersioning] = None):
         azure_config = config.azure
         if not all([azure_config.azure_organization_url, azure_config.azure_pat]):
             raise ValueError("Missing Azure authentication configuration")
@@ -36,18 +45,39 @@ class AzureTaskRepository(TaskRepository):
         self.worktime_extractor_type = worktime_extractor_type or WorkTimeExtractorType.SIMPLE
         self._executor = ThreadPoolExecutor(max_workers=100, thread_name_prefix="azure-fetch")
         self._cache = cache
+        self._parent_title_cache = parent_title_cache
+        self._cache_versioning = cache_versioning
         self._story_point_extractor = FunctionStoryPointExtractor(extract_azure_story_points(config))
+        self._conversion = ChunkedTaskConversion(conversion_executor,
+                                                 config.conversion.chunk_size,
+                                                 config.conversion.min_parallel_tasks)
+        self._working_time_calculator = WorkingTimeCalculator(
+            BusinessCalendar(config.working_calendar.working_days_per_week, config.working_calendar.holidays)
+        )
 
     async def find_all(self, search_criteria: Optional[TaskSearchCriteria] = None,
                        enrichment: Optional[EnrichmentOptions] = None) -> List[Task]:
         include_time_tracking = enrichment.include_time_tracking if enrichment else True
         query = self._build_search_query(search_criteria)
-        azure_tasks = await self._fetch_azure_tasks(query, include_time_tracking)
+        azure_tasks = await self._fetch_azure_tasks(query, include_time_tracking, self._cache_for(search_criteria))
+        self._remember_parent_level_titles(azure_tasks)
         converter = self._create_converter_for_criteria(search_criteria, enrichment)
-        tasks = [converter.convert_to_task(azure_task) for azure_task in azure_tasks]
+        tasks = await self._conversion.convert_all(converter, azure_tasks)
         self._enrich_parent_titles(tasks)
         return tasks
 
+    async def stream_all(self, search_criteria: Optional[TaskSearchCriteria] = None,
+                         enrichment: Optional[EnrichmentOptions] = None) -> AsyncIterator[List[Task]]:
+        include_time_tracking = enrichment.include_time_tracking if enrichment else True
+        query = self._build_search_query(search_criteria)
+        converter = self._create_converter_for_criteria(search_criteria, enrichment)
+        provider = self._create_task_provider(query, include_time_tracking, self._cache_for(search_criteria))
+        async for azure_tasks in iterate_pages(provider.iter_pages()):
+            self._remember_parent_level_titles(azure_tasks)
+            tasks = await self._conversion.convert_all(converter, azure_tasks)
+            self._enrich_parent_titles(tasks)
+            yield tasks
+
     def _build_search_query(self, search_criteria: Optional[TaskSearchCriteria]) -> str:
         if search_criteria is None:
             return AzureSearchQueryBuilder(projects=self.project_keys).build_query()
@@ -91,7 +121,17 @@ class AzureTaskRepository(TaskRepository):
             parts.append(f"[Microsoft.VSTS.Common.StateChangeDate] <= '{end_date.strftime('%Y-%m-%d')}'")
         return ' AND '.join(parts)
 
-    async def _fetch_azure_tasks(self, query: str, include_time_tracking: bool = True):
+    async def _fetch_azure_tasks(self, query: str, include_time_tracking: bool = True, cache=None):
+        base_provider = self._create_task_provider(query, include_time_tracking, cache)
+        cached_provider = CachingTaskProvider(base_provider, cache)
+        return cached_provider.get_tasks()
+
+    def _cache_for(self, search_criteria: Optional[TaskSearchCriteria]):
+        if self._cache is None or self._cache_versioning is None:
+            return self._cache
+        return self._cache_versioning.scoped(self._cache, search_criteria)
+
+    def _create_task_provider(self, query: str, include_time_tracking: bool, cache=None) -> PagedAzureTaskProvider:
         azure_client = self.connection.clients.get_work_item_tracking_client()
 
         additional_fields = list(AzureTaskProvider.DEFAULT_FIELDS)
@@ -108,16 +148,23 @@ class AzureTaskRepository(TaskRepository):
             additional_fields.append(self.config.azure.iteration_field)
         additional_fields.extend(self.config.sorting.custom_sort_field_names())
 
-        base_provider = AzureTaskProvider(
+        return PagedAzureTaskProvider(
             azure_client,
             query,
             additional_fields=additional_fields,
             custom_expand_fields=self._build_custom_expand_fields(include_time_tracking),
             thread_pool_executor=self._executor,
+            cache=cache,
+            revision_history=self._create_revision_history(azure_client),
+            bulk_revisions_min_tasks=self.config.azure.bulk_revisions_min_tasks,
         )
 
-        cached_provider = CachingTaskProvider(base_provider, self._cache)
-        return cached_provider.get_tasks()
+    def _create_revision_history(self, azure_client) -> Optional[AzureRevisionHistoryFetcher]:
+        if self.config.azure.changelog_source != 'revisions':
+            return None
+        return AzureRevisionHistoryFetcher(azure_client,
+                                           max_span_days=self.config.azure.bulk_revisions_max_span_days,
+                                           max_scanned_per_item=self.config.azure.bulk_revisions_max_scanned_per_item)
 
     @staticmethod
     def _build_custom_expand_fields(include_time_tracking: bool) -> List[str]:
@@ -131,7 +178,17 @@ class AzureTaskRepository(TaskRepository):
         if not unresolved_parent_ids:
             return
 
-        parent_titles_by_id = self._fetch_parent_titles(unresolved_parent_ids)
+        parent_titles_by_id = self._collect_fetched_parent_titles(tasks, unresolved_parent_ids)
+        self._remember_parent_titles(parent_titles_by_id)
+        parent_titles_by_id.update(self._lookup_cached_parent_titles(
+            self._missing_parent_ids(unresolved_parent_ids, parent_titles_by_id)))
+
+        missing_parent_ids = self._missing_parent_ids(unresolved_parent_ids, parent_titles_by_id)
+        if missing_parent_ids:
+            fetched_titles_by_id = self._fetch_parent_titles(missing_parent_ids)
+            self._remember_parent_titles(fetched_titles_by_id)
+            parent_titles_by_id.update(fetched_titles_by_id)
+
         for task in tasks:
             if task.parent and not task.parent.title:
                 resolved_title = parent_titles_by_id.get(task.parent.id)
@@ -150,13 +207,50 @@ class AzureTaskRepository(TaskRepository):
                 continue
         return list(unique_parent_ids)
 
+    @staticmethod
+    def _collect_fetched_parent_titles(tasks: List[Task], parent_ids: List[int]) -> Dict[str, str]:
+        wanted_ids = {str(parent_id) for parent_id in parent_ids}
+        return {task.id: task.title for task in tasks if task.id in wanted_ids and task.title}
+
+    @staticmethod
+    def _missing_parent_ids(parent_ids: List[int], titles_by_id: Dict[str, str]) -> List[int]:
+        return [parent_id for parent_id in parent_ids if str(parent_id) not in titles_by_id]
+
+    def _lookup_cached_parent_titles(self, parent_ids: List[int]) -> Dict[str, str]:
+        if self._parent_title_cache is None or not parent_ids:
+            return {}
+        return self._parent_title_cache.get_many(str(parent_id) for parent_id in parent_ids)
+
+    def _remember_parent_titles(self, titles_by_id: Dict[str, str]) -> None:
+        if self._parent_title_cache is not None:
+            self._parent_title_cache.put_many(titles_by_id)
+
+    def _remember_parent_level_titles(self, azure_tasks) -> None:
+        if self._parent_title_cache is None:
+            return
+        self._parent_title_cache.put_many({
+            str(azure_task.id): azure_task.fields['System.Title']
+            for azure_task in azure_tasks or []
+            if azure_task.fields.get('System.WorkItemType') in self.PARENT_LEVEL_WORK_ITEM_TYPES
+            and azure_task.fields.get('System.Title')
+        })
+
     def _fetch_parent_titles(self, parent_ids: List[int]) -> Dict[str, str]:
         azure_client = self.connection.clients.get_work_item_tracking_client()
-        titles_by_id: Dict[str, str] = {}
         batch_size = 200
-        for batch_start in range(0, len(parent_ids), batch_size):
-            batch = parent_ids[batch_start:batch_start + batch_size]
-            work_items = azure_client.get_work_items(ids=batch, fields=["System.Title"])
+        batches = [parent_ids[batch_start:batch_start + batch_size]
+                   for batch_start in range(0, len(parent_ids), batch_size)]
+
+        def fetch_batch(batch: List[int]):
+            return azure_client.get_work_items(ids=batch, fields=["System.Title"]) or []
+
+        if self._executor is None or len(batches) == 1:
+            batch_results = map(fetch_batch, batches)
+        else:
+            batch_results = self._executor.map(fetch_batch, batches)
+
+        titles_by_id: Dict[str, str] = {}
+        for work_items in batch_results:
             for work_item in work_items:
                 if work_item is None:
                     continue
@@ -173,7 +267,7 @@ class AzureTaskRepository(TaskRepository):
         if enrichment and enrichment.worklog_transition_statuses:
             worklog_statuses = enrichment.worklog_transition_statuses
 
-        worklog_extractor = AzureStatusChangeWorklogExtractor(
+        worklog_extractor = BatchedAzureStatusChangeWorklogExtractor(
             transition_statuses=worklog_statuses,
             use_user_name=True,
             worktime_extractor=worktime_extractor
@@ -186,14 +280,14 @@ class AzureTaskRepository(TaskRepository):
             if criteria:
                 start_date, end_date = criteria.resolved_state_change_date_range() or (None, None)
                 if start_date and end_date:
-                    return BoundarySimpleWorkTimeExtractor(start_date, end_date)
+                    return self._working_time_calculator.with_boundaries(start_date, end_date)
         elif self.worktime_extractor_type == WorkTimeExtractorType.BOUNDARY_FROM_RESOLUTION:
             if criteria and criteria.resolution_date_range:
                 start_date, end_date = criteria.resolution_date_range
                 if start_date and end_date:
-                    return BoundarySimpleWorkTimeExtractor(start_date, end_date)
+                    return self._working_time_calculator.with_boundaries(start_date, end_date)
 
-        return SIMPLE_WORKTIME_EXTRACTOR
+        return self._working_time_calculator
 
     @staticmethod
     def _resolve_transition_statuses(config: TasksConfig) -> List[str]:
@@ -0,0 +1,110 @@
+import math
+import threading
+from datetime import datetime
+from typing import Dict, List, Tuple
+
+from sd_metrics_lib.sources.azure.worklog import AzureStatusChangeWorklogExtractor
+from sd_metrics_lib.sources.jira.worklog import JiraStatusChangeWorklogExtractor
+from sd_metrics_lib.utils.time import Duration, TimeUnit
+
+from .convertors.task_conversion_utils import TaskConversionUtils
+from .working_time_calculator import WorkingTimeCalculator
+
+
+class BatchedWorklogMixin:
+
+    @property
+    def interval_start_time(self):
+        return getattr(self._interval_state(), 'start_time', None)
+
+    @interval_start_time.setter
+    def interval_start_time(self, value):
+        self._interval_state().start_time = value
+
+    @property
+    def interval_end_time(self):
+        return getattr(self._interval_state(), 'end_time', None)
+
+    @interval_end_time.setter
+    def interval_end_time(self, value):
+        self._interval_state().end_time = value
+
+    def get_work_time_per_user(self, task) -> Dict[str, Duration]:
+        state = self._interval_state()
+        state.pending_intervals = []
+        self._clean_interval_times()
+        super().get_work_time_per_user(task)
+        intervals, state.pending_intervals = state.pending_intervals, []
+        return self._sum_intervals_by_user(intervals)
+
+    def _sum_working_time(self, working_time_per_user: Dict[str, Duration], last_assigned_user: str):
+        if self._is_interval_found_for_status_change():
+            self._interval_state().pending_intervals.append(
+                (last_assigned_user, self.interval_start_time, self.interval_end_time)
+            )
+            self._clean_interval_times()
+
+    def _sum_intervals_by_user(self, intervals: List[Tuple[str, datetime, datetime]]) -> Dict[str, Duration]:
+        if not intervals:
+            return {}
+
+        seconds_per_interval = self._working_seconds_per_interval(intervals)
+        seconds_per_user: Dict[str, float] = {}
+        for (assigned_user, _, _), seconds in zip(intervals, seconds_per_interval):
+            if seconds is None or math.isnan(seconds):
+                continue
+            seconds_per_user[assigned_user] = seconds_per_user.get(assigned_user, 0.0) + float(seconds)
+        return {assigned_user: Duration.of(seconds, TimeUnit.SECOND)
+                for assigned_user, seconds in seconds_per_user.items()}
+
+    def _working_seconds_per_interval(self, intervals: List[Tuple[str, datetime, datetime]]):
+        if isinstance(self.worktime_extractor, WorkingTimeCalculator):
+            return self.worktime_extractor.working_seconds_batch([(start, end) for _, start, end in intervals])
+
+        seconds_per_interval = []
+        for _, start, end in intervals:
+            duration = self.worktime_extractor.extract_time_from_period(start, end)
+            seconds_per_interval.append(duration.convert(TimeUnit.SECOND).time_delta if duration is not None else None)
+        return seconds_per_interval
+
+    def _interval_state(self):
+        local_state = self.__dict__.get('_local_state')
+        if local_state is None:
+            local_state = threading.local()
+            self.__dict__['_local_state'] = local_state
+        return local_state
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state.pop('_local_state', None)
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+
+
+class BatchedJiraStatusChangeWorklogExtractor(BatchedWorklogMixin, JiraStatusChangeWorklogExtractor):
+
+    def _extract_change_time(self, changelog_entry):
+        return TaskConversionUtils.parse_date(changelog_entry['created'])
+
+
+class BatchedAzureStatusChangeWorklogExtractor(BatchedWorklogMixin, AzureStatusChangeWorklogExtractor):
+
+    def _extract_change_time(self, changelog_entry):
+        change_time = self._extract_change_time_value(changelog_entry)
+        if isinstance(change_time, datetime):
+            return change_time
+        return TaskConversionUtils.parse_date(change_time)
+
+    @staticmethod
+    def _extract_change_time_value(changelog_entry):
+        fields = changelog_entry.fields
+        if fields:
+            state_change_field = fields.get('Microsoft.VSTS.Common.StateChangeDate')
+            if state_change_field and state_change_field.new_value:
+                return state_change_field.new_value
+            changed_date_field = fields.get('System.ChangedDate')
+            if changed_date_field and changed_date_field.new_value:
+                return changed_date_field.new_value
+        return changelog_entry.revised_date
@@ -0,0 +1,47 @@
+import asyncio
+import copy
+from concurrent.futures import Executor
+from typing import Any, List, Optional, Sequence
+
+from ..app.domain.model.task import Task
+
+
+def convert_task_chunk(converter, raw_tasks: Sequence[Any]) -> List[Task]:
+    chunk_converter = _chunk_converter(converter)
+    return [chunk_converter.convert_to_task(raw_task) for raw_task in raw_tasks]
+
+
+def _chunk_converter(converter):
+    # Status-change worklog extractors keep the open interval on the instance, so chunks must not share one
+    chunk_converter = copy.copy(converter)
+    chunk_converter.worklog_extractor = copy.copy(converter.worklog_extractor)
+    return chunk_converter
+
+
+class ChunkedTaskConversion:
+
+    def __init__(self, executor: Optional[Executor] = None, chunk_size: int = 250, min_parallel_tasks: int = 1000):
+        self._executor = executor
+        self._chunk_size = max(1, chunk_size)
+        self._min_parallel_tasks = min_parallel_tasks
+
+    async def convert_all(self, converter, raw_tasks: Sequence[Any]) -> List[Task]:
+        raw_tasks = list(raw_tasks)
+        if not self._should_parallelize(raw_tasks):
+            return convert_task_chunk(converter, raw_tasks)
+
+        loop = asyncio.get_running_loop()
+        converted_chunks = await asyncio.gather(*[
+            loop.run_in_executor(self._executor, convert_task_chunk, converter, chunk)
+            for chunk in self._split_into_chunks(raw_tasks)
+        ])
+        return [task for chunk in converted_chunks for task in chunk]
+
+    def _should_parallelize(self, raw_tasks: List[Any]) -> bool:
+        if self._executor is None:
+            return False
+        return len(raw_tasks) >= max(self._min_parallel_tasks, self._chunk_size + 1)
+
+    def _split_into_chunks(self, raw_tasks: List[Any]) -> List[List[Any]]:
+        return [raw_tasks[chunk_start:chunk_start + self._chunk_size]
+                for chunk_start in range(0, len(raw_tasks), self._chunk_size)]
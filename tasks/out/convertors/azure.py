@@ -5,8 +5,9 @@ from sd_metrics_lib.sources.azure.tasks import AzureTaskProvider
 from sd_metrics_lib.utils.time import Duration
 
 from tasks.app.domain.model.config import TasksConfig
-from tasks.app.domain.model.task import Task, Assignee, Assignment, TimeTracking, SystemMetadata, MemberGroup, Release
+from tasks.app.domain.model.task import Task, Assignee, Assignment, TimeTracking
 from tasks.out.convertors.task_conversion_utils import TaskConversionUtils
+from tasks.out.convertors.task_object_interner import TaskObjectInterner
 
 logger = logging.getLogger(__name__)
 
@@ -14,11 +15,12 @@ logger = logging.getLogger(__name__)
 class AzureTaskConverter:
 
     def __init__(self, config: TasksConfig, worklog_extractor, story_point_extractor,
-                 include_time_tracking: bool = True):
+                 include_time_tracking: bool = True, interner: Optional[TaskObjectInterner] = None):
         self.config = config
         self.worklog_extractor = worklog_extractor
         self.story_point_extractor = story_point_extractor
         self.include_time_tracking = include_time_tracking
+        self.interner = interner or TaskObjectInterner()
 
     def convert_to_task(self, azure_task) -> Task:
         task = self._create_basic_task(azure_task)
@@ -48,7 +50,8 @@ class AzureTaskConverter:
             story_points=story_points,
             priority=priority,
             child_tasks_count=child_tasks_count,
-            system_metadata=SystemMetadata(original_status="", project_key="", url=""),
+            resolved_at=TaskConversionUtils.parse_date(azure_task.fields.get("Microsoft.VSTS.Common.ClosedDate")),
+            system_metadata=self.interner.system_metadata(original_status="", project_key="", url=""),
             assignment=Assignment(assignee=None, member_group=None),
             time_tracking=TimeTracking(total_spent_time=Duration.zero(), spent_time_by_assignee={}, current_assignee_spent_time=None)
         )
@@ -57,7 +60,7 @@ class AzureTaskConverter:
         assignee = self._extract_assignee_from_azure_fields(azure_task)
         member_group_name = TaskConversionUtils.determine_member_group_name(assignee, self.config)
         member_group_id = TaskConversionUtils.create_member_group_id(member_group_name)
-        member_group = MemberGroup(id=member_group_id, name=member_group_name)
+        member_group = self.interner.member_group(member_group_id, member_group_name)
 
         task.assignment = Assignment(assignee=assignee, member_group=member_group)
 
@@ -79,7 +82,7 @@ class AzureTaskConverter:
         azure_status = azure_task.fields.get("System.State", "")
         project_name = azure_task.fields.get("System.TeamProject") or ""
 
-        task.system_metadata = SystemMetadata(
+        task.system_metadata = self.interner.system_metadata(
             original_status=azure_status,
             project_key=project_name,
             url=self._build_work_item_url(azure_task.id, project_name)
@@ -104,7 +107,7 @@ class AzureTaskConverter:
             for segment in self._split_release_segments(text):
                 name = segment.split('\\')[-1] if '\\' in segment else segment
                 if name:
-                    releases.append(Release(id=segment, name=name))
+                    releases.append(self.interner.release(segment, name))
         if releases:
             task.releases = releases
 
@@ -139,26 +142,20 @@ class AzureTaskConverter:
         project_name = azure_task.fields.get("System.TeamProject") or ""
         parent_id = str(parent_id_value)
 
-        task.parent = Task(
-            id=parent_id,
+        task.parent = self.interner.parent(
+            parent_id=parent_id,
             title='',
-            system_metadata=SystemMetadata(
-                original_status='',
-                project_key=project_name,
-                url=self._build_work_item_url(parent_id, project_name)
-            ),
-            assignment=Assignment(assignee=None, member_group=None),
-            time_tracking=TimeTracking()
+            project_key=project_name,
+            url=self._build_work_item_url(parent_id, project_name)
         )
 
-    @staticmethod
-    def _extract_assignee_from_azure_fields(azure_task) -> Optional[Assignee]:
+    def _extract_assignee_from_azure_fields(self, azure_task) -> Optional[Assignee]:
         assigned_to = azure_task.fields.get("System.AssignedTo")
         if not assigned_to:
             return None
 
-        return Assignee(
-            id=assigned_to.get("displayName", ""),
+        return self.interner.assignee(
+            assignee_id=assigned_to.get("displayName", ""),
             display_name=assigned_to.get("displayName", ""),
             avatar_url=assigned_to.get("imageUrl"),
         )
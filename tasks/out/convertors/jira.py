@@ -4,8 +4,9 @@ from typing import Optional, Dict, List
 from sd_metrics_lib.utils.time import Duration
 
 from tasks.app.domain.model.config import TasksConfig
-from tasks.app.domain.model.task import Task, Assignee, Assignment, TimeTracking, SystemMetadata, MemberGroup, Release
+from tasks.app.domain.model.task import Task, Assignee, Assignment, TimeTracking, Release
 from tasks.out.convertors.task_conversion_utils import TaskConversionUtils
+from tasks.out.convertors.task_object_interner import TaskObjectInterner
 
 logger = logging.getLogger(__name__)
 
@@ -13,11 +14,12 @@ logger = logging.getLogger(__name__)
 class JiraTaskConverter:
 
     def __init__(self, config: TasksConfig, worklog_extractor, story_point_extractor,
-                 include_time_tracking: bool = True):
+                 include_time_tracking: bool = True, interner: Optional[TaskObjectInterner] = None):
         self.config = config
         self.worklog_extractor = worklog_extractor
         self.story_point_extractor = story_point_extractor
         self.include_time_tracking = include_time_tracking
+        self.interner = interner or TaskObjectInterner()
 
     def convert_to_task(self, jira_task: dict) -> Task:
         task = self._create_basic_task(jira_task)
@@ -48,7 +50,8 @@ class JiraTaskConverter:
             story_points=story_points,
             priority=priority,
             child_tasks_count=child_tasks_count,
-            system_metadata=SystemMetadata(original_status="", project_key="", url=""),
+            resolved_at=TaskConversionUtils.parse_date(task_fields.get('resolutiondate')),
+            system_metadata=self.interner.system_metadata(original_status="", project_key="", url=""),
             assignment=Assignment(assignee=None, member_group=None),
             time_tracking=TimeTracking(total_spent_time=None, spent_time_by_assignee={}, current_assignee_spent_time=None)
         )
@@ -57,7 +60,7 @@ class JiraTaskConverter:
         assignee = self._extract_assignee_from_jira_fields(jira_task)
         member_group_name = TaskConversionUtils.determine_member_group_name(assignee, self.config)
         member_group_id = TaskConversionUtils.create_member_group_id(member_group_name)
-        member_group = MemberGroup(id=member_group_id, name=member_group_name)
+        member_group = self.interner.member_group(member_group_id, member_group_name)
 
         task.assignment = Assignment(assignee=assignee, member_group=member_group)
 
@@ -80,7 +83,7 @@ class JiraTaskConverter:
         jira_status = task_fields.get('status', {}).get('name', '')
         project_key = jira_task['key'].split('-')[0]
 
-        task.system_metadata = SystemMetadata(
+        task.system_metadata = self.interner.system_metadata(
             original_status=jira_status,
             project_key=project_key,
             url=self._build_browse_url(jira_task['key'])
@@ -98,8 +101,7 @@ class JiraTaskConverter:
         if releases:
             task.releases = releases
 
-    @staticmethod
-    def _coerce_release_value(value) -> List[Release]:
+    def _coerce_release_value(self, value) -> List[Release]:
         if not value:
             return []
         if isinstance(value, list):
@@ -108,22 +110,21 @@ class JiraTaskConverter:
                 if isinstance(item, dict):
                     name = item.get('name', '')
                     if name:
-                        result.append(Release(id=str(item.get('id') or name), name=name))
+                        result.append(self.interner.release(str(item.get('id') or name), name))
                 elif isinstance(item, str):
-                    result.extend(JiraTaskConverter._split_comma_separated_names(item))
+                    result.extend(self._split_comma_separated_names(item))
             return result
         if isinstance(value, dict):
             name = value.get('name', '')
             if not name:
                 return []
-            return [Release(id=str(value.get('id') or name), name=name)]
+            return [self.interner.release(str(value.get('id') or name), name)]
         if isinstance(value, str):
-            return JiraTaskConverter._split_comma_separated_names(value)
+            return self._split_comma_separated_names(value)
         return []
 
-    @staticmethod
-    def _split_comma_separated_names(raw: str) -> List[Release]:
-        return [Release(id=name, name=name) for name in (segment.strip() for segment in raw.split(',')) if name]
+    def _split_comma_separated_names(self, raw: str) -> List[Release]:
+        return [self.interner.release(name, name) for name in (segment.strip() for segment in raw.split(',')) if name]
 
     def _populate_iteration(self, task: Task, jira_task: dict) -> None:
         field = self.config.jira.iteration_field
@@ -177,27 +178,21 @@ class JiraTaskConverter:
         parent_key = parent_data['key']
         parent_title = parent_data.get('fields', {}).get('summary', '')
 
-        task.parent = Task(
-            id=parent_key,
+        task.parent = self.interner.parent(
+            parent_id=parent_key,
             title=parent_title,
-            system_metadata=SystemMetadata(
-                original_status='',
-                project_key=parent_key.split('-')[0],
-                url=self._build_browse_url(parent_key)
-            ),
-            assignment=Assignment(assignee=None, member_group=None),
-            time_tracking=TimeTracking()
+            project_key=parent_key.split('-')[0],
+            url=self._build_browse_url(parent_key)
         )
 
-    @staticmethod
-    def _extract_assignee_from_jira_fields(jira_task: dict) -> Optional[Assignee]:
+    def _extract_assignee_from_jira_fields(self, jira_task: dict) -> Optional[Assignee]:
         task_fields = jira_task['fields']
         if not task_fields.get('assignee'):
             return None
 
         assignee_data = task_fields['assignee']
-        return Assignee(
-            id=assignee_data.get('displayName', ''),
+        return self.interner.assignee(
+            assignee_id=assignee_data.get('displayName', ''),
             display_name=assignee_data.get('displayName', ''),
             avatar_url=assignee_data.get('avatarUrls', {}).get('32x32')
         )
@@ -25,6 +25,12 @@ class TaskConversionUtils:
     def parse_date(date_str) -> Optional[datetime]:
         if not date_str:
             return None
+        if isinstance(date_str, datetime):
+            return date_str
+        try:
+            return datetime.fromisoformat(date_str)
+        except (ValueError, TypeError):
+            pass
         try:
             return parser.parse(date_str)
         except (ValueError, TypeError):
@@ -0,0 +1,49 @@
+from typing import Callable, Dict, Hashable, Optional, TypeVar
+
+from tasks.app.domain.model.task import Task, Assignee, Assignment, TimeTracking, SystemMetadata, MemberGroup, Release
+
+T = TypeVar('T')
+
+
+class TaskObjectInterner:
+
+    def __init__(self):
+        self._assignees: Dict[Hashable, Assignee] = {}
+        self._member_groups: Dict[Hashable, MemberGroup] = {}
+        self._releases: Dict[Hashable, Release] = {}
+        self._system_metadata: Dict[Hashable, SystemMetadata] = {}
+        self._parents: Dict[Hashable, Task] = {}
+
+    def assignee(self, assignee_id: str, display_name: str, avatar_url: Optional[str] = None) -> Assignee:
+        return self._intern(self._assignees, (assignee_id, display_name, avatar_url),
+                            lambda: Assignee(id=assignee_id, display_name=display_name, avatar_url=avatar_url))
+
+    def member_group(self, member_group_id: str, name: str) -> MemberGroup:
+        return self._intern(self._member_groups, (member_group_id, name),
+                            lambda: MemberGroup(id=member_group_id, name=name))
+
+    def release(self, release_id: str, name: str) -> Release:
+        return self._intern(self._releases, (release_id, name),
+                            lambda: Release(id=release_id, name=name))
+
+    def system_metadata(self, original_status: str, project_key: str, url: Optional[str]) -> SystemMetadata:
+        return self._intern(self._system_metadata, (original_status, project_key, url),
+                            lambda: SystemMetadata(original_status=original_status, project_key=project_key, url=url))
+
+    def parent(self, parent_id: str, title: str, project_key: str, url: Optional[str]) -> Task:
+        return self._intern(self._parents, (parent_id, title, project_key, url),
+                            lambda: Task(
+                                id=parent_id,
+                                title=title,
+                                system_metadata=self.system_metadata('', project_key, url),
+                                assignment=Assignment(assignee=None, member_group=None),
+                                time_tracking=TimeTracking()
+                            ))
+
+    @staticmethod
+    def _intern(pool: Dict[Hashable, T], key: Hashable, factory: Callable[[], T]) -> T:
+        interned = pool.get(key)
+        if interned is None:
+            interned = factory()
+            pool[key] = interned
+        return interned
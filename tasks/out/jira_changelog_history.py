@@ -0,0 +1,133 @@
+from concurrent.futures import Executor
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+@dataclass(slots=True)
+class StoredChangelog:
+    updated: Optional[str]
+    histories: List[dict] = field(default_factory=list)
+
+
+class JiraChangelogStore:
+    KEY_PREFIX = "jira-changelog||"
+
+    def __init__(self, cache):
+        self._cache = cache
+
+    def get_many(self, issue_ids: Iterable[str]) -> Dict[str, StoredChangelog]:
+        keys_by_id = {issue_id: self._key(issue_id) for issue_id in issue_ids}
+        cached = self._cache.get_many(list(keys_by_id.values()))
+        return {issue_id: cached[key] for issue_id, key in keys_by_id.items() if key in cached}
+
+    def put_many(self, changelogs_by_id: Dict[str, StoredChangelog]) -> None:
+        if changelogs_by_id:
+            self._cache.set_many({self._key(issue_id): changelog for issue_id, changelog in changelogs_by_id.items()})
+
+    def _key(self, issue_id: str) -> str:
+        return f"{self.KEY_PREFIX}{issue_id}"
+
+
+class JiraChangelogFetcher:
+    BULK_ISSUES_PER_REQUEST = 1000
+    CHANGELOG_PAGE_SIZE = 100
+
+    def __init__(self, jira_client, store: JiraChangelogStore, thread_pool_executor: Optional[Executor] = None):
+        self.jira_client = jira_client
+        self.store = store
+        self.thread_pool_executor = thread_pool_executor
+
+    def attach_changelogs(self, issues: List[dict]) -> None:
+        if not issues:
+            return
+
+        stored_by_id = self.store.get_many(issue['id'] for issue in issues)
+        changelogs_by_id: Dict[str, StoredChangelog] = {}
+        outdated: List[Tuple[dict, StoredChangelog]] = []
+        unknown: List[dict] = []
+        for issue in issues:
+            stored = stored_by_id.get(issue['id'])
+            if stored is None:
+                unknown.append(issue)
+            elif stored.updated is not None and stored.updated == self._updated(issue):
+                changelogs_by_id[issue['id']] = stored
+            else:
+                outdated.append((issue, stored))
+
+        fetched_by_id: Dict[str, StoredChangelog] = {}
+        if unknown:
+            fetched_by_id.update(self._fetch_full_changelogs(unknown))
+        if outdated:
+            for issue, changelog in zip((issue for issue, _ in outdated),
+                                        self._map(lambda item: self._append_new_histories(*item), outdated)):
+                fetched_by_id[issue['id']] = changelog
+        self.store.put_many(fetched_by_id)
+        changelogs_by_id.update(fetched_by_id)
+
+        for issue in issues:
+            histories = list(changelogs_by_id[issue['id']].histories)
+            issue['changelog'] = {'startAt': 0, 'maxResults': len(histories), 'total': len(histories),
+                                  'histories': histories}
+
+    def _fetch_full_changelogs(self, issues: List[dict]) -> Dict[str, StoredChangelog]:
+        issue_chunks = [issues[chunk_start:chunk_start + self.BULK_ISSUES_PER_REQUEST]
+                        for chunk_start in range(0, len(issues), self.BULK_ISSUES_PER_REQUEST)]
+        changelogs_by_id: Dict[str, StoredChangelog] = {}
+        for issue_chunk, histories_by_id in zip(issue_chunks, self._map(self._fetch_bulk_histories, issue_chunks)):
+            for issue in issue_chunk:
+                histories = histories_by_id.get(issue['id'], [])
+                changelogs_by_id[issue['id']] = StoredChangelog(self._updated(issue), self._newest_first(histories))
+        return changelogs_by_id
+
+    def _fetch_bulk_histories(self, issues: List[dict]) -> Dict[str, List[dict]]:
+        histories_by_id: Dict[str, List[dict]] = {issue['id']: [] for issue in issues}
+        next_page_token = None
+        while True:
+            result = self.jira_client.get_changelogs_bulk([issue['id'] for issue in issues],
+                                                          next_page_token=next_page_token) or {}
+            for issue_changelog in result.get('issueChangeLogs', []):
+                histories = histories_by_id.setdefault(str(issue_changelog.get('issueId')), [])
+                histories.extend(self._normalize_history(history)
+                                 for history in issue_changelog.get('changeHistories', []))
+            next_page_token = result.get('nextPageToken')
+            if not next_page_token:
+                return histories_by_id
+
+    def _append_new_histories(self, issue: dict, stored: StoredChangelog) -> StoredChangelog:
+        new_histories = []
+        start_at = len(stored.histories)
+        while True:
+            result = self.jira_client.get_issue_changelog(issue['key'], start=start_at,
+                                                          limit=self.CHANGELOG_PAGE_SIZE) or {}
+            page = result.get('values', [])
+            new_histories.extend(self._normalize_history(history) for history in page)
+            start_at += len(page)
+            if not page or result.get('isLast', True):
+                break
+
+        known_history_ids = {history.get('id') for history in stored.histories}
+        new_histories = [history for history in new_histories if history.get('id') not in known_history_ids]
+        return StoredChangelog(self._updated(issue), self._newest_first(stored.histories + new_histories))
+
+    def _map(self, function, items: list) -> list:
+        if self.thread_pool_executor is None or len(items) == 1:
+            return [function(item) for item in items]
+        return list(self.thread_pool_executor.map(function, items))
+
+    @staticmethod
+    def _updated(issue: dict) -> Optional[str]:
+        return issue.get('fields', {}).get('updated')
+
+    @staticmethod
+    def _newest_first(histories: List[dict]) -> List[dict]:
+        return sorted(histories, key=lambda history: int(history.get('id') or 0), reverse=True)
+
+    @staticmethod
+    def _normalize_history(history: dict) -> dict:
+        created = history.get('created')
+        if isinstance(created, (int, float)):
+            seconds = created / 1000 if created > 10 ** 11 else created
+            created_at = datetime.fromtimestamp(seconds, tz=timezone.utc)
+            history = {**history, 'created': created_at.strftime('%Y-%m-%dT%H:%M:%S.%f')[:-3] + '+0000'}
+        return history
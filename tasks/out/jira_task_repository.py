@@ -1,15 +1,20 @@
-from typing import List, Optional
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import AsyncIterator, List, Optional
 
 from atlassian import Jira
 from sd_metrics_lib.sources.jira.query import JiraSearchQueryBuilder
-from sd_metrics_lib.sources.jira.tasks import JiraTaskProvider
-from sd_metrics_lib.sources.jira.worklog import JiraStatusChangeWorklogExtractor
 from sd_metrics_lib.sources.story_points import FunctionStoryPointExtractor
 from sd_metrics_lib.sources.tasks import CachingTaskProvider
-from sd_metrics_lib.utils.worktime import WorkTimeExtractor, SIMPLE_WORKTIME_EXTRACTOR, BoundarySimpleWorkTimeExtractor
+from sd_metrics_lib.utils.worktime import WorkTimeExtractor
 
+from .batched_worklog_extractors import BatchedJiraStatusChangeWorklogExtractor
+from .chunked_task_conversion import ChunkedTaskConversion
 from .convertors.jira import JiraTaskConverter
+from .jira_changelog_history import JiraChangelogFetcher, JiraChangelogStore
+from .paged_task_providers import PagedJiraTaskProvider, iterate_pages
 from .story_point_extractors import extract_jira_story_points
+from .version_stamped_cache import TaskCacheVersioning
+from .working_time_calculator import WorkingTimeCalculator, BusinessCalendar
 from ..app.domain.model.config import TasksConfig
 from ..app.domain.model.task import TaskSearchCriteria, Task, EnrichmentOptions, WorkTimeExtractorType
 from ..app.spi.task_repository import TaskRepository
@@ -17,7 +22,9 @@ from ..app.spi.task_repository import TaskRepository
 
 class JiraTaskRepository(TaskRepository):
 
-    def __init__(self, config: TasksConfig, worktime_extractor_type: Optional[WorkTimeExtractorType] = None, cache=None):
+    def __init__(self, config: TasksConfig, worktime_extractor_type: Optional[WorkTimeExtractorType] = None, cache=None,
+                 conversion_executor: Optional[Executor] = None, changelog_store: Optional[JiraChangelogStore] = None,
+                 cache_versioning: Optional[TaskCacheVersioning] = None):
         jira_config = config.jira
         if not all([jira_config.jira_server_url, jira_config.jira_email, jira_config.jira_api_token]):
             raise ValueError("Missing Jira authentication configuration")
@@ -35,18 +42,46 @@ class JiraTaskRepository(TaskRepository):
         self.config = config
         self.worktime_extractor_type = worktime_extractor_type or WorkTimeExtractorType.SIMPLE
         self._cache = cache
+        self._executor = ThreadPoolExecutor(max_workers=jira_config.search_concurrency, thread_name_prefix="jira-fetch")
+        self._changelog_store = changelog_store
+        self._cache_versioning = cache_versioning
 
         self._story_point_extractor = FunctionStoryPointExtractor(extract_jira_story_points(config))
+        self._conversion = ChunkedTaskConversion(conversion_executor,
+                                                 config.conversion.chunk_size,
+                                                 config.conversion.min_parallel_tasks)
+        self._working_time_calculator = WorkingTimeCalculator(
+            BusinessCalendar(config.working_calendar.working_days_per_week, config.working_calendar.holidays)
+        )
 
     async def find_all(self, search_criteria: Optional[TaskSearchCriteria] = None,
                        enrichment: Optional[EnrichmentOptions] = None) -> List[Task]:
         include_time_tracking = enrichment.include_time_tracking if enrichment else True
         query = self._build_search_query(search_criteria)
-        jira_tasks = await self._fetch_jira_tasks(query, include_time_tracking)
+        jira_tasks = await self._fetch_jira_tasks(query, include_time_tracking, self._cache_for(search_criteria))
+        converter = self._create_converter_for_criteria(search_criteria, enrichment)
+        return await self._conversion.convert_all(converter, jira_tasks)
+
+    async def stream_all(self, search_criteria: Optional[TaskSearchCriteria] = None,
+                         enrichment: Optional[EnrichmentOptions] = None) -> AsyncIterator[List[Task]]:
+        include_time_tracking = enrichment.include_time_tracking if enrichment else True
+        query = self._build_search_query(search_criteria)
         converter = self._create_converter_for_criteria(search_criteria, enrichment)
-        return [converter.convert_to_task(jira_task) for jira_task in jira_tasks]
+        provider = self._create_task_provider(query, include_time_tracking)
+        async for jira_tasks in iterate_pages(provider.iter_pages()):
+            yield await self._conversion.convert_all(converter, jira_tasks)
 
-    async def _fetch_jira_tasks(self, query: str, include_time_tracking: bool = True):
+    async def _fetch_jira_tasks(self, query: str, include_time_tracking: bool = True, cache=None):
+        base_provider = self._create_task_provider(query, include_time_tracking)
+        cached_provider = CachingTaskProvider(base_provider, cache)
+        return cached_provider.get_tasks()
+
+    def _cache_for(self, search_criteria: Optional[TaskSearchCriteria]):
+        if self._cache is None or self._cache_versioning is None:
+            return self._cache
+        return self._cache_versioning.scoped(self._cache, search_criteria)
+
+    def _create_task_provider(self, query: str, include_time_tracking: bool) -> PagedJiraTaskProvider:
         additional_fields = ['subtasks']
         if include_time_tracking:
             additional_fields.insert(0, 'changelog')
@@ -56,14 +91,18 @@ class JiraTaskRepository(TaskRepository):
             additional_fields.append(self.config.jira.iteration_field)
         additional_fields.extend(self.config.sorting.custom_sort_field_names())
 
-        base_provider = JiraTaskProvider(
+        return PagedJiraTaskProvider(
             self.jira_client,
             query,
-            additional_fields=additional_fields
+            additional_fields=additional_fields,
+            thread_pool_executor=self._executor,
+            changelog_fetcher=self._create_changelog_fetcher()
         )
 
-        cached_provider = CachingTaskProvider(base_provider, self._cache)
-        return cached_provider.get_tasks()
+    def _create_changelog_fetcher(self) -> Optional[JiraChangelogFetcher]:
+        if self._changelog_store is None:
+            return None
+        return JiraChangelogFetcher(self.jira_client, self._changelog_store, self._executor)
 
     def _build_search_query(self, search_criteria: Optional[TaskSearchCriteria]) -> str:
         if search_criteria is None:
@@ -105,7 +144,7 @@ class JiraTaskRepository(TaskRepository):
         if enrichment and enrichment.worklog_transition_statuses:
             worklog_statuses = enrichment.worklog_transition_statuses
 
-        worklog_extractor = JiraStatusChangeWorklogExtractor(
+        worklog_extractor = BatchedJiraStatusChangeWorklogExtractor(
             transition_statuses=worklog_statuses,
             worktime_extractor=worktime_extractor
         )
@@ -117,15 +156,15 @@ class JiraTaskRepository(TaskRepository):
             if criteria:
                 start_date, end_date = criteria.resolved_state_change_date_range() or (None, None)
                 if start_date and end_date:
-                    return BoundarySimpleWorkTimeExtractor(start_date, end_date)
+                    return self._working_time_calculator.with_boundaries(start_date, end_date)
 
         elif self.worktime_extractor_type == WorkTimeExtractorType.BOUNDARY_FROM_RESOLUTION:
             if criteria and criteria.resolution_date_range:
                 start_date, end_date = criteria.resolution_date_range
                 if start_date and end_date:
-                    return BoundarySimpleWorkTimeExtractor(start_date, end_date)
+                    return self._working_time_calculator.with_boundaries(start_date, end_date)
 
-        return SIMPLE_WORKTIME_EXTRACTOR
+        return self._working_time_calculator
 
     @staticmethod
     def _resolve_transition_statuses(config: TasksConfig) -> List[str]:
@@ -0,0 +1,239 @@
+import asyncio
+from concurrent.futures import Executor
+from datetime import date, timedelta
+from typing import AsyncIterator, Iterator, List, Optional, Set, Tuple
+
+from azure.devops.v7_1.work_item_tracking.models import Wiql
+
+from sd_metrics_lib.sources.azure.tasks import AzureTaskProvider
+from sd_metrics_lib.sources.jira.tasks import JiraTaskProvider
+from sd_metrics_lib.utils.cache import CacheKeyBuilder
+
+from .azure_revision_history import AzureRevisionHistoryFetcher
+from .convertors.task_conversion_utils import TaskConversionUtils
+from .jira_changelog_history import JiraChangelogFetcher
+
+
+class PagedJiraTaskProvider(JiraTaskProvider):
+
+    def __init__(self, *args, thread_pool_executor: Optional[Executor] = None,
+                 id_probe_page_size: int = 5000, changelog_fetcher: Optional[JiraChangelogFetcher] = None,
+                 **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.thread_pool_executor = thread_pool_executor
+        self.id_probe_page_size = max(1, id_probe_page_size)
+        self.changelog_fetcher = None
+        if changelog_fetcher is not None and self.additional_fields and 'changelog' in self.additional_fields:
+            self.changelog_fetcher = changelog_fetcher
+            self._expand_str = self._without_changelog(self._expand_str)
+
+    def iter_pages(self) -> Iterator[list]:
+        next_page_token = None
+        while True:
+            result = self.jira_client.enhanced_jql(
+                self.query,
+                expand=self._expand_str,
+                limit=self.page_size,
+                nextPageToken=next_page_token
+            )
+
+            page = result.get("issues", [])
+            if not page:
+                return
+
+            if self.additional_fields and 'subtasks' in self.additional_fields:
+                self._fetch_child_tasks_and_replace_subtasks_field(page)
+            if self.changelog_fetcher is not None:
+                self.changelog_fetcher.attach_changelogs(page)
+            yield page
+
+            next_page_token = result.get('nextPageToken')
+            if not next_page_token:
+                return
+
+    def _fetch_tasks(self, query: str, expand_str: str):
+        if self.changelog_fetcher is None:
+            return self._fetch_tasks_concurrently(query, expand_str)
+
+        tasks = self._fetch_tasks_concurrently(query, self._without_changelog(expand_str))
+        self.changelog_fetcher.attach_changelogs(tasks)
+        return tasks
+
+    def _fetch_tasks_concurrently(self, query: str, expand_str: str):
+        if self.thread_pool_executor is None:
+            return super()._fetch_tasks(query, expand_str)
+
+        first_result = self.jira_client.enhanced_jql(query, expand=expand_str, limit=self.page_size)
+        first_page = first_result.get("issues", [])
+        if not first_page or not first_result.get('nextPageToken'):
+            return first_page
+
+        fetched_ids = {issue.get('id') for issue in first_page}
+        remaining_ids = [issue_id for issue_id in self._probe_issue_ids(query) if issue_id not in fetched_ids]
+        chunk_size = len(first_page)
+        id_chunks = [remaining_ids[chunk_start:chunk_start + chunk_size]
+                     for chunk_start in range(0, len(remaining_ids), chunk_size)]
+        pages = self.thread_pool_executor.map(lambda id_chunk: self._fetch_tasks_by_issue_ids(id_chunk, expand_str),
+                                              id_chunks)
+
+        tasks = list(first_page)
+        for id_chunk, page in zip(id_chunks, pages):
+            positions = {issue_id: position for position, issue_id in enumerate(id_chunk)}
+            tasks.extend(sorted(page, key=lambda issue: positions.get(issue.get('id'), len(positions))))
+        return tasks
+
+    def _probe_issue_ids(self, query: str) -> List[str]:
+        issue_ids = []
+        next_page_token = None
+        while True:
+            result = self.jira_client.enhanced_jql(query, fields='id', limit=self.id_probe_page_size,
+                                                   nextPageToken=next_page_token)
+            issue_ids.extend(issue['id'] for issue in result.get("issues", []))
+            next_page_token = result.get('nextPageToken')
+            if not next_page_token or not result.get("issues"):
+                return issue_ids
+
+    def _fetch_tasks_by_issue_ids(self, issue_ids: List[str], expand_str: str) -> list:
+        return super()._fetch_tasks("id in (" + ", ".join(issue_ids) + ")", expand_str)
+
+    @staticmethod
+    def _without_changelog(expand_str: Optional[str]) -> Optional[str]:
+        if not expand_str:
+            return expand_str
+        return ",".join(value for value in expand_str.split(",") if value != 'changelog') or None
+
+
+class PagedAzureTaskProvider(AzureTaskProvider):
+
+    def __init__(self, *args, stream_page_size: int = 1000,
+                 revision_history: Optional[AzureRevisionHistoryFetcher] = None,
+                 bulk_revisions_min_tasks: int = 50, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.stream_page_size = max(1, stream_page_size)
+        self.revision_history = revision_history
+        self.bulk_revisions_min_tasks = bulk_revisions_min_tasks
+
+    def iter_pages(self) -> Iterator[list]:
+        task_ids = self._fetch_task_ids_paginated()
+        for batch_start in range(0, len(task_ids), self.stream_page_size):
+            batch_ids = task_ids[batch_start:batch_start + self.stream_page_size]
+            page = self._fetch_tasks(batch_ids, self.custom_expand_fields)
+            if page:
+                yield page
+
+    def _fetch_task_ids_paginated(self) -> List[int]:
+        base_query_no_order = self._remove_custom_order_by(self.query)
+        first_page_ids = self._query_ids(self._add_tasks_pagination_with_stable_order_by(base_query_no_order, 0))
+        if len(first_page_ids) < self.WIQL_RESULT_LIMIT_BEFORE_EXCEPTION_THROWING:
+            return first_page_ids
+
+        earliest_changed_date = self._probe_earliest_changed_date(base_query_no_order)
+        if earliest_changed_date is None:
+            return super()._fetch_task_ids_paginated()
+        date_range = (earliest_changed_date, date.today() + timedelta(days=1))
+        task_ids = self._fetch_task_ids_in_date_slices(base_query_no_order, date_range)
+        task_ids.update(first_page_ids)
+        return sorted(task_ids)
+
+    def _fetch_task_ids_in_date_slices(self, base_query_no_order: str, date_range: Tuple[date, date]) -> Set[int]:
+        task_ids: Set[int] = set()
+        pending_slices = [date_range]
+        while pending_slices:
+            slice_queries = [self._add_changed_date_slice(base_query_no_order, date_slice)
+                             for date_slice in pending_slices]
+            slice_results = self._map_concurrently(
+                lambda slice_query: self._query_ids(self._add_tasks_pagination_with_stable_order_by(slice_query, 0)),
+                slice_queries
+            )
+            overflowing_slices = []
+            for date_slice, slice_query, slice_ids in zip(pending_slices, slice_queries, slice_results):
+                if len(slice_ids) < self.WIQL_RESULT_LIMIT_BEFORE_EXCEPTION_THROWING:
+                    task_ids.update(slice_ids)
+                elif (date_slice[1] - date_slice[0]).days > 1:
+                    overflowing_slices.extend(self._bisect(date_slice))
+                else:
+                    task_ids.update(self._fetch_slice_ids_by_id_pages(slice_query, slice_ids))
+            pending_slices = overflowing_slices
+        return task_ids
+
+    def _fetch_slice_ids_by_id_pages(self, slice_query: str, first_page_ids: List[int]) -> List[int]:
+        slice_ids = list(first_page_ids)
+        page_ids = first_page_ids
+        while len(page_ids) >= self.WIQL_RESULT_LIMIT_BEFORE_EXCEPTION_THROWING:
+            page_ids = self._query_ids(self._add_tasks_pagination_with_stable_order_by(slice_query, page_ids[-1]))
+            slice_ids.extend(page_ids)
+        return slice_ids
+
+    def _probe_earliest_changed_date(self, base_query_no_order: str) -> Optional[date]:
+        earliest_ids = self._query_ids(base_query_no_order + " ORDER BY [System.ChangedDate] ASC", top=1)
+        if not earliest_ids:
+            return None
+        work_items = self.azure_client.get_work_items(ids=earliest_ids, fields=['System.ChangedDate']) or []
+        for work_item in work_items:
+            changed_date = work_item.fields.get('System.ChangedDate') if work_item else None
+            if changed_date:
+                return TaskConversionUtils.parse_date(changed_date).date()
+        return None
+
+    def _query_ids(self, wiql_text: str, top: Optional[int] = None) -> List[int]:
+        query_result = self.azure_client.query_by_wiql(Wiql(query=wiql_text),
+                                                       top=top or self.WIQL_RESULT_LIMIT_BEFORE_EXCEPTION_THROWING)
+        return [ref.id for ref in query_result.work_items or []]
+
+    def _map_concurrently(self, function, items: list) -> list:
+        if self.thread_pool_executor is None or len(items) == 1:
+            return [function(item) for item in items]
+        return list(self.thread_pool_executor.map(function, items))
+
+    @staticmethod
+    def _bisect(date_slice: Tuple[date, date]) -> List[Tuple[date, date]]:
+        start, end = date_slice
+        middle = start + timedelta(days=(end - start).days // 2)
+        return [(start, middle), (middle, end)]
+
+    @staticmethod
+    def _add_changed_date_slice(base_query_no_order: str, date_slice: Tuple[date, date]) -> str:
+        start, end = date_slice
+        date_filter = (f"[System.ChangedDate] >= '{start.strftime('%Y-%m-%d')}'"
+                       f" AND [System.ChangedDate] < '{end.strftime('%Y-%m-%d')}'")
+        if " where " in base_query_no_order.lower():
+            return f"{base_query_no_order} AND {date_filter}"
+        return f"{base_query_no_order} WHERE {date_filter}"
+
+    def _attach_changelog_history(self, tasks: List[object]):
+        if self.revision_history is None:
+            super()._attach_changelog_history(tasks)
+            return
+
+        uncached_tasks = []
+        for task in tasks:
+            cached = self.cache.get(self._changelog_cache_key(task)) if self.cache is not None else None
+            if cached is not None:
+                task.fields[self.WORK_ITEM_UPDATES_CUSTOM_FIELD_NAME] = cached
+            else:
+                uncached_tasks.append(task)
+
+        if len(uncached_tasks) < self.bulk_revisions_min_tasks:
+            super()._attach_changelog_history(uncached_tasks)
+            return
+
+        updates_by_id = self.revision_history.fetch_updates(uncached_tasks)
+        super()._attach_changelog_history([task for task in uncached_tasks if task.id not in updates_by_id])
+        for task in uncached_tasks:
+            if task.id not in updates_by_id:
+                continue
+            updates = updates_by_id[task.id]
+            task.fields[self.WORK_ITEM_UPDATES_CUSTOM_FIELD_NAME] = updates
+            if self.cache is not None:
+                self.cache.set(self._changelog_cache_key(task), updates)
+
+    def _changelog_cache_key(self, task) -> str:
+        return CacheKeyBuilder.create_provider_custom_key(self.__class__, ["updates", str(getattr(task, 'id', None))])
+
+
+async def iterate_pages(pages: Iterator[list]) -> AsyncIterator[List]:
+    while True:
+        page = await asyncio.to_thread(next, pages, None)
+        if page is None:
+            return
+        yield page
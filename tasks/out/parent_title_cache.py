@@ -0,0 +1,20 @@
+from typing import Dict, Iterable
+
+
+class ParentTitleCache:
+    KEY_PREFIX = "parent-title||"
+
+    def __init__(self, cache):
+        self._cache = cache
+
+    def get_many(self, parent_ids: Iterable[str]) -> Dict[str, str]:
+        keys_by_id = {parent_id: self._key(parent_id) for parent_id in parent_ids}
+        cached = self._cache.get_many(list(keys_by_id.values()))
+        return {parent_id: cached[key] for parent_id, key in keys_by_id.items() if key in cached}
+
+    def put_many(self, titles_by_id: Dict[str, str]) -> None:
+        if titles_by_id:
+            self._cache.set_many({self._key(parent_id): title for parent_id, title in titles_by_id.items()})
+
+    def _key(self, parent_id: str) -> str:
+        return f"{self.KEY_PREFIX}{parent_id}"
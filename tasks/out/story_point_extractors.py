@@ -1,3 +1,4 @@
+from functools import partial
 from typing import Optional, Dict, Any, Callable
 
 from tasks.app.domain.model.config import TasksConfig
@@ -18,20 +19,36 @@ def extract_story_points(fields: Dict[str, Any], custom_field_id: Optional[str],
 
 
 def extract_jira_story_points(config: TasksConfig) -> Callable[[dict], float]:
-    return lambda jira_task: extract_story_points(
-        fields=jira_task.get('fields', {}),
+    return partial(
+        _extract_jira_task_story_points,
         custom_field_id=config.jira.story_point_custom_field_id,
-        default_field_id='customfield_10016',
         default_value_when_missing=config.estimation.default_story_points_value_when_missing
     )
 
 
 def extract_azure_story_points(config: TasksConfig) -> Callable[[Any], float]:
-    return lambda azure_task: extract_story_points(
-        fields=azure_task.fields,
+    return partial(
+        _extract_azure_task_story_points,
         custom_field_id=config.jira.story_point_custom_field_id,
-        default_field_id="Microsoft.VSTS.Scheduling.StoryPoints",
         default_value_when_missing=config.estimation.default_story_points_value_when_missing
     )
 
 
+def _extract_jira_task_story_points(jira_task: dict, custom_field_id: Optional[str],
+                                    default_value_when_missing: float) -> float:
+    return extract_story_points(
+        fields=jira_task.get('fields', {}),
+        custom_field_id=custom_field_id,
+        default_field_id='customfield_10016',
+        default_value_when_missing=default_value_when_missing
+    )
+
+
+def _extract_azure_task_story_points(azure_task, custom_field_id: Optional[str],
+                                     default_value_when_missing: float) -> float:
+    return extract_story_points(
+        fields=azure_task.fields,
+        custom_field_id=custom_field_id,
+        default_field_id="Microsoft.VSTS.Scheduling.StoryPoints",
+        default_value_when_missing=default_value_when_missing
+    )
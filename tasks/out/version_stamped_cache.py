@@ -0,0 +1,58 @@
+from typing import Any, Dict, List, Optional
+
+from metrics import version_stamps
+from metrics.version_stamps import VersionStamps
+
+from ..app.domain.model.config import TasksConfig
+from ..app.domain.model.task import TaskSearchCriteria
+
+
+class VersionStampedCache:
+
+    def __init__(self, cache, token: str):
+        self._cache = cache
+        self._prefix = f"{token}||"
+
+    def get(self, key: str) -> Any:
+        return self._cache.get(self._prefix + key)
+
+    def set(self, key: str, value: Any) -> None:
+        self._cache.set(self._prefix + key, value)
+
+
+class TaskCacheVersioning:
+
+    def __init__(self, stamps: VersionStamps, config: TasksConfig):
+        self._stamps = stamps
+        self._config = config
+
+    def scoped(self, cache, criteria: Optional[TaskSearchCriteria]) -> VersionStampedCache:
+        return VersionStampedCache(cache, self._stamps.token(self.dependencies(criteria)))
+
+    def dependencies(self, criteria: Optional[TaskSearchCriteria]) -> Dict[str, List[str]]:
+        if criteria is not None and criteria.id_filter:
+            return {version_stamps.ISSUE: list(criteria.id_filter)}
+
+        assignees = self._filtered_assignees(criteria)
+        if assignees:
+            member_groups = self._member_groups_of(assignees)
+            if member_groups is not None:
+                return {version_stamps.MEMBER_GROUP: member_groups}
+        return {version_stamps.PROJECT: list(self._config.project.project_keys)}
+
+    @staticmethod
+    def _filtered_assignees(criteria: Optional[TaskSearchCriteria]) -> List[str]:
+        if criteria is None:
+            return []
+        return list(criteria.assignee_filter or []) + list(criteria.assignees_history_filter or [])
+
+    def _member_groups_of(self, assignees: List[str]) -> Optional[List[str]]:
+        default_member_group = self._config.member_group.default_member_group_when_missing
+        member_groups = set()
+        for assignee in assignees:
+            member_groups_of_assignee = self._config.get_assignee_member_groups(assignee)
+            if not member_groups_of_assignee and not default_member_group:
+                # Changes to this assignee's tasks bump no member group, so only the project stamp tracks them
+                return None
+            member_groups.update(member_groups_of_assignee or [default_member_group])
+        return sorted(member_groups)
@@ -0,0 +1,196 @@
+import datetime
+from typing import Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+from sd_metrics_lib.utils.time import Duration, TimeUnit, TimePolicy
+from sd_metrics_lib.utils.worktime import WorkTimeExtractor
+
+from .convertors.task_conversion_utils import TaskConversionUtils
+
+SECONDS_IN_DAY = 86400
+SECONDS_IN_HOUR = 3600
+MINIMUM_TRACKABLE_SECONDS = 0.25 * SECONDS_IN_HOUR
+
+
+class BusinessCalendar:
+    INDEX_START = datetime.date(2000, 1, 1)
+    INDEX_END = datetime.date(2040, 1, 1)
+
+    def __init__(self, working_days_per_week: int = 5, holidays: Iterable[datetime.date] = ()):
+        self.working_days_per_week = max(0, min(7, working_days_per_week))
+        self.holidays = sorted(set(holidays))
+        self._busday_calendar = self._create_busday_calendar()
+        self._index_start_ordinal = 0
+        self._cumulative_working_days = np.zeros(1, dtype=np.int32)
+        self._cumulative_working_days_list: List[int] = [0]
+        self._build_index(self.INDEX_START.toordinal(), self.INDEX_END.toordinal())
+
+    def working_days_before(self, ordinal: int) -> int:
+        self._ensure_index_covers(ordinal, ordinal)
+        return self._cumulative_working_days_list[ordinal - self._index_start_ordinal]
+
+    def is_working_day(self, ordinal: int) -> bool:
+        return self.working_days_before(ordinal + 1) - self.working_days_before(ordinal) == 1
+
+    def working_days_before_batch(self, ordinals: np.ndarray) -> np.ndarray:
+        if ordinals.size:
+            self._ensure_index_covers(int(ordinals.min()), int(ordinals.max()) + 1)
+        return self._cumulative_working_days[ordinals - self._index_start_ordinal]
+
+    def _create_busday_calendar(self):
+        if self.working_days_per_week == 0:
+            return None
+        weekmask = [1 if weekday < self.working_days_per_week else 0 for weekday in range(7)]
+        holidays = np.array(self.holidays, dtype='datetime64[D]')
+        return np.busdaycalendar(weekmask=weekmask, holidays=holidays)
+
+    def _ensure_index_covers(self, first_ordinal: int, last_ordinal: int) -> None:
+        index_end_ordinal = self._index_start_ordinal + len(self._cumulative_working_days_list) - 1
+        if first_ordinal >= self._index_start_ordinal and last_ordinal <= index_end_ordinal:
+            return
+        self._build_index(min(first_ordinal, self._index_start_ordinal) - 366,
+                          max(last_ordinal, index_end_ordinal) + 366)
+
+    def _build_index(self, start_ordinal: int, end_ordinal: int) -> None:
+        start_day = np.datetime64(datetime.date.fromordinal(start_ordinal), 'D')
+        days = start_day + np.arange(end_ordinal - start_ordinal)
+        if self._busday_calendar is None:
+            working_day_flags = np.zeros(days.size, dtype=np.int32)
+        else:
+            working_day_flags = np.is_busday(days, busdaycal=self._busday_calendar).astype(np.int32)
+        cumulative = np.zeros(days.size + 1, dtype=np.int32)
+        np.cumsum(working_day_flags, out=cumulative[1:])
+        self._index_start_ordinal = start_ordinal
+        self._cumulative_working_days = cumulative
+        self._cumulative_working_days_list = cumulative.tolist()
+
+
+class WorkingTimeCalculator(WorkTimeExtractor):
+
+    def __init__(self, calendar: Optional[BusinessCalendar] = None,
+                 start_time_boundary: Optional[datetime.datetime] = None,
+                 end_time_boundary: Optional[datetime.datetime] = None):
+        self.calendar = calendar or BusinessCalendar()
+        self.start_time_boundary = start_time_boundary
+        self.end_time_boundary = end_time_boundary
+
+    def with_boundaries(self, start_time_boundary: datetime.datetime,
+                        end_time_boundary: datetime.datetime) -> 'WorkingTimeCalculator':
+        return WorkingTimeCalculator(self.calendar, start_time_boundary, end_time_boundary)
+
+    def extract_time_from_period(self,
+                                 start_time_period: datetime.date | datetime.datetime,
+                                 end_time_period: datetime.date | datetime.datetime,
+                                 time_policy: TimePolicy = TimePolicy.BUSINESS_HOURS,
+                                 result_unit: TimeUnit = TimeUnit.SECOND) -> Duration | None:
+        seconds = self.working_seconds(start_time_period, end_time_period, time_policy)
+        if seconds is None:
+            return None
+        return Duration.of(seconds, TimeUnit.SECOND).convert(result_unit, time_policy)
+
+    def working_seconds(self, start_time_period: datetime.date | datetime.datetime,
+                        end_time_period: datetime.date | datetime.datetime,
+                        time_policy: TimePolicy = TimePolicy.BUSINESS_HOURS) -> Optional[float]:
+        start, end = self._clip_to_boundaries(self._as_datetime(start_time_period), self._as_datetime(end_time_period))
+        if end <= start:
+            return None
+
+        end = self._align_timezone(end, start)
+        elapsed_seconds = (end - start).total_seconds()
+        if elapsed_seconds < MINIMUM_TRACKABLE_SECONDS:
+            return None
+        if time_policy == TimePolicy.ALL_HOURS:
+            return elapsed_seconds
+
+        start_ordinal, start_second_of_day = self._split_day(start)
+        end_ordinal, end_second_of_day = self._split_day(end)
+        weekday_seconds = self._weekday_seconds(start_ordinal, start_second_of_day, end_ordinal, end_second_of_day)
+        return self._ramp_then_plateau_seconds(weekday_seconds, time_policy)
+
+    def working_seconds_batch(self, intervals: Sequence[Tuple[datetime.datetime, datetime.datetime]],
+                              time_policy: TimePolicy = TimePolicy.BUSINESS_HOURS) -> np.ndarray:
+        count = len(intervals)
+        start_ordinals = np.empty(count, dtype=np.int64)
+        end_ordinals = np.empty(count, dtype=np.int64)
+        start_seconds_of_day = np.empty(count, dtype=np.float64)
+        end_seconds_of_day = np.empty(count, dtype=np.float64)
+        elapsed_seconds = np.empty(count, dtype=np.float64)
+        for position, (start_time_period, end_time_period) in enumerate(intervals):
+            start, end = self._clip_to_boundaries(self._as_datetime(start_time_period),
+                                                  self._as_datetime(end_time_period))
+            end = self._align_timezone(end, start)
+            start_ordinals[position], start_seconds_of_day[position] = self._split_day(start)
+            end_ordinals[position], end_seconds_of_day[position] = self._split_day(end)
+            elapsed_seconds[position] = (end - start).total_seconds()
+
+        if time_policy == TimePolicy.ALL_HOURS:
+            result = elapsed_seconds.copy()
+        else:
+            working_days = (self.calendar.working_days_before_batch(end_ordinals)
+                            - self.calendar.working_days_before_batch(start_ordinals))
+            start_is_working_day = (self.calendar.working_days_before_batch(start_ordinals + 1)
+                                    - self.calendar.working_days_before_batch(start_ordinals))
+            end_is_working_day = (self.calendar.working_days_before_batch(end_ordinals + 1)
+                                  - self.calendar.working_days_before_batch(end_ordinals))
+            weekday_seconds = (working_days * SECONDS_IN_DAY
+                               - start_is_working_day * start_seconds_of_day
+                               + end_is_working_day * end_seconds_of_day)
+            full_days = np.floor(weekday_seconds / SECONDS_IN_DAY)
+            partial_hours = (weekday_seconds - full_days * SECONDS_IN_DAY) / SECONDS_IN_HOUR
+            result = (full_days * time_policy.hours_per_day
+                      + np.minimum(partial_hours, time_policy.hours_per_day)) * SECONDS_IN_HOUR
+
+        result[elapsed_seconds < MINIMUM_TRACKABLE_SECONDS] = np.nan
+        return result
+
+    def _weekday_seconds(self, start_ordinal: int, start_second_of_day: float,
+                         end_ordinal: int, end_second_of_day: float) -> float:
+        calendar = self.calendar
+        working_days = calendar.working_days_before(end_ordinal) - calendar.working_days_before(start_ordinal)
+        weekday_seconds = working_days * SECONDS_IN_DAY
+        if calendar.is_working_day(start_ordinal):
+            weekday_seconds -= start_second_of_day
+        if calendar.is_working_day(end_ordinal):
+            weekday_seconds += end_second_of_day
+        return weekday_seconds
+
+    @staticmethod
+    def _ramp_then_plateau_seconds(weekday_seconds: float, time_policy: TimePolicy) -> float:
+        full_days = int(weekday_seconds // SECONDS_IN_DAY)
+        partial_hours = (weekday_seconds - full_days * SECONDS_IN_DAY) / SECONDS_IN_HOUR
+        return (full_days * time_policy.hours_per_day + min(partial_hours, time_policy.hours_per_day)) * SECONDS_IN_HOUR
+
+    def _clip_to_boundaries(self, start: datetime.datetime,
+                            end: datetime.datetime) -> Tuple[datetime.datetime, datetime.datetime]:
+        if self.start_time_boundary is not None:
+            boundary = self._align_timezone(self._as_datetime(self.start_time_boundary), start)
+            if boundary > start:
+                start = boundary
+        if self.end_time_boundary is not None:
+            boundary = self._align_timezone(self._as_datetime(self.end_time_boundary), end)
+            if boundary < end:
+                end = boundary
+        return start, end
+
+    @staticmethod
+    def _split_day(moment: datetime.datetime) -> Tuple[int, float]:
+        second_of_day = moment.hour * SECONDS_IN_HOUR + moment.minute * 60 + moment.second + moment.microsecond / 1e6
+        return moment.toordinal(), second_of_day
+
+    @staticmethod
+    def _align_timezone(moment: datetime.datetime, reference: datetime.datetime) -> datetime.datetime:
+        if moment.tzinfo is None and reference.tzinfo is not None:
+            return moment.replace(tzinfo=reference.tzinfo)
+        if moment.tzinfo is not None and reference.tzinfo is None:
+            return moment.replace(tzinfo=None)
+        if moment.tzinfo is not None and moment.utcoffset() != reference.utcoffset():
+            return moment.astimezone(reference.tzinfo)
+        return moment
+
+    @staticmethod
+    def _as_datetime(moment: datetime.date | datetime.datetime | str) -> datetime.datetime:
+        if isinstance(moment, datetime.datetime):
+            return moment
+        if isinstance(moment, str):
+            return TaskConversionUtils.parse_date(moment)
+        return datetime.datetime.combine(moment, datetime.time.min)
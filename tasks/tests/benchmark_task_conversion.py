@@ -0,0 +1,142 @@
+import asyncio
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from datetime import datetime, timedelta
+
+import django
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'metrics.settings.development')
+django.setup()
+
+from sd_metrics_lib.sources.jira.worklog import JiraStatusChangeWorklogExtractor
+from sd_metrics_lib.sources.story_points import FunctionStoryPointExtractor
+from sd_metrics_lib.utils.worktime import SIMPLE_WORKTIME_EXTRACTOR
+
+from tasks.app.domain.model.config import (
+    TasksConfig, JiraConfig, AzureConfig, ProjectConfig, WorkflowConfig,
+    TaskFilterConfig, MemberGroupConfig, EstimationConfig, SortingConfig
+)
+from tasks.out.chunked_task_conversion import ChunkedTaskConversion
+from tasks.out.convertors.jira import JiraTaskConverter
+from tasks.out.story_point_extractors import extract_jira_story_points
+
+TASK_COUNTS = [100, 250, 500, 1000, 2500, 5000, 10000]
+CHANGELOG_ENTRIES_PER_TASK = 30
+CHUNK_SIZE = 250
+ROUNDS = 3
+
+
+def build_config() -> TasksConfig:
+    return TasksConfig(
+        jira=JiraConfig(jira_server_url="https://example.atlassian.net", jira_email="bench@example.com",
+                        jira_api_token="token", story_point_custom_field_id="customfield_10016"),
+        azure=AzureConfig(azure_organization_url=None, azure_pat=None),
+        project=ProjectConfig(project_keys=["PROJ"], task_tracker="jira"),
+        workflow=WorkflowConfig(
+            stages={"Development": ["In Progress", "Review"], "Validation": ["QA"]},
+            in_progress_status_codes=["In Progress", "Review", "QA"],
+            pending_status_codes=["Blocked"],
+            done_status_codes=["Done"],
+            recently_finished_tasks_days=14
+        ),
+        task_filter=TaskFilterConfig(global_task_types_filter=None, global_team_filter=None),
+        member_group=MemberGroupConfig(members={}, default_member_group_when_missing="Unassigned"),
+        estimation=EstimationConfig(
+            working_days_per_month=22,
+            default_story_points_value_when_missing=3.0,
+            ideal_hours_per_day=4.0,
+            story_points_to_ideal_hours_convertion_ratio=1.0,
+            default_seniority_level_when_missing="middle",
+            default_health_status_when_missing="GREEN"
+        ),
+        sorting=SortingConfig(stage_sort_overrides={}, default_sort_criteria="-health")
+    )
+
+
+def build_converter(config: TasksConfig) -> JiraTaskConverter:
+    worklog_extractor = JiraStatusChangeWorklogExtractor(
+        transition_statuses=["In Progress", "Review", "QA"],
+        worktime_extractor=SIMPLE_WORKTIME_EXTRACTOR
+    )
+    story_point_extractor = FunctionStoryPointExtractor(extract_jira_story_points(config))
+    return JiraTaskConverter(config, worklog_extractor, story_point_extractor)
+
+
+def build_jira_task(index: int) -> dict:
+    statuses = ["To Do", "In Progress", "Review", "QA", "In Progress", "Done"]
+    started_at = datetime(2025, 1, 1, 9) + timedelta(hours=index % 500)
+    histories = []
+    for entry_index in range(CHANGELOG_ENTRIES_PER_TASK):
+        created = (started_at + timedelta(hours=entry_index * 7)).strftime('%Y-%m-%dT%H:%M:%S.000+0000')
+        histories.append({
+            "created": created,
+            "author": {"accountId": f"user-{(index + entry_index) % 7}", "displayName": f"User {(index + entry_index) % 7}"},
+            "items": [
+                {"fieldId": "status", "fromString": statuses[entry_index % 6], "toString": statuses[(entry_index + 1) % 6]},
+                {"fieldId": "assignee", "to": f"user-{entry_index % 5}", "toString": f"User {entry_index % 5}"}
+            ]
+        })
+    histories.reverse()
+    return {
+        "key": f"PROJ-{index}",
+        "fields": {
+            "summary": f"Task {index}",
+            "status": {"name": "Review"},
+            "priority": {"id": str(index % 5 + 1)},
+            "customfield_10016": index % 8,
+            "assignee": {"accountId": f"user-{index % 5}", "displayName": f"User {index % 5}"},
+            "subtasks": []
+        },
+        "changelog": {"histories": histories}
+    }
+
+
+def measure(conversion: ChunkedTaskConversion, converter: JiraTaskConverter, raw_tasks) -> float:
+    timings = []
+    for _ in range(ROUNDS):
+        started = time.perf_counter()
+        asyncio.run(conversion.convert_all(converter, raw_tasks))
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def find_crossover(speedups, min_speedup: float = 1.1):
+    crossover = None
+    for task_count, speedup in reversed(speedups):
+        if speedup < min_speedup:
+            break
+        crossover = task_count
+    return crossover
+
+
+def main():
+    config = build_config()
+    converter = build_converter(config)
+    max_workers = os.cpu_count() or 1
+    serial = ChunkedTaskConversion()
+    with ThreadPoolExecutor(max_workers=max_workers) as thread_executor, \
+            ProcessPoolExecutor(max_workers=max_workers) as process_executor:
+        threaded = ChunkedTaskConversion(thread_executor, CHUNK_SIZE, min_parallel_tasks=0)
+        processed = ChunkedTaskConversion(process_executor, CHUNK_SIZE, min_parallel_tasks=0)
+        asyncio.run(processed.convert_all(converter, [build_jira_task(i) for i in range(CHUNK_SIZE * max_workers)]))
+
+        print(f"workers={max_workers} chunk_size={CHUNK_SIZE} changelog_entries={CHANGELOG_ENTRIES_PER_TASK}")
+        print(f"{'tasks':>7} {'serial':>9} {'thread':>9} {'process':>9}")
+        process_speedups = []
+        for task_count in TASK_COUNTS:
+            raw_tasks = [build_jira_task(i) for i in range(task_count)]
+            serial_seconds = measure(serial, converter, raw_tasks)
+            thread_seconds = measure(threaded, converter, raw_tasks)
+            process_seconds = measure(processed, converter, raw_tasks)
+            print(f"{task_count:>7} {serial_seconds:>9.3f} {thread_seconds:>9.3f} {process_seconds:>9.3f}")
+            process_speedups.append((task_count, serial_seconds / process_seconds))
+
+    crossover = find_crossover(process_speedups)
+    print(f"process pool crossover: {crossover if crossover else 'not reached'}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,4 +1,4 @@
-from typing import List, Optional, Callable, Dict, Any
+from typing import AsyncIterator, List, Optional, Callable, Dict, Any
 from unittest.mock import AsyncMock
 
 from tasks.app.domain.model.task import TaskSearchCriteria, Task, EnrichmentOptions
@@ -24,6 +24,12 @@ class MockTaskRepository(TaskRepository):
             self._call_log.append(search_criteria)
         return await self._mock.find_all(search_criteria, enrichment)
     
+    async def stream_all(self,
+                         search_criteria: Optional[TaskSearchCriteria] = None,
+                         enrichment: Optional[EnrichmentOptions] = None
+                         ) -> AsyncIterator[List[Task]]:
+        yield await self.find_all(search_criteria, enrichment)
+
     @property
     def mock(self) -> AsyncMock:
         return self._mock
@@ -0,0 +1,126 @@
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from django.core.cache.backends.locmem import LocMemCache
+
+from tasks.app.domain.model.task import EnrichmentOptions
+from tasks.out.azure_task_repository import AzureTaskRepository
+from tasks.out.parent_title_cache import ParentTitleCache
+from tasks.tests.test_unit_task_repository_streaming import _build_tasks_config
+
+
+class FakeAzureClient:
+
+    def __init__(self, work_items_by_id):
+        self._work_items_by_id = work_items_by_id
+        self.title_batches = []
+
+    def query_by_wiql(self, wiql, top=None):
+        if "WorkItemLinks" in wiql.query or "> 0" not in wiql.query:
+            return SimpleNamespace(work_items=[], work_item_relations=[])
+        return SimpleNamespace(work_items=[SimpleNamespace(id=work_item_id) for work_item_id in self._work_items_by_id],
+                               work_item_relations=[])
+
+    def get_work_items(self, ids, fields=None):
+        if fields == ["System.Title"]:
+            self.title_batches.append(list(ids))
+            return [SimpleNamespace(id=parent_id, fields={"System.Title": f"Epic {parent_id}"}) for parent_id in ids]
+        return [self._work_items_by_id[work_item_id] for work_item_id in ids]
+
+
+def _build_work_item(work_item_id: int, parent_id=None, title=None, work_item_type="Task"):
+    fields = {
+        "System.Title": title or f"Item {work_item_id}",
+        "System.State": "In Progress",
+        "System.WorkItemType": work_item_type,
+        "System.TeamProject": "PROJ"
+    }
+    if parent_id is not None:
+        fields["System.Parent"] = parent_id
+    return SimpleNamespace(id=work_item_id, fields=fields)
+
+
+def _create_repository(azure_client, parent_title_cache, executor=None) -> AzureTaskRepository:
+    repository = AzureTaskRepository(_build_tasks_config(), parent_title_cache=parent_title_cache)
+    repository.connection = MagicMock()
+    repository.connection.clients.get_work_item_tracking_client.return_value = azure_client
+    repository._executor = executor
+    return repository
+
+
+class TestAzureParentTitleCache(unittest.IsolatedAsyncioTestCase):
+
+    async def test_shouldReuseParentTitlesAcrossRequests(self):
+        # given
+        parent_title_cache = ParentTitleCache(LocMemCache("parent-titles-reuse", {}))
+        first_client = FakeAzureClient({1: _build_work_item(1, parent_id=500)})
+        second_client = FakeAzureClient({2: _build_work_item(2, parent_id=500)})
+        await _create_repository(first_client, parent_title_cache).find_all(
+            enrichment=EnrichmentOptions(include_time_tracking=False))
+
+        # when
+        tasks = await _create_repository(second_client, parent_title_cache).find_all(
+            enrichment=EnrichmentOptions(include_time_tracking=False))
+
+        # then
+        self.assertEqual([[500]], first_client.title_batches)
+        self.assertEqual([], second_client.title_batches)
+        self.assertEqual("Epic 500", tasks[0].parent.title)
+
+    async def test_shouldTakeParentTitlesFromAlreadyFetchedItems(self):
+        # given
+        parent_title_cache = ParentTitleCache(LocMemCache("parent-titles-fetched", {}))
+        azure_client = FakeAzureClient({
+            10: _build_work_item(10, title="Checkout epic"),
+            11: _build_work_item(11, parent_id=10)
+        })
+
+        # when
+        tasks = await _create_repository(azure_client, parent_title_cache).find_all(
+            enrichment=EnrichmentOptions(include_time_tracking=False))
+
+        # then
+        child = next(task for task in tasks if task.id == "11")
+        self.assertEqual("Checkout epic", child.parent.title)
+        self.assertEqual([], azure_client.title_batches)
+        self.assertEqual({"10": "Checkout epic"}, parent_title_cache.get_many(["10"]))
+
+    async def test_shouldCacheTitlesOfFetchedParentLevelItemsWithoutChildrenInResult(self):
+        # given
+        parent_title_cache = ParentTitleCache(LocMemCache("parent-titles-parent-level", {}))
+        azure_client = FakeAzureClient({
+            20: _build_work_item(20, title="Billing epic", work_item_type="Epic"),
+            21: _build_work_item(21, title="Invoices feature", work_item_type="Feature"),
+            22: _build_work_item(22, title="Plain task")
+        })
+
+        # when
+        await _create_repository(azure_client, parent_title_cache).find_all(
+            enrichment=EnrichmentOptions(include_time_tracking=False))
+
+        # then
+        self.assertEqual({"20": "Billing epic", "21": "Invoices feature"},
+                         parent_title_cache.get_many(["20", "21", "22"]))
+        self.assertEqual([], azure_client.title_batches)
+
+    async def test_shouldFetchMissingParentTitleBatchesOnExecutor(self):
+        # given
+        work_items = {work_item_id: _build_work_item(work_item_id, parent_id=1000 + work_item_id)
+                      for work_item_id in range(1, 451)}
+        azure_client = FakeAzureClient(work_items)
+        executor = ThreadPoolExecutor(max_workers=4)
+        self.addCleanup(executor.shutdown)
+
+        # when
+        tasks = await _create_repository(azure_client, None, executor).find_all(
+            enrichment=EnrichmentOptions(include_time_tracking=False))
+
+        # then
+        self.assertEqual([200, 200, 50], sorted((len(batch) for batch in azure_client.title_batches), reverse=True))
+        self.assertTrue(all(task.parent.title == f"Epic {task.parent.id}" for task in tasks))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,217 @@
+import unittest
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from azure.devops.v7_1.work_item_tracking.models import WorkItemFieldUpdate, WorkItemUpdate
+
+from tasks.app.domain.model.config import (
+    TasksConfig, JiraConfig, AzureConfig, ProjectConfig, WorkflowConfig,
+    TaskFilterConfig, MemberGroupConfig, EstimationConfig, SortingConfig
+)
+from tasks.app.domain.model.task import EnrichmentOptions
+from tasks.out.azure_task_repository import AzureTaskRepository
+
+ALICE = {"id": "alice-id", "displayName": "Alice", "uniqueName": "alice@example.com"}
+RECENTLY_CREATED = (datetime.now(timezone.utc) - timedelta(days=10)).strftime("%Y-%m-%dT%H:%M:%S.000Z")
+YEARS_AGO_CREATED = "2019-03-01T08:00:00.000Z"
+
+
+def _build_tasks_config(changelog_source: str) -> TasksConfig:
+    return TasksConfig(
+        jira=JiraConfig(
+            jira_server_url=None,
+            jira_email=None,
+            jira_api_token=None,
+            story_point_custom_field_id=None,
+            release_field=None
+        ),
+        azure=AzureConfig(
+            azure_organization_url="https://dev.azure.com/example",
+            azure_pat="pat",
+            changelog_source=changelog_source,
+            bulk_revisions_min_tasks=10
+        ),
+        project=ProjectConfig(project_keys=["PROJ"], task_tracker="azure"),
+        workflow=WorkflowConfig(
+            stages={"Development": ["In Progress"]},
+            in_progress_status_codes=["In Progress"],
+            pending_status_codes=["Blocked"],
+            done_status_codes=["Done"],
+            recently_finished_tasks_days=14
+        ),
+        task_filter=TaskFilterConfig(global_task_types_filter=None, global_team_filter=None),
+        member_group=MemberGroupConfig(members={}, default_member_group_when_missing=None),
+        estimation=EstimationConfig(
+            working_days_per_month=22,
+            default_story_points_value_when_missing=3.0,
+            ideal_hours_per_day=4.0,
+            story_points_to_ideal_hours_convertion_ratio=1.0,
+            default_seniority_level_when_missing="middle",
+            default_health_status_when_missing="GREEN"
+        ),
+        sorting=SortingConfig(stage_sort_overrides={}, default_sort_criteria="-health")
+    )
+
+
+def _revisions_of(work_item_id: int):
+    day = 6 + work_item_id % 3
+    return [
+        {"id": work_item_id, "rev": 1, "fields": {
+            "System.State": "New", "System.AssignedTo": ALICE,
+            "System.ChangedDate": f"2025-01-0{day}T08:00:00.000Z", "System.ChangedBy": ALICE}},
+        {"id": work_item_id, "rev": 2, "fields": {
+            "System.State": "In Progress", "System.AssignedTo": ALICE,
+            "System.ChangedDate": f"2025-01-0{day}T09:00:00.000Z", "System.ChangedBy": ALICE,
+            "Microsoft.VSTS.Common.StateChangeDate": f"2025-01-0{day}T09:00:00.000Z"}},
+        {"id": work_item_id, "rev": 3, "fields": {
+            "System.State": "Done", "System.AssignedTo": ALICE,
+            "System.ChangedDate": f"2025-01-{day + 7:02d}T15:30:00.000Z", "System.ChangedBy": ALICE,
+            "Microsoft.VSTS.Common.StateChangeDate": f"2025-01-{day + 7:02d}T15:30:00.000Z"}},
+    ]
+
+
+def _updates_of(work_item_id: int):
+    updates = []
+    previous_fields = {}
+    for revision in _revisions_of(work_item_id):
+        fields = {name: WorkItemFieldUpdate(new_value=value, old_value=previous_fields.get(name))
+                  for name, value in revision["fields"].items()
+                  if name == "System.ChangedBy" or previous_fields.get(name) != value}
+        updates.append(WorkItemUpdate(id=revision["rev"], rev=revision["rev"], fields=fields, work_item_id=work_item_id))
+        previous_fields = revision["fields"]
+    return updates
+
+
+class FakeAzureServer:
+
+    def __init__(self, work_item_ids, revisions_batch_size: int = 50, created_dates=None, unrelated_revisions: int = 1):
+        self._work_item_ids = work_item_ids
+        self._revisions_batch_size = revisions_batch_size
+        self._created_dates = created_dates or {}
+        self._unrelated_revisions = unrelated_revisions
+        self.updates_calls = 0
+        self.revisions_calls = 0
+        self.revisions_filters = []
+
+    def query_by_wiql(self, wiql, top=None):
+        if "WorkItemLinks" in wiql.query or "> 0" not in wiql.query:
+            return SimpleNamespace(work_items=[], work_item_relations=[])
+        return SimpleNamespace(work_items=[SimpleNamespace(id=work_item_id) for work_item_id in self._work_item_ids],
+                               work_item_relations=[])
+
+    def get_work_items(self, ids, fields=None):
+        return [SimpleNamespace(id=work_item_id, fields={
+            "System.Title": f"Item {work_item_id}",
+            "System.State": "Done",
+            "System.WorkItemType": "Task",
+            "System.TeamProject": "PROJ",
+            "System.AssignedTo": ALICE,
+            "System.CreatedDate": self._created_dates.get(work_item_id, RECENTLY_CREATED)
+        }) for work_item_id in ids]
+
+    def get_updates(self, work_item_id, project=None, top=None, skip=None):
+        self.updates_calls += 1
+        return _updates_of(work_item_id)
+
+    def read_reporting_revisions_post(self, revisions_filter, project=None, continuation_token=None,
+                                      start_date_time=None, expand=None):
+        self.revisions_calls += 1
+        self.revisions_filters.append(revisions_filter)
+        all_revisions = [{"id": 99999, "rev": rev, "fields": {"System.State": "New"}}
+                         for rev in range(1, self._unrelated_revisions + 1)]
+        all_revisions.extend(revision for work_item_id in self._work_item_ids for revision in _revisions_of(work_item_id))
+        offset = int(continuation_token or 0)
+        next_offset = offset + self._revisions_batch_size
+        batch = SimpleNamespace(continuation_token=None, is_last_batch=None, values=None)
+        batch.additional_properties = {
+            "values": all_revisions[offset:next_offset],
+            "continuationToken": str(next_offset),
+            "isLastBatch": next_offset >= len(all_revisions)
+        }
+        return batch
+
+
+def _create_repository(changelog_source: str, server: FakeAzureServer) -> AzureTaskRepository:
+    repository = AzureTaskRepository(_build_tasks_config(changelog_source))
+    repository.connection = MagicMock()
+    repository.connection.clients.get_work_item_tracking_client.return_value = server
+    repository._executor = None
+    return repository
+
+
+class TestAzureRevisionHistory(unittest.IsolatedAsyncioTestCase):
+
+    async def test_shouldFetchStatusHistoryInBulkInsteadOfPerWorkItem(self):
+        # given
+        work_item_ids = list(range(1, 61))
+        updates_server = FakeAzureServer(work_item_ids)
+        revisions_server = FakeAzureServer(work_item_ids)
+
+        # when
+        per_item_tasks = await _create_repository('updates', updates_server).find_all(
+            enrichment=EnrichmentOptions(include_time_tracking=True))
+        bulk_tasks = await _create_repository('revisions', revisions_server).find_all(
+            enrichment=EnrichmentOptions(include_time_tracking=True))
+
+        # then
+        self.assertEqual(60, updates_server.updates_calls)
+        self.assertEqual(0, revisions_server.updates_calls)
+        self.assertEqual(4, revisions_server.revisions_calls)
+        self.assertEqual([task.id for task in per_item_tasks], [task.id for task in bulk_tasks])
+        for per_item_task, bulk_task in zip(per_item_tasks, bulk_tasks):
+            self.assertGreater(bulk_task.time_tracking.total_spent_time.time_delta, 0)
+            self.assertEqual(per_item_task.time_tracking.spent_time_by_assignee,
+                             bulk_task.time_tracking.spent_time_by_assignee)
+
+    async def test_shouldFallBackToPerItemUpdatesBelowBulkThreshold(self):
+        # given
+        server = FakeAzureServer(list(range(1, 4)))
+
+        # when
+        await _create_repository('revisions', server).find_all(enrichment=EnrichmentOptions(include_time_tracking=True))
+
+        # then
+        self.assertEqual(3, server.updates_calls)
+        self.assertEqual(0, server.revisions_calls)
+
+    async def test_shouldOnlyStreamRevisionsOfRequestedWorkItemTypes(self):
+        # given
+        server = FakeAzureServer(list(range(1, 21)))
+
+        # when
+        await _create_repository('revisions', server).find_all(enrichment=EnrichmentOptions(include_time_tracking=True))
+
+        # then
+        self.assertEqual({("Task",)}, {tuple(revisions_filter.types) for revisions_filter in server.revisions_filters})
+
+    async def test_shouldUsePerItemUpdatesForLongLivedWorkItems(self):
+        # given
+        work_item_ids = list(range(1, 21))
+        server = FakeAzureServer(work_item_ids, created_dates={1: YEARS_AGO_CREATED, 2: YEARS_AGO_CREATED})
+
+        # when
+        tasks = await _create_repository('revisions', server).find_all(
+            enrichment=EnrichmentOptions(include_time_tracking=True))
+
+        # then
+        self.assertEqual(2, server.updates_calls)
+        self.assertGreater(server.revisions_calls, 0)
+        self.assertTrue(all(task.time_tracking.total_spent_time.time_delta > 0 for task in tasks))
+
+    async def test_shouldFallBackToPerItemUpdatesWhenStreamIsDominatedByUnrelatedRevisions(self):
+        # given
+        server = FakeAzureServer(list(range(1, 21)), unrelated_revisions=5000)
+
+        # when
+        tasks = await _create_repository('revisions', server).find_all(
+            enrichment=EnrichmentOptions(include_time_tracking=True))
+
+        # then
+        self.assertEqual(20, server.updates_calls)
+        self.assertLessEqual(server.revisions_calls, 41)
+        self.assertTrue(all(task.time_tracking.total_spent_time.time_delta > 0 for task in tasks))
+
+
+if __name__ == '__main__':
+    unittest.main()
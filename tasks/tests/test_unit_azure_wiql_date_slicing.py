@@ -0,0 +1,98 @@
+import re
+import threading
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
+from types import SimpleNamespace
+
+from tasks.out.paged_task_providers import PagedAzureTaskProvider
+
+RESULT_CAP = 50
+
+
+class FakeWiqlServer:
+
+    def __init__(self, changed_dates_by_id):
+        self._changed_dates_by_id = changed_dates_by_id
+        self._lock = threading.Lock()
+        self.queries = []
+
+    def query_by_wiql(self, wiql, top=None):
+        with self._lock:
+            self.queries.append(wiql.query)
+        matching_ids = [work_item_id for work_item_id, changed_date in self._changed_dates_by_id.items()
+                        if self._matches(wiql.query, work_item_id, changed_date)]
+        if "ORDER BY [System.ChangedDate]" in wiql.query:
+            matching_ids.sort(key=lambda work_item_id: self._changed_dates_by_id[work_item_id])
+        else:
+            matching_ids.sort()
+        return SimpleNamespace(work_items=[SimpleNamespace(id=work_item_id) for work_item_id in matching_ids[:top]])
+
+    def get_work_items(self, ids, fields=None):
+        return [SimpleNamespace(id=work_item_id, fields={
+            "System.ChangedDate": f"{self._changed_dates_by_id[work_item_id].isoformat()}T10:00:00.000Z"
+        }) for work_item_id in ids]
+
+    @staticmethod
+    def _matches(query: str, work_item_id: int, changed_date: date) -> bool:
+        last_id = re.search(r"\[System\.Id] > (\d+)", query)
+        if last_id and work_item_id <= int(last_id.group(1)):
+            return False
+        since = re.search(r"\[System\.ChangedDate] >= '([\d-]+)'", query)
+        if since and changed_date < date.fromisoformat(since.group(1)):
+            return False
+        until = re.search(r"\[System\.ChangedDate] < '([\d-]+)'", query)
+        if until and changed_date >= date.fromisoformat(until.group(1)):
+            return False
+        return True
+
+
+def _create_provider(server, executor=None) -> PagedAzureTaskProvider:
+    provider = PagedAzureTaskProvider(server, "SELECT [System.Id] FROM WorkItems WHERE [System.TeamProject] = 'PROJ'",
+                                      thread_pool_executor=executor)
+    provider.WIQL_RESULT_LIMIT_BEFORE_EXCEPTION_THROWING = RESULT_CAP
+    return provider
+
+
+class TestAzureWiqlDateSlicing(unittest.TestCase):
+
+    def test_shouldReturnFirstPageWhenBelowResultCap(self):
+        # given
+        server = FakeWiqlServer({work_item_id: date(2025, 1, 1) for work_item_id in range(1, 11)})
+
+        # when
+        task_ids = _create_provider(server)._fetch_task_ids_paginated()
+
+        # then
+        self.assertEqual(list(range(1, 11)), task_ids)
+        self.assertEqual(1, len(server.queries))
+
+    def test_shouldBisectOnChangedDateAndMergeSlicesWithoutDuplicates(self):
+        # given
+        today = date.today()
+        changed_dates_by_id = {work_item_id: today - timedelta(days=work_item_id % 120)
+                               for work_item_id in range(1, 401)}
+        server = FakeWiqlServer(changed_dates_by_id)
+        executor = ThreadPoolExecutor(max_workers=4)
+        self.addCleanup(executor.shutdown)
+
+        # when
+        task_ids = _create_provider(server, executor)._fetch_task_ids_paginated()
+
+        # then
+        self.assertEqual(list(range(1, 401)), task_ids)
+        self.assertTrue(any("[System.ChangedDate] >= " in query for query in server.queries))
+
+    def test_shouldPageByIdWhenSingleDayExceedsResultCap(self):
+        # given
+        server = FakeWiqlServer({work_item_id: date.today() for work_item_id in range(1, 131)})
+
+        # when
+        task_ids = _create_provider(server)._fetch_task_ids_paginated()
+
+        # then
+        self.assertEqual(list(range(1, 131)), task_ids)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,161 @@
+import unittest
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from unittest.mock import MagicMock
+
+from sd_metrics_lib.sources.jira.worklog import JiraStatusChangeWorklogExtractor
+from sd_metrics_lib.sources.story_points import FunctionStoryPointExtractor
+from sd_metrics_lib.utils.worktime import SIMPLE_WORKTIME_EXTRACTOR
+
+from tasks.app.domain.model.config import (
+    TasksConfig, JiraConfig, AzureConfig, ProjectConfig, WorkflowConfig,
+    TaskFilterConfig, MemberGroupConfig, EstimationConfig, SortingConfig
+)
+from tasks.out.chunked_task_conversion import ChunkedTaskConversion, convert_task_chunk
+from tasks.out.convertors.jira import JiraTaskConverter
+from tasks.out.story_point_extractors import extract_jira_story_points
+
+
+def _build_tasks_config() -> TasksConfig:
+    return TasksConfig(
+        jira=JiraConfig(
+            jira_server_url="https://example.atlassian.net",
+            jira_email="test@example.com",
+            jira_api_token="token",
+            story_point_custom_field_id="customfield_10016"
+        ),
+        azure=AzureConfig(azure_organization_url=None, azure_pat=None),
+        project=ProjectConfig(project_keys=["PROJ"], task_tracker="jira"),
+        workflow=WorkflowConfig(
+            stages={"Development": ["In Progress"]},
+            in_progress_status_codes=["In Progress"],
+            pending_status_codes=["Blocked"],
+            done_status_codes=["Done"],
+            recently_finished_tasks_days=14
+        ),
+        task_filter=TaskFilterConfig(global_task_types_filter=None, global_team_filter=None),
+        member_group=MemberGroupConfig(members={}, default_member_group_when_missing=None),
+        estimation=EstimationConfig(
+            working_days_per_month=22,
+            default_story_points_value_when_missing=3.0,
+            ideal_hours_per_day=4.0,
+            story_points_to_ideal_hours_convertion_ratio=1.0,
+            default_seniority_level_when_missing="middle",
+            default_health_status_when_missing="GREEN"
+        ),
+        sorting=SortingConfig(stage_sort_overrides={}, default_sort_criteria="-health")
+    )
+
+
+def _build_converter(config: TasksConfig) -> JiraTaskConverter:
+    worklog_extractor = JiraStatusChangeWorklogExtractor(
+        transition_statuses=["In Progress"],
+        worktime_extractor=SIMPLE_WORKTIME_EXTRACTOR
+    )
+    story_point_extractor = FunctionStoryPointExtractor(extract_jira_story_points(config))
+    return JiraTaskConverter(config, worklog_extractor, story_point_extractor)
+
+
+def _build_jira_response(index: int) -> dict:
+    return {
+        "key": f"PROJ-{index}",
+        "fields": {
+            "summary": f"Task {index}",
+            "status": {"name": "Done"},
+            "priority": {"id": "3"},
+            "customfield_10016": index % 5,
+            "assignee": {"accountId": f"user-{index % 3}", "displayName": f"User {index % 3}"}
+        },
+        "changelog": {"histories": [
+            {
+                "created": "2025-01-08T17:00:00.000+0000",
+                "author": {"accountId": f"user-{index % 3}", "displayName": f"User {index % 3}"},
+                "items": [{"fieldId": "status", "fromString": "In Progress", "toString": "Done"}]
+            },
+            {
+                "created": "2025-01-06T09:00:00.000+0000",
+                "author": {"accountId": f"user-{index % 3}", "displayName": f"User {index % 3}"},
+                "items": [{"fieldId": "status", "fromString": "To Do", "toString": "In Progress"}]
+            }
+        ]}
+    }
+
+
+def _time_tracking_digest(task) -> tuple:
+    return tuple(sorted((user, duration.time_delta) for user, duration in
+                        (task.time_tracking.spent_time_by_assignee or {}).items()))
+
+
+class TestChunkedTaskConversion(unittest.IsolatedAsyncioTestCase):
+
+    async def test_shouldKeepSourceOrderWhenChunksAreConvertedOnThreadPool(self):
+        # Given
+        converter = _build_converter(_build_tasks_config())
+        raw_tasks = [_build_jira_response(index) for index in range(53)]
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            conversion = ChunkedTaskConversion(executor, chunk_size=5, min_parallel_tasks=0)
+
+            # When
+            tasks = await conversion.convert_all(converter, raw_tasks)
+
+        # Then
+        self.assertEqual([task.id for task in convert_task_chunk(converter, raw_tasks)], [task.id for task in tasks])
+        self.assertEqual(convert_task_chunk(converter, raw_tasks), tasks)
+
+    async def test_shouldKeepTimeTrackingOfSerialConversionWhenLargeResultSetRunsOnThreadPool(self):
+        # Given
+        converter = _build_converter(_build_tasks_config())
+        raw_tasks = [_build_jira_response(index) for index in range(4000)]
+        expected = [task.time_tracking for task in convert_task_chunk(converter, raw_tasks)]
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            conversion = ChunkedTaskConversion(executor, chunk_size=50, min_parallel_tasks=0)
+
+            # When
+            tasks = await conversion.convert_all(converter, raw_tasks)
+
+        # Then
+        self.assertEqual(expected, [task.time_tracking for task in tasks])
+
+    async def test_shouldKeepTimeTrackingOfSerialConversionWhenLargeResultSetRunsOnThreadPool(self):
+        # Given
+        converter = _build_converter(_build_tasks_config())
+        raw_tasks = [_build_jira_response(index) for index in range(4000)]
+        expected = [_time_tracking_digest(task) for task in convert_task_chunk(converter, raw_tasks)]
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            conversion = ChunkedTaskConversion(executor, chunk_size=50, min_parallel_tasks=0)
+
+            # When
+            tasks = await conversion.convert_all(converter, raw_tasks)
+
+        # Then
+        mismatched_ids = [task.id for task, digest in zip(tasks, expected) if _time_tracking_digest(task) != digest]
+        self.assertEqual([], mismatched_ids)
+
+    async def test_shouldProduceSameTasksAsSerialConversionWhenUsingProcessPool(self):
+        # Given
+        converter = _build_converter(_build_tasks_config())
+        raw_tasks = [_build_jira_response(index) for index in range(12)]
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            conversion = ChunkedTaskConversion(executor, chunk_size=4, min_parallel_tasks=0)
+
+            # When
+            tasks = await conversion.convert_all(converter, raw_tasks)
+
+        # Then
+        self.assertEqual(convert_task_chunk(converter, raw_tasks), tasks)
+
+    async def test_shouldConvertInlineWhenResultSetIsBelowParallelThreshold(self):
+        # Given
+        converter = _build_converter(_build_tasks_config())
+        executor = MagicMock()
+        conversion = ChunkedTaskConversion(executor, chunk_size=2, min_parallel_tasks=10)
+
+        # When
+        tasks = await conversion.convert_all(converter, [_build_jira_response(index) for index in range(9)])
+
+        # Then
+        self.assertEqual(9, len(tasks))
+        executor.submit.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,108 @@
+import unittest
+
+from django.core.cache.backends.locmem import LocMemCache
+
+from tasks.out.jira_changelog_history import JiraChangelogFetcher, JiraChangelogStore
+from tasks.out.paged_task_providers import PagedJiraTaskProvider
+
+
+def _history(history_id: int) -> dict:
+    status = "In Progress" if history_id % 2 else "Review"
+    previous_status = "Review" if history_id % 2 else "In Progress"
+    return {"id": str(history_id), "created": f"2025-01-01T10:00:00.{history_id % 1000:03d}+0000",
+            "author": {"accountId": "alice"},
+            "items": [{"fieldId": "status", "fromString": previous_status, "toString": status}]}
+
+
+class FakeJiraChangelogServer:
+
+    def __init__(self, histories_per_issue: int):
+        self.histories_by_key = {"PROJ-1": [_history(index) for index in range(1, histories_per_issue + 1)]}
+        self.updated_by_key = {"PROJ-1": "2025-01-01T10:00:00.000+0000"}
+        self.search_expands = []
+        self.bulk_calls = 0
+        self.issue_changelog_starts = []
+
+    def add_histories(self, key: str, count: int, updated: str):
+        histories = self.histories_by_key[key]
+        first_new_id = len(histories) + 1
+        histories.extend([_history(history_id) for history_id in range(first_new_id, first_new_id + count)])
+        self.updated_by_key[key] = updated
+
+    def enhanced_jql(self, jql, fields='*all', nextPageToken=None, limit=None, expand=None):
+        self.search_expands.append(expand)
+        return {"issues": [{"id": "10001", "key": key, "fields": {"updated": self.updated_by_key[key], "subtasks": []}}
+                           for key in self.histories_by_key]}
+
+    def get_changelogs_bulk(self, issue_ids_or_keys, fields_by=None, next_page_token=None, max_results=None):
+        self.bulk_calls += 1
+        histories = self.histories_by_key["PROJ-1"]
+        offset = int(next_page_token or 0)
+        page = histories[offset:offset + 100]
+        next_offset = offset + 100
+        return {"issueChangeLogs": [{"issueId": "10001", "changeHistories": page}],
+                "nextPageToken": str(next_offset) if next_offset < len(histories) else None}
+
+    def get_issue_changelog(self, issue_key, start=None, limit=None):
+        self.issue_changelog_starts.append(start)
+        histories = self.histories_by_key[issue_key]
+        page = histories[start:start + limit]
+        return {"values": page, "startAt": start, "total": len(histories), "isLast": start + limit >= len(histories)}
+
+
+def _fetch(server, store):
+    provider = PagedJiraTaskProvider(server, "project = PROJ", additional_fields=['changelog', 'subtasks'],
+                                     changelog_fetcher=JiraChangelogFetcher(server, store))
+    return provider.get_tasks()
+
+
+class TestJiraChangelogHistory(unittest.TestCase):
+
+    def test_shouldAttachFullHistoryFetchedOutsideSearch(self):
+        # given
+        server = FakeJiraChangelogServer(histories_per_issue=250)
+        store = JiraChangelogStore(LocMemCache("jira-changelog-full", {}))
+
+        # when
+        issues = _fetch(server, store)
+
+        # then
+        histories = issues[0]["changelog"]["histories"]
+        self.assertEqual(250, len(histories))
+        self.assertEqual("250", histories[0]["id"])
+        self.assertEqual(["subtasks"], server.search_expands)
+        self.assertEqual(3, server.bulk_calls)
+
+    def test_shouldReuseStoredHistoryWhenIssueWasNotUpdated(self):
+        # given
+        server = FakeJiraChangelogServer(histories_per_issue=20)
+        store = JiraChangelogStore(LocMemCache("jira-changelog-reuse", {}))
+        _fetch(server, store)
+
+        # when
+        issues = _fetch(server, store)
+
+        # then
+        self.assertEqual(20, len(issues[0]["changelog"]["histories"]))
+        self.assertEqual(1, server.bulk_calls)
+        self.assertEqual([], server.issue_changelog_starts)
+
+    def test_shouldDownloadOnlyNewHistoriesForUpdatedIssue(self):
+        # given
+        server = FakeJiraChangelogServer(histories_per_issue=150)
+        store = JiraChangelogStore(LocMemCache("jira-changelog-increment", {}))
+        _fetch(server, store)
+        server.add_histories("PROJ-1", 2, updated="2025-01-02T10:00:00.000+0000")
+
+        # when
+        issues = _fetch(server, store)
+
+        # then
+        histories = issues[0]["changelog"]["histories"]
+        self.assertEqual([150], server.issue_changelog_starts)
+        self.assertEqual(152, len(histories))
+        self.assertEqual(["152", "151", "150"], [history["id"] for history in histories[:3]])
+
+
+if __name__ == '__main__':
+    unittest.main()
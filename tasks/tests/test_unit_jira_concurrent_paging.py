@@ -0,0 +1,109 @@
+import re
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from tasks.out.paged_task_providers import PagedJiraTaskProvider
+
+FULL_PAGE_LIMIT = 10
+
+
+class FakeJiraSearchServer:
+
+    def __init__(self, issue_count: int):
+        self._issues = [{"id": str(10000 + index), "key": f"PROJ-{index}",
+                         "fields": {"summary": f"Issue {index}", "subtasks": []}}
+                        for index in range(issue_count, 0, -1)]
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self.max_in_flight = 0
+        self.full_requests = 0
+        self.probe_requests = 0
+
+    def enhanced_jql(self, jql, fields='*all', nextPageToken=None, limit=None, expand=None):
+        with self._lock:
+            self._in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self._in_flight)
+            if fields == 'id':
+                self.probe_requests += 1
+            else:
+                self.full_requests += 1
+        try:
+            time.sleep(0.01)
+            return self._search(jql, fields, nextPageToken, limit)
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+
+    def _search(self, jql, fields, next_page_token, limit):
+        matching = self._issues
+        id_filter = re.match(r"id in \((.*)\)", jql)
+        if id_filter:
+            wanted_ids = {issue_id.strip() for issue_id in id_filter.group(1).split(",")}
+            matching = sorted((issue for issue in self._issues if issue["id"] in wanted_ids),
+                              key=lambda issue: issue["id"])
+
+        page_limit = min(limit, FULL_PAGE_LIMIT) if fields != 'id' else limit
+        offset = int(next_page_token or 0)
+        page = matching[offset:offset + page_limit]
+        if fields == 'id':
+            page = [{"id": issue["id"]} for issue in page]
+        next_offset = offset + page_limit
+        return {"issues": page, "nextPageToken": str(next_offset) if next_offset < len(matching) else None}
+
+
+def _create_provider(server, executor=None) -> PagedJiraTaskProvider:
+    return PagedJiraTaskProvider(server, "project = PROJ ORDER BY created DESC", additional_fields=['subtasks'],
+                                 thread_pool_executor=executor)
+
+
+class TestJiraConcurrentPaging(unittest.TestCase):
+
+    def test_shouldReturnSameIssuesInSameOrderAsSerialPaging(self):
+        # given
+        serial_server = FakeJiraSearchServer(95)
+        concurrent_server = FakeJiraSearchServer(95)
+        executor = ThreadPoolExecutor(max_workers=3)
+        self.addCleanup(executor.shutdown)
+
+        # when
+        serial_tasks = _create_provider(serial_server).get_tasks()
+        concurrent_tasks = _create_provider(concurrent_server, executor).get_tasks()
+
+        # then
+        self.assertEqual([task["key"] for task in serial_tasks], [task["key"] for task in concurrent_tasks])
+        self.assertEqual(95, len({task["key"] for task in concurrent_tasks}))
+        self.assertEqual(1, concurrent_server.probe_requests)
+
+    def test_shouldKeepConcurrentPageRequestsWithinExecutorLimit(self):
+        # given
+        server = FakeJiraSearchServer(200)
+        executor = ThreadPoolExecutor(max_workers=3)
+        self.addCleanup(executor.shutdown)
+
+        # when
+        tasks = _create_provider(server, executor).get_tasks()
+
+        # then
+        self.assertEqual(200, len(tasks))
+        self.assertGreater(server.max_in_flight, 1)
+        self.assertLessEqual(server.max_in_flight, 3)
+
+    def test_shouldSkipProbeWhenResultFitsInFirstPage(self):
+        # given
+        server = FakeJiraSearchServer(7)
+        executor = ThreadPoolExecutor(max_workers=3)
+        self.addCleanup(executor.shutdown)
+
+        # when
+        tasks = _create_provider(server, executor).get_tasks()
+
+        # then
+        self.assertEqual(7, len(tasks))
+        self.assertEqual(0, server.probe_requests)
+        self.assertEqual(1, server.full_requests)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,128 @@
+import pickle
+import unittest
+from unittest.mock import MagicMock
+
+from tasks.app.domain.model.config import (
+    TasksConfig, JiraConfig, AzureConfig, ProjectConfig, WorkflowConfig,
+    TaskFilterConfig, MemberGroupConfig, EstimationConfig, SortingConfig
+)
+from tasks.out.convertors.azure import AzureTaskConverter
+from tasks.out.convertors.jira import JiraTaskConverter
+
+
+def _build_tasks_config() -> TasksConfig:
+    return TasksConfig(
+        jira=JiraConfig(
+            jira_server_url="https://example.atlassian.net",
+            jira_email="test@example.com",
+            jira_api_token="token",
+            story_point_custom_field_id="customfield_10016",
+            release_field="fixVersions"
+        ),
+        azure=AzureConfig(
+            azure_organization_url="https://dev.azure.com/example",
+            azure_pat="pat",
+            release_field="Custom.Release"
+        ),
+        project=ProjectConfig(project_keys=["PROJ"], task_tracker="jira"),
+        workflow=WorkflowConfig(
+            stages={"Development": ["In Progress"]},
+            in_progress_status_codes=["In Progress"],
+            pending_status_codes=["Blocked"],
+            done_status_codes=["Done"],
+            recently_finished_tasks_days=14
+        ),
+        task_filter=TaskFilterConfig(global_task_types_filter=None, global_team_filter=None),
+        member_group=MemberGroupConfig(members={}, default_member_group_when_missing="Unassigned"),
+        estimation=EstimationConfig(
+            working_days_per_month=22,
+            default_story_points_value_when_missing=3.0,
+            ideal_hours_per_day=4.0,
+            story_points_to_ideal_hours_convertion_ratio=1.0,
+            default_seniority_level_when_missing="middle",
+            default_health_status_when_missing="GREEN"
+        ),
+        sorting=SortingConfig(stage_sort_overrides={}, default_sort_criteria="-health")
+    )
+
+
+def _build_extractors():
+    worklog_extractor = MagicMock()
+    worklog_extractor.get_work_time_per_user.return_value = {}
+    story_point_extractor = MagicMock()
+    story_point_extractor.get_story_points.return_value = None
+    return worklog_extractor, story_point_extractor
+
+
+def _build_jira_response(key: str) -> dict:
+    return {"key": key, "fields": {
+        "summary": key,
+        "status": {"name": "In Progress"},
+        "assignee": {"displayName": "Alice", "avatarUrls": {"32x32": "https://avatar/alice"}},
+        "fixVersions": [{"id": "10", "name": "2026.015"}],
+        "parent": {"key": "PROJ-1", "fields": {"summary": "Epic"}}
+    }}
+
+
+def _build_azure_work_item(work_item_id: int):
+    work_item = MagicMock()
+    work_item.id = work_item_id
+    work_item.fields = {
+        "System.Title": f"Item {work_item_id}",
+        "System.State": "In Progress",
+        "System.TeamProject": "PROJ",
+        "System.AssignedTo": {"displayName": "Alice", "imageUrl": "https://avatar/alice"},
+        "System.Parent": 7,
+        "Custom.Release": "2026.015"
+    }
+    return work_item
+
+
+class TestTaskObjectInterning(unittest.TestCase):
+
+    def test_shouldShareRepeatedSubObjectsAcrossJiraTasks(self):
+        # given
+        converter = JiraTaskConverter(_build_tasks_config(), *_build_extractors())
+
+        # when
+        first = converter.convert_to_task(_build_jira_response("PROJ-2"))
+        second = converter.convert_to_task(_build_jira_response("PROJ-3"))
+
+        # then
+        self.assertIs(first.assignment.assignee, second.assignment.assignee)
+        self.assertIs(first.assignment.member_group, second.assignment.member_group)
+        self.assertIs(first.releases[0], second.releases[0])
+        self.assertIs(first.parent, second.parent)
+        self.assertIsNot(first.assignment, second.assignment)
+        self.assertIsNot(first.system_metadata, second.system_metadata)
+
+    def test_shouldShareParentStubSoResolvedTitleReachesEveryAzureChild(self):
+        # given
+        converter = AzureTaskConverter(_build_tasks_config(), *_build_extractors())
+        first = converter.convert_to_task(_build_azure_work_item(101))
+        second = converter.convert_to_task(_build_azure_work_item(102))
+
+        # when
+        first.parent.title = "Resolved epic"
+
+        # then
+        self.assertIs(first.parent, second.parent)
+        self.assertEqual("Resolved epic", second.parent.title)
+        self.assertIs(first.assignment.assignee, second.assignment.assignee)
+        self.assertIs(first.releases[0], second.releases[0])
+
+    def test_shouldPickleSharedSubObjectsOnce(self):
+        # given
+        converter = JiraTaskConverter(_build_tasks_config(), *_build_extractors())
+        tasks = [converter.convert_to_task(_build_jira_response(f"PROJ-{index}")) for index in range(2, 50)]
+
+        # when
+        restored = pickle.loads(pickle.dumps(tasks))
+
+        # then
+        self.assertIs(restored[0].parent, restored[-1].parent)
+        self.assertIs(restored[0].assignment.assignee, restored[-1].assignment.assignee)
+
+
+if __name__ == '__main__':
+    unittest.main()
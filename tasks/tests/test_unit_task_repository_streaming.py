@@ -0,0 +1,176 @@
+import unittest
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from django.core.cache.backends.locmem import LocMemCache
+
+from metrics.version_stamps import VersionStamps
+from tasks.app.domain.model.config import (
+    TasksConfig, JiraConfig, AzureConfig, ProjectConfig, WorkflowConfig,
+    TaskFilterConfig, MemberGroupConfig, EstimationConfig, SortingConfig
+)
+from tasks.app.domain.model.task import EnrichmentOptions, TaskSearchCriteria
+from tasks.out.azure_task_repository import AzureTaskRepository
+from tasks.out.jira_task_repository import JiraTaskRepository
+from tasks.out.version_stamped_cache import TaskCacheVersioning, VersionStampedCache
+
+
+def _build_tasks_config() -> TasksConfig:
+    return TasksConfig(
+        jira=JiraConfig(
+            jira_server_url="https://example.atlassian.net",
+            jira_email="test@example.com",
+            jira_api_token="token",
+            story_point_custom_field_id="customfield_10016",
+            release_field=None
+        ),
+        azure=AzureConfig(
+            azure_organization_url="https://dev.azure.com/example",
+            azure_pat="pat",
+            release_field=None,
+            iteration_field=None
+        ),
+        project=ProjectConfig(project_keys=["PROJ"], task_tracker="jira"),
+        workflow=WorkflowConfig(
+            stages={"Development": ["In Progress"]},
+            in_progress_status_codes=["In Progress"],
+            pending_status_codes=["Blocked"],
+            done_status_codes=["Done"],
+            recently_finished_tasks_days=14
+        ),
+        task_filter=TaskFilterConfig(global_task_types_filter=None, global_team_filter=None),
+        member_group=MemberGroupConfig(members={}, default_member_group_when_missing=None),
+        estimation=EstimationConfig(
+            working_days_per_month=22,
+            default_story_points_value_when_missing=3.0,
+            ideal_hours_per_day=4.0,
+            story_points_to_ideal_hours_convertion_ratio=1.0,
+            default_seniority_level_when_missing="middle",
+            default_health_status_when_missing="GREEN"
+        ),
+        sorting=SortingConfig(stage_sort_overrides={}, default_sort_criteria="-health")
+    )
+
+
+class FakeJiraClient:
+
+    def __init__(self, pages):
+        self._pages = pages
+        self.requested_tokens = []
+
+    def enhanced_jql(self, query, expand=None, limit=None, nextPageToken=None):
+        self.requested_tokens.append(nextPageToken)
+        page_index = int(nextPageToken or 0)
+        next_token = str(page_index + 1) if page_index + 1 < len(self._pages) else None
+        return {"issues": self._pages[page_index], "nextPageToken": next_token}
+
+
+class FakeAzureClient:
+
+    def __init__(self, work_item_ids):
+        self._work_item_ids = work_item_ids
+
+    def query_by_wiql(self, wiql, top=None):
+        return SimpleNamespace(work_items=[SimpleNamespace(id=work_item_id) for work_item_id in self._work_item_ids],
+                               work_item_relations=[])
+
+    def get_work_items(self, ids, fields=None):
+        return [_build_azure_work_item(work_item_id) for work_item_id in ids]
+
+
+def _build_jira_issue(key: str) -> dict:
+    return {"key": key, "fields": {"summary": key, "status": {"name": "In Progress"}, "subtasks": []}}
+
+
+def _build_azure_work_item(work_item_id: int):
+    return SimpleNamespace(id=work_item_id, fields={
+        "System.Title": f"Item {work_item_id}",
+        "System.State": "In Progress",
+        "System.WorkItemType": "Task",
+        "System.TeamProject": "PROJ"
+    })
+
+
+class TestTaskRepositoryStreaming(unittest.IsolatedAsyncioTestCase):
+
+    async def test_shouldYieldConvertedJiraPagesInTrackerOrder(self):
+        # Given
+        repository = JiraTaskRepository(_build_tasks_config())
+        repository.jira_client = FakeJiraClient([
+            [_build_jira_issue("PROJ-1"), _build_jira_issue("PROJ-2")],
+            [_build_jira_issue("PROJ-3")]
+        ])
+
+        # When
+        pages = [page async for page in repository.stream_all(enrichment=EnrichmentOptions(include_time_tracking=False))]
+
+        # Then
+        self.assertEqual([["PROJ-1", "PROJ-2"], ["PROJ-3"]], [[task.id for task in page] for page in pages])
+
+    async def test_shouldFetchNextJiraPageOnlyWhenConsumerAsksForIt(self):
+        # Given
+        repository = JiraTaskRepository(_build_tasks_config())
+        jira_client = FakeJiraClient([[_build_jira_issue("PROJ-1")], [_build_jira_issue("PROJ-2")]])
+        repository.jira_client = jira_client
+        stream = repository.stream_all(enrichment=EnrichmentOptions(include_time_tracking=False))
+
+        # When
+        first_page = await anext(stream)
+
+        # Then
+        self.assertEqual(["PROJ-1"], [task.id for task in first_page])
+        self.assertEqual([None], jira_client.requested_tokens)
+        await stream.aclose()
+
+    async def test_shouldStreamAzureWorkItemsInBoundedPages(self):
+        # Given
+        repository = AzureTaskRepository(_build_tasks_config())
+        azure_client = FakeAzureClient(list(range(1, 6)))
+        repository.connection = MagicMock()
+        repository.connection.clients.get_work_item_tracking_client.return_value = azure_client
+        repository._executor = None
+        original_create_task_provider = repository._create_task_provider
+
+        def create_small_page_provider(query, include_time_tracking, cache=None):
+            provider = original_create_task_provider(query, include_time_tracking, cache)
+            provider.stream_page_size = 2
+            return provider
+
+        repository._create_task_provider = create_small_page_provider
+
+        # When
+        pages = [page async for page in repository.stream_all(enrichment=EnrichmentOptions(include_time_tracking=False))]
+
+        # Then
+        self.assertEqual([["1", "2"], ["3", "4"], ["5"]], [[task.id for task in page] for page in pages])
+
+    async def test_shouldScopeAzurePerItemCacheByVersionStampOnSearchAndStream(self):
+        # Given
+        config = _build_tasks_config()
+        cache = LocMemCache("azure-per-item-scoped", {})
+        stamps = VersionStamps(LocMemCache("azure-per-item-stamps", {}))
+        repository = AzureTaskRepository(config, cache=cache, cache_versioning=TaskCacheVersioning(stamps, config))
+        repository.connection = MagicMock()
+        repository.connection.clients.get_work_item_tracking_client.return_value = FakeAzureClient([1])
+        repository._executor = None
+        criteria = TaskSearchCriteria(id_filter=["1"])
+        provider_caches = []
+        original_create_task_provider = repository._create_task_provider
+
+        def recording_create_task_provider(query, include_time_tracking, cache=None):
+            provider_caches.append(cache)
+            return original_create_task_provider(query, include_time_tracking, cache)
+
+        repository._create_task_provider = recording_create_task_provider
+
+        # When
+        await repository.find_all(criteria, EnrichmentOptions(include_time_tracking=False))
+        [page async for page in repository.stream_all(criteria, EnrichmentOptions(include_time_tracking=False))]
+
+        # Then
+        self.assertEqual(2, len(provider_caches))
+        self.assertTrue(all(isinstance(provider_cache, VersionStampedCache) for provider_cache in provider_caches))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,79 @@
+import unittest
+
+from django.core.cache.backends.locmem import LocMemCache
+
+from metrics import version_stamps
+from metrics.version_stamps import VersionStamps
+from tasks.app.domain.model.config import MemberGroupConfig
+from tasks.app.domain.model.task import TaskSearchCriteria
+from tasks.out.version_stamped_cache import TaskCacheVersioning
+from tasks.tests.test_unit_task_repository_streaming import _build_tasks_config
+
+
+def _new_cache(name: str) -> LocMemCache:
+    cache = LocMemCache(name, {})
+    cache.clear()
+    return cache
+
+
+class TestTaskCacheVersioning(unittest.TestCase):
+
+    def setUp(self):
+        config = _build_tasks_config()
+        config.member_group = MemberGroupConfig(
+            members={"Alice": {"member_groups": ["backend"]}, "Bob": {"member_groups": ["frontend"]}},
+            default_member_group_when_missing=None
+        )
+        self.stamps = VersionStamps(_new_cache("task-version-stamps"))
+        self.versioning = TaskCacheVersioning(self.stamps, config)
+        self.search_results = _new_cache("task-search-results")
+
+    def test_shouldDependOnIssueStampsForIdQueries(self):
+        # when
+        dependencies = self.versioning.dependencies(TaskSearchCriteria(id_filter=["PROJ-1", "PROJ-2"]))
+
+        # then
+        self.assertEqual({version_stamps.ISSUE: ["PROJ-1", "PROJ-2"]}, dependencies)
+
+    def test_shouldDependOnMemberGroupsOfFilteredAssignees(self):
+        # when
+        dependencies = self.versioning.dependencies(TaskSearchCriteria(assignee_filter=["Bob", "Alice"]))
+
+        # then
+        self.assertEqual({version_stamps.MEMBER_GROUP: ["backend", "frontend"]}, dependencies)
+
+    def test_shouldFallBackToProjectStampsForAssigneeWithoutMemberGroup(self):
+        # when
+        dependencies = self.versioning.dependencies(TaskSearchCriteria(assignee_filter=["Alice", "Carol"]))
+
+        # then
+        self.assertEqual({version_stamps.PROJECT: ["PROJ"]}, dependencies)
+
+    def test_shouldMissOnlyEntriesOfBumpedMemberGroup(self):
+        # given
+        backend_criteria = TaskSearchCriteria(assignee_filter=["Alice"])
+        frontend_criteria = TaskSearchCriteria(assignee_filter=["Bob"])
+        self.versioning.scoped(self.search_results, backend_criteria).set("query", ["backend task"])
+        self.versioning.scoped(self.search_results, frontend_criteria).set("query", ["frontend task"])
+
+        # when
+        self.stamps.bump(version_stamps.MEMBER_GROUP, ["backend"])
+
+        # then
+        self.assertIsNone(self.versioning.scoped(self.search_results, backend_criteria).get("query"))
+        self.assertEqual(["frontend task"],
+                         self.versioning.scoped(self.search_results, frontend_criteria).get("query"))
+
+    def test_shouldMissProjectWideEntriesAfterProjectBump(self):
+        # given
+        self.versioning.scoped(self.search_results, TaskSearchCriteria()).set("query", ["task"])
+
+        # when
+        self.stamps.bump(version_stamps.PROJECT, ["PROJ"])
+
+        # then
+        self.assertIsNone(self.versioning.scoped(self.search_results, TaskSearchCriteria()).get("query"))
+
+
+if __name__ == '__main__':
+    unittest.main()
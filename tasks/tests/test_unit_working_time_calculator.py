@@ -0,0 +1,136 @@
+import random
+import unittest
+from datetime import date, datetime, timedelta, timezone
+
+from sd_metrics_lib.sources.jira.worklog import JiraStatusChangeWorklogExtractor
+from sd_metrics_lib.utils.time import TimeUnit
+from sd_metrics_lib.utils.worktime import SIMPLE_WORKTIME_EXTRACTOR, BoundarySimpleWorkTimeExtractor
+
+from tasks.out.batched_worklog_extractors import BatchedJiraStatusChangeWorklogExtractor
+from tasks.out.working_time_calculator import WorkingTimeCalculator, BusinessCalendar
+
+
+def _random_intervals(count: int):
+    generator = random.Random(42)
+    origin = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    intervals = []
+    for _ in range(count):
+        start = origin + timedelta(minutes=generator.randint(0, 60 * 24 * 365))
+        end = start + timedelta(minutes=generator.randint(1, 60 * 24 * 40))
+        intervals.append((start, end))
+    return intervals
+
+
+def _build_jira_task(histories):
+    return {"key": "PROJ-1", "fields": {"status": {"name": "Done"}}, "changelog": {"histories": histories}}
+
+
+def _history(created: str, author: str, items):
+    return {"created": created, "author": {"accountId": author, "displayName": author}, "items": items}
+
+
+def _status_change(from_status: str, to_status: str):
+    return {"fieldId": "status", "from": from_status, "fromString": from_status, "to": to_status, "toString": to_status}
+
+
+def _assignee_change(assignee: str):
+    return {"fieldId": "assignee", "from": None, "fromString": None, "to": assignee, "toString": assignee}
+
+
+class TestWorkingTimeCalculator(unittest.TestCase):
+
+    def test_shouldMatchSimpleWorkTimeExtractorWithoutHolidays(self):
+        # given
+        calculator = WorkingTimeCalculator()
+        intervals = _random_intervals(500)
+
+        # when
+        actual = [calculator.extract_time_from_period(start, end) for start, end in intervals]
+
+        # then
+        for (start, end), duration in zip(intervals, actual):
+            expected = SIMPLE_WORKTIME_EXTRACTOR.extract_time_from_period(start, end)
+            if expected is None:
+                self.assertIsNone(duration)
+            else:
+                self.assertAlmostEqual(expected.convert(TimeUnit.SECOND).time_delta,
+                                       duration.convert(TimeUnit.SECOND).time_delta, places=3)
+
+    def test_shouldMatchBoundaryExtractorWhenBoundariesSet(self):
+        # given
+        start_boundary = datetime(2025, 3, 1, tzinfo=timezone.utc)
+        end_boundary = datetime(2025, 6, 1, tzinfo=timezone.utc)
+        calculator = WorkingTimeCalculator().with_boundaries(start_boundary, end_boundary)
+        boundary_extractor = BoundarySimpleWorkTimeExtractor(start_boundary, end_boundary)
+        intervals = _random_intervals(300)
+
+        # when
+        actual = [calculator.extract_time_from_period(start, end) for start, end in intervals]
+
+        # then
+        for (start, end), duration in zip(intervals, actual):
+            expected = boundary_extractor.extract_time_from_period(start, end)
+            if expected is None:
+                self.assertIsNone(duration)
+            else:
+                self.assertAlmostEqual(expected.convert(TimeUnit.SECOND).time_delta,
+                                       duration.convert(TimeUnit.SECOND).time_delta, places=3)
+
+    def test_shouldSkipHolidaysWhenCountingWorkingDays(self):
+        # given
+        calculator = WorkingTimeCalculator(BusinessCalendar(holidays=[date(2025, 12, 25), date(2025, 12, 26)]))
+        start = datetime(2025, 12, 22, 0, 0)
+        end = datetime(2025, 12, 29, 0, 0)
+
+        # when
+        duration = calculator.extract_time_from_period(start, end)
+
+        # then
+        self.assertEqual(3 * 8 * 3600, duration.convert(TimeUnit.SECOND).time_delta)
+
+    def test_shouldReturnSameSecondsForBatchAndScalarPaths(self):
+        # given
+        calculator = WorkingTimeCalculator(BusinessCalendar(holidays=[date(2025, 5, 1)]))
+        intervals = _random_intervals(300) + [(datetime(2025, 1, 6, 9, 0), datetime(2025, 1, 6, 9, 5))]
+
+        # when
+        batch = calculator.working_seconds_batch(intervals)
+
+        # then
+        for (start, end), batch_seconds in zip(intervals, batch):
+            scalar_seconds = calculator.working_seconds(start, end)
+            if scalar_seconds is None:
+                self.assertNotEqual(batch_seconds, batch_seconds)
+            else:
+                self.assertAlmostEqual(scalar_seconds, batch_seconds, places=3)
+
+
+class TestBatchedStatusChangeWorklogExtractor(unittest.TestCase):
+
+    def test_shouldSumSameWorkTimePerUserAsLibraryExtractor(self):
+        # given
+        task = _build_jira_task([
+            _history("2025-01-20T10:00:00.000+0000", "bob", [_status_change("In Progress", "Done")]),
+            _history("2025-01-14T09:30:00.000+0000", "bob", [_assignee_change("bob")]),
+            _history("2025-01-10T15:00:00.000+0000", "alice", [_status_change("Review", "In Progress")]),
+            _history("2025-01-09T12:00:00.000+0000", "alice", [_status_change("In Progress", "Review")]),
+            _history("2025-01-06T09:00:00.000+0000", "alice", [_assignee_change("alice"),
+                                                               _status_change("To Do", "In Progress")]),
+        ])
+        statuses = ["In Progress"]
+        library_extractor = JiraStatusChangeWorklogExtractor(statuses, worktime_extractor=SIMPLE_WORKTIME_EXTRACTOR)
+        batched_extractor = BatchedJiraStatusChangeWorklogExtractor(statuses, worktime_extractor=WorkingTimeCalculator())
+
+        # when
+        expected = library_extractor.get_work_time_per_user(_build_jira_task(task["changelog"]["histories"]))
+        actual = batched_extractor.get_work_time_per_user(task)
+
+        # then
+        self.assertEqual(set(expected.keys()), set(actual.keys()))
+        for user, duration in expected.items():
+            self.assertAlmostEqual(duration.convert(TimeUnit.SECOND).time_delta,
+                                   actual[user].convert(TimeUnit.SECOND).time_delta, places=3)
+
+
+if __name__ == '__main__':
+    unittest.main()
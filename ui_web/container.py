@@ -1,7 +1,9 @@
 from django.conf import settings
+from django.core.cache import caches
 from sd_metrics_lib.utils.time import TimePolicy
 
 from forecast.container import forecast_container
+from metrics.version_stamps import VersionStamps
 from pull_requests.container import pull_requests_container
 from tasks.app.domain.model.config import SortingConfig
 from tasks.container import tasks_container
@@ -25,8 +27,11 @@ from .facades.pull_requests_facade import PullRequestsFacade
 from .facades.tasks_facade import TasksFacade
 from .facades.team_velocity_facade import TeamVelocityFacade
 from .utils.available_member_stage_filter import AvailableMemberStageFilter
+from .utils.data_version_etag import DataVersionEtag
 from .utils.federated_data_post_processors import MemberGroupTaskFilter
 from .utils.filter_fields import build_field_filters
+from .utils.fragment_cache import FragmentCache
+from .utils.task_event_stream import TaskEventStream
 
 
 class UiWebContainer:
@@ -52,6 +57,38 @@ class UiWebContainer:
         self._member_group_task_filter = None
         self._pull_request_convertor = None
         self._pull_requests_facade = None
+        self._data_version_etag = None
+        self._fragment_cache = None
+        self._task_event_stream = None
+
+    @property
+    def data_version_etag(self) -> DataVersionEtag:
+        if self._data_version_etag is None:
+            self._data_version_etag = DataVersionEtag(
+                VersionStamps(caches['version_stamps']),
+                tasks_container.get_project_keys(),
+                settings.METRICS_ETAG_WINDOW_SECONDS
+            )
+        return self._data_version_etag
+
+    @property
+    def fragment_cache(self) -> FragmentCache:
+        if self._fragment_cache is None:
+            self._fragment_cache = FragmentCache(caches['rendered_fragments'])
+        return self._fragment_cache
+
+    @property
+    def task_event_stream(self) -> TaskEventStream:
+        if self._task_event_stream is None:
+            self._task_event_stream = TaskEventStream(
+                VersionStamps(caches['version_stamps']),
+                tasks_container.get_project_keys(),
+                caches['task_board_snapshots'],
+                settings.METRICS_TASK_EVENTS_POLL_SECONDS,
+                settings.METRICS_TASK_EVENTS_RESYNC_SECONDS,
+                settings.METRICS_TASK_EVENTS_MAX_SECONDS
+            )
+        return self._task_event_stream
 
     @property
     def task_convertor(self) -> TaskConvertor:
@@ -122,6 +159,7 @@ class UiWebContainer:
                 merge_unassigned_into_filtered_group=tasks_container.get_member_group_config().merge_unassigned_into_filtered_group,
                 release_column_enabled=tasks_container.is_release_field_configured(),
                 lazy_loading_enabled=settings.METRICS_CURRENT_TASKS_LAZY_LOADING,
+                sectioned_loading_enabled=settings.METRICS_CURRENT_TASKS_SECTIONED_LOADING,
                 pull_request_search_api=self._pull_request_search_api_if_supported()
             )
         return self._tasks_facade
@@ -205,9 +243,11 @@ class UiWebContainer:
                 resolve_member_group_members=velocity_container.resolve_member_group_members,
                 velocity_task_detail_convertor=self._get_velocity_task_detail_convertor(),
                 velocity_calculation_api=velocity_container.velocity_calculation_api,
+                task_velocity_breakdown_api=velocity_container.task_velocity_breakdown_api,
                 in_progress_status_codes=tasks_container.get_workflow_config().in_progress_status_codes,
                 development_stage_status_codes=tasks_container.get_workflow_config().stages.get("Development", []),
-                member_group_custom_filters=tasks_container.get_member_group_config().custom_filters
+                member_group_custom_filters=tasks_container.get_member_group_config().custom_filters,
+                period_tasks_api=velocity_container.period_tasks_api
             )
         return self._tasks_velocity_facade
 
@@ -1,4 +1,4 @@
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 from sd_metrics_lib.utils.time import Duration, TimeUnit, TimePolicy
 
@@ -22,12 +22,20 @@ class TaskConvertor:
     def __init__(self, time_policy: TimePolicy):
         self._time_policy = time_policy
 
-    def convert_task_to_data(self, task: Task) -> TaskData:
+    def convert_tasks_to_data(self, tasks: List[Task]) -> List[TaskData]:
+        # Parent stubs shared by several tasks are converted once per call, the memo dies with the call
+        parent_data_memo: Dict[int, TaskData] = {}
+        return [self.convert_task_to_data(task, parent_data_memo) for task in tasks]
+
+    def convert_task_to_data(self, task: Task, parent_data_memo: Optional[Dict[int, TaskData]] = None) -> TaskData:
+        if parent_data_memo is None:
+            parent_data_memo = {}
+
         child_tasks_data = None
         if task.child_tasks:
-            child_tasks_data = [self.convert_task_to_data(child_task) for child_task in task.child_tasks]
+            child_tasks_data = [self.convert_task_to_data(child_task, parent_data_memo) for child_task in task.child_tasks]
 
-        parent_data = self.convert_task_to_data(task.parent) if task.parent else None
+        parent_data = self._convert_parent_to_data(task.parent, parent_data_memo) if task.parent else None
 
         releases_data = to_release_data_list(task.releases)
 
@@ -49,6 +57,14 @@ class TaskConvertor:
             custom_sort_fields=task.custom_sort_fields
         )
 
+    def _convert_parent_to_data(self, parent: Task, parent_data_memo: Dict[int, TaskData]) -> TaskData:
+        # The tasks being converted keep every parent alive for the whole call, so id() keys cannot be reused
+        parent_data = parent_data_memo.get(id(parent))
+        if parent_data is None:
+            parent_data = self.convert_task_to_data(parent, parent_data_memo)
+            parent_data_memo[id(parent)] = parent_data
+        return parent_data
+
     @staticmethod
     def _convert_assignment_to_data(assignment: Assignment) -> AssignmentData:
         assignee_data = None
@@ -1,8 +1,8 @@
-from typing import Dict, List, Mapping
+from typing import Dict, List, Mapping, Optional
 
-from ..data.task_data import TaskData
-from ..data.task_filter_data import TaskFilterPanel
+from ..data.task_filter_data import FilterField, FilterOption, IndexedFilterField, TaskFilterIndex, TaskFilterPanel
 from ..utils.filter_fields import FieldFilter
+from ..utils.task_filter_utils import TaskFilterUtils
 
 
 class TaskFilterConvertor:
@@ -17,11 +17,25 @@ class TaskFilterConvertor:
         return selections
 
     @staticmethod
-    def to_panel(tasks: List[TaskData], selections: Dict[str, str],
-                 field_filters: List[FieldFilter]) -> TaskFilterPanel:
-        fields = [field_filter.to_field(tasks, selections.get(field_filter.param))
-                  for field_filter in field_filters]
+    def to_panel(index: TaskFilterIndex, selections: Dict[str, str]) -> TaskFilterPanel:
+        fields = [TaskFilterConvertor._to_field(index, indexed_field, selections)
+                  for indexed_field in index.fields]
         return TaskFilterPanel(
             fields=[field for field in fields if field is not None],
             has_active_selection=bool(selections)
         )
+
+    @staticmethod
+    def _to_field(index: TaskFilterIndex, indexed_field: IndexedFilterField,
+                  selections: Dict[str, str]) -> Optional[FilterField]:
+        if not indexed_field.options:
+            return None
+        # Facet counts honour every other selection, so each option tells how many tasks picking it would leave
+        available = TaskFilterUtils.matching_bitset(index, selections, ignored_param=indexed_field.param)
+        selected = selections.get(indexed_field.param)
+        options = [
+            FilterOption(id=value_id, label=label, selected=value_id == selected,
+                         count=(indexed_field.positions_by_id.get(value_id, 0) & available).bit_count())
+            for value_id, label in indexed_field.options
+        ]
+        return FilterField(param=indexed_field.param, label=indexed_field.label, options=options)
@@ -38,8 +38,8 @@ class VelocityChartConvertor:
         labels = []
         data_values = []
         
-        for report in velocity_reports_data:
-            label = f"{report.start_date.year}-{report.start_date.month:02d}"
+        for report in VelocityChartConvertor._order_chronologically(velocity_reports_data):
+            label = VelocityChartConvertor._build_period_label(report)
             labels.append(label)
             data_values.append(extract_fn(report))
         
@@ -55,12 +55,12 @@ class VelocityChartConvertor:
         if not velocity_reports_data:
             return None
         
-        labels = set()
+        labels = {}
         developer_data = {}
         
-        for report in velocity_reports_data:
-            label = f"{report.start_date.year}-{report.start_date.month:02d}"
-            labels.add(label)
+        for report in VelocityChartConvertor._order_chronologically(velocity_reports_data):
+            label = VelocityChartConvertor._build_period_label(report)
+            labels.setdefault(label, None)
             
             developer_name = report.metric_scope_name or report.metric_scope or 'Unknown'
             if developer_name not in developer_data:
@@ -68,7 +68,7 @@ class VelocityChartConvertor:
             
             developer_data[developer_name][label] = extract_fn(report)
         
-        sorted_labels = sorted(list(labels))
+        sorted_labels = list(labels)
         datasets = []
         
         for developer, periods in developer_data.items():
@@ -81,4 +81,14 @@ class VelocityChartConvertor:
                 color=color
             ))
         
-        return ChartData(labels=sorted_labels, datasets=datasets)
\ No newline at end of file
+        return ChartData(labels=sorted_labels, datasets=datasets)
+
+    @staticmethod
+    def _order_chronologically(velocity_reports_data: List[VelocityReportData]) -> List[VelocityReportData]:
+        return sorted(velocity_reports_data, key=lambda report: report.start_date)
+
+    @staticmethod
+    def _build_period_label(report: VelocityReportData) -> str:
+        if report.period_name:
+            return report.period_name
+        return f"{report.start_date.year}-{report.start_date.month:02d}"
@@ -41,7 +41,8 @@ class VelocityReportConvertor:
             velocity=velocity_report.velocity,
             story_points=velocity_report.story_points,
             metric_scope=velocity_report.metric_scope,
-            metric_scope_name=metric_scope_name
+            metric_scope_name=metric_scope_name,
+            period_name=velocity_report.period_name
         )
     
     def _convert_velocity_report_to_data_with_name(self, velocity_report: VelocityReport) -> VelocityReportData:
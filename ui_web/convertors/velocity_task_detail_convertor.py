@@ -1,9 +1,9 @@
 from typing import Dict, List, Optional
 
-from sd_metrics_lib.calculators.story_points import ProportionalStoryPointCalculator
-from sd_metrics_lib.utils.time import Duration, TimeUnit, TimePolicy
+from sd_metrics_lib.utils.time import TimeUnit, TimePolicy
 
 from tasks.app.domain.model.task import Task
+from velocity.app.domain.model.velocity import DeveloperTaskShare
 from ..data.task_data import AssigneeData, AssignmentData, TimeTrackingData, SystemMetadataData
 from ..data.velocity_task_detail_data import TaskVelocityData
 
@@ -13,25 +13,21 @@ class VelocityTaskDetailConvertor:
     def __init__(self, time_policy: TimePolicy):
         self._time_policy = time_policy
 
-    def convert_tasks_to_developers_breakdown(self, tasks: List[Task],
-                                              developer_names: List[str],
-                                              developer_velocities: Dict[str, Optional[float]]) -> List[TaskVelocityData]:
-        result = []
-        for task in tasks:
-            if not task.story_points or task.story_points <= 0:
-                continue
-            if not task.time_tracking or not task.time_tracking.spent_time_by_assignee:
-                continue
-            for developer_name in developer_names:
-                if developer_name in task.time_tracking.spent_time_by_assignee:
-                    velocity = developer_velocities.get(developer_name)
-                    result.append(self._convert_task_for_developer(task, developer_name, velocity))
-        return result
+    def convert_shares_to_developers_breakdown(self, shares: List[DeveloperTaskShare],
+                                               developer_velocities: Dict[str, Optional[float]]) -> List[TaskVelocityData]:
+        seconds_to_days = self._time_policy.convert(1.0, TimeUnit.SECOND, TimeUnit.DAY)
+        return [
+            self._convert_task_for_developer(
+                share.task, share.developer_name, developer_velocities.get(share.developer_name),
+                share.story_points, share.spent_seconds * seconds_to_days
+            )
+            for share in shares
+        ]
 
     def _convert_task_for_developer(self, task: Task, developer_name: str,
-                                    velocity: Optional[float]) -> TaskVelocityData:
-        developer_story_points = VelocityTaskDetailConvertor._calculate_developer_story_points(task, developer_name)
-        developer_time_days = self._calculate_developer_time_days(task, developer_name)
+                                    velocity: Optional[float],
+                                    developer_story_points: float,
+                                    developer_time_days: float) -> TaskVelocityData:
         total_estimated_days = VelocityTaskDetailConvertor._calculate_estimated_days(task.story_points, velocity)
         estimated_days = VelocityTaskDetailConvertor._calculate_estimated_days(developer_story_points, velocity)
         deviation_percent = VelocityTaskDetailConvertor._calculate_deviation_percent(estimated_days, developer_time_days)
@@ -65,20 +61,6 @@ class VelocityTaskDetailConvertor:
             return None
         return ((estimated_days - actual_days) / estimated_days) * 100
 
-    @staticmethod
-    def _calculate_developer_story_points(task: Task, developer_name: str) -> float:
-        spent_time_by_assignee = task.time_tracking.spent_time_by_assignee
-        developer_duration = spent_time_by_assignee[developer_name]
-        total_duration = Duration.sum(spent_time_by_assignee.values(), unit=TimeUnit.SECOND)
-
-        return ProportionalStoryPointCalculator.calculate(
-            task.story_points, developer_duration, total_duration
-        ) or 0.0
-
-    def _calculate_developer_time_days(self, task: Task, developer_name: str) -> float:
-        developer_duration = task.time_tracking.spent_time_by_assignee[developer_name]
-        return developer_duration.convert(TimeUnit.DAY, self._time_policy).time_delta
-
     @staticmethod
     def _extract_system_metadata(task: Task) -> SystemMetadataData:
         if not task.system_metadata:
@@ -1,5 +1,7 @@
 from dataclasses import dataclass, field
-from typing import List
+from typing import Dict, List, Optional, Tuple
+
+from .task_data import TaskData
 
 UNASSIGNED_OPTION_ID = "__unassigned__"
 NO_PARENT_OPTION_ID = "__no_parent__"
@@ -10,6 +12,7 @@ class FilterOption:
     id: str
     label: str
     selected: bool = False
+    count: Optional[int] = None
 
 
 @dataclass(slots=True)
@@ -23,3 +26,17 @@ class FilterField:
 class TaskFilterPanel:
     fields: List[FilterField] = field(default_factory=list)
     has_active_selection: bool = False
+
+
+@dataclass(slots=True)
+class IndexedFilterField:
+    param: str
+    label: str
+    options: List[Tuple[str, str]] = field(default_factory=list)
+    positions_by_id: Dict[str, int] = field(default_factory=dict)
+
+
+@dataclass(slots=True)
+class TaskFilterIndex:
+    tasks: List[TaskData] = field(default_factory=list)
+    fields: List[IndexedFilterField] = field(default_factory=list)
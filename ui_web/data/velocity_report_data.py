@@ -9,4 +9,5 @@ class VelocityReportData:
     velocity: float
     story_points: float
     metric_scope: Optional[str] = None
-    metric_scope_name: Optional[str] = None
\ No newline at end of file
+    metric_scope_name: Optional[str] = None
+    period_name: Optional[str] = None
@@ -18,7 +18,7 @@ class ChildTasksFacade:
 
     async def get_child_tasks(self, parent_task_id: str) -> List[TaskData]:
         enriched_child_tasks = await self._fetch_child_tasks(parent_task_id)
-        child_tasks_data = [self.task_convertor.convert_task_to_data(task) for task in enriched_child_tasks]
+        child_tasks_data = self.task_convertor.convert_tasks_to_data(enriched_child_tasks)
         await PullRequestGatewayLookupUtils.populate_linked_pull_requests(child_tasks_data, self.pull_request_search_api)
         return child_tasks_data
 
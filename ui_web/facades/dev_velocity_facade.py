@@ -3,7 +3,7 @@ from typing import Dict, Optional, List
 from sd_metrics_lib.utils.time import TimeUnit
 
 from velocity.app.domain.model.config import MemberVelocityConfig
-from velocity.app.domain.model.velocity import ReportGenerationParameters, ReportType, TaskFilter
+from velocity.app.domain.model.velocity import ReportGenerationParameters, ReportType, TaskFilter, ReportGranularity
 from ..convertors.velocity_chart_convertor import VelocityChartConvertor
 from ..convertors.velocity_report_convertor import VelocityReportConvertor
 from ..data.chart_data import ChartData
@@ -40,9 +40,11 @@ class DevVelocityFacade:
     async def get_velocity_reports_data(self, member_group_id: Optional[str] = None,
                                          number_of_periods: int = 6,
                                          include_all_statuses: bool = False,
-                                         use_custom_filter: bool = False) -> List[VelocityReportData]:
+                                         use_custom_filter: bool = False,
+                                         granularity: ReportGranularity = ReportGranularity.MONTH) -> List[VelocityReportData]:
         custom_query = self._resolve_custom_query(member_group_id) if use_custom_filter else None
-        velocity_reports = await self._get_velocity_reports(member_group_id, number_of_periods, include_all_statuses, custom_query)
+        velocity_reports = await self._get_velocity_reports(member_group_id, number_of_periods, include_all_statuses,
+                                                            custom_query, granularity)
         return self._velocity_report_convertor.convert_velocity_reports_to_data_with_names(velocity_reports)
 
     def get_velocity_chart_data(self, velocity_reports_data: List[VelocityReportData],
@@ -83,13 +85,15 @@ class DevVelocityFacade:
     async def _get_velocity_reports(self, member_group_id: Optional[str],
                                     number_of_periods: int = 6,
                                     include_all_statuses: bool = False,
-                                    custom_query: Optional[str] = None):
+                                    custom_query: Optional[str] = None,
+                                    granularity: ReportGranularity = ReportGranularity.MONTH):
         criteria = ReportGenerationParameters(
-            time_unit=TimeUnit.MONTH,
+            time_unit=TimeUnit.WEEK if granularity == ReportGranularity.WEEK else TimeUnit.MONTH,
             number_of_periods=number_of_periods,
             report_type=ReportType.MEMBER_SCOPE,
             scope_id=member_group_id,
             task_filter=TaskFilter(include_all_statuses=include_all_statuses, custom_query=custom_query,
-                                  worklog_transition_statuses=self._development_stage_status_codes)
+                                  worklog_transition_statuses=self._development_stage_status_codes),
+            granularity=granularity
         )
         return await self._velocity_api.generate_velocity_report(criteria)
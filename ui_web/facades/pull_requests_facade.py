@@ -32,6 +32,12 @@ class PullRequestsFacade:
         pull_requests = await self._pull_request_search_api.search(criteria, PullRequestProjection.REVIEW_DETAILS)
         return self._pull_request_convertor.convert_review_details(pull_requests[0])
 
+    async def get_review_details_batch(self, refs: List[PullRequestRef]) -> List[PullRequestData]:
+        if not refs:
+            return []
+        pull_requests = await self._pull_request_search_api.find_review_details(refs)
+        return [self._pull_request_convertor.convert_review_details(pull_request) for pull_request in pull_requests]
+
     async def get_pull_requests(self, member_group_id: Optional[str] = None) -> List[PullRequestData]:
         if not self._enabled:
             return []
@@ -2,7 +2,7 @@ from typing import Dict, List, Mapping
 
 from ..convertors.task_filter_convertor import TaskFilterConvertor
 from ..data.task_data import TaskData
-from ..data.task_filter_data import TaskFilterPanel
+from ..data.task_filter_data import TaskFilterIndex, TaskFilterPanel
 from ..utils.filter_fields import FieldFilter
 from ..utils.task_filter_utils import TaskFilterUtils
 
@@ -15,8 +15,14 @@ class TaskFilterFacade:
     def parse_selections(self, query_params: Mapping[str, str]) -> Dict[str, str]:
         return TaskFilterConvertor.parse_selections(query_params, self._field_filters)
 
-    def get_panel(self, tasks: List[TaskData], selections: Dict[str, str]) -> TaskFilterPanel:
-        return TaskFilterConvertor.to_panel(tasks, selections, self._field_filters)
+    def build_index(self, tasks: List[TaskData]) -> TaskFilterIndex:
+        return TaskFilterUtils.build_index(tasks, self._field_filters)
+
+    def get_panel(self, index: TaskFilterIndex, selections: Dict[str, str]) -> TaskFilterPanel:
+        return TaskFilterConvertor.to_panel(index, selections)
+
+    def filter_index(self, index: TaskFilterIndex, selections: Dict[str, str]) -> List[TaskData]:
+        return TaskFilterUtils.filter_index(index, selections)
 
     def filter_tasks(self, tasks: List[TaskData], selections: Dict[str, str]) -> List[TaskData]:
         return TaskFilterUtils.filter_tasks(tasks, selections, self._field_filters)
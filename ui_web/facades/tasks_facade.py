@@ -28,6 +28,7 @@ class TasksFacade:
                  merge_unassigned_into_filtered_group: bool = False,
                  release_column_enabled: bool = False,
                  lazy_loading_enabled: bool = True,
+                 sectioned_loading_enabled: bool = False,
                  pull_request_search_api=None):
         self.task_search_api = task_search_api
         self.forecast_api = forecast_api
@@ -42,6 +43,7 @@ class TasksFacade:
         self.merge_unassigned_into_filtered_group = merge_unassigned_into_filtered_group
         self._release_column_enabled = release_column_enabled
         self._lazy_loading_enabled = lazy_loading_enabled
+        self._sectioned_loading_enabled = sectioned_loading_enabled
         self.pull_request_search_api = pull_request_search_api
 
     async def get_tasks(self, member_group_id: Optional[str] = None) -> List[TaskData]:
@@ -68,12 +70,21 @@ class TasksFacade:
         return [self.member_convertor.convert_member_group_to_data(group) for group in
                 self.available_member_groups]
 
+    def get_member_group_sections(self) -> List[MemberGroupData]:
+        if not self.available_member_groups:
+            return []
+        unassigned = TaskConversionUtils.UNASSIGNED_MEMBER_GROUP_NAME
+        return self.get_available_member_groups() + [MemberGroupData(id=unassigned, name=unassigned)]
+
     def is_release_column_enabled(self) -> bool:
         return self._release_column_enabled
 
     def is_lazy_loading_enabled(self) -> bool:
         return self._lazy_loading_enabled
 
+    def is_sectioned_loading_enabled(self) -> bool:
+        return self._sectioned_loading_enabled
+
     def is_pull_request_gateway_column_enabled(self) -> bool:
         return self.pull_request_search_api is not None
 
@@ -86,7 +97,7 @@ class TasksFacade:
         return colspan
 
     def _convert_to_task_data(self, tasks: List[Task]) -> List[TaskData]:
-        return [self.task_convertor.convert_task_to_data(task) for task in tasks]
+        return self.task_convertor.convert_tasks_to_data(tasks)
 
     async def _fetch_tasks(self, member_group_id: Optional[str], enrichment: EnrichmentOptions) -> List[Task]:
         current_tasks_future = self._build_task_fetcher(
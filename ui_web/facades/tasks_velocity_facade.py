@@ -4,7 +4,10 @@ from typing import Dict, List, Optional, Callable
 from sd_metrics_lib.utils.time import TimeUnit
 
 from tasks.app.domain.model.task import EnrichmentOptions, WorkTimeExtractorType
+from velocity.app.api.api_for_period_tasks import ApiForPeriodTasks
+from velocity.app.api.api_for_task_velocity_breakdown import ApiForTaskVelocityBreakdown
 from velocity.app.api.api_for_velocity_calculation import ApiForVelocityCalculation
+from velocity.app.domain.model.velocity import TaskFilter
 from ..convertors.velocity_task_detail_convertor import VelocityTaskDetailConvertor
 from ..data.velocity_task_detail_data import TaskVelocityData
 
@@ -16,17 +19,21 @@ class TasksVelocityFacade:
                  resolve_member_group_members: Callable,
                  velocity_task_detail_convertor: VelocityTaskDetailConvertor,
                  velocity_calculation_api: ApiForVelocityCalculation,
+                 task_velocity_breakdown_api: ApiForTaskVelocityBreakdown,
                  in_progress_status_codes: List[str],
                  development_stage_status_codes: List[str],
-                 member_group_custom_filters: Optional[Dict[str, str]] = None):
+                 member_group_custom_filters: Optional[Dict[str, str]] = None,
+                 period_tasks_api: Optional[ApiForPeriodTasks] = None):
         self._task_search_api = task_search_api
         self._create_velocity_search_criteria = create_velocity_search_criteria
         self._resolve_member_group_members = resolve_member_group_members
         self._velocity_task_detail_convertor = velocity_task_detail_convertor
         self._velocity_calculation_api = velocity_calculation_api
+        self._task_velocity_breakdown_api = task_velocity_breakdown_api
         self._in_progress_status_codes = in_progress_status_codes
         self._development_stage_status_codes = development_stage_status_codes
         self._member_group_custom_filters = member_group_custom_filters
+        self._period_tasks_api = period_tasks_api
 
     def resolve_developer_names(self, developer_names: List[str],
                                 member_group_id: Optional[str] = None) -> List[str]:
@@ -38,24 +45,37 @@ class TasksVelocityFacade:
                         start_date: datetime, end_date: datetime,
                         member_group_id: Optional[str] = None,
                         include_all_statuses: bool = False,
-                        use_custom_filter: bool = False) -> List[TaskVelocityData]:
+                        use_custom_filter: bool = False,
+                        iteration: Optional[str] = None) -> List[TaskVelocityData]:
         custom_query = self._get_custom_filter(member_group_id) if use_custom_filter else None
-        tasks = await self._search_tasks(start_date, end_date, member_group_id, include_all_statuses, custom_query,
-                                         self._development_stage_status_codes)
+        task_filter = TaskFilter(include_all_statuses=include_all_statuses, custom_query=custom_query,
+                                 worklog_transition_statuses=self._development_stage_status_codes)
+        tasks = self._find_period_tasks(start_date, end_date, member_group_id, task_filter, iteration)
+        if tasks is None:
+            tasks = await self._search_tasks(start_date, end_date, member_group_id, include_all_statuses, custom_query,
+                                             self._development_stage_status_codes)
+            tasks = TasksVelocityFacade._filter_by_iteration(tasks, iteration)
+        shares = self._task_velocity_breakdown_api.breakdown_by_developer(tasks, developer_names)
         developer_velocities = await self._compute_developer_velocities(developer_names)
-        return self._velocity_task_detail_convertor.convert_tasks_to_developers_breakdown(
-            tasks, developer_names, developer_velocities
+        return self._velocity_task_detail_convertor.convert_shares_to_developers_breakdown(
+            shares, developer_velocities
         )
 
     async def get_team_tasks(self, start_date: datetime, end_date: datetime,
                              member_group_id: Optional[str] = None,
-                             use_custom_filter: bool = False) -> List[TaskVelocityData]:
+                             use_custom_filter: bool = False,
+                             iteration: Optional[str] = None) -> List[TaskVelocityData]:
         custom_query = self._get_custom_filter(member_group_id) if use_custom_filter else None
-        tasks = await self._search_tasks(start_date, end_date, member_group_id, False, custom_query)
-        all_developer_names = TasksVelocityFacade._extract_developer_names(tasks)
-        developer_velocities = await self._compute_developer_velocities(all_developer_names)
-        return self._velocity_task_detail_convertor.convert_tasks_to_developers_breakdown(
-            tasks, all_developer_names, developer_velocities
+        tasks = self._find_period_tasks(start_date, end_date, member_group_id, TaskFilter(custom_query=custom_query),
+                                        iteration)
+        if tasks is None:
+            tasks = await self._search_tasks(start_date, end_date, member_group_id, False, custom_query)
+            tasks = TasksVelocityFacade._filter_by_iteration(tasks, iteration)
+        shares = self._task_velocity_breakdown_api.breakdown_by_developer(tasks)
+        developer_names = list(dict.fromkeys(share.developer_name for share in shares))
+        developer_velocities = await self._compute_developer_velocities(developer_names)
+        return self._velocity_task_detail_convertor.convert_shares_to_developers_breakdown(
+            shares, developer_velocities
         )
 
     async def _compute_developer_velocities(self,
@@ -67,13 +87,19 @@ class TasksVelocityFacade:
             )
         return velocities
 
+    def _find_period_tasks(self, start_date: datetime, end_date: datetime,
+                           member_group_id: Optional[str],
+                           task_filter: TaskFilter,
+                           iteration: Optional[str] = None):
+        if self._period_tasks_api is None or task_filter.include_all_statuses:
+            return None
+        return self._period_tasks_api.find_period_tasks(start_date, end_date, member_group_id, task_filter, iteration)
+
     @staticmethod
-    def _extract_developer_names(tasks):
-        names = set()
-        for task in tasks:
-            if task.time_tracking and task.time_tracking.spent_time_by_assignee:
-                names.update(task.time_tracking.spent_time_by_assignee.keys())
-        return list(names)
+    def _filter_by_iteration(tasks, iteration: Optional[str]):
+        if not iteration:
+            return tasks
+        return [task for task in tasks if task.iteration == iteration]
 
     async def _search_tasks(self, start_date: datetime, end_date: datetime,
                              member_group_id: Optional[str],
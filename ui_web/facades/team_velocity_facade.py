@@ -2,7 +2,7 @@ from typing import Dict, Optional, List
 
 from sd_metrics_lib.utils.time import TimeUnit
 
-from velocity.app.domain.model.velocity import ReportGenerationParameters, ReportType, TaskFilter
+from velocity.app.domain.model.velocity import ReportGenerationParameters, ReportType, TaskFilter, ReportGranularity
 from ..convertors.member_convertor import MemberConvertor
 from ..convertors.velocity_chart_convertor import VelocityChartConvertor
 from ..convertors.velocity_report_convertor import VelocityReportConvertor
@@ -33,9 +33,11 @@ class TeamVelocityFacade:
 
     async def get_velocity_reports_data(self, member_group_id: Optional[str] = None,
                                          number_of_periods: int = 12,
-                                         use_custom_filter: bool = False) -> List[VelocityReportData]:
+                                         use_custom_filter: bool = False,
+                                         granularity: ReportGranularity = ReportGranularity.MONTH) -> List[VelocityReportData]:
         custom_query = self._resolve_custom_query(member_group_id) if use_custom_filter else None
-        velocity_reports = await self._get_velocity_reports(member_group_id, number_of_periods, custom_query)
+        velocity_reports = await self._get_velocity_reports(member_group_id, number_of_periods, custom_query,
+                                                            granularity)
         return self.velocity_report_convertor.convert_velocity_reports_to_data(velocity_reports)
 
     def get_velocity_chart_data(self, velocity_reports_data: List[VelocityReportData],
@@ -66,12 +68,14 @@ class TeamVelocityFacade:
 
     async def _get_velocity_reports(self, member_group_id: Optional[str],
                                     number_of_periods: int = 12,
-                                    custom_query: Optional[str] = None):
+                                    custom_query: Optional[str] = None,
+                                    granularity: ReportGranularity = ReportGranularity.MONTH):
         criteria = ReportGenerationParameters(
-            time_unit=TimeUnit.MONTH,
+            time_unit=TimeUnit.WEEK if granularity == ReportGranularity.WEEK else TimeUnit.MONTH,
             number_of_periods=number_of_periods,
             report_type=ReportType.MEMBER_GROUP_SCOPE,
             scope_id=member_group_id,
-            task_filter=TaskFilter(custom_query=custom_query)
+            task_filter=TaskFilter(custom_query=custom_query),
+            granularity=granularity
         )
         return await self.velocity_api.generate_velocity_report(criteria)
@@ -0,0 +1,11 @@
+from django import template
+from django.utils.safestring import mark_safe
+
+from ..container import ui_web_container
+
+register = template.Library()
+
+
+@register.simple_tag
+def cached_fragments(template_name, items, item_name, **flags):
+    return mark_safe(ui_web_container.fragment_cache.render_all(template_name, items or [], item_name, flags))
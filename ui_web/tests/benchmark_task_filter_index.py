@@ -0,0 +1,85 @@
+import os
+import pickle
+import random
+import sys
+import time
+
+import django
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'metrics.settings.development')
+django.setup()
+
+from ui_web.convertors.task_filter_convertor import TaskFilterConvertor
+from ui_web.tests.fixtures.filter_task_builders import task_data
+from ui_web.utils.filter_fields import build_field_filters
+from ui_web.utils.task_filter_utils import TaskFilterUtils
+
+TASK_COUNTS = [1000, 10000]
+FIELD_FILTERS = build_field_filters(["priority", "story_points", "assignee", "member_group", "parent", "stage",
+                                     "status", "release", "iteration"])
+SELECTIONS = {"priority": "2", "member_group": "group-3"}
+ROUNDS = 5
+
+
+def build_tasks(task_count: int):
+    generator = random.Random(42)
+    return [task_data(f"PROJ-{index}",
+                      priority=generator.randint(1, 5),
+                      assignee_id=generator.choice([None, *[f"user-{number}" for number in range(40)]]),
+                      member_group=f"group-{generator.randint(1, 6)}",
+                      releases=[(f"r{generator.randint(1, 8)}", f"Release {generator.randint(1, 8)}")],
+                      parent_id=f"EPIC-{generator.randint(1, task_count // 20)}",
+                      stage=generator.choice(["todo", "development", "review", "testing"]),
+                      story_points=generator.choice([1.0, 2.0, 3.0, 5.0, 8.0]),
+                      iteration=f"Sprint {generator.randint(1, 12)}")
+            for index in range(task_count)]
+
+
+def per_field_scan(tasks):
+    fields = [field_filter.to_field(tasks, SELECTIONS.get(field_filter.param)) for field_filter in FIELD_FILTERS]
+    return fields, TaskFilterUtils.filter_tasks(tasks, SELECTIONS, FIELD_FILTERS)
+
+
+def indexed(tasks):
+    index = TaskFilterUtils.build_index(tasks, FIELD_FILTERS)
+    return TaskFilterConvertor.to_panel(index, SELECTIONS), TaskFilterUtils.filter_index(index, SELECTIONS)
+
+
+def reuse_index(index):
+    return TaskFilterConvertor.to_panel(index, SELECTIONS), TaskFilterUtils.filter_index(index, SELECTIONS)
+
+
+def measure(function, argument) -> float:
+    timings = []
+    for _ in range(ROUNDS):
+        started = time.perf_counter()
+        function(argument)
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def main():
+    print(f"fields={len(FIELD_FILTERS)} selections={SELECTIONS} rounds={ROUNDS}")
+    print(f"{'tasks':>7} {'scan':>9} {'index':>9} {'speedup':>8} {'reused':>9} {'speedup':>8} {'pickled':>9}")
+    for task_count in TASK_COUNTS:
+        tasks = build_tasks(task_count)
+        expected_fields, expected_tasks = per_field_scan(tasks)
+        panel, actual_tasks = indexed(tasks)
+        expected_options = [[option.id for option in field.options] for field in expected_fields if field]
+        actual_options = [[option.id for option in field.options] for field in panel.fields]
+        if expected_tasks != actual_tasks or expected_options != actual_options:
+            print(f"result mismatch for {task_count} tasks")
+            return 1
+
+        scan_seconds = measure(per_field_scan, tasks)
+        index_seconds = measure(indexed, tasks)
+        index = TaskFilterUtils.build_index(tasks, FIELD_FILTERS)
+        reused_seconds = measure(reuse_index, index)
+        pickled_bytes = len(pickle.dumps(index))
+        print(f"{task_count:>7} {scan_seconds:>9.4f} {index_seconds:>9.4f} {scan_seconds / index_seconds:>7.2f}x "
+              f"{reused_seconds:>9.4f} {scan_seconds / reused_seconds:>7.2f}x {pickled_bytes:>9}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
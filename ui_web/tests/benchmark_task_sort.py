@@ -0,0 +1,81 @@
+import os
+import random
+import sys
+import time
+
+import django
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'metrics.settings.development')
+django.setup()
+
+from tasks.app.domain.model.config import SortingConfig
+from ui_web.tests.fixtures.ui_web_builders import TaskDataBuilder
+from ui_web.utils.task_sort_utils import TaskSortUtils
+
+TASK_COUNTS = [1000, 10000]
+CRITERIA = "-health,priority,-assignee,story_points"
+ROUNDS = 5
+
+
+def build_tasks(task_count: int):
+    generator = random.Random(42)
+    tasks = []
+    for index in range(task_count):
+        builder = (TaskDataBuilder(f"PROJ-{index}", f"Task {index}")
+                   .assigned_to(f"user-{generator.randint(1, 40)}")
+                   .with_priority(generator.randint(1, 5))
+                   .with_story_points(generator.choice([1.0, 2.0, 3.0, 5.0, 8.0])))
+        health = generator.random()
+        if health < 0.3:
+            builder = builder.with_red_health_forecast()
+        elif health < 0.6:
+            builder = builder.with_yellow_health_forecast()
+        else:
+            builder = builder.with_green_health_forecast()
+        tasks.append(builder.build())
+    return tasks
+
+
+def sort_pass_per_criterion(tasks, sorting_config: SortingConfig):
+    criteria = []
+    for criteria_part in sorting_config.default_sort_criteria.split(','):
+        criterion = TaskSortUtils._build_criterion(criteria_part.strip().lstrip('-'), True)
+        natural_key = criterion.natural_key or (lambda value: value)
+        criteria.append((lambda task, criterion=criterion, natural_key=natural_key:
+                         natural_key(criterion.value_function(task)), not criteria_part.strip().startswith('-')))
+    sorted_tasks = list(tasks)
+    for key_function, is_ascending in reversed(criteria):
+        sorted_tasks.sort(key=key_function, reverse=not is_ascending)
+    return sorted_tasks
+
+
+def measure(sort_function, tasks, sorting_config: SortingConfig) -> float:
+    timings = []
+    for _ in range(ROUNDS):
+        started = time.perf_counter()
+        sort_function(tasks, sorting_config)
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def main():
+    sorting_config = SortingConfig(stage_sort_overrides={}, default_sort_criteria=CRITERIA)
+    print(f"criteria={CRITERIA} rounds={ROUNDS}")
+    print(f"{'tasks':>7} {'per-pass':>9} {'compiled':>9} {'speedup':>8}")
+    for task_count in TASK_COUNTS:
+        tasks = build_tasks(task_count)
+        expected = [task.id for task in sort_pass_per_criterion(tasks, sorting_config)]
+        actual = [task.id for task in TaskSortUtils.sort_tasks(tasks, sorting_config)]
+        if expected != actual:
+            print(f"order mismatch for {task_count} tasks")
+            return 1
+
+        per_pass_seconds = measure(sort_pass_per_criterion, tasks, sorting_config)
+        compiled_seconds = measure(TaskSortUtils.sort_tasks, tasks, sorting_config)
+        print(f"{task_count:>7} {per_pass_seconds:>9.4f} {compiled_seconds:>9.4f} "
+              f"{per_pass_seconds / compiled_seconds:>7.2f}x")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
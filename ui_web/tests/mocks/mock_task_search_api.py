@@ -1,4 +1,4 @@
-from typing import List, Optional
+from typing import AsyncIterator, List, Optional
 from unittest.mock import AsyncMock
 
 from tasks.app.api.api_for_task_search import ApiForTaskSearch
@@ -18,6 +18,10 @@ class MockTaskSearchApi(ApiForTaskSearch):
                            enrichment: Optional[EnrichmentOptions] = None) -> List[Task]:
         return await self._mock.search_by_ids(task_ids, enrichment)
     
+    async def stream(self, criteria: Optional[TaskSearchCriteria] = None,
+                     enrichment: Optional[EnrichmentOptions] = None) -> AsyncIterator[List[Task]]:
+        yield await self._mock.search(criteria, enrichment)
+
     @property
     def mock(self) -> AsyncMock:
         return self._mock
\ No newline at end of file
@@ -109,3 +109,28 @@ class TestTasksFacadeLazyLoading(unittest.IsolatedAsyncioTestCase):
         # then
         self.assertEqual([], result)
         self.task_search_api.mock.search.assert_not_called()
+
+    def test_shouldListConfiguredMemberGroupsFollowedByUnassignedSection(self):
+        # given
+        # when
+        sections = self.facade.get_member_group_sections()
+
+        # then
+        self.assertEqual(["frontend-team", "Unassigned"], [section.id for section in sections])
+
+    async def test_shouldFetchOnlyTasksOfRequestedSection(self):
+        # given
+        unassigned_task = DomainTaskBuilder("2", "Triage incoming bug").with_stage("development").build()
+
+        async def return_current_tasks(criteria, enrichment):
+            return [self._make_task("1"), unassigned_task] if criteria.status_filter == ["In Progress"] else []
+
+        self.task_search_api.mock.search.side_effect = return_current_tasks
+
+        # when
+        frontend_tasks = await self.facade.get_task_structure("frontend-team")
+        unassigned_tasks = await self.facade.get_task_structure("Unassigned")
+
+        # then
+        self.assertEqual(["1"], [task.id for task in frontend_tasks])
+        self.assertEqual(["2"], [task.id for task in unassigned_tasks])
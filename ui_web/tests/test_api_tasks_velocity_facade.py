@@ -1,5 +1,6 @@
 import unittest
 from datetime import datetime
+from unittest.mock import MagicMock
 
 from sd_metrics_lib.utils.time import Duration, TimeUnit, TimePolicy
 
@@ -9,6 +10,7 @@ from ui_web.convertors.velocity_task_detail_convertor import VelocityTaskDetailC
 from ui_web.facades.tasks_velocity_facade import TasksVelocityFacade
 from ui_web.tests.mocks.mock_task_search_api import MockTaskSearchApi
 from ui_web.tests.mocks.mock_velocity_calculation_api import MockVelocityCalculationApi
+from velocity.app.domain.task_velocity_breakdown_service import TaskVelocityBreakdownService
 
 _START_DATE = datetime(2024, 1, 1)
 _END_DATE = datetime(2024, 1, 31)
@@ -38,7 +40,8 @@ def _build_task(task_id, title, story_points, time_by_assignee):
 
 def _create_facade(task_search_api, velocity_calculation_api,
                     member_group_members=None,
-                    member_group_custom_filters=None):
+                    member_group_custom_filters=None,
+                    period_tasks_api=None):
     return TasksVelocityFacade(
         task_search_api=task_search_api,
         create_velocity_search_criteria=lambda start, end: TaskSearchCriteria(
@@ -50,9 +53,11 @@ def _create_facade(task_search_api, velocity_calculation_api,
             time_policy=TimePolicy.BUSINESS_HOURS
         ),
         velocity_calculation_api=velocity_calculation_api,
+        task_velocity_breakdown_api=TaskVelocityBreakdownService(),
         in_progress_status_codes=_IN_PROGRESS_STATUSES,
         development_stage_status_codes=_DEVELOPMENT_STAGE_STATUSES,
-        member_group_custom_filters=member_group_custom_filters
+        member_group_custom_filters=member_group_custom_filters,
+        period_tasks_api=period_tasks_api
     )
 
 
@@ -261,5 +266,60 @@ class TestTasksVelocityFacadeWorklogTransitionStatuses(unittest.IsolatedAsyncioT
         self.assertEqual(_IN_PROGRESS_STATUSES, enrichment.worklog_transition_statuses)
 
 
+class TestTasksVelocityFacadePeriodTaskReuse(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.task_search_api = MockTaskSearchApi()
+        self.velocity_calculation_api = MockVelocityCalculationApi()
+        self.velocity_calculation_api.mock.calculate_ideal_velocity.return_value = 2.0
+        self.period_tasks_api = MagicMock()
+
+    async def test_shouldRenderTeamTasksFromChartPeriodTasksWithoutSearching(self):
+        # Given
+        task = _build_task("TASK-1", "Cached feature", story_points=5.0, time_by_assignee={"alice": 28800})
+        self.period_tasks_api.find_period_tasks.return_value = [task]
+        facade = _create_facade(self.task_search_api, self.velocity_calculation_api,
+                                period_tasks_api=self.period_tasks_api)
+
+        # When
+        result = await facade.get_team_tasks(_START_DATE, _END_DATE, "backend-team")
+
+        # Then
+        self.assertEqual(["TASK-1"], [entry.id for entry in result])
+        self.task_search_api.mock.search.assert_not_called()
+        task_filter = self.period_tasks_api.find_period_tasks.call_args.args[3]
+        self.assertIsNone(task_filter.worklog_transition_statuses)
+
+    async def test_shouldFallBackToSearchWhenPeriodTasksMissing(self):
+        # Given
+        task = _build_task("TASK-2", "Fresh feature", story_points=3.0, time_by_assignee={"bob": 28800})
+        self.period_tasks_api.find_period_tasks.return_value = None
+        self.task_search_api.mock.search.return_value = [task]
+        facade = _create_facade(self.task_search_api, self.velocity_calculation_api,
+                                period_tasks_api=self.period_tasks_api)
+
+        # When
+        result = await facade.get_tasks(["bob"], _START_DATE, _END_DATE)
+
+        # Then
+        self.assertEqual(["TASK-2"], [entry.id for entry in result])
+        self.task_search_api.mock.search.assert_called_once()
+        task_filter = self.period_tasks_api.find_period_tasks.call_args.args[3]
+        self.assertEqual(_DEVELOPMENT_STAGE_STATUSES, task_filter.worklog_transition_statuses)
+
+    async def test_shouldNotReusePeriodTasksWhenIncludingAllStatuses(self):
+        # Given
+        self.task_search_api.mock.search.return_value = []
+        facade = _create_facade(self.task_search_api, self.velocity_calculation_api,
+                                period_tasks_api=self.period_tasks_api)
+
+        # When
+        await facade.get_tasks(["bob"], _START_DATE, _END_DATE, include_all_statuses=True)
+
+        # Then
+        self.period_tasks_api.find_period_tasks.assert_not_called()
+        self.task_search_api.mock.search.assert_called_once()
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,103 @@
+import unittest
+
+from django.core.cache.backends.locmem import LocMemCache
+from django.http import HttpResponse
+from django.test import RequestFactory
+
+from metrics import version_stamps
+from metrics.version_stamps import VersionStamps
+from ui_web.container import ui_web_container
+from ui_web.utils.data_version_etag import DataVersionEtag
+from ui_web.views.graceful_template_view import GracefulTemplateView
+
+
+class FakeClock:
+
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class CountingView(GracefulTemplateView):
+    etag_scopes = (version_stamps.PROJECT,)
+    renders = 0
+
+    def populate_context(self, context, **kwargs):
+        pass
+
+    def render_to_response(self, context, **response_kwargs):
+        CountingView.renders += 1
+        return HttpResponse("rendered")
+
+
+class TestDataVersionEtag(unittest.TestCase):
+
+    def setUp(self):
+        cache = LocMemCache("etag-version-stamps", {})
+        cache.clear()
+        self.stamps = VersionStamps(cache)
+        self.clock = FakeClock()
+        self.etag = DataVersionEtag(self.stamps, ["PROJ"], window_seconds=60, clock=self.clock)
+        self.factory = RequestFactory()
+        self._original_etag = ui_web_container._data_version_etag
+        ui_web_container._data_version_etag = self.etag
+        CountingView.renders = 0
+
+    def tearDown(self):
+        ui_web_container._data_version_etag = self._original_etag
+
+    def test_shouldKeepEtagUntilProjectStampIsBumped(self):
+        # given
+        first = self.etag.build("View", ["/partials/tasks/?member_group_id=backend"], [version_stamps.PROJECT])
+
+        # when
+        unchanged = self.etag.build("View", ["/partials/tasks/?member_group_id=backend"], [version_stamps.PROJECT])
+        self.stamps.bump(version_stamps.PROJECT, ["PROJ"])
+        bumped = self.etag.build("View", ["/partials/tasks/?member_group_id=backend"], [version_stamps.PROJECT])
+
+        # then
+        self.assertEqual(first, unchanged)
+        self.assertNotEqual(first, bumped)
+
+    def test_shouldChangeEtagWithRequestParametersAndTimeWindow(self):
+        # given
+        first = self.etag.build("View", ["/partials/tasks/?member_group_id=backend"], [version_stamps.PROJECT])
+
+        # when
+        other_filter = self.etag.build("View", ["/partials/tasks/?member_group_id=qa"], [version_stamps.PROJECT])
+        self.clock.now += 60
+        next_window = self.etag.build("View", ["/partials/tasks/?member_group_id=backend"], [version_stamps.PROJECT])
+
+        # then
+        self.assertNotEqual(first, other_filter)
+        self.assertNotEqual(first, next_window)
+
+    def test_shouldAnswerNotModifiedWithoutRenderingWhenClientHoldsCurrentVersion(self):
+        # given
+        response = CountingView.as_view()(self.factory.get("/partials/tasks/"))
+
+        # when
+        repeated = CountingView.as_view()(self.factory.get("/partials/tasks/", HTTP_IF_NONE_MATCH=response['ETag']))
+
+        # then
+        self.assertEqual(200, response.status_code)
+        self.assertEqual(304, repeated.status_code)
+        self.assertEqual(1, CountingView.renders)
+
+    def test_shouldRenderAgainAfterStampBump(self):
+        # given
+        response = CountingView.as_view()(self.factory.get("/partials/tasks/"))
+        self.stamps.bump(version_stamps.PROJECT, ["PROJ"])
+
+        # when
+        repeated = CountingView.as_view()(self.factory.get("/partials/tasks/", HTTP_IF_NONE_MATCH=response['ETag']))
+
+        # then
+        self.assertEqual(200, repeated.status_code)
+        self.assertEqual(2, CountingView.renders)
+
+
+if __name__ == '__main__':
+    unittest.main()
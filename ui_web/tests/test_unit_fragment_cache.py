@@ -0,0 +1,72 @@
+import unittest
+from unittest.mock import patch
+
+from django.core.cache.backends.locmem import LocMemCache
+from django.template.loader import get_template
+
+from ui_web.data.pull_request_data import PullRequestData
+from ui_web.utils.fragment_cache import FragmentCache
+
+
+class CountingTemplate:
+
+    def __init__(self, template_name: str):
+        self._template = get_template(template_name)
+        self.rendered_ids = []
+
+    def render(self, context):
+        self.rendered_ids.append(context["pull_request"].id)
+        return self._template.render(context)
+
+
+class TestFragmentCache(unittest.TestCase):
+
+    def setUp(self):
+        cache = LocMemCache("test-rendered-fragments", {})
+        cache.clear()
+        self.fragment_cache = FragmentCache(cache)
+        self.template = CountingTemplate("partials/pull_request_row.html")
+        self.pull_requests = [PullRequestData(id="1", title="First"), PullRequestData(id="2", title="Second")]
+
+    def _render(self, **flags) -> str:
+        with patch("ui_web.utils.fragment_cache.get_template", return_value=self.template):
+            return self.fragment_cache.render_all("partials/pull_request_row.html", self.pull_requests,
+                                                  "pull_request", flags)
+
+    def test_shouldStitchCachedRowsWithoutRenderingAgain(self):
+        # given
+        first = self._render()
+
+        # when
+        second = self._render()
+
+        # then
+        self.assertEqual(first, second)
+        self.assertEqual(["1", "2"], self.template.rendered_ids)
+        self.assertLess(first.index("First"), first.index("Second"))
+
+    def test_shouldRenderOnlyChangedRow(self):
+        # given
+        self._render()
+        self.pull_requests[1].title = "Second renamed"
+
+        # when
+        html = self._render()
+
+        # then
+        self.assertEqual(["1", "2", "2"], self.template.rendered_ids)
+        self.assertIn("Second renamed", html)
+
+    def test_shouldKeyRowsByColumnFlags(self):
+        # given
+        self._render(release_column_enabled=False)
+
+        # when
+        self._render(release_column_enabled=True)
+
+        # then
+        self.assertEqual(["1", "2", "1", "2"], self.template.rendered_ids)
+
+
+if __name__ == '__main__':
+    unittest.main()
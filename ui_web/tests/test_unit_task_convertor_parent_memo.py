@@ -0,0 +1,60 @@
+import unittest
+
+from sd_metrics_lib.utils.time import TimePolicy
+
+from tasks.tests.fixtures.task_builders import TaskBuilder
+from ui_web.convertors.task_convertor import TaskConvertor
+
+
+class TestTaskConvertorParentMemo(unittest.TestCase):
+
+    def test_shouldConvertSharedParentStubOnce(self):
+        # given
+        parent = TaskBuilder.epic_parent_task().build()
+        first = TaskBuilder.sprint_story().assigned_to_senior_developer().build()
+        second = TaskBuilder.ui_enhancement().assigned_to_junior_developer().build()
+        first.parent = parent
+        second.parent = parent
+        convertor = TaskConvertor(TimePolicy.BUSINESS_HOURS)
+
+        # when
+        first_data, second_data = convertor.convert_tasks_to_data([first, second])
+
+        # then
+        self.assertIs(first_data.parent, second_data.parent)
+        self.assertEqual(parent.id, first_data.parent.id)
+
+    def test_shouldConvertDistinctParentObjectsSeparately(self):
+        # given
+        first = TaskBuilder.sprint_story().build()
+        second = TaskBuilder.sprint_story().build()
+        first.parent = TaskBuilder.epic_parent_task().build()
+        second.parent = TaskBuilder.epic_parent_task().with_url("https://example/other").build()
+        convertor = TaskConvertor(TimePolicy.BUSINESS_HOURS)
+
+        # when
+        first_data, second_data = convertor.convert_tasks_to_data([first, second])
+
+        # then
+        self.assertIsNot(first_data.parent, second_data.parent)
+        self.assertEqual("https://example/other", second_data.parent.system_metadata.url)
+
+    def test_shouldNotKeepParentsBetweenConvertCalls(self):
+        # given
+        parent = TaskBuilder.epic_parent_task().build()
+        task = TaskBuilder.sprint_story().build()
+        task.parent = parent
+        convertor = TaskConvertor(TimePolicy.BUSINESS_HOURS)
+
+        # when
+        first_data = convertor.convert_tasks_to_data([task])[0]
+        parent.title = "Renamed epic"
+        second_data = convertor.convert_tasks_to_data([task])[0]
+
+        # then
+        self.assertIsNot(first_data.parent, second_data.parent)
+        self.assertEqual("Renamed epic", second_data.parent.title)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,181 @@
+import unittest
+from typing import Callable, List
+
+from django.core.cache.backends.locmem import LocMemCache
+
+from metrics import version_stamps
+from metrics.version_stamps import VersionStamps
+from ui_web.data.task_data import TaskData
+from ui_web.tests.fixtures.ui_web_builders import TaskDataBuilder
+from ui_web.utils.task_event_stream import TaskEventScope, TaskEventStream
+
+
+def _task(task_id: str, stage: str = "development", story_points: float = 3.0) -> TaskData:
+    return TaskDataBuilder(task_id, f"Task {task_id}").with_stage(stage).with_story_points(story_points).build()
+
+
+class FakeBoard:
+
+    def __init__(self, tasks: List[TaskData]):
+        self.tasks = tasks
+        self.fetches = 0
+        self.renders = 0
+
+    def fetch_tasks(self) -> List[TaskData]:
+        self.fetches += 1
+        return list(self.tasks)
+
+    def render_rows(self, scope: TaskEventScope, tasks: List[TaskData]) -> str:
+        self.renders += 1
+        return "\n".join(f'<tbody id="task-row-{task.id}" hx-swap-oob="true"></tbody>' for task in tasks)
+
+    def scope(self, section_id: str = "current-tasks-board", member_group_id: str = "backend") -> TaskEventScope:
+        return TaskEventScope(section_id=section_id, key=member_group_id, member_group_id=member_group_id,
+                              fetch_tasks=self.fetch_tasks)
+
+
+class FakeClock:
+
+    def __init__(self):
+        self.now = 0.0
+        self.changes: List[Callable[[], None]] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.now += seconds
+        if self.changes:
+            self.changes.pop(0)()
+
+
+class TestTaskEventStream(unittest.TestCase):
+
+    def setUp(self):
+        stamps_cache = LocMemCache("task-events-version-stamps", {})
+        stamps_cache.clear()
+        self.snapshot_cache = LocMemCache("task-events-snapshots", {})
+        self.snapshot_cache.clear()
+        self.stamps = VersionStamps(stamps_cache)
+        self.clock = FakeClock()
+        self.stream = TaskEventStream(self.stamps, ["PROJ"], self.snapshot_cache, poll_seconds=5,
+                                      resync_seconds=60, max_seconds=20, clock=self.clock, sleep=self.clock.sleep)
+        self.board = FakeBoard([_task("PROJ-1"), _task("PROJ-2")])
+
+    def _events(self, last_event_id: str = None) -> List[str]:
+        return list(self.stream.events([self.board.scope()], self.board.render_rows, "list", last_event_id))
+
+    def _change(self, *tasks: TaskData) -> Callable[[], None]:
+        def apply():
+            self.board.tasks = list(tasks)
+            self.stamps.bump(version_stamps.MEMBER_GROUP, ["backend"])
+        return apply
+
+    def test_shouldOnlyMarkWhereStreamStartsOnFirstConnection(self):
+        # given
+        # when
+        events = self._events()
+
+        # then
+        self.assertTrue(events[1].startswith("id: "))
+        self.assertNotIn("event:", "".join(events))
+
+    def test_shouldRefetchOnlyAfterVersionStampMoves(self):
+        # given
+        self.clock.changes = [lambda: None, self._change(_task("PROJ-1"), _task("PROJ-2"))]
+
+        # when
+        self._events()
+
+        # then
+        self.assertEqual(2, self.board.fetches)
+
+    def test_shouldSendOnlyEditedRows(self):
+        # given
+        self.clock.changes = [self._change(_task("PROJ-1", story_points=8.0), _task("PROJ-2"))]
+
+        # when
+        events = self._events()
+
+        # then
+        rows_events = [event for event in events if "event: task-rows" in event]
+        self.assertEqual(1, len(rows_events))
+        self.assertIn('id="task-row-PROJ-1"', rows_events[0])
+        self.assertNotIn("PROJ-2", rows_events[0])
+
+    def test_shouldAskBoardToReloadWhenTaskMovesStage(self):
+        # given
+        self.clock.changes = [self._change(_task("PROJ-1", stage="review"), _task("PROJ-2"))]
+
+        # when
+        events = "".join(self._events())
+
+        # then
+        self.assertIn("event: tasks-restructured-current-tasks-board", events)
+        self.assertNotIn("event: task-rows", events)
+
+    def test_shouldDiffAgainstLastEventAfterReconnect(self):
+        # given
+        first_connection = self._events()
+        last_event_id = first_connection[1].split("id: ")[1].strip()
+        self._change(_task("PROJ-1"), _task("PROJ-2", story_points=1.0))()
+        self.clock.now = 0.0
+
+        # when
+        events = self._events(last_event_id)
+
+        # then
+        rows_events = [event for event in events if "event: task-rows" in event]
+        self.assertEqual(1, len(rows_events))
+        self.assertIn('id="task-row-PROJ-2"', rows_events[0])
+
+    def test_shouldShareSnapshotAndRenderedRowsBetweenStreamsOfSameScope(self):
+        # given
+        first_stream = self.stream.events([self.board.scope()], self.board.render_rows, "list", None)
+        second_stream = self.stream.events([self.board.scope()], self.board.render_rows, "list", None)
+        for _ in range(2):
+            next(first_stream)
+            next(second_stream)
+        self._change(_task("PROJ-1", story_points=8.0), _task("PROJ-2"))()
+
+        # when
+        first_event = next(first_stream)
+        second_event = next(second_stream)
+
+        # then
+        self.assertEqual(2, self.board.fetches)
+        self.assertEqual(1, self.board.renders)
+        self.assertIn("event: task-rows", first_event)
+        self.assertEqual(first_event, second_event)
+
+    def test_shouldDispatchSectionEventsOverOnePageStream(self):
+        # given
+        backend = FakeBoard([_task("PROJ-1"), _task("PROJ-2")])
+        frontend = FakeBoard([_task("PROJ-3")])
+        scopes = [backend.scope("task-section-backend", "backend"), frontend.scope("task-section-frontend", "frontend")]
+
+        def move_backend_task():
+            backend.tasks = [_task("PROJ-1", stage="review"), _task("PROJ-2")]
+            self.stamps.bump(version_stamps.MEMBER_GROUP, ["backend"])
+
+        self.clock.changes = [move_backend_task]
+
+        # when
+        events = "".join(self.stream.events(scopes, backend.render_rows, "list", None))
+
+        # then
+        self.assertIn("event: tasks-restructured-task-section-backend", events)
+        self.assertNotIn("task-section-frontend", events)
+        self.assertEqual(1, frontend.fetches)
+
+    def test_shouldReloadEverySectionWhenLastEventIsUnknown(self):
+        # when
+        events = "".join(self.stream.events([self.board.scope("task-section-backend")], self.board.render_rows,
+                                            "list", "expired-page"))
+
+        # then
+        self.assertIn("event: tasks-restructured-task-section-backend", events)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -3,6 +3,7 @@ import unittest
 from ui_web.convertors.task_filter_convertor import TaskFilterConvertor
 from ui_web.tests.fixtures.filter_task_builders import task_data
 from ui_web.utils.filter_fields import build_field_filters
+from ui_web.utils.task_filter_utils import TaskFilterUtils
 
 _FIELD_FILTERS = build_field_filters(["priority", "assignee"])
 
@@ -47,7 +48,7 @@ class TestTaskFilterConvertorToPanel(unittest.TestCase):
         tasks = [task_data("TASK-1", priority=1, assignee_id="alice")]
 
         # when
-        panel = TaskFilterConvertor.to_panel(tasks, {}, _FIELD_FILTERS)
+        panel = TaskFilterConvertor.to_panel(TaskFilterUtils.build_index(tasks, _FIELD_FILTERS), {})
 
         # then
         self.assertEqual(["priority", "assignee"], [field.param for field in panel.fields])
@@ -58,7 +59,7 @@ class TestTaskFilterConvertorToPanel(unittest.TestCase):
         field_filters = build_field_filters(["priority", "release", "assignee"])
 
         # when
-        panel = TaskFilterConvertor.to_panel(tasks, {}, field_filters)
+        panel = TaskFilterConvertor.to_panel(TaskFilterUtils.build_index(tasks, field_filters), {})
 
         # then
         self.assertEqual(["assignee"], [field.param for field in panel.fields])
@@ -68,7 +69,7 @@ class TestTaskFilterConvertorToPanel(unittest.TestCase):
         tasks = [task_data("TASK-1", priority=1), task_data("TASK-2", priority=2)]
 
         # when
-        panel = TaskFilterConvertor.to_panel(tasks, {"priority": "2"}, _FIELD_FILTERS)
+        panel = TaskFilterConvertor.to_panel(TaskFilterUtils.build_index(tasks, _FIELD_FILTERS), {"priority": "2"})
 
         # then
         priority_field = next(field for field in panel.fields if field.param == "priority")
@@ -79,7 +80,7 @@ class TestTaskFilterConvertorToPanel(unittest.TestCase):
         tasks = [task_data("TASK-1", assignee_id="alice")]
 
         # when
-        panel = TaskFilterConvertor.to_panel(tasks, {"assignee": "alice"}, _FIELD_FILTERS)
+        panel = TaskFilterConvertor.to_panel(TaskFilterUtils.build_index(tasks, _FIELD_FILTERS), {"assignee": "alice"})
 
         # then
         self.assertTrue(panel.has_active_selection)
@@ -89,7 +90,33 @@ class TestTaskFilterConvertorToPanel(unittest.TestCase):
         tasks = [task_data("TASK-1", assignee_id="alice")]
 
         # when
-        panel = TaskFilterConvertor.to_panel(tasks, {}, _FIELD_FILTERS)
+        panel = TaskFilterConvertor.to_panel(TaskFilterUtils.build_index(tasks, _FIELD_FILTERS), {})
 
         # then
         self.assertFalse(panel.has_active_selection)
+
+    def test_shouldCountTasksPerOptionWhenNoSelectionActive(self):
+        # given
+        tasks = [task_data("TASK-1", priority=1), task_data("TASK-2", priority=2), task_data("TASK-3", priority=2)]
+
+        # when
+        panel = TaskFilterConvertor.to_panel(TaskFilterUtils.build_index(tasks, _FIELD_FILTERS), {})
+
+        # then
+        priority_field = next(field for field in panel.fields if field.param == "priority")
+        self.assertEqual({"1": 1, "2": 2}, {option.id: option.count for option in priority_field.options})
+
+    def test_shouldCountOptionsAgainstOtherSelectionsOnly(self):
+        # given
+        tasks = [task_data("TASK-1", priority=1, assignee_id="alice"),
+                 task_data("TASK-2", priority=2, assignee_id="alice"),
+                 task_data("TASK-3", priority=2, assignee_id="bob")]
+        selections = {"priority": "1", "assignee": "alice"}
+
+        # when
+        panel = TaskFilterConvertor.to_panel(TaskFilterUtils.build_index(tasks, _FIELD_FILTERS), selections)
+
+        # then
+        counts = {field.param: {option.id: option.count for option in field.options} for field in panel.fields}
+        self.assertEqual({"1": 1, "2": 1}, counts["priority"])
+        self.assertEqual({"alice": 1, "bob": 0}, counts["assignee"])
@@ -1,5 +1,6 @@
 import unittest
 
+from ui_web.data.task_filter_data import UNASSIGNED_OPTION_ID
 from ui_web.tests.fixtures.filter_task_builders import task_data
 from ui_web.utils.filter_fields import build_field_filters
 from ui_web.utils.task_filter_utils import TaskFilterUtils
@@ -52,3 +53,35 @@ class TestTaskFilterUtils(unittest.TestCase):
 
         # then
         self.assertEqual([], result)
+
+
+class TestTaskFilterUtilsIndex(unittest.TestCase):
+
+    def test_shouldMatchLinearFilterWhenFilteringThroughIndex(self):
+        # given
+        tasks = [task_data("TASK-1", priority=1, assignee_id="alice"), task_data("TASK-2", priority=2),
+                 task_data("TASK-3", priority=1, assignee_id="bob"), task_data("TASK-4", priority=1)]
+        index = TaskFilterUtils.build_index(tasks, _FIELD_FILTERS)
+        selections_list = [{}, {"priority": "1"}, {"assignee": UNASSIGNED_OPTION_ID},
+                           {"priority": "1", "assignee": UNASSIGNED_OPTION_ID}, {"priority": "9"}]
+
+        # when
+        results = [TaskFilterUtils.filter_index(index, selections) for selections in selections_list]
+
+        # then
+        expected = [TaskFilterUtils.filter_tasks(tasks, selections, _FIELD_FILTERS) for selections in selections_list]
+        self.assertEqual([[task.id for task in result] for result in expected],
+                         [[task.id for task in result] for result in results])
+
+    def test_shouldIndexEveryValueOfMultiValueField(self):
+        # given
+        tasks = [task_data("TASK-1", releases=[("r1", "1.0"), ("r2", "2.0")]),
+                 task_data("TASK-2", releases=[("r2", "2.0")])]
+
+        # when
+        index = TaskFilterUtils.build_index(tasks, build_field_filters(["release"]))
+
+        # then
+        self.assertEqual(["TASK-1", "TASK-2"],
+                         [task.id for task in TaskFilterUtils.filter_index(index, {"release": "r2"})])
+        self.assertEqual([("r1", "1.0"), ("r2", "2.0")], index.fields[0].options)
@@ -696,3 +696,33 @@ class TestTaskSortUtilsNaturalOrdering(unittest.TestCase):
 
         # then
         self.assertEqual(["PROJ-456", "PROJ-001", "PROJ-123"], [task.id for task in result])
+
+
+class TestTaskSortUtilsCompiledPlans(unittest.TestCase):
+
+    def test_shouldMatchPassPerCriterionOrderWhenMixingDescendingNamesAndNumbers(self):
+        # given
+        tasks = [
+            TaskDataBuilder(f"PROJ-{index}", f"Task {index}").assigned_to(assignee).with_priority(priority).build()
+            for index, (assignee, priority) in enumerate([("bob", 2), ("alice", 1), ("bob", 1), ("alice2", 3),
+                                                          ("alice10", 3), ("bob", 2)])
+        ]
+
+        # when
+        result = TaskSortUtils.sort_tasks(tasks, sorting_config("-assignee,-priority"))
+
+        # then
+        self.assertEqual(["PROJ-0", "PROJ-5", "PROJ-2", "PROJ-1", "PROJ-4", "PROJ-3"], [task.id for task in result])
+
+    def test_shouldCompileEachCriteriaStringOnce(self):
+        # given
+        tasks = [TaskDataBuilder.sprint_dashboard_task().build(), TaskDataBuilder.team_velocity_task().build()]
+        TaskSortUtils._compile_plan.cache_clear()
+
+        # when
+        for _ in range(3):
+            TaskSortUtils.sort_tasks(tasks, sorting_config("-health,priority,assignee,-story_points"))
+
+        # then
+        self.assertEqual(1, TaskSortUtils._compile_plan.cache_info().misses)
+        self.assertEqual(2, TaskSortUtils._compile_plan.cache_info().hits)
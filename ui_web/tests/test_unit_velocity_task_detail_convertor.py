@@ -4,6 +4,7 @@ from sd_metrics_lib.utils.time import Duration, TimeUnit, TimePolicy
 
 from tasks.app.domain.model.task import Task, Assignment, Assignee, TimeTracking, SystemMetadata
 from ui_web.convertors.velocity_task_detail_convertor import VelocityTaskDetailConvertor
+from velocity.app.domain.task_velocity_breakdown_service import TaskVelocityBreakdownService
 
 
 _TEST_TIME_POLICY = TimePolicy(hours_per_day=4.0, days_per_week=5, days_per_month=22)
@@ -13,6 +14,10 @@ _MIDDLE_VELOCITY = 0.5
 _JUNIOR_VELOCITY = 0.25
 
 
+def _shares(tasks, developer_names):
+    return TaskVelocityBreakdownService().breakdown_by_developer(tasks, developer_names)
+
+
 def _create_convertor(time_policy=_TEST_TIME_POLICY):
     return VelocityTaskDetailConvertor(time_policy=time_policy)
 
@@ -32,8 +37,8 @@ class TestVelocityTaskDetailConvertorDeveloperBreakdown(unittest.TestCase):
         )
 
         # When
-        result = self.convertor.convert_tasks_to_developers_breakdown(
-            [task], ["alice", "bob"], self.velocities
+        result = self.convertor.convert_shares_to_developers_breakdown(
+            _shares([task], ["alice", "bob"]), self.velocities
         )
 
         # Then
@@ -51,8 +56,8 @@ class TestVelocityTaskDetailConvertorDeveloperBreakdown(unittest.TestCase):
         )
 
         # When
-        result = self.convertor.convert_tasks_to_developers_breakdown(
-            [task], ["alice"], self.velocities
+        result = self.convertor.convert_shares_to_developers_breakdown(
+            _shares([task], ["alice"]), self.velocities
         )
 
         # Then
@@ -67,8 +72,8 @@ class TestVelocityTaskDetailConvertorDeveloperBreakdown(unittest.TestCase):
         )
 
         # When
-        result = self.convertor.convert_tasks_to_developers_breakdown(
-            [task], ["alice"], self.velocities
+        result = self.convertor.convert_shares_to_developers_breakdown(
+            _shares([task], ["alice"]), self.velocities
         )
 
         # Then
@@ -79,8 +84,8 @@ class TestVelocityTaskDetailConvertorDeveloperBreakdown(unittest.TestCase):
         task = _build_task("TASK-1", "Task without time tracking", story_points=5.0)
 
         # When
-        result = self.convertor.convert_tasks_to_developers_breakdown(
-            [task], ["alice"], self.velocities
+        result = self.convertor.convert_shares_to_developers_breakdown(
+            _shares([task], ["alice"]), self.velocities
         )
 
         # Then
@@ -95,8 +100,8 @@ class TestVelocityTaskDetailConvertorDeveloperBreakdown(unittest.TestCase):
         )
 
         # When
-        result = self.convertor.convert_tasks_to_developers_breakdown(
-            [task], ["alice", "bob"], self.velocities
+        result = self.convertor.convert_shares_to_developers_breakdown(
+            _shares([task], ["alice", "bob"]), self.velocities
         )
 
         # Then
@@ -113,8 +118,8 @@ class TestVelocityTaskDetailConvertorDeveloperBreakdown(unittest.TestCase):
         )
 
         # When
-        result = self.convertor.convert_tasks_to_developers_breakdown(
-            [task], ["alice"], self.velocities
+        result = self.convertor.convert_shares_to_developers_breakdown(
+            _shares([task], ["alice"]), self.velocities
         )
 
         # Then
@@ -129,8 +134,8 @@ class TestVelocityTaskDetailConvertorDeveloperBreakdown(unittest.TestCase):
         )
 
         # When
-        result = self.convertor.convert_tasks_to_developers_breakdown(
-            [task], ["alice"], self.velocities
+        result = self.convertor.convert_shares_to_developers_breakdown(
+            _shares([task], ["alice"]), self.velocities
         )
 
         # Then
@@ -152,8 +157,8 @@ class TestVelocityTaskDetailConvertorEstimation(unittest.TestCase):
         velocities = {"alice": _SENIOR_VELOCITY, "charlie": _JUNIOR_VELOCITY}
 
         # When
-        result = self.convertor.convert_tasks_to_developers_breakdown(
-            [task], ["alice", "charlie"], velocities
+        result = self.convertor.convert_shares_to_developers_breakdown(
+            _shares([task], ["alice", "charlie"]), velocities
         )
 
         # Then
@@ -171,8 +176,8 @@ class TestVelocityTaskDetailConvertorEstimation(unittest.TestCase):
         velocities = {"alice": _MIDDLE_VELOCITY}
 
         # When
-        result = self.convertor.convert_tasks_to_developers_breakdown(
-            [task], ["alice"], velocities
+        result = self.convertor.convert_shares_to_developers_breakdown(
+            _shares([task], ["alice"]), velocities
         )
 
         # Then
@@ -188,8 +193,8 @@ class TestVelocityTaskDetailConvertorEstimation(unittest.TestCase):
         velocities = {"alice": _SENIOR_VELOCITY}
 
         # When
-        result = self.convertor.convert_tasks_to_developers_breakdown(
-            [task], ["alice"], velocities
+        result = self.convertor.convert_shares_to_developers_breakdown(
+            _shares([task], ["alice"]), velocities
         )
 
         # Then
@@ -205,8 +210,8 @@ class TestVelocityTaskDetailConvertorEstimation(unittest.TestCase):
         velocities = {"unknown_dev": None}
 
         # When
-        result = self.convertor.convert_tasks_to_developers_breakdown(
-            [task], ["unknown_dev"], velocities
+        result = self.convertor.convert_shares_to_developers_breakdown(
+            _shares([task], ["unknown_dev"]), velocities
         )
 
         # Then
@@ -224,8 +229,8 @@ class TestVelocityTaskDetailConvertorEstimation(unittest.TestCase):
         velocities = {"alice": _MIDDLE_VELOCITY}
 
         # When
-        result = self.convertor.convert_tasks_to_developers_breakdown(
-            [task], ["alice"], velocities
+        result = self.convertor.convert_shares_to_developers_breakdown(
+            _shares([task], ["alice"]), velocities
         )
 
         # Then
@@ -241,8 +246,8 @@ class TestVelocityTaskDetailConvertorEstimation(unittest.TestCase):
         velocities = {"alice": _MIDDLE_VELOCITY, "bob": _MIDDLE_VELOCITY}
 
         # When
-        result = self.convertor.convert_tasks_to_developers_breakdown(
-            [task], ["alice", "bob"], velocities
+        result = self.convertor.convert_shares_to_developers_breakdown(
+            _shares([task], ["alice", "bob"]), velocities
         )
 
         # Then
@@ -260,8 +265,8 @@ class TestVelocityTaskDetailConvertorEstimation(unittest.TestCase):
         velocities = {"alice": _SENIOR_VELOCITY}
 
         # When
-        result = self.convertor.convert_tasks_to_developers_breakdown(
-            [task], ["alice"], velocities
+        result = self.convertor.convert_shares_to_developers_breakdown(
+            _shares([task], ["alice"]), velocities
         )
 
         # Then
@@ -3,10 +3,11 @@ from django.urls import path
 
 from .utils.url_utils import django_normalized_base_url
 from .views.current_tasks_view import CurrentTasksView, CurrentTasksChildrenView, CurrentTasksStageView, \
-    AvailableMembersView, TaskPullRequestGatewayView
+    CurrentTasksSectionView, CurrentTasksFiltersView, CurrentTasksEventsView, AvailableMembersView, \
+    TaskPullRequestGatewayView, TaskPullRequestGatewaysView
 from .views.dev_velocity_view import DevVelocityView, DevVelocityChartView, DevStoryPointsChartView, DevVelocityTasksView
 from .views.homepage_view import HomepageView
-from .views.pull_requests_view import PullRequestsView, PullRequestReviewStateView
+from .views.pull_requests_view import PullRequestsView, PullRequestReviewStateView, PullRequestReviewStatesView
 from .views.task_forecast_view import TaskForecastView
 from .views.team_velocity_view import TeamVelocityView, TeamVelocityChartView, TeamStoryPointsChartView, TeamVelocityTasksView
 
@@ -31,15 +32,22 @@ urlpatterns = [
     # Partials for HTMX
     path(_base_prefix + 'partials/tasks/', CurrentTasksView.as_view(), name='partials_tasks'),
     path(_base_prefix + 'partials/tasks/stage/', CurrentTasksStageView.as_view(), name='partials_tasks_stage'),
+    path(_base_prefix + 'partials/tasks/section/', CurrentTasksSectionView.as_view(), name='partials_tasks_section'),
+    path(_base_prefix + 'partials/tasks/filters/', CurrentTasksFiltersView.as_view(), name='partials_tasks_filters'),
+    path(_base_prefix + 'partials/tasks/events/', CurrentTasksEventsView.as_view(), name='partials_tasks_events'),
     path(_base_prefix + 'partials/tasks/available-members/', AvailableMembersView.as_view(),
          name='partials_available_members'),
     path(_base_prefix + 'partials/pull-requests/', PullRequestsView.as_view(), name='partials_pull_requests'),
     path(_base_prefix + 'partials/pull-requests/<str:pull_request_id>/review-state/',
          PullRequestReviewStateView.as_view(), name='partials_pr_review_state'),
+    path(_base_prefix + 'partials/pull-requests/review-states/', PullRequestReviewStatesView.as_view(),
+         name='partials_pr_review_states'),
     path(_base_prefix + 'partials/tasks/<str:task_id>/children/', CurrentTasksChildrenView.as_view(),
          name='partials_task_children'),
     path(_base_prefix + 'partials/tasks/<str:task_id>/pr-gateway/', TaskPullRequestGatewayView.as_view(),
          name='partials_task_pr_gateway'),
+    path(_base_prefix + 'partials/tasks/pr-gateways/', TaskPullRequestGatewaysView.as_view(),
+         name='partials_task_pr_gateways'),
     path(_base_prefix + 'partials/dev-velocity/chart/', DevVelocityChartView.as_view(), name='dev_velocity_chart'),
     path(_base_prefix + 'partials/dev-velocity/sp-chart/', DevStoryPointsChartView.as_view(), name='dev_sp_chart'),
     path(_base_prefix + 'partials/dev-velocity/tasks/', DevVelocityTasksView.as_view(), name='dev_velocity_tasks'),
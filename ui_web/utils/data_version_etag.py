@@ -0,0 +1,33 @@
+import hashlib
+import time
+from typing import Callable, Iterable, List, Optional
+
+from metrics import version_stamps
+from metrics.version_stamps import VersionStamps
+
+
+class DataVersionEtag:
+
+    def __init__(self, stamps: VersionStamps, project_keys: List[str], window_seconds: int,
+                 clock: Callable[[], float] = time.time):
+        self._stamps = stamps
+        self._project_keys = project_keys
+        self._window_seconds = window_seconds
+        self._clock = clock
+
+    def is_enabled(self) -> bool:
+        return self._window_seconds > 0
+
+    def build(self, view_name: str, request_parts: Iterable[str], scopes: Iterable[str]) -> Optional[str]:
+        if not self.is_enabled():
+            return None
+        # Without a webhook bump the tracker data still changes, so every tag also expires with the time window
+        window = int(self._clock() // self._window_seconds)
+        token = self._stamps.token({scope: self._keys_of(scope) for scope in scopes})
+        digest = hashlib.sha256("|".join([view_name, *request_parts, token, str(window)]).encode("utf-8"))
+        return f'"{digest.hexdigest()[:32]}"'
+
+    def _keys_of(self, scope: str) -> List[str]:
+        if scope == version_stamps.PROJECT:
+            return self._project_keys
+        return [version_stamps.ALL]
@@ -13,9 +13,8 @@ LabelledValue = Optional[Tuple[str, str]]
 LabelledValues = List[Tuple[str, str]]
 
 
-def _sorted_options(labels_by_id: dict) -> List[FilterOption]:
-    return [FilterOption(id=value_id, label=label)
-            for value_id, label in sorted(labels_by_id.items(), key=lambda pair: NATURAL_KEY(pair[1]))]
+def _sorted_options(labels_by_id: dict) -> LabelledValues:
+    return sorted(labels_by_id.items(), key=lambda pair: NATURAL_KEY(pair[1]))
 
 
 class FieldFilter(ABC):
@@ -26,19 +25,27 @@ class FieldFilter(ABC):
         self.requires_enrichment = requires_enrichment
 
     def to_field(self, tasks: List[TaskData], selected: Optional[str]) -> Optional[FilterField]:
-        options = self._build_options(tasks)
+        labels_by_id = {}
+        for task in tasks:
+            for value_id, label in self.values_of(task):
+                labels_by_id.setdefault(value_id, label)
+        options = [FilterOption(id=value_id, label=label, selected=value_id == selected)
+                   for value_id, label in self.ordered_options(labels_by_id)]
         if not options:
             return None
-        for option in options:
-            option.selected = option.id == selected
         return FilterField(param=self.param, label=self.label, options=options)
 
+    def matches(self, task: TaskData, selected: str) -> bool:
+        if not selected:
+            return True
+        return any(value_id == selected for value_id, _ in self.values_of(task))
+
     @abstractmethod
-    def _build_options(self, tasks: List[TaskData]) -> List[FilterOption]:
+    def values_of(self, task: TaskData) -> LabelledValues:
         ...
 
     @abstractmethod
-    def matches(self, task: TaskData, selected: str) -> bool:
+    def ordered_options(self, labels_by_id: dict) -> LabelledValues:
         ...
 
 
@@ -51,28 +58,22 @@ class SingleValueFilter(FieldFilter):
         self._missing_option_id = missing_option_id
         self._missing_option_label = missing_option_label
 
-    def _build_options(self, tasks: List[TaskData]) -> List[FilterOption]:
-        labels_by_id = {}
-        has_missing = False
-        for task in tasks:
-            value = self._value_of(task)
-            if value is None:
-                has_missing = True
-            else:
-                labels_by_id.setdefault(value[0], value[1])
+    def values_of(self, task: TaskData) -> LabelledValues:
+        value = self._value_of(task)
+        if value is not None:
+            return [value]
+        if self._missing_option_id is not None:
+            return [(self._missing_option_id, self._missing_option_label)]
+        return []
+
+    def ordered_options(self, labels_by_id: dict) -> LabelledValues:
+        labels_by_id = dict(labels_by_id)
+        missing_label = labels_by_id.pop(self._missing_option_id, None)
         options = _sorted_options(labels_by_id)
-        if has_missing and self._missing_option_id is not None:
-            options.insert(0, FilterOption(id=self._missing_option_id, label=self._missing_option_label))
+        if missing_label is not None:
+            options.insert(0, (self._missing_option_id, missing_label))
         return options
 
-    def matches(self, task: TaskData, selected: str) -> bool:
-        if not selected:
-            return True
-        if self._missing_option_id is not None and selected == self._missing_option_id:
-            return self._value_of(task) is None
-        value = self._value_of(task)
-        return value is not None and value[0] == selected
-
 
 class MultiValueFilter(FieldFilter):
 
@@ -80,17 +81,11 @@ class MultiValueFilter(FieldFilter):
         super().__init__(param, label)
         self._values_of = values_of
 
-    def _build_options(self, tasks: List[TaskData]) -> List[FilterOption]:
-        labels_by_id = {}
-        for task in tasks:
-            for value_id, label in self._values_of(task):
-                labels_by_id.setdefault(value_id, label)
-        return _sorted_options(labels_by_id)
+    def values_of(self, task: TaskData) -> LabelledValues:
+        return self._values_of(task)
 
-    def matches(self, task: TaskData, selected: str) -> bool:
-        if not selected:
-            return True
-        return any(value_id == selected for value_id, _ in self._values_of(task))
+    def ordered_options(self, labels_by_id: dict) -> LabelledValues:
+        return _sorted_options(labels_by_id)
 
 
 class FixedOptionsFilter(FieldFilter):
@@ -99,15 +94,17 @@ class FixedOptionsFilter(FieldFilter):
                  value_of: Callable[[TaskData], Optional[str]], requires_enrichment: bool = False):
         super().__init__(param, label, requires_enrichment)
         self._options = options
+        self._labels_by_id = dict(options)
         self._value_of = value_of
 
-    def _build_options(self, tasks: List[TaskData]) -> List[FilterOption]:
-        return [FilterOption(id=option_id, label=label) for option_id, label in self._options]
+    def values_of(self, task: TaskData) -> LabelledValues:
+        value = self._value_of(task)
+        if value is None:
+            return []
+        return [(value, self._labels_by_id.get(value, value))]
 
-    def matches(self, task: TaskData, selected: str) -> bool:
-        if not selected:
-            return True
-        return self._value_of(task) == selected
+    def ordered_options(self, labels_by_id: dict) -> LabelledValues:
+        return list(self._options)
 
 
 def _priority_value(task: TaskData) -> LabelledValue:
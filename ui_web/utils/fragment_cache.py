@@ -0,0 +1,36 @@
+import hashlib
+from typing import Any, Dict, Iterable, List
+
+from django.template.loader import get_template
+
+
+class FragmentCache:
+    KEY_PREFIX = "fragment||"
+
+    def __init__(self, cache):
+        self._cache = cache
+
+    def render_all(self, template_name: str, items: Iterable[Any], item_name: str, flags: Dict[str, Any]) -> str:
+        items = list(items)
+        flags_part = ",".join(f"{name}={flags[name]}" for name in sorted(flags))
+        keys = [self._key(template_name, item, flags_part) for item in items]
+        cached = self._cache.get_many(keys)
+
+        template = None
+        rendered_by_key: Dict[str, str] = {}
+        fragments: List[str] = []
+        for key, item in zip(keys, items):
+            fragment = cached.get(key) or rendered_by_key.get(key)
+            if fragment is None:
+                template = template or get_template(template_name)
+                fragment = template.render({item_name: item, **flags})
+                rendered_by_key[key] = fragment
+            fragments.append(fragment)
+
+        if rendered_by_key:
+            self._cache.set_many(rendered_by_key)
+        return "".join(fragments)
+
+    def _key(self, template_name: str, item: Any, flags_part: str) -> str:
+        content_hash = hashlib.blake2b(repr(item).encode("utf-8"), digest_size=16).hexdigest()
+        return f"{self.KEY_PREFIX}{template_name}||{getattr(item, 'id', '')}||{content_hash}||{flags_part}"
@@ -1,4 +1,4 @@
-from typing import Dict, List, Optional
+from typing import List
 
 from pull_requests.app.domain.model.pull_request import PullRequest
 from ..data.task_data import LinkedPullRequestData, TaskData
@@ -11,34 +11,15 @@ class PullRequestGatewayLookupUtils:
         if not pull_request_search_api or not tasks_data:
             return
 
-        pull_requests = await pull_request_search_api.search()
-        linked_pull_request_by_task_id = PullRequestGatewayLookupUtils._index_latest_by_task_id(pull_requests)
+        linked_pull_request_by_task_id = await pull_request_search_api.find_linked_pull_requests(
+            [task_data.id for task_data in tasks_data]
+        )
 
         for task_data in tasks_data:
-            task_data.linked_pull_request = linked_pull_request_by_task_id.get(task_data.id)
-
-    @staticmethod
-    def _index_latest_by_task_id(pull_requests: List[PullRequest]) -> Dict[str, LinkedPullRequestData]:
-        latest_pull_request_by_task_id: Dict[str, PullRequest] = {}
-
-        for pull_request in pull_requests:
-            if not pull_request.linked_task_id:
-                continue
-
-            current = latest_pull_request_by_task_id.get(pull_request.linked_task_id)
-            if current is None or PullRequestGatewayLookupUtils._is_more_recent(pull_request, current):
-                latest_pull_request_by_task_id[pull_request.linked_task_id] = pull_request
-
-        return {
-            task_id: PullRequestGatewayLookupUtils._to_linked_pull_request_data(pull_request)
-            for task_id, pull_request in latest_pull_request_by_task_id.items()
-        }
-
-    @staticmethod
-    def _is_more_recent(candidate: PullRequest, current: PullRequest) -> bool:
-        if not candidate.created_date or not current.created_date:
-            return False
-        return candidate.created_date > current.created_date
+            pull_request = linked_pull_request_by_task_id.get(task_data.id)
+            task_data.linked_pull_request = (
+                PullRequestGatewayLookupUtils._to_linked_pull_request_data(pull_request) if pull_request else None
+            )
 
     @staticmethod
     def _to_linked_pull_request_data(pull_request: PullRequest) -> LinkedPullRequestData:
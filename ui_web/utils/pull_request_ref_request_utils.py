@@ -0,0 +1,23 @@
+from typing import List
+
+from pull_requests.app.domain.model.pull_request import PullRequestRef
+
+_REF_PARAMETERS = ('pull_request_id', 'repository_id', 'project_id', 'project')
+
+
+class PullRequestRefRequestUtils:
+
+    @staticmethod
+    def extract_refs(query_dict) -> List[PullRequestRef]:
+        columns = [query_dict.getlist(parameter) for parameter in _REF_PARAMETERS]
+        refs = []
+        for pull_request_id, repository_id, project_id, project_name in zip(*columns):
+            if not pull_request_id:
+                continue
+            refs.append(PullRequestRef(
+                pull_request_id=pull_request_id,
+                repository_id=repository_id,
+                project_id=project_id,
+                project_name=project_name
+            ))
+        return refs
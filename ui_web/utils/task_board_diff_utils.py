@@ -0,0 +1,52 @@
+import hashlib
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+from ..data.task_data import TaskData
+
+TaskBoardSnapshot = Dict[str, Tuple[str, Optional[str], Optional[str]]]
+
+
+@dataclass(slots=True)
+class TaskBoardDiff:
+    changed_tasks: List[TaskData] = field(default_factory=list)
+    restructured: bool = False
+
+
+class TaskBoardDiffUtils:
+
+    @staticmethod
+    def snapshot(tasks: List[TaskData]) -> TaskBoardSnapshot:
+        return {task.id: (TaskBoardDiffUtils._fingerprint(task), TaskBoardDiffUtils._member_group_name(task), task.stage)
+                for task in tasks}
+
+    @staticmethod
+    def digest(snapshot: TaskBoardSnapshot) -> str:
+        content = "|".join(f"{task_id}={state}" for task_id, state in sorted(snapshot.items()))
+        return hashlib.blake2b(content.encode("utf-8"), digest_size=16).hexdigest()
+
+    @staticmethod
+    def diff(previous: TaskBoardSnapshot, current: TaskBoardSnapshot, tasks: List[TaskData]) -> TaskBoardDiff:
+        # Added, removed or moved tasks change group counts and row order, so only in-place edits are sent as rows
+        if previous.keys() != current.keys():
+            return TaskBoardDiff(restructured=True)
+
+        board_diff = TaskBoardDiff()
+        for task in tasks:
+            fingerprint, member_group_name, stage = current[task.id]
+            previous_fingerprint, previous_member_group_name, previous_stage = previous[task.id]
+            if (member_group_name, stage) != (previous_member_group_name, previous_stage):
+                return TaskBoardDiff(restructured=True)
+            if fingerprint != previous_fingerprint:
+                board_diff.changed_tasks.append(task)
+        return board_diff
+
+    @staticmethod
+    def _fingerprint(task: TaskData) -> str:
+        return hashlib.blake2b(repr(task).encode("utf-8"), digest_size=16).hexdigest()
+
+    @staticmethod
+    def _member_group_name(task: TaskData) -> Optional[str]:
+        if task.assignment and task.assignment.member_group:
+            return task.assignment.member_group.name
+        return None
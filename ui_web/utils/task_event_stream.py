@@ -0,0 +1,161 @@
+import hashlib
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+from metrics import version_stamps
+from metrics.version_stamps import VersionStamps
+from ..data.task_data import TaskData
+from .task_board_diff_utils import TaskBoardDiffUtils, TaskBoardSnapshot
+
+ROWS_EVENT = "task-rows"
+RESTRUCTURED_EVENT = "tasks-restructured"
+
+TaskBoardChange = Tuple[str, str]
+
+
+@dataclass(slots=True)
+class TaskEventScope:
+    section_id: str
+    key: str
+    member_group_id: Optional[str]
+    fetch_tasks: Callable[[], List[TaskData]]
+
+
+class TaskEventStream:
+    SNAPSHOT_KEY_PREFIX = "task-board-snapshot||"
+    SCOPE_KEY_PREFIX = "task-board-scope||"
+    CHANGE_KEY_PREFIX = "task-board-change||"
+    PAGE_KEY_PREFIX = "task-board-page||"
+    UNKNOWN_DIGEST = "unknown"
+    RETRY_MILLISECONDS = 5000
+
+    def __init__(self, stamps: VersionStamps, project_keys: List[str], snapshot_cache,
+                 poll_seconds: int, resync_seconds: int, max_seconds: int,
+                 clock: Callable[[], float] = time.time, sleep: Callable[[float], None] = time.sleep):
+        self._stamps = stamps
+        self._project_keys = project_keys
+        self._snapshot_cache = snapshot_cache
+        self._poll_seconds = poll_seconds
+        self._resync_seconds = resync_seconds
+        self._max_seconds = max_seconds
+        self._clock = clock
+        self._sleep = sleep
+
+    def is_enabled(self) -> bool:
+        return self._poll_seconds > 0
+
+    def events(self, scopes: List[TaskEventScope], render_rows: Callable[[TaskEventScope, List[TaskData]], str],
+               render_key: str, last_event_id: Optional[str]) -> Iterator[str]:
+        started_at = self._clock()
+        digests = self._page_digests(scopes, last_event_id)
+        tokens: Dict[str, str] = {}
+
+        yield f"retry: {self.RETRY_MILLISECONDS}\n\n"
+        while True:
+            now = self._clock()
+            page_events = []
+            page_id = None
+            last_sent_page_id = None
+            for scope in scopes:
+                token = self._version_token(scope.member_group_id, now)
+                if tokens.get(scope.section_id) == token:
+                    continue
+                tokens[scope.section_id] = token
+                change = self._scope_change(scope, token, digests.get(scope.section_id), render_rows, render_key)
+                if change is None:
+                    continue
+                digests[scope.section_id], event_name, data = change
+                page_id = self._remember_page(digests)
+                if event_name:
+                    page_events.append(self._event(page_id, event_name, data))
+                    last_sent_page_id = page_id
+            if page_id is not None and page_id != last_sent_page_id:
+                # First connection: the page already shows this state, only remember where the stream starts from
+                page_events.append(f"id: {page_id}\n\n")
+            # The keep-alive comment is also what ends the stream once a board closes its connection
+            yield "".join(page_events) or ": unchanged\n\n"
+
+            if now - started_at + self._poll_seconds >= self._max_seconds:
+                return
+            self._sleep(self._poll_seconds)
+
+    def _scope_change(self, scope: TaskEventScope, token: str, digest: Optional[str],
+                      render_rows: Callable[[TaskEventScope, List[TaskData]], str],
+                      render_key: str) -> Optional[Tuple[str, Optional[str], Optional[str]]]:
+        # Streams of the same scope share the snapshot of a version token and the change between two snapshots,
+        # so only the first stream to see a stamp move fetches and renders
+        current_digest = self._snapshot_cache.get(self._scope_key(scope, token))
+        if current_digest is not None:
+            if current_digest == digest:
+                return None
+            if digest is None:
+                return current_digest, None, None
+            cached_change = self._snapshot_cache.get(self._change_key(scope, render_key, digest, current_digest))
+            if cached_change is not None:
+                return (current_digest, *cached_change)
+
+        tasks = scope.fetch_tasks()
+        snapshot = TaskBoardDiffUtils.snapshot(tasks)
+        current_digest = TaskBoardDiffUtils.digest(snapshot)
+        self._snapshot_cache.set(self._snapshot_key(current_digest), snapshot)
+        self._snapshot_cache.set(self._scope_key(scope, token), current_digest)
+        if current_digest == digest:
+            return None
+        if digest is None:
+            return current_digest, None, None
+
+        change = self._change(scope, self._snapshot_cache.get(self._snapshot_key(digest)), snapshot, tasks,
+                              render_rows)
+        self._snapshot_cache.set(self._change_key(scope, render_key, digest, current_digest), change)
+        return (current_digest, *change)
+
+    @staticmethod
+    def _change(scope: TaskEventScope, previous: Optional[TaskBoardSnapshot], snapshot: TaskBoardSnapshot,
+                tasks: List[TaskData], render_rows: Callable[[TaskEventScope, List[TaskData]], str]) -> TaskBoardChange:
+        restructured = (f"{RESTRUCTURED_EVENT}-{scope.section_id}", scope.section_id)
+        if previous is None:
+            return restructured
+        board_diff = TaskBoardDiffUtils.diff(previous, snapshot, tasks)
+        if board_diff.restructured:
+            return restructured
+        return ROWS_EVENT, render_rows(scope, board_diff.changed_tasks)
+
+    def _page_digests(self, scopes: List[TaskEventScope], last_event_id: Optional[str]) -> Dict[str, str]:
+        if not last_event_id:
+            return {}
+        page_digests = self._snapshot_cache.get(self._page_key(last_event_id)) or {}
+        return {scope.section_id: page_digests.get(scope.section_id, self.UNKNOWN_DIGEST) for scope in scopes}
+
+    def _remember_page(self, digests: Dict[str, str]) -> str:
+        content = "|".join(f"{section_id}={digest}" for section_id, digest in sorted(digests.items()))
+        page_id = hashlib.blake2b(content.encode("utf-8"), digest_size=16).hexdigest()
+        self._snapshot_cache.set(self._page_key(page_id), dict(digests))
+        return page_id
+
+    def _version_token(self, member_group_id: Optional[str], now: float) -> str:
+        dependencies = {version_stamps.PROJECT: self._project_keys}
+        if member_group_id:
+            dependencies[version_stamps.MEMBER_GROUP] = [member_group_id]
+        token = self._stamps.token(dependencies)
+        if self._resync_seconds <= 0:
+            return token
+        # Installs without webhooks never move a stamp, so every stream of a scope resyncs in the same time slot
+        return f"{token}|{int(now // self._resync_seconds)}"
+
+    @staticmethod
+    def _event(event_id: str, event_name: str, data: str) -> str:
+        data_lines = "".join(f"data: {line}\n" for line in data.splitlines() if line.strip()) or "data: \n"
+        return f"id: {event_id}\nevent: {event_name}\n{data_lines}\n"
+
+    def _snapshot_key(self, digest: str) -> str:
+        return f"{self.SNAPSHOT_KEY_PREFIX}{digest}"
+
+    def _scope_key(self, scope: TaskEventScope, token: str) -> str:
+        return f"{self.SCOPE_KEY_PREFIX}{scope.key}||{token}"
+
+    def _change_key(self, scope: TaskEventScope, render_key: str, digest: str, current_digest: str) -> str:
+        return f"{self.CHANGE_KEY_PREFIX}{scope.key}||{scope.section_id}||{render_key}||{digest}||{current_digest}"
+
+    def _page_key(self, page_id: str) -> str:
+        return f"{self.PAGE_KEY_PREFIX}{page_id}"
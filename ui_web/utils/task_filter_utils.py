@@ -1,6 +1,7 @@
-from typing import Dict, List
+from typing import Dict, List, Optional
 
 from ..data.task_data import TaskData
+from ..data.task_filter_data import IndexedFilterField, TaskFilterIndex
 from .filter_fields import FieldFilter
 
 
@@ -15,8 +16,64 @@ class TaskFilterUtils:
             return tasks
         return [task for task in tasks if TaskFilterUtils._matches_all(task, selections, active_filters)]
 
+    @staticmethod
+    def build_index(tasks: List[TaskData], field_filters: List[FieldFilter]) -> TaskFilterIndex:
+        positions_by_field = [{} for _ in field_filters]
+        labels_by_field = [{} for _ in field_filters]
+        for position, task in enumerate(tasks):
+            for field_filter, positions_by_id, labels_by_id in zip(field_filters, positions_by_field,
+                                                                   labels_by_field):
+                for value_id, label in field_filter.values_of(task):
+                    positions_by_id.setdefault(value_id, []).append(position)
+                    labels_by_id.setdefault(value_id, label)
+
+        fields = [
+            IndexedFilterField(
+                param=field_filter.param,
+                label=field_filter.label,
+                options=field_filter.ordered_options(labels_by_id),
+                positions_by_id={value_id: TaskFilterUtils._to_bitset(positions, len(tasks))
+                                 for value_id, positions in positions_by_id.items()}
+            )
+            for field_filter, positions_by_id, labels_by_id in zip(field_filters, positions_by_field, labels_by_field)
+        ]
+        return TaskFilterIndex(tasks=tasks, fields=fields)
+
+    @staticmethod
+    def filter_index(index: TaskFilterIndex, selections: Dict[str, str]) -> List[TaskData]:
+        if not any(indexed_field.param in selections for indexed_field in index.fields):
+            return index.tasks
+        return TaskFilterUtils._tasks_at(index.tasks, TaskFilterUtils.matching_bitset(index, selections))
+
+    @staticmethod
+    def matching_bitset(index: TaskFilterIndex, selections: Dict[str, str],
+                        ignored_param: Optional[str] = None) -> int:
+        bitset = (1 << len(index.tasks)) - 1
+        for indexed_field in index.fields:
+            selected = selections.get(indexed_field.param)
+            if selected and indexed_field.param != ignored_param:
+                bitset &= indexed_field.positions_by_id.get(selected, 0)
+        return bitset
+
     @staticmethod
     def _matches_all(task: TaskData, selections: Dict[str, str],
                      active_filters: List[FieldFilter]) -> bool:
         return all(field_filter.matches(task, selections[field_filter.param])
                    for field_filter in active_filters)
+
+    @staticmethod
+    def _to_bitset(positions: List[int], size: int) -> int:
+        bits = bytearray((size + 7) // 8)
+        for position in positions:
+            bits[position >> 3] |= 1 << (position & 7)
+        return int.from_bytes(bits, 'little')
+
+    @staticmethod
+    def _tasks_at(tasks: List[TaskData], bitset: int) -> List[TaskData]:
+        bits = bin(bitset)[:1:-1]
+        matching_tasks = []
+        position = bits.find('1')
+        while position != -1:
+            matching_tasks.append(tasks[position])
+            position = bits.find('1', position + 1)
+        return matching_tasks
@@ -1,4 +1,6 @@
-from typing import Callable, List, Set, Union, Optional, Tuple, Any
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 from natsort import natsort_keygen, ns
 
@@ -18,6 +20,44 @@ SORT_EXTRACTORS = {
 _NATURAL_KEY = natsort_keygen(alg=ns.IGNORECASE)
 
 
+@dataclass(slots=True, frozen=True)
+class SortCriterion:
+    value_function: Callable[[Union[TaskData, 'Task']], Any]
+    is_ascending: bool
+    natural_key: Optional[Callable[[Any], Any]] = None
+
+    def column(self, tasks: List[Union[TaskData, 'Task']]) -> List[Any]:
+        values = [self.value_function(task) for task in tasks]
+        if self.natural_key is None:
+            return values if self.is_ascending else [-value for value in values]
+        rank_by_value = self._rank_by_value(values)
+        return [rank_by_value[value] for value in values]
+
+    def _rank_by_value(self, values: List[Any]) -> Dict[Any, int]:
+        # Natural keys are built once per distinct value; their ranks compare as plain ints and negate for descending
+        direction = 1 if self.is_ascending else -1
+        keyed_values = sorted(((value, self.natural_key(value)) for value in set(values)), key=lambda pair: pair[1])
+        rank_by_value = {}
+        rank = 0
+        for position, (value, key) in enumerate(keyed_values):
+            if position and key != keyed_values[position - 1][1]:
+                rank += 1
+            rank_by_value[value] = direction * rank
+        return rank_by_value
+
+
+@dataclass(slots=True, frozen=True)
+class SortPlan:
+    criteria: Tuple[SortCriterion, ...]
+
+    def sort(self, items: List[Any], task_accessor: Callable[[Any], Union[TaskData, 'Task']]) -> List[Any]:
+        if not self.criteria:
+            return list(items)
+        tasks = [task_accessor(item) for item in items]
+        keys = list(zip(*[criterion.column(tasks) for criterion in self.criteria]))
+        return [items[position] for position in sorted(range(len(items)), key=keys.__getitem__)]
+
+
 class TaskSortUtils:
 
     @staticmethod
@@ -43,14 +83,8 @@ class TaskSortUtils:
     ) -> List[Any]:
         if not items or not sorting_config:
             return items
-        custom_field_names = set(sorting_config.custom_sort_field_names())
         criteria_string = TaskSortUtils._resolve_criteria_string(items, task_accessor, sorting_config)
-        criteria = TaskSortUtils._parse_criteria(criteria_string, custom_field_names)
-
-        sorted_items = list(items)
-        for extractor, is_ascending in reversed(criteria):
-            sorted_items.sort(key=lambda item: extractor(task_accessor(item)), reverse=not is_ascending)
-        return sorted_items
+        return TaskSortUtils._compile_plan(criteria_string).sort(items, task_accessor)
 
     @staticmethod
     def _resolve_criteria_string(
@@ -65,37 +99,27 @@ class TaskSortUtils:
         return sorting_config.default_sort_criteria
 
     @staticmethod
-    def _parse_criteria(
-            criteria_string: str,
-            custom_field_names: Set[str]
-    ) -> List[Tuple[Callable[[Union[TaskData, 'Task']], Any], bool]]:
+    @lru_cache(maxsize=64)
+    def _compile_plan(criteria_string: str) -> SortPlan:
         criteria = []
         for criteria_part in criteria_string.split(','):
             criteria_part = criteria_part.strip()
             if not criteria_part:
                 continue
             is_ascending = not criteria_part.startswith('-')
-            criterion_name = criteria_part.lstrip('-')
-            extractor = TaskSortUtils._build_extractor(criterion_name, custom_field_names)
-            if extractor is not None:
-                criteria.append((extractor, is_ascending))
-        return criteria
+            criteria.append(TaskSortUtils._build_criterion(criteria_part.lstrip('-'), is_ascending))
+        return SortPlan(tuple(criteria))
 
     @staticmethod
-    def _build_extractor(
-            criterion_name: str,
-            custom_field_names: Set[str]
-    ) -> Optional[Callable[[Union[TaskData, 'Task']], Any]]:
+    def _build_criterion(criterion_name: str, is_ascending: bool) -> SortCriterion:
         if criterion_name in SORT_EXTRACTORS:
             value_type, extractor_function = SORT_EXTRACTORS[criterion_name]
             if value_type == 'numeric':
-                return extractor_function
-            return lambda task: _NATURAL_KEY(str(extractor_function(task) or ""))
-        if criterion_name in custom_field_names:
-            return lambda task: TaskSortUtils._natural_missing_key(
-                TaskSortUtils._read_custom_sort_field(task, criterion_name)
-            )
-        return None
+                return SortCriterion(extractor_function, is_ascending)
+            return SortCriterion(lambda task: str(extractor_function(task) or ""), is_ascending, _NATURAL_KEY)
+        # Every non-builtin criterion of a SortingConfig is one of its custom sort fields
+        return SortCriterion(lambda task: TaskSortUtils._read_custom_sort_field(task, criterion_name), is_ascending,
+                             TaskSortUtils._natural_missing_key)
 
     @staticmethod
     def _natural_missing_key(value: Optional[str]) -> Tuple[Any, ...]:
@@ -0,0 +1,54 @@
+import calendar
+from datetime import datetime, time, timedelta, timezone
+from typing import Optional, Tuple
+
+from dateutil.relativedelta import relativedelta
+
+from velocity.app.domain.model.velocity import ReportGranularity
+
+
+class VelocityGranularityUtils:
+
+    ITERATION_LOOKBACK_MONTHS = 12
+
+    @staticmethod
+    def parse_granularity(value: Optional[str]) -> ReportGranularity:
+        try:
+            return ReportGranularity(value)
+        except ValueError:
+            return ReportGranularity.MONTH
+
+    @staticmethod
+    def is_chronological(granularity: ReportGranularity) -> bool:
+        return granularity != ReportGranularity.ITERATION
+
+    @staticmethod
+    def parse_period(period: str, granularity: ReportGranularity) -> Tuple[datetime, datetime]:
+        if granularity == ReportGranularity.ITERATION:
+            return VelocityGranularityUtils._build_iteration_lookback_period()
+        if granularity == ReportGranularity.WEEK:
+            return VelocityGranularityUtils._parse_week_period(period)
+        return VelocityGranularityUtils._parse_month_period(period)
+
+    @staticmethod
+    def _parse_month_period(period: str) -> Tuple[datetime, datetime]:
+        year, month = int(period[:4]), int(period[5:7])
+        last_day = calendar.monthrange(year, month)[1]
+        start_date = datetime(year, month, 1, tzinfo=timezone.utc)
+        end_date = datetime.combine(datetime(year, month, last_day), time.max, tzinfo=timezone.utc)
+        return start_date, end_date
+
+    @staticmethod
+    def _parse_week_period(period: str) -> Tuple[datetime, datetime]:
+        week_start = datetime.strptime(f"{period}-1", '%G-W%V-%u')
+        start_date = datetime.combine(week_start, time.min, tzinfo=timezone.utc)
+        end_date = datetime.combine(week_start + timedelta(days=6), time.max, tzinfo=timezone.utc)
+        return start_date, end_date
+
+    @staticmethod
+    def _build_iteration_lookback_period() -> Tuple[datetime, datetime]:
+        today = datetime.now(timezone.utc)
+        first_month = today - relativedelta(months=VelocityGranularityUtils.ITERATION_LOOKBACK_MONTHS - 1)
+        start_date = datetime.combine(first_month.replace(day=1), time.min, tzinfo=timezone.utc)
+        end_date = datetime.combine(today, time.max, tzinfo=timezone.utc)
+        return start_date, end_date
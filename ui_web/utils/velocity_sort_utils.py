@@ -11,7 +11,7 @@ class VelocitySortUtils:
         try:
             sorted_indices = sorted(
                 range(len(chart.labels)),
-                key=lambda i: datetime.strptime(chart.labels[i], '%Y-%m'),
+                key=lambda i: VelocitySortUtils._parse_period_label(chart.labels[i]),
                 reverse=not ascending
             )
         except ValueError:
@@ -26,3 +26,9 @@ class VelocitySortUtils:
             dataset.data = [dataset.data[i] for i in sorted_indices]
 
         return chart
+
+    @staticmethod
+    def _parse_period_label(label: str) -> datetime:
+        if '-W' in label:
+            return datetime.strptime(f"{label}-1", '%G-W%V-%u')
+        return datetime.strptime(label, '%Y-%m')
@@ -1,20 +1,39 @@
 import asyncio
-from typing import Union, List
+from typing import Dict, Union, List
+from urllib.parse import urlencode
 
+from django.http import Http404, StreamingHttpResponse
+from django.template.loader import render_to_string
+from django.utils.text import slugify
+from django.views import View
 from django.views.generic import TemplateView
 
+from metrics import version_stamps
 from pull_requests.app.domain.model.pull_request import PullRequestRef
 from tasks.container import tasks_container
 from ..container import ui_web_container
 from ..data.hierarchical_item_data import HierarchicalItemData
 from ..data.task_data import TaskData
+from ..utils.pull_request_ref_request_utils import PullRequestRefRequestUtils
+from ..utils.task_event_stream import TaskEventScope
 from ..utils.task_grouping_utils import TaskGroupingUtils
 from ..utils.task_sort_utils import TaskSortUtils
 from .graceful_template_view import GracefulTemplateView
 
+BOARD_SECTION_ID = "current-tasks-board"
+
+
+def _section_id(group_id: str) -> str:
+    return f"task-section-{slugify(group_id)}"
+
+
+def _task_events_id(group_id) -> str:
+    return f"task-events-{slugify(group_id or 'all')}"
+
 
 class CurrentTasksView(GracefulTemplateView):
     template_name = "current_tasks.html"
+    etag_scopes = (version_stamps.PROJECT,)
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
@@ -35,31 +54,25 @@ class CurrentTasksView(GracefulTemplateView):
         group_id = self.request.GET.get('member_group_id')
         selections = self.task_filter_facade.parse_selections(self.request.GET)
         view_mode = self.request.GET.get('view', 'list')
+        lazy_loading = self._is_lazy_loading(selections, view_mode)
 
-        lazy_loading_enabled = self.tasks_facade.is_lazy_loading_enabled()
-        expand_all = self.request.GET.get('expand_all') == 'true'
-        needs_full_fetch = self.task_filter_facade.requires_full_fetch(selections)
-        lazy_loading = lazy_loading_enabled and not expand_all and not needs_full_fetch and view_mode != 'board'
-
-        context["view_mode"] = view_mode
-        context["lazy_loading_enabled"] = lazy_loading_enabled
-        context["lazy_loading"] = lazy_loading
-        context["release_column_enabled"] = self.tasks_facade.is_release_column_enabled()
-        context["pr_gateway_column_enabled"] = self.tasks_facade.is_pull_request_gateway_column_enabled()
-        context["task_table_colspan"] = self.tasks_facade.task_table_colspan()
+        self._populate_display_flags(context, view_mode, lazy_loading)
         context["success"] = False
 
-        if lazy_loading:
-            tasks = asyncio.run(self.tasks_facade.get_task_structure(group_id))
-        else:
-            tasks = asyncio.run(self.tasks_facade.get_tasks(group_id))
+        if self._is_sectioned(group_id, view_mode):
+            self._populate_sections(context)
+            return
 
-        context["task_filter_panel"] = self.task_filter_facade.get_panel(tasks, selections)
+        self._populate_task_events(context, group_id, BOARD_SECTION_ID, self.request.GET.urlencode())
+        tasks = self._fetch_tasks(group_id, lazy_loading)
+        task_filter_index = self.task_filter_facade.build_index(tasks)
 
-        if not lazy_loading_enabled:
+        context["task_filter_panel"] = self.task_filter_facade.get_panel(task_filter_index, selections)
+
+        if not context["lazy_loading_enabled"]:
             self._populate_available_members(context, tasks, group_id)
 
-        tasks = self.task_filter_facade.filter_tasks(tasks, selections)
+        tasks = self.task_filter_facade.filter_index(task_filter_index, selections)
         grouped_tasks = self._group_tasks(tasks, view_mode)
 
         context["tasks"] = grouped_tasks
@@ -67,6 +80,51 @@ class CurrentTasksView(GracefulTemplateView):
         context["has_groups"] = self._determine_has_groups(grouped_tasks)
         context["success"] = True
 
+    def _is_lazy_loading(self, selections, view_mode: str) -> bool:
+        expand_all = self.request.GET.get('expand_all') == 'true'
+        needs_full_fetch = self.task_filter_facade.requires_full_fetch(selections)
+        return (self.tasks_facade.is_lazy_loading_enabled() and not expand_all and not needs_full_fetch
+                and view_mode != 'board')
+
+    def _is_sectioned(self, group_id, view_mode: str) -> bool:
+        return (self.tasks_facade.is_sectioned_loading_enabled() and not group_id and view_mode != 'board'
+                and bool(self.tasks_facade.get_member_group_sections()))
+
+    def _populate_display_flags(self, context, view_mode: str, lazy_loading: bool):
+        context["view_mode"] = view_mode
+        context["lazy_loading_enabled"] = self.tasks_facade.is_lazy_loading_enabled()
+        context["lazy_loading"] = lazy_loading
+        context["release_column_enabled"] = self.tasks_facade.is_release_column_enabled()
+        context["pr_gateway_column_enabled"] = self.tasks_facade.is_pull_request_gateway_column_enabled()
+        context["task_table_colspan"] = self.tasks_facade.task_table_colspan()
+
+    def _populate_sections(self, context):
+        section_query = self.request.GET.copy()
+        section_query.pop('member_group_id', None)
+
+        member_group_sections = self.tasks_facade.get_member_group_sections()
+        context["member_group_sections"] = member_group_sections
+        context["section_query"] = section_query.urlencode()
+        # One stream for the whole page carries the events of every section, see CurrentTasksEventsView
+        task_events_query = section_query.copy()
+        task_events_query.setlist('section', [section.id for section in member_group_sections])
+        context["task_events_enabled"] = ui_web_container.task_event_stream.is_enabled()
+        context["task_events_query"] = task_events_query.urlencode()
+        context["selected_member_group_id"] = None
+        context["has_groups"] = True
+        context["success"] = True
+
+    def _populate_task_events(self, context, group_id, section_id: str, task_events_query: str):
+        context["task_events_enabled"] = ui_web_container.task_event_stream.is_enabled()
+        context["task_events_query"] = task_events_query
+        context["task_events_id"] = _task_events_id(group_id)
+        context["task_events_section_id"] = section_id
+
+    def _fetch_tasks(self, group_id, lazy_loading: bool) -> List[TaskData]:
+        if lazy_loading:
+            return asyncio.run(self.tasks_facade.get_task_structure(group_id))
+        return asyncio.run(self.tasks_facade.get_tasks(group_id))
+
     def _populate_available_members(self, context, tasks, group_id):
         available_members = asyncio.run(self.members_facade.get_available_members(tasks, group_id))
         context["available_members"] = available_members
@@ -90,8 +148,108 @@ class CurrentTasksView(GracefulTemplateView):
         )
 
 
+class CurrentTasksSectionView(CurrentTasksView):
+    template_name = "partials/current_tasks_section.html"
+
+    def get_template_names(self):
+        return [self.template_name]
+
+    def populate_context(self, context, **kwargs):
+        group_id = self.request.GET.get('member_group_id', '')
+        selections = self.task_filter_facade.parse_selections(self.request.GET)
+        lazy_loading = self._is_lazy_loading(selections, 'list')
+
+        self._populate_display_flags(context, 'list', lazy_loading)
+        section_id = _section_id(group_id)
+        self._populate_task_events(context, group_id, section_id, self.request.GET.urlencode())
+        context["section_name"] = group_id
+        context["section_id"] = section_id
+        context["tasks"] = []
+
+        tasks = self.task_filter_facade.filter_tasks(self._fetch_tasks(group_id, lazy_loading), selections)
+        grouped_tasks = self._group_tasks(tasks, 'list')
+
+        context["tasks"] = grouped_tasks
+        context["task_count"] = len(tasks)
+        context["has_groups"] = self._determine_has_groups(grouped_tasks)
+        context["success"] = True
+
+
+class CurrentTasksFiltersView(CurrentTasksView):
+    template_name = "partials/current_tasks_filters.html"
+
+    def get_template_names(self):
+        return [self.template_name]
+
+    def populate_context(self, context, **kwargs):
+        selections = self.task_filter_facade.parse_selections(self.request.GET)
+        view_mode = self.request.GET.get('view', 'list')
+        lazy_loading = self._is_lazy_loading(selections, view_mode)
+
+        self._populate_display_flags(context, view_mode, lazy_loading)
+        context["selected_member_group_id"] = None
+        context["has_groups"] = True
+
+        task_filter_index = self.task_filter_facade.build_index(self._fetch_tasks(None, lazy_loading))
+
+        context["task_filter_panel"] = self.task_filter_facade.get_panel(task_filter_index, selections)
+        context["success"] = True
+
+
+class CurrentTasksEventsView(View):
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.tasks_facade = ui_web_container.tasks_facade
+        self.task_filter_facade = ui_web_container.task_filter_facade
+        self.task_event_stream = ui_web_container.task_event_stream
+
+    def get(self, request, *args, **kwargs):
+        if not self.task_event_stream.is_enabled():
+            raise Http404("Task events are disabled")
+
+        selections = self.task_filter_facade.parse_selections(request.GET)
+        view_mode = request.GET.get('view', 'list')
+        # A sectioned page subscribes once for all of its sections instead of opening a stream per section
+        section_group_ids = request.GET.getlist('section')
+        if section_group_ids:
+            scopes = [self._build_scope(_section_id(group_id), group_id, selections) for group_id in section_group_ids]
+        else:
+            scopes = [self._build_scope(BOARD_SECTION_ID, request.GET.get('member_group_id') or None, selections)]
+        update_context = {
+            "view_mode": view_mode,
+            "release_column_enabled": self.tasks_facade.is_release_column_enabled(),
+            "pr_gateway_column_enabled": self.tasks_facade.is_pull_request_gateway_column_enabled()
+        }
+
+        def render_rows(scope: TaskEventScope, tasks: List[TaskData]) -> str:
+            return render_to_string("partials/task_updates.html",
+                                    {**update_context, "tasks": tasks,
+                                     "task_events_id": _task_events_id(scope.member_group_id)},
+                                    request=request)
+
+        events = self.task_event_stream.events(scopes, render_rows, view_mode, request.headers.get('Last-Event-ID'))
+        response = StreamingHttpResponse(events, content_type="text/event-stream")
+        response['Cache-Control'] = 'no-cache'
+        response['X-Accel-Buffering'] = 'no'
+        return response
+
+    def _build_scope(self, section_id: str, group_id, selections: Dict[str, str]) -> TaskEventScope:
+        def fetch_tasks() -> List[TaskData]:
+            tasks = asyncio.run(self.tasks_facade.get_tasks(group_id))
+            return self.task_filter_facade.filter_tasks(tasks, selections)
+
+        return TaskEventScope(
+            section_id=section_id,
+            key=f"{group_id or ''}||{urlencode(sorted(selections.items()))}",
+            member_group_id=group_id,
+            fetch_tasks=fetch_tasks
+        )
+
+
 class CurrentTasksStageView(GracefulTemplateView):
     template_name = "partials/task_table.html"
+    etag_scopes = (version_stamps.PROJECT,)
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
@@ -113,6 +271,7 @@ class CurrentTasksStageView(GracefulTemplateView):
 
 class AvailableMembersView(GracefulTemplateView):
     template_name = "partials/available_members_table.html"
+    etag_scopes = (version_stamps.PROJECT,)
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
@@ -157,6 +316,7 @@ class CurrentTasksChildrenView(TemplateView):
 
 class TaskPullRequestGatewayView(GracefulTemplateView):
     template_name = "partials/task_pull_request_gateway.html"
+    etag_scopes = (version_stamps.PROJECT, version_stamps.PULL_REQUESTS)
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
@@ -171,3 +331,28 @@ class TaskPullRequestGatewayView(GracefulTemplateView):
         )
         context["pull_request"] = asyncio.run(self.pull_requests_facade.get_review_details(ref))
         context["success"] = True
+
+
+class TaskPullRequestGatewaysView(GracefulTemplateView):
+    template_name = "partials/task_pull_request_gateways.html"
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.pull_requests_facade = ui_web_container.pull_requests_facade
+
+    def post(self, request, *args, **kwargs):
+        return self.get(request, *args, **kwargs)
+
+    def populate_context(self, context, **kwargs):
+        context["gateways"] = []
+        task_ids = self.request.POST.getlist('task_id')
+        refs = PullRequestRefRequestUtils.extract_refs(self.request.POST)
+        unique_refs = list({ref.pull_request_id: ref for ref in refs}.values())
+
+        pull_requests = asyncio.run(self.pull_requests_facade.get_review_details_batch(unique_refs))
+        pull_request_by_id = {pull_request.id: pull_request for pull_request in pull_requests}
+        context["gateways"] = [
+            (task_id, pull_request_by_id.get(ref.pull_request_id))
+            for task_id, ref in zip(task_ids, refs)
+        ]
+        context["success"] = True
@@ -1,19 +1,21 @@
 import asyncio
-import calendar
 import json
 from dataclasses import asdict
-from datetime import datetime, time, timezone
 
+from metrics import version_stamps
+from velocity.app.domain.model.velocity import ReportGranularity
 from ..container import ui_web_container
 from ..data.hierarchical_item_data import HierarchicalItemData
 from ..utils.chart_json_utils import ChartJsonUtils
 from ..utils.task_grouping_utils import TaskGroupingUtils
+from ..utils.velocity_granularity_utils import VelocityGranularityUtils
 from ..utils.velocity_sort_utils import VelocitySortUtils
 from .graceful_template_view import GracefulTemplateView
 
 
 class DevVelocityView(GracefulTemplateView):
     template_name = 'dev_velocity.html'
+    etag_scopes = (version_stamps.PROJECT,)
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
@@ -30,6 +32,7 @@ class DevVelocityView(GracefulTemplateView):
         rolling_avg = int(self.request.GET.get('rolling_avg', 0))
         include_all_statuses = self.request.GET.get('all_tasks') == 'true'
         use_custom_filter = self.request.GET.get('use_custom_filter') == 'true'
+        granularity = VelocityGranularityUtils.parse_granularity(self.request.GET.get('granularity'))
 
         context["month_velocity"] = "{}"
         context["month_sp"] = "{}"
@@ -40,6 +43,7 @@ class DevVelocityView(GracefulTemplateView):
         context["member_group_id"] = member_group_id or ''
         context["include_all_statuses"] = include_all_statuses
         context["use_custom_filter"] = use_custom_filter
+        context["granularity"] = granularity.value
         context["has_custom_filter"] = self.dev_velocity_facade.has_custom_filter(member_group_id)
         context["selected_period"] = self.request.GET.get('period', '')
         context["selected_developers"] = self.request.GET.get('developers', '')
@@ -52,20 +56,20 @@ class DevVelocityView(GracefulTemplateView):
 
         velocity_reports_data = asyncio.run(
             self.dev_velocity_facade.get_velocity_reports_data(
-                member_group_id, 6 + extra_periods, include_all_statuses, use_custom_filter
+                member_group_id, 6 + extra_periods, include_all_statuses, use_custom_filter, granularity
             )
         )
 
         velocity_chart = self.dev_velocity_facade.get_velocity_chart_data(
             velocity_reports_data, rolling_avg, display_periods if rolling_avg > 0 else 0
         )
-        if velocity_chart and velocity_chart.labels:
+        if velocity_chart and velocity_chart.labels and VelocityGranularityUtils.is_chronological(granularity):
             VelocitySortUtils.sort_chart_data_chronologically(velocity_chart)
 
         story_points_chart = self.dev_velocity_facade.get_story_points_chart_data(
             velocity_reports_data, rolling_avg, display_periods if rolling_avg > 0 else 0
         )
-        if story_points_chart and story_points_chart.labels:
+        if story_points_chart and story_points_chart.labels and VelocityGranularityUtils.is_chronological(granularity):
             VelocitySortUtils.sort_chart_data_chronologically(story_points_chart)
 
         context["month_velocity"] = ChartJsonUtils.convert_chart_data_to_chartjs_json(velocity_chart) if velocity_chart else "{}"
@@ -75,6 +79,7 @@ class DevVelocityView(GracefulTemplateView):
 
 class DevVelocityChartView(GracefulTemplateView):
     template_name = 'partials/dev_velocity_chart.html'
+    etag_scopes = (version_stamps.PROJECT,)
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
@@ -85,12 +90,14 @@ class DevVelocityChartView(GracefulTemplateView):
         rolling_avg = int(self.request.GET.get('rolling_avg', 0))
         include_all_statuses = self.request.GET.get('all_tasks') == 'true'
         use_custom_filter = self.request.GET.get('use_custom_filter') == 'true'
+        granularity = VelocityGranularityUtils.parse_granularity(self.request.GET.get('granularity'))
 
         context["month_velocity"] = "{}"
         context["velocity_rolling_avg"] = rolling_avg
         context["member_group_id"] = member_group_id or ''
         context["include_all_statuses"] = include_all_statuses
         context["use_custom_filter"] = use_custom_filter
+        context["granularity"] = granularity.value
         context["has_custom_filter"] = self.dev_velocity_facade.has_custom_filter(member_group_id)
         context["selected_period"] = self.request.GET.get('period', '')
         context["selected_developers"] = self.request.GET.get('developers', '')
@@ -102,13 +109,14 @@ class DevVelocityChartView(GracefulTemplateView):
         display_periods = 6
 
         velocity_reports_data = asyncio.run(
-            self.dev_velocity_facade.get_velocity_reports_data(member_group_id, 6 + extra_periods, include_all_statuses, use_custom_filter)
+            self.dev_velocity_facade.get_velocity_reports_data(member_group_id, 6 + extra_periods, include_all_statuses, use_custom_filter,
+                                                               granularity)
         )
 
         velocity_chart = self.dev_velocity_facade.get_velocity_chart_data(
             velocity_reports_data, rolling_avg, display_periods if rolling_avg > 0 else 0
         )
-        if velocity_chart and velocity_chart.labels:
+        if velocity_chart and velocity_chart.labels and VelocityGranularityUtils.is_chronological(granularity):
             VelocitySortUtils.sort_chart_data_chronologically(velocity_chart)
 
         context["month_velocity"] = ChartJsonUtils.convert_chart_data_to_chartjs_json(velocity_chart) if velocity_chart else "{}"
@@ -116,6 +124,7 @@ class DevVelocityChartView(GracefulTemplateView):
 
 class DevStoryPointsChartView(GracefulTemplateView):
     template_name = 'partials/dev_story_points_chart.html'
+    etag_scopes = (version_stamps.PROJECT,)
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
@@ -126,12 +135,14 @@ class DevStoryPointsChartView(GracefulTemplateView):
         rolling_avg = int(self.request.GET.get('rolling_avg', 0))
         include_all_statuses = self.request.GET.get('all_tasks') == 'true'
         use_custom_filter = self.request.GET.get('use_custom_filter') == 'true'
+        granularity = VelocityGranularityUtils.parse_granularity(self.request.GET.get('granularity'))
 
         context["month_sp"] = "{}"
         context["sp_rolling_avg"] = rolling_avg
         context["member_group_id"] = member_group_id or ''
         context["include_all_statuses"] = include_all_statuses
         context["use_custom_filter"] = use_custom_filter
+        context["granularity"] = granularity.value
         context["has_custom_filter"] = self.dev_velocity_facade.has_custom_filter(member_group_id)
         context["selected_period"] = self.request.GET.get('period', '')
         context["selected_developers"] = self.request.GET.get('developers', '')
@@ -140,13 +151,14 @@ class DevStoryPointsChartView(GracefulTemplateView):
         display_periods = 6
 
         velocity_reports_data = asyncio.run(
-            self.dev_velocity_facade.get_velocity_reports_data(member_group_id, 6 + extra_periods, include_all_statuses, use_custom_filter)
+            self.dev_velocity_facade.get_velocity_reports_data(member_group_id, 6 + extra_periods, include_all_statuses, use_custom_filter,
+                                                               granularity)
         )
 
         story_points_chart = self.dev_velocity_facade.get_story_points_chart_data(
             velocity_reports_data, rolling_avg, display_periods if rolling_avg > 0 else 0
         )
-        if story_points_chart and story_points_chart.labels:
+        if story_points_chart and story_points_chart.labels and VelocityGranularityUtils.is_chronological(granularity):
             VelocitySortUtils.sort_chart_data_chronologically(story_points_chart)
 
         context["month_sp"] = ChartJsonUtils.convert_chart_data_to_chartjs_json(story_points_chart) if story_points_chart else "{}"
@@ -154,6 +166,7 @@ class DevStoryPointsChartView(GracefulTemplateView):
 
 class BaseVelocityTasksView(GracefulTemplateView):
     template_name = 'partials/dev_velocity_tasks.html'
+    etag_scopes = (version_stamps.PROJECT,)
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
@@ -179,12 +192,10 @@ class BaseVelocityTasksView(GracefulTemplateView):
         return self.summary_convertor.enrich_with_summaries(groups)
 
     @staticmethod
-    def _parse_month_period(period: str):
-        year, month = int(period[:4]), int(period[5:7])
-        last_day = calendar.monthrange(year, month)[1]
-        start_date = datetime(year, month, 1, tzinfo=timezone.utc)
-        end_date = datetime.combine(datetime(year, month, last_day), time.max, tzinfo=timezone.utc)
-        return start_date, end_date
+    def _parse_period(period: str, granularity: ReportGranularity):
+        start_date, end_date = VelocityGranularityUtils.parse_period(period, granularity)
+        iteration = period if granularity == ReportGranularity.ITERATION else None
+        return start_date, end_date, iteration
 
 
 class DevVelocityTasksView(BaseVelocityTasksView):
@@ -192,13 +203,15 @@ class DevVelocityTasksView(BaseVelocityTasksView):
     def populate_context(self, context, **kwargs):
         context["task_groups"] = []
 
-        developer_names, period, member_group_id, include_all_statuses, use_custom_filter = self._parse_request_params()
+        (developer_names, period, member_group_id, include_all_statuses,
+         use_custom_filter, granularity) = self._parse_request_params()
         developer_names = self.tasks_velocity_facade.resolve_developer_names(developer_names, member_group_id)
 
-        start_date, end_date = self._parse_month_period(period)
+        start_date, end_date, iteration = self._parse_period(period, granularity)
         velocity_tasks = asyncio.run(
             self.tasks_velocity_facade.get_tasks(
-                developer_names, start_date, end_date, member_group_id, include_all_statuses, use_custom_filter
+                developer_names, start_date, end_date, member_group_id, include_all_statuses, use_custom_filter,
+                iteration
             )
         )
         context["task_groups"] = self._build_task_hierarchy(velocity_tasks, period)
@@ -208,8 +221,9 @@ class DevVelocityTasksView(BaseVelocityTasksView):
         member_group_id = self.request.GET.get('member_group_id')
         include_all_statuses = self.request.GET.get('all_tasks') == 'true'
         use_custom_filter = self.request.GET.get('use_custom_filter') == 'true'
+        granularity = VelocityGranularityUtils.parse_granularity(self.request.GET.get('granularity'))
 
         developers_param = self.request.GET.get('developers', '')
         developer_names = [d.strip() for d in developers_param.split(',') if d.strip()]
 
-        return developer_names, period, member_group_id, include_all_statuses, use_custom_filter
+        return developer_names, period, member_group_id, include_all_statuses, use_custom_filter, granularity
@@ -1,11 +1,31 @@
 import logging
+from typing import Optional, Tuple
 
+from django.utils.cache import get_conditional_response, patch_cache_control, patch_vary_headers
 from django.views.generic import TemplateView
 
+from ..container import ui_web_container
+
 logger = logging.getLogger("ui_web.views")
 
 
 class GracefulTemplateView(TemplateView):
+    etag_scopes: Tuple[str, ...] = ()
+
+    def dispatch(self, request, *args, **kwargs):
+        etag = self._build_etag(request)
+        if etag is not None:
+            not_modified = get_conditional_response(request, etag=etag)
+            if not_modified is not None:
+                return not_modified
+
+        response = super().dispatch(request, *args, **kwargs)
+        if etag is not None and response.status_code == 200 and not self._is_degraded(response):
+            response['ETag'] = etag
+            patch_cache_control(response, no_cache=True)
+            patch_vary_headers(response, ['HX-Request'])
+        return response
+
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         try:
@@ -17,3 +37,14 @@ class GracefulTemplateView(TemplateView):
 
     def populate_context(self, context, **kwargs):
         raise NotImplementedError
+
+    def _build_etag(self, request) -> Optional[str]:
+        if not self.etag_scopes or request.method not in ('GET', 'HEAD'):
+            return None
+        request_parts = [request.get_full_path(), request.headers.get('HX-Request', '')]
+        return ui_web_container.data_version_etag.build(type(self).__name__, request_parts, self.etag_scopes)
+
+    @staticmethod
+    def _is_degraded(response) -> bool:
+        context_data = getattr(response, 'context_data', None) or {}
+        return bool(context_data.get('error'))
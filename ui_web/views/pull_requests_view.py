@@ -1,14 +1,17 @@
 import asyncio
 
+from metrics import version_stamps
 from pull_requests.app.domain.model.pull_request import PullRequestRef
 from ..container import ui_web_container
 from ..utils.pull_request_filter_utils import PullRequestFilterUtils
+from ..utils.pull_request_ref_request_utils import PullRequestRefRequestUtils
 from ..utils.pull_request_summary_utils import PullRequestSummaryUtils
 from .graceful_template_view import GracefulTemplateView
 
 
 class PullRequestsView(GracefulTemplateView):
     template_name = "pull_requests.html"
+    etag_scopes = (version_stamps.PROJECT, version_stamps.PULL_REQUESTS)
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
@@ -47,6 +50,7 @@ class PullRequestsView(GracefulTemplateView):
 
 class PullRequestReviewStateView(GracefulTemplateView):
     template_name = "partials/pull_request_review_state.html"
+    etag_scopes = (version_stamps.PROJECT, version_stamps.PULL_REQUESTS)
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
@@ -64,3 +68,20 @@ class PullRequestReviewStateView(GracefulTemplateView):
             project_id=self.request.GET.get('project_id', ''),
             project_name=self.request.GET.get('project', '')
         )
+
+
+class PullRequestReviewStatesView(GracefulTemplateView):
+    template_name = "partials/pull_request_review_states.html"
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.pull_requests_facade = ui_web_container.pull_requests_facade
+
+    def post(self, request, *args, **kwargs):
+        return self.get(request, *args, **kwargs)
+
+    def populate_context(self, context, **kwargs):
+        context["pull_requests"] = []
+        refs = PullRequestRefRequestUtils.extract_refs(self.request.POST)
+        context["pull_requests"] = asyncio.run(self.pull_requests_facade.get_review_details_batch(refs))
+        context["success"] = True
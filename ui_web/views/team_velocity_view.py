@@ -1,7 +1,9 @@
 import asyncio
 
+from metrics import version_stamps
 from ..container import ui_web_container
 from ..utils.chart_json_utils import ChartJsonUtils
+from ..utils.velocity_granularity_utils import VelocityGranularityUtils
 from ..utils.velocity_sort_utils import VelocitySortUtils
 from .dev_velocity_view import BaseVelocityTasksView
 from .graceful_template_view import GracefulTemplateView
@@ -9,6 +11,7 @@ from .graceful_template_view import GracefulTemplateView
 
 class TeamVelocityView(GracefulTemplateView):
     template_name = 'team_velocity.html'
+    etag_scopes = (version_stamps.PROJECT,)
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
@@ -24,6 +27,7 @@ class TeamVelocityView(GracefulTemplateView):
         member_group_id = team_id or self.request.GET.get('member_group_id')
         rolling_avg = int(self.request.GET.get('rolling_avg', 0))
         use_custom_filter = self.request.GET.get('use_custom_filter') == 'true'
+        granularity = VelocityGranularityUtils.parse_granularity(self.request.GET.get('granularity'))
 
         context["month_velocity"] = "{}"
         context["month_sp"] = "{}"
@@ -32,6 +36,7 @@ class TeamVelocityView(GracefulTemplateView):
         context["velocity_rolling_avg"] = rolling_avg
         context["member_group_id"] = member_group_id or ''
         context["use_custom_filter"] = use_custom_filter
+        context["granularity"] = granularity.value
         context["has_custom_filter"] = self.team_velocity_facade.has_custom_filter(member_group_id)
         context["selected_period"] = self.request.GET.get('period', '')
 
@@ -39,17 +44,18 @@ class TeamVelocityView(GracefulTemplateView):
         display_periods = 12
 
         velocity_reports_data = asyncio.run(
-            self.team_velocity_facade.get_velocity_reports_data(member_group_id, 12 + extra_periods, use_custom_filter)
+            self.team_velocity_facade.get_velocity_reports_data(member_group_id, 12 + extra_periods, use_custom_filter,
+                                                                granularity)
         )
 
         velocity_chart = self.team_velocity_facade.get_velocity_chart_data(
             velocity_reports_data, rolling_avg, display_periods if rolling_avg > 0 else 0
         )
-        if velocity_chart and velocity_chart.labels:
+        if velocity_chart and velocity_chart.labels and VelocityGranularityUtils.is_chronological(granularity):
             VelocitySortUtils.sort_chart_data_chronologically(velocity_chart)
 
         story_points_chart = self.team_velocity_facade.get_story_points_chart_data(velocity_reports_data)
-        if story_points_chart and story_points_chart.labels:
+        if story_points_chart and story_points_chart.labels and VelocityGranularityUtils.is_chronological(granularity):
             VelocitySortUtils.sort_chart_data_chronologically(story_points_chart)
 
         context["month_velocity"] = ChartJsonUtils.convert_chart_data_to_chartjs_json(
@@ -64,12 +70,12 @@ class TeamVelocityTasksView(BaseVelocityTasksView):
     def populate_context(self, context, **kwargs):
         context["task_groups"] = []
 
-        period, member_group_id, use_custom_filter = self._parse_request_params()
+        period, member_group_id, use_custom_filter, granularity = self._parse_request_params()
 
-        start_date, end_date = self._parse_month_period(period)
+        start_date, end_date, iteration = self._parse_period(period, granularity)
         velocity_tasks = asyncio.run(
             self.tasks_velocity_facade.get_team_tasks(
-                start_date, end_date, member_group_id, use_custom_filter
+                start_date, end_date, member_group_id, use_custom_filter, iteration
             )
         )
         context["task_groups"] = self._build_task_hierarchy(velocity_tasks, period)
@@ -78,11 +84,13 @@ class TeamVelocityTasksView(BaseVelocityTasksView):
         period = self.request.GET.get('period', '')
         member_group_id = self.request.GET.get('member_group_id')
         use_custom_filter = self.request.GET.get('use_custom_filter') == 'true'
-        return period, member_group_id, use_custom_filter
+        granularity = VelocityGranularityUtils.parse_granularity(self.request.GET.get('granularity'))
+        return period, member_group_id, use_custom_filter, granularity
 
 
 class TeamVelocityChartView(GracefulTemplateView):
     template_name = 'partials/team_velocity_chart.html'
+    etag_scopes = (version_stamps.PROJECT,)
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
@@ -92,11 +100,13 @@ class TeamVelocityChartView(GracefulTemplateView):
         member_group_id = self.request.GET.get('member_group_id')
         rolling_avg = int(self.request.GET.get('rolling_avg', 0))
         use_custom_filter = self.request.GET.get('use_custom_filter') == 'true'
+        granularity = VelocityGranularityUtils.parse_granularity(self.request.GET.get('granularity'))
 
         context["month_velocity"] = "{}"
         context["velocity_rolling_avg"] = rolling_avg
         context["member_group_id"] = member_group_id or ''
         context["use_custom_filter"] = use_custom_filter
+        context["granularity"] = granularity.value
         context["has_custom_filter"] = self.team_velocity_facade.has_custom_filter(member_group_id)
         context["selected_period"] = self.request.GET.get('period', '')
 
@@ -105,14 +115,14 @@ class TeamVelocityChartView(GracefulTemplateView):
 
         velocity_reports_data = asyncio.run(
             self.team_velocity_facade.get_velocity_reports_data(
-                member_group_id, 12 + extra_periods, use_custom_filter
+                member_group_id, 12 + extra_periods, use_custom_filter, granularity
             )
         )
 
         velocity_chart = self.team_velocity_facade.get_velocity_chart_data(
             velocity_reports_data, rolling_avg, display_periods if rolling_avg > 0 else 0
         )
-        if velocity_chart and velocity_chart.labels:
+        if velocity_chart and velocity_chart.labels and VelocityGranularityUtils.is_chronological(granularity):
             VelocitySortUtils.sort_chart_data_chronologically(velocity_chart)
 
         context["month_velocity"] = ChartJsonUtils.convert_chart_data_to_chartjs_json(velocity_chart) if velocity_chart else "{}"
@@ -120,6 +130,7 @@ class TeamVelocityChartView(GracefulTemplateView):
 
 class TeamStoryPointsChartView(GracefulTemplateView):
     template_name = 'partials/team_story_points_chart.html'
+    etag_scopes = (version_stamps.PROJECT,)
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
@@ -128,21 +139,23 @@ class TeamStoryPointsChartView(GracefulTemplateView):
     def populate_context(self, context, **kwargs):
         member_group_id = self.request.GET.get('member_group_id')
         use_custom_filter = self.request.GET.get('use_custom_filter') == 'true'
+        granularity = VelocityGranularityUtils.parse_granularity(self.request.GET.get('granularity'))
 
         context["month_sp"] = "{}"
         context["member_group_id"] = member_group_id or ''
         context["use_custom_filter"] = use_custom_filter
+        context["granularity"] = granularity.value
         context["has_custom_filter"] = self.team_velocity_facade.has_custom_filter(member_group_id)
         context["selected_period"] = self.request.GET.get('period', '')
 
         velocity_reports_data = asyncio.run(
             self.team_velocity_facade.get_velocity_reports_data(
-                member_group_id, 12, use_custom_filter
+                member_group_id, 12, use_custom_filter, granularity
             )
         )
 
         story_points_chart = self.team_velocity_facade.get_story_points_chart_data(velocity_reports_data)
-        if story_points_chart and story_points_chart.labels:
+        if story_points_chart and story_points_chart.labels and VelocityGranularityUtils.is_chronological(granularity):
             VelocitySortUtils.sort_chart_data_chronologically(story_points_chart)
 
         context["month_sp"] = ChartJsonUtils.convert_chart_data_to_chartjs_json(story_points_chart) if story_points_chart else "{}"
@@ -0,0 +1,16 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import List, Optional
+
+from tasks.app.domain.model.task import Task
+from ..domain.model.velocity import TaskFilter
+
+
+class ApiForPeriodTasks(ABC):
+
+    @abstractmethod
+    def find_period_tasks(self, start_date: datetime, end_date: datetime,
+                          scope_id: Optional[str] = None,
+                          task_filter: Optional[TaskFilter] = None,
+                          iteration: Optional[str] = None) -> Optional[List[Task]]:
+        pass
@@ -0,0 +1,13 @@
+from abc import ABC, abstractmethod
+from typing import List, Optional
+
+from tasks.app.domain.model.task import Task
+from ..domain.model.velocity import DeveloperTaskShare
+
+
+class ApiForTaskVelocityBreakdown(ABC):
+
+    @abstractmethod
+    def breakdown_by_developer(self, tasks: List[Task],
+                               developer_names: Optional[List[str]] = None) -> List[DeveloperTaskShare]:
+        pass
@@ -0,0 +1,68 @@
+import datetime
+from typing import List, Tuple
+
+import numpy as np
+from sd_metrics_lib.utils.generators import TimeRangeGenerator
+from sd_metrics_lib.utils.time import TimeUnit
+
+from velocity.app.domain.model.task_frame import TaskFrame, PeriodBucket
+from velocity.app.domain.model.velocity import ReportGranularity
+
+
+class PeriodBucketing:
+
+    @staticmethod
+    def resolve_window(number_of_periods: int) -> Tuple[datetime.datetime, datetime.datetime]:
+        periods = PeriodBucketing._generate_periods(TimeUnit.MONTH, number_of_periods)
+        return periods[-1][0], periods[0][1]
+
+    @staticmethod
+    def build_buckets(frame: TaskFrame, granularity: ReportGranularity, number_of_periods: int) -> List[PeriodBucket]:
+        if granularity == ReportGranularity.ITERATION:
+            return PeriodBucketing._build_iteration_buckets(frame, number_of_periods)
+
+        time_unit = TimeUnit.WEEK if granularity == ReportGranularity.WEEK else TimeUnit.MONTH
+        return [
+            PeriodBucket(
+                start_date=start_date,
+                end_date=end_date,
+                name=PeriodBucketing._format_period_name(start_date, time_unit),
+                task_mask=(frame.resolved_at >= start_date.timestamp()) & (frame.resolved_at <= end_date.timestamp())
+            )
+            for start_date, end_date in PeriodBucketing._generate_periods(time_unit, number_of_periods)
+        ]
+
+    @staticmethod
+    def _build_iteration_buckets(frame: TaskFrame, number_of_periods: int) -> List[PeriodBucket]:
+        buckets = []
+        for position, iteration_name in enumerate(frame.iteration_names):
+            task_mask = frame.iteration_index == position
+            resolved_at = frame.resolved_at[task_mask]
+            resolved_at = resolved_at[~np.isnan(resolved_at)]
+            if resolved_at.size == 0:
+                continue
+            buckets.append(PeriodBucket(
+                start_date=datetime.datetime.fromtimestamp(resolved_at.min(), tz=datetime.timezone.utc),
+                end_date=datetime.datetime.fromtimestamp(resolved_at.max(), tz=datetime.timezone.utc),
+                name=iteration_name,
+                task_mask=task_mask
+            ))
+
+        buckets.sort(key=lambda bucket: bucket.end_date, reverse=True)
+        return buckets[:number_of_periods]
+
+    @staticmethod
+    def _generate_periods(time_unit: TimeUnit, number_of_periods: int) -> List[Tuple[datetime.datetime, datetime.datetime]]:
+        # Bounds are UTC like the configured TIME_ZONE, so bucketing does not depend on the server's local zone
+        return [
+            (datetime.datetime.combine(start_date.date(), datetime.time.min, tzinfo=datetime.timezone.utc),
+             datetime.datetime.combine(end_date.date(), datetime.time.max, tzinfo=datetime.timezone.utc))
+            for start_date, end_date in TimeRangeGenerator(time_unit, number_of_periods, datetime.timedelta(1))
+        ]
+
+    @staticmethod
+    def _format_period_name(start_date: datetime.datetime, time_unit: TimeUnit) -> str:
+        if time_unit == TimeUnit.WEEK:
+            iso_year, iso_week, _ = start_date.isocalendar()
+            return f"{iso_year}-W{iso_week:02d}"
+        return f"{start_date.year}-{start_date.month:02d}"
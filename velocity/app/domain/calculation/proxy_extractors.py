@@ -1,7 +1,5 @@
 from typing import Dict
 
-from sd_metrics_lib.sources.story_points import FunctionStoryPointExtractor
-from sd_metrics_lib.sources.worklog import FunctionWorklogExtractor, FunctionTotalSpentTimeExtractor
 from sd_metrics_lib.utils.time import Duration
 
 from velocity.app.domain.model.task import Task
@@ -22,7 +20,3 @@ def extract_total_spent_time(task: Task) -> Duration:
         return task.time_tracking.total_spent_time
     return Duration.zero()
 
-
-TaskModuleStoryPointExtractor = FunctionStoryPointExtractor(extract_story_points)
-TaskModuleWorklogExtractor = FunctionWorklogExtractor(extract_worklog_by_assignee)
-TaskModuleTotalSpentTimeExtractor = FunctionTotalSpentTimeExtractor(extract_total_spent_time)
@@ -0,0 +1,85 @@
+from datetime import datetime, timezone
+from typing import Dict, List, Optional
+
+import numpy as np
+from sd_metrics_lib.utils.time import Duration, TimeUnit
+
+from tasks.app.domain.model.task import Task
+from velocity.app.domain.calculation.proxy_extractors import (
+    extract_story_points, extract_total_spent_time, extract_worklog_by_assignee
+)
+from velocity.app.domain.model.task_frame import TaskFrame
+
+
+class TaskFrameBuilder:
+
+    @staticmethod
+    def from_tasks(tasks: List[Task]) -> TaskFrame:
+        task_count = len(tasks)
+        story_points = np.zeros(task_count, dtype=np.float64)
+        total_spent_seconds = np.zeros(task_count, dtype=np.float64)
+        resolved_at = np.full(task_count, np.nan, dtype=np.float64)
+        member_group_index = np.full(task_count, -1, dtype=np.int64)
+        iteration_index = np.full(task_count, -1, dtype=np.int64)
+
+        member_group_positions: Dict[str, int] = {}
+        iteration_positions: Dict[str, int] = {}
+        assignee_positions: Dict[str, int] = {}
+        worklog_task_index = []
+        worklog_assignee_index = []
+        worklog_seconds = []
+
+        for position, task in enumerate(tasks):
+            story_points[position] = extract_story_points(task)
+            total_spent_seconds[position] = TaskFrameBuilder._to_seconds(extract_total_spent_time(task))
+            task_resolved_at = getattr(task, 'resolved_at', None)
+            if task_resolved_at:
+                resolved_at[position] = TaskFrameBuilder._to_utc_timestamp(task_resolved_at)
+
+            member_group_id = TaskFrameBuilder._extract_member_group_id(task)
+            if member_group_id is not None:
+                member_group_index[position] = member_group_positions.setdefault(
+                    member_group_id, len(member_group_positions)
+                )
+
+            iteration = getattr(task, 'iteration', None)
+            if iteration:
+                iteration_index[position] = iteration_positions.setdefault(iteration, len(iteration_positions))
+
+            for assignee_id, spent_time in extract_worklog_by_assignee(task).items():
+                worklog_task_index.append(position)
+                worklog_assignee_index.append(assignee_positions.setdefault(assignee_id, len(assignee_positions)))
+                worklog_seconds.append(TaskFrameBuilder._to_seconds(spent_time))
+
+        return TaskFrame(
+            tasks=list(tasks),
+            story_points=story_points,
+            total_spent_seconds=total_spent_seconds,
+            resolved_at=resolved_at,
+            member_group_index=member_group_index,
+            member_group_ids=list(member_group_positions),
+            iteration_index=iteration_index,
+            iteration_names=list(iteration_positions),
+            worklog_task_index=np.array(worklog_task_index, dtype=np.int64),
+            worklog_assignee_index=np.array(worklog_assignee_index, dtype=np.int64),
+            worklog_seconds=np.array(worklog_seconds, dtype=np.float64),
+            assignee_ids=list(assignee_positions)
+        )
+
+    @staticmethod
+    def _extract_member_group_id(task: Task) -> Optional[str]:
+        assignment = getattr(task, 'assignment', None)
+        member_group = getattr(assignment, 'member_group', None) if assignment else None
+        return member_group.id if member_group else None
+
+    @staticmethod
+    def _to_utc_timestamp(value: datetime) -> float:
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+        return value.timestamp()
+
+    @staticmethod
+    def _to_seconds(duration: Optional[Duration]) -> float:
+        if not duration:
+            return 0.0
+        return duration.convert(TimeUnit.SECOND).time_delta
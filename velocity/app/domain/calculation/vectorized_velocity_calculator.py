@@ -0,0 +1,67 @@
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+from sd_metrics_lib.utils.time import TimePolicy, TimeUnit
+
+from velocity.app.domain.model.task_frame import TaskFrame
+
+
+class VectorizedVelocityCalculator:
+
+    def __init__(self, time_unit: TimeUnit = TimeUnit.DAY, time_policy: TimePolicy = TimePolicy.BUSINESS_HOURS):
+        self._seconds_to_time_unit = time_policy.convert(1.0, TimeUnit.SECOND, time_unit)
+
+    def calculate_team_velocity(self, frame: TaskFrame,
+                                task_mask: Optional[np.ndarray] = None) -> Tuple[float, float]:
+        counted = (frame.story_points > 0) & (frame.total_spent_seconds != 0)
+        if task_mask is not None:
+            counted &= task_mask
+        story_points = float(frame.story_points[counted].sum())
+        spent_time = float(frame.total_spent_seconds[counted].sum()) * self._seconds_to_time_unit
+
+        if spent_time == 0:
+            return 0, story_points
+        return story_points / spent_time, story_points
+
+    def calculate_user_velocity(self, frame: TaskFrame,
+                                task_mask: Optional[np.ndarray] = None) -> Tuple[Dict[str, float], Dict[str, float]]:
+        assignee_count = len(frame.assignee_ids)
+        counted = VectorizedVelocityCalculator._counted_worklog_entries(frame)
+        if task_mask is not None:
+            counted &= task_mask[frame.worklog_task_index]
+        assignee_index = frame.worklog_assignee_index[counted]
+
+        story_points = np.bincount(assignee_index,
+                                   weights=VectorizedVelocityCalculator.proportional_story_points(frame)[counted],
+                                   minlength=assignee_count)
+        spent_seconds = np.bincount(assignee_index, weights=frame.worklog_seconds[counted], minlength=assignee_count)
+        participated = np.bincount(assignee_index, minlength=assignee_count) > 0
+
+        velocity_per_user = {}
+        story_points_per_user = {}
+        for position in np.flatnonzero(participated):
+            assignee_id = frame.assignee_ids[position]
+            story_points_per_user[assignee_id] = float(story_points[position])
+            spent_time = float(spent_seconds[position]) * self._seconds_to_time_unit
+            if spent_time != 0:
+                velocity = story_points_per_user[assignee_id] / spent_time
+                if velocity != 0:
+                    velocity_per_user[assignee_id] = velocity
+        return velocity_per_user, story_points_per_user
+
+    @staticmethod
+    def proportional_story_points(frame: TaskFrame) -> np.ndarray:
+        task_worklog_seconds = VectorizedVelocityCalculator.worklog_seconds_per_task(frame)[frame.worklog_task_index]
+        task_story_points = frame.story_points[frame.worklog_task_index]
+        return np.divide(task_story_points * frame.worklog_seconds, task_worklog_seconds,
+                         out=np.zeros_like(frame.worklog_seconds), where=task_worklog_seconds != 0)
+
+    @staticmethod
+    def worklog_seconds_per_task(frame: TaskFrame) -> np.ndarray:
+        return np.bincount(frame.worklog_task_index, weights=frame.worklog_seconds, minlength=len(frame))
+
+    @staticmethod
+    def _counted_worklog_entries(frame: TaskFrame) -> np.ndarray:
+        task_worklog_seconds = VectorizedVelocityCalculator.worklog_seconds_per_task(frame)
+        counted_tasks = (frame.story_points > 0) & (task_worklog_seconds != 0)
+        return counted_tasks[frame.worklog_task_index]
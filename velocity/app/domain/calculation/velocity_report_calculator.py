@@ -2,16 +2,17 @@ from copy import deepcopy
 from datetime import datetime
 from typing import Optional, List, Callable
 
-from sd_metrics_lib.calculators.velocity import GeneralizedTeamVelocityCalculator, UserVelocityCalculator
-from sd_metrics_lib.sources.tasks import ProxyTaskProvider
+import numpy as np
 
-from tasks.app.domain.model.task import EnrichmentOptions
+from tasks.app.domain.model.task import EnrichmentOptions, Task
 from velocity.app.domain.calculation.member_group_resolver import MemberGroupResolver
-from velocity.app.domain.calculation.proxy_extractors import (
-    TaskModuleStoryPointExtractor, TaskModuleTotalSpentTimeExtractor, TaskModuleWorklogExtractor
-)
+from velocity.app.domain.calculation.period_bucketing import PeriodBucketing
+from velocity.app.domain.calculation.task_frame_builder import TaskFrameBuilder
+from velocity.app.domain.calculation.vectorized_velocity_calculator import VectorizedVelocityCalculator
 from velocity.app.domain.model.config import VelocityConfig
-from velocity.app.domain.model.velocity import TaskFilter, VelocityReport
+from velocity.app.domain.model.task_frame import TaskFrame, PeriodBucket
+from velocity.app.domain.model.velocity import TaskFilter, VelocityReport, ReportGranularity
+from velocity.app.domain.period_task_registry import PeriodTaskRegistry
 from velocity.app.spi.task_repository import TaskRepository
 
 
@@ -19,11 +20,14 @@ class VelocityReportCalculator:
 
     def __init__(self, task_repository: TaskRepository, configuration: VelocityConfig,
                  member_group_resolver: MemberGroupResolver,
-                 velocity_search_criteria_factory: Callable[[], any]):
+                 velocity_search_criteria_factory: Callable[[], any],
+                 period_task_registry: Optional[PeriodTaskRegistry] = None):
         self._task_repository = task_repository
+        self._period_task_registry = period_task_registry
         self._configuration = configuration
         self._member_group_resolver = member_group_resolver
         self.__velocity_search_criteria_template = velocity_search_criteria_factory()
+        self._velocity_calculator = VectorizedVelocityCalculator()
 
     async def calculate_velocity_report_for_period(self,
                                                    start_date: datetime,
@@ -31,6 +35,7 @@ class VelocityReportCalculator:
                                                    scope_id: Optional[str] = None,
                                                    task_filter: TaskFilter = None) -> VelocityReport:
         tasks = await self._fetch_tasks_for_period(start_date, end_date, scope_id, task_filter)
+        self._remember_period_tasks(start_date, end_date, tasks, scope_id, task_filter)
 
         if not tasks:
             return VelocityReport(
@@ -40,15 +45,7 @@ class VelocityReportCalculator:
                 story_points=0
             )
 
-        velocity_calculator = GeneralizedTeamVelocityCalculator(
-            task_provider=ProxyTaskProvider(tasks),
-            story_point_extractor=TaskModuleStoryPointExtractor,
-            time_extractor=TaskModuleTotalSpentTimeExtractor
-        )
-        velocity_calculator.calculate()
-
-        velocity = velocity_calculator.get_metric()
-        story_points = velocity_calculator.get_story_points()
+        velocity, story_points = self._velocity_calculator.calculate_team_velocity(TaskFrameBuilder.from_tasks(tasks))
 
         return VelocityReport(
             start_date=start_date,
@@ -63,19 +60,61 @@ class VelocityReportCalculator:
                                                            scope_id: Optional[str] = None,
                                                            task_filter: TaskFilter = None) -> List[VelocityReport]:
         tasks = await self._fetch_tasks_for_period(start_date, end_date, scope_id, task_filter)
+        self._remember_period_tasks(start_date, end_date, tasks, scope_id, task_filter)
         allowed_scope_ids = await self._get_allowed_scope_ids(scope_id)
 
         if not tasks:
             return self._build_zero_velocity_reports(start_date, end_date, allowed_scope_ids)
 
-        velocity_calculator = UserVelocityCalculator(
-            task_provider=ProxyTaskProvider(tasks),
-            story_point_extractor=TaskModuleStoryPointExtractor,
-            worklog_extractor=TaskModuleWorklogExtractor
+        return self._build_scoped_velocity_reports(
+            start_date, end_date, TaskFrameBuilder.from_tasks(tasks), allowed_scope_ids
         )
 
-        scope_velocities = velocity_calculator.calculate()
-        scope_story_points = velocity_calculator.get_story_points()
+    async def calculate_velocity_reports_by_granularity(self,
+                                                        granularity: ReportGranularity,
+                                                        number_of_periods: int,
+                                                        scope_id: Optional[str] = None,
+                                                        task_filter: TaskFilter = None) -> List[VelocityReport]:
+        frame = await self._fetch_window_frame(number_of_periods, scope_id, task_filter)
+
+        velocity_reports = []
+        for bucket in PeriodBucketing.build_buckets(frame, granularity, number_of_periods):
+            self._remember_bucket_tasks(frame, bucket, granularity, scope_id, task_filter)
+            velocity, story_points = self._velocity_calculator.calculate_team_velocity(frame, bucket.task_mask)
+            velocity_reports.append(VelocityReport(
+                start_date=bucket.start_date,
+                end_date=bucket.end_date,
+                velocity=velocity,
+                story_points=story_points,
+                period_name=bucket.name
+            ))
+        return velocity_reports
+
+    async def calculate_scoped_velocity_reports_by_granularity(self,
+                                                               granularity: ReportGranularity,
+                                                               number_of_periods: int,
+                                                               scope_id: Optional[str] = None,
+                                                               task_filter: TaskFilter = None) -> List[VelocityReport]:
+        frame = await self._fetch_window_frame(number_of_periods, scope_id, task_filter)
+        allowed_scope_ids = await self._get_allowed_scope_ids(scope_id)
+
+        velocity_reports = []
+        for bucket in PeriodBucketing.build_buckets(frame, granularity, number_of_periods):
+            self._remember_bucket_tasks(frame, bucket, granularity, scope_id, task_filter)
+            if not bucket.task_mask.any():
+                velocity_reports.extend(self._build_zero_velocity_reports(
+                    bucket.start_date, bucket.end_date, allowed_scope_ids, bucket.name
+                ))
+                continue
+            velocity_reports.extend(self._build_scoped_velocity_reports(
+                bucket.start_date, bucket.end_date, frame, allowed_scope_ids, bucket.task_mask, bucket.name
+            ))
+        return velocity_reports
+
+    def _build_scoped_velocity_reports(self, start_date: datetime, end_date: datetime,
+                                       frame: TaskFrame, allowed_scope_ids: Optional[set],
+                                       task_mask=None, period_name: Optional[str] = None) -> List[VelocityReport]:
+        scope_velocities, scope_story_points = self._velocity_calculator.calculate_user_velocity(frame, task_mask)
 
         velocity_reports = []
 
@@ -90,18 +129,34 @@ class VelocityReportCalculator:
                 end_date=end_date,
                 velocity=velocity,
                 story_points=story_points,
-                metric_scope=member_id
+                metric_scope=member_id,
+                period_name=period_name
             ))
 
         return velocity_reports
 
+    def _remember_bucket_tasks(self, frame: TaskFrame, bucket: PeriodBucket, granularity: ReportGranularity,
+                               scope_id: Optional[str], task_filter: TaskFilter) -> None:
+        bucket_tasks = [frame.tasks[position] for position in np.flatnonzero(bucket.task_mask)]
+        iteration = bucket.name if granularity == ReportGranularity.ITERATION else None
+        self._remember_period_tasks(bucket.start_date, bucket.end_date, bucket_tasks, scope_id, task_filter, iteration)
+
+    def _remember_period_tasks(self, start_date: datetime, end_date: datetime, tasks: List[Task],
+                               scope_id: Optional[str], task_filter: TaskFilter,
+                               iteration: Optional[str] = None) -> None:
+        if self._period_task_registry is None or tasks is None:
+            return
+        self._period_task_registry.remember_period_tasks(start_date, end_date, tasks, scope_id, task_filter, iteration)
+
     @staticmethod
     def _build_zero_velocity_reports(start_date: datetime, end_date: datetime,
-                                     allowed_scope_ids: Optional[set]) -> List[VelocityReport]:
+                                     allowed_scope_ids: Optional[set],
+                                     period_name: Optional[str] = None) -> List[VelocityReport]:
         if not allowed_scope_ids:
             return []
         return [
-            VelocityReport(start_date=start_date, end_date=end_date, velocity=0, story_points=0, metric_scope=member_id)
+            VelocityReport(start_date=start_date, end_date=end_date, velocity=0, story_points=0, metric_scope=member_id,
+                           period_name=period_name)
             for member_id in allowed_scope_ids
         ]
 
@@ -149,6 +204,18 @@ class VelocityReportCalculator:
         enrichment = VelocityReportCalculator._build_enrichment(task_filter)
         return await self._task_repository.search(search_criteria, enrichment)
 
+    async def _fetch_window_frame(self, number_of_periods: int,
+                                  member_group_id: Optional[str] = None,
+                                  task_filter: TaskFilter = None) -> TaskFrame:
+        window_start, window_end = PeriodBucketing.resolve_window(number_of_periods)
+        search_criteria = self._create_velocity_search_criteria(
+            window_start, window_end, member_group_id, task_filter
+        )
+        enrichment = VelocityReportCalculator._build_enrichment(task_filter)
+        # The window goes through the cached search, so switching granularity reuses one tracker query
+        tasks = await self._task_repository.search(search_criteria, enrichment)
+        return TaskFrameBuilder.from_tasks(tasks or [])
+
     @staticmethod
     def _build_enrichment(task_filter: TaskFilter) -> Optional[EnrichmentOptions]:
         if not task_filter or not task_filter.worklog_transition_statuses:
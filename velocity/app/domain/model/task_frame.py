@@ -0,0 +1,37 @@
+from dataclasses import dataclass
+from datetime import datetime
+from typing import List
+
+import numpy as np
+
+from tasks.app.domain.model.task import Task
+
+
+@dataclass(slots=True)
+class TaskFrame:
+    tasks: List[Task]
+    story_points: np.ndarray
+    total_spent_seconds: np.ndarray
+    resolved_at: np.ndarray
+    member_group_index: np.ndarray
+    member_group_ids: List[str]
+    iteration_index: np.ndarray
+    iteration_names: List[str]
+    worklog_task_index: np.ndarray
+    worklog_assignee_index: np.ndarray
+    worklog_seconds: np.ndarray
+    assignee_ids: List[str]
+
+    def __len__(self) -> int:
+        return len(self.tasks)
+
+    def is_empty(self) -> bool:
+        return not self.tasks
+
+
+@dataclass(slots=True)
+class PeriodBucket:
+    start_date: datetime
+    end_date: datetime
+    name: str
+    task_mask: np.ndarray
@@ -5,12 +5,20 @@ from typing import List, Optional
 
 from sd_metrics_lib.utils.time import TimeUnit
 
+from tasks.app.domain.model.task import Task
+
 
 class ReportType(Enum):
     MEMBER_GROUP_SCOPE = auto()
     MEMBER_SCOPE = auto()
 
 
+class ReportGranularity(Enum):
+    WEEK = "week"
+    MONTH = "month"
+    ITERATION = "iteration"
+
+
 @dataclass(slots=True)
 class TaskFilter:
     include_all_statuses: bool = False
@@ -18,6 +26,14 @@ class TaskFilter:
     worklog_transition_statuses: Optional[List[str]] = None
 
 
+@dataclass(slots=True)
+class DeveloperTaskShare:
+    task: Task
+    developer_name: str
+    story_points: float
+    spent_seconds: float
+
+
 @dataclass(slots=True)
 class ReportGenerationParameters:
     time_unit: TimeUnit
@@ -25,6 +41,7 @@ class ReportGenerationParameters:
     report_type: ReportType = None
     scope_id: Optional[str] = None
     task_filter: TaskFilter = field(default_factory=TaskFilter)
+    granularity: Optional[ReportGranularity] = None
 
 
 @dataclass(slots=True)
@@ -42,3 +59,4 @@ class VelocityReport:
     story_points: float
     metric_scope: Optional[str] = None
     metric_scope_name: Optional[str] = None
+    period_name: Optional[str] = None
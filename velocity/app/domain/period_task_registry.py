@@ -0,0 +1,64 @@
+import hashlib
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from metrics import version_stamps
+from metrics.version_stamps import VersionStamps
+from tasks.app.domain.model.task import Task
+from .model.velocity import TaskFilter
+from ..api.api_for_period_tasks import ApiForPeriodTasks
+from ..spi.period_task_store import PeriodTaskStore
+
+
+class PeriodTaskRegistry(ApiForPeriodTasks):
+
+    def __init__(self, period_task_store: PeriodTaskStore, stamps: Optional[VersionStamps] = None,
+                 project_keys: Optional[List[str]] = None):
+        self._period_task_store = period_task_store
+        self._stamps = stamps
+        self._project_keys = project_keys or []
+
+    def find_period_tasks(self, start_date: datetime, end_date: datetime,
+                          scope_id: Optional[str] = None,
+                          task_filter: Optional[TaskFilter] = None,
+                          iteration: Optional[str] = None) -> Optional[List[Task]]:
+        key = self._build_versioned_key(start_date, end_date, scope_id, task_filter, iteration)
+        return self._period_task_store.get(key)
+
+    def remember_period_tasks(self, start_date: datetime, end_date: datetime,
+                              tasks: List[Task],
+                              scope_id: Optional[str] = None,
+                              task_filter: Optional[TaskFilter] = None,
+                              iteration: Optional[str] = None) -> None:
+        key = self._build_versioned_key(start_date, end_date, scope_id, task_filter, iteration)
+        self._period_task_store.put(key, tasks)
+
+    def _build_versioned_key(self, start_date: datetime, end_date: datetime,
+                             scope_id: Optional[str],
+                             task_filter: Optional[TaskFilter],
+                             iteration: Optional[str]) -> str:
+        key = PeriodTaskRegistry._build_key(start_date, end_date, scope_id, task_filter, iteration)
+        if self._stamps is None:
+            return key
+        return f"{key}:{self._stamps.token(self._dependencies(scope_id))}"
+
+    def _dependencies(self, scope_id: Optional[str]) -> Dict[str, List[str]]:
+        if scope_id:
+            return {version_stamps.MEMBER_GROUP: [scope_id]}
+        return {version_stamps.PROJECT: self._project_keys}
+
+    @staticmethod
+    def _build_key(start_date: datetime, end_date: datetime,
+                   scope_id: Optional[str],
+                   task_filter: Optional[TaskFilter],
+                   iteration: Optional[str]) -> str:
+        task_filter = task_filter or TaskFilter()
+        period = f"iteration={iteration}" if iteration else f"{start_date.date()}..{end_date.date()}"
+        parts = [
+            period,
+            f"scope={scope_id or ''}",
+            f"all_statuses={bool(task_filter.include_all_statuses)}",
+            f"query={task_filter.custom_query or ''}",
+            f"worklog={','.join(sorted(task_filter.worklog_transition_statuses or []))}"
+        ]
+        return "velocity_period_tasks:" + hashlib.sha256("|".join(parts).encode("utf-8")).hexdigest()
@@ -1,6 +1,5 @@
 import asyncio
 import datetime
-from concurrent.futures import ThreadPoolExecutor
 from functools import partial
 from typing import List, Optional
 
@@ -8,11 +7,9 @@ from sd_metrics_lib.utils.generators import TimeRangeGenerator
 from sd_metrics_lib.utils.time import TimeUnit
 
 from velocity.app.domain.calculation.velocity_report_calculator import VelocityReportCalculator
-from .model.velocity import ReportGenerationParameters, VelocityReport, ReportType
+from .model.velocity import ReportGenerationParameters, VelocityReport, ReportType, ReportGranularity
 from ..api.api_for_report_generation import ApiForVelocityReportGeneration
 
-metrics_executor = ThreadPoolExecutor(thread_name_prefix="metrics-calculator")
-
 
 class ReportGenerationService(ApiForVelocityReportGeneration):
 
@@ -23,6 +20,9 @@ class ReportGenerationService(ApiForVelocityReportGeneration):
         if generation_parameters.report_type is None:
             return None
             
+        if self._should_rebucket_window(generation_parameters):
+            return await self._generate_rebucketed_velocity_report(generation_parameters)
+
         metrics_calculation_function = self._resolve_metrics_calculation_function(generation_parameters.report_type)
         if metrics_calculation_function is None:
             return None
@@ -41,6 +41,35 @@ class ReportGenerationService(ApiForVelocityReportGeneration):
 
         return self._flatten_reports(period_reports)
 
+    async def _generate_rebucketed_velocity_report(self,
+                                                   generation_parameters: ReportGenerationParameters) -> Optional[List[VelocityReport]]:
+        rebucketing_function = self._resolve_rebucketing_function(generation_parameters.report_type)
+        if rebucketing_function is None:
+            return None
+
+        return await rebucketing_function(
+            generation_parameters.granularity,
+            generation_parameters.number_of_periods,
+            scope_id=generation_parameters.scope_id,
+            task_filter=generation_parameters.task_filter
+        )
+
+    @staticmethod
+    def _should_rebucket_window(generation_parameters: ReportGenerationParameters) -> bool:
+        if generation_parameters.granularity is None:
+            return False
+        if generation_parameters.granularity == ReportGranularity.ITERATION:
+            return True
+        task_filter = generation_parameters.task_filter
+        return not (task_filter and task_filter.include_all_statuses)
+
+    def _resolve_rebucketing_function(self, report_type: ReportType):
+        if report_type == ReportType.MEMBER_GROUP_SCOPE:
+            return self._calculation_service.calculate_velocity_reports_by_granularity
+        elif report_type == ReportType.MEMBER_SCOPE:
+            return self._calculation_service.calculate_scoped_velocity_reports_by_granularity
+        return None
+
     def _resolve_metrics_calculation_function(self, report_type: ReportType):
         if report_type is None:
             return None
@@ -0,0 +1,37 @@
+from typing import List, Optional
+
+import numpy as np
+
+from tasks.app.domain.model.task import Task
+from .calculation.task_frame_builder import TaskFrameBuilder
+from .calculation.vectorized_velocity_calculator import VectorizedVelocityCalculator
+from .model.velocity import DeveloperTaskShare
+from ..api.api_for_task_velocity_breakdown import ApiForTaskVelocityBreakdown
+
+
+class TaskVelocityBreakdownService(ApiForTaskVelocityBreakdown):
+
+    def breakdown_by_developer(self, tasks: List[Task],
+                               developer_names: Optional[List[str]] = None) -> List[DeveloperTaskShare]:
+        frame = TaskFrameBuilder.from_tasks(tasks)
+        if developer_names is None:
+            developer_names = frame.assignee_ids
+
+        developer_order = {developer_name: order for order, developer_name in enumerate(developer_names)}
+        assignee_order = np.array([developer_order.get(assignee_id, -1) for assignee_id in frame.assignee_ids],
+                                  dtype=np.int64)
+        worklog_order = assignee_order[frame.worklog_assignee_index]
+
+        selected = np.flatnonzero((worklog_order >= 0) & (frame.story_points[frame.worklog_task_index] > 0))
+        selected = selected[np.lexsort((worklog_order[selected], frame.worklog_task_index[selected]))]
+        developer_story_points = VectorizedVelocityCalculator.proportional_story_points(frame)
+
+        return [
+            DeveloperTaskShare(
+                task=frame.tasks[frame.worklog_task_index[position]],
+                developer_name=frame.assignee_ids[frame.worklog_assignee_index[position]],
+                story_points=float(developer_story_points[position]),
+                spent_seconds=float(frame.worklog_seconds[position])
+            )
+            for position in selected
+        ]
@@ -0,0 +1,15 @@
+from abc import ABC, abstractmethod
+from typing import List, Optional
+
+from tasks.app.domain.model.task import Task
+
+
+class PeriodTaskStore(ABC):
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[List[Task]]:
+        pass
+
+    @abstractmethod
+    def put(self, key: str, tasks: List[Task]) -> None:
+        pass
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import AsyncIterator, List, Optional
 
 from tasks.app.domain.model.task import Task, TaskSearchCriteria, EnrichmentOptions
 
@@ -10,3 +10,8 @@ class TaskRepository(ABC):
     async def search(self, search_criteria: TaskSearchCriteria,
                      enrichment: Optional[EnrichmentOptions] = None) -> List[Task]:
         pass
+
+    @abstractmethod
+    def stream(self, search_criteria: TaskSearchCriteria,
+               enrichment: Optional[EnrichmentOptions] = None) -> AsyncIterator[List[Task]]:
+        pass
@@ -1,17 +1,24 @@
 from typing import Optional, List
 
 from django.conf import settings
+from django.core.cache import caches
 from sd_metrics_lib.utils.time import TimePolicy
 
+from metrics.version_stamps import VersionStamps
 from tasks.container import tasks_container
 from velocity.app.domain.calculation.member_group_resolver import MemberGroupResolver
 from .app.domain.model.config import MemberVelocityConfig
+from .app.api.api_for_period_tasks import ApiForPeriodTasks
 from .app.api.api_for_report_generation import ApiForVelocityReportGeneration
+from .app.api.api_for_task_velocity_breakdown import ApiForTaskVelocityBreakdown
 from .app.api.api_for_velocity_calculation import ApiForVelocityCalculation
 from .app.domain.calculation.velocity_report_calculator import VelocityReportCalculator
+from .app.domain.period_task_registry import PeriodTaskRegistry
 from .app.domain.report_generation_service import ReportGenerationService
+from .app.domain.task_velocity_breakdown_service import TaskVelocityBreakdownService
 from .app.domain.velocity_calculation_service import VelocityCalculationService
 from .config_loader import load_velocity_config
+from .out.django_cache_period_task_store import DjangoCachePeriodTaskStore
 from .out.tasks_api_repository import TasksApiRepository
 
 
@@ -30,15 +37,30 @@ class VelocityContainer:
     def velocity_calculation_api(self) -> ApiForVelocityCalculation:
         return VelocityCalculationService(self._config.member_velocity, self.ideal_time_policy)
 
+    @property
+    def task_velocity_breakdown_api(self) -> ApiForTaskVelocityBreakdown:
+        return TaskVelocityBreakdownService()
+
+    @property
+    def period_tasks_api(self) -> ApiForPeriodTasks:
+        return self._period_task_registry
+
     @property
     def _calculation_service(self) -> VelocityReportCalculator:
         return VelocityReportCalculator(
             task_repository=self._task_repository,
             configuration=self._config,
             member_group_resolver=self._member_group_resolver,
-            velocity_search_criteria_factory=tasks_container.create_velocity_search_criteria
+            velocity_search_criteria_factory=tasks_container.create_velocity_search_criteria,
+            period_task_registry=self._period_task_registry
         )
 
+    @property
+    def _period_task_registry(self) -> PeriodTaskRegistry:
+        return PeriodTaskRegistry(DjangoCachePeriodTaskStore(caches['velocity_period_tasks']),
+                                  VersionStamps(caches['version_stamps']),
+                                  tasks_container.get_project_keys())
+
     @property
     def _task_repository(self) -> TasksApiRepository:
         return TasksApiRepository(tasks_container.task_search_api)
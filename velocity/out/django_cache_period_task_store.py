@@ -0,0 +1,16 @@
+from typing import List, Optional
+
+from tasks.app.domain.model.task import Task
+from velocity.app.spi.period_task_store import PeriodTaskStore
+
+
+class DjangoCachePeriodTaskStore(PeriodTaskStore):
+
+    def __init__(self, cache):
+        self._cache = cache
+
+    def get(self, key: str) -> Optional[List[Task]]:
+        return self._cache.get(key)
+
+    def put(self, key: str, tasks: List[Task]) -> None:
+        self._cache.set(key, tasks)
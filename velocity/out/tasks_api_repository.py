@@ -1,4 +1,4 @@
-from typing import List, Optional
+from typing import AsyncIterator, List, Optional
 
 from django.conf import settings
 
@@ -14,9 +14,18 @@ class TasksApiRepository(TaskRepository):
 
     async def search(self, search_criteria: TaskSearchCriteria,
                      enrichment: Optional[EnrichmentOptions] = None) -> List[Task]:
+        return await self._task_search_api.search(search_criteria, self._resolve_enrichment(enrichment))
+
+    async def stream(self, search_criteria: TaskSearchCriteria,
+                     enrichment: Optional[EnrichmentOptions] = None) -> AsyncIterator[List[Task]]:
+        async for tasks in self._task_search_api.stream(search_criteria, self._resolve_enrichment(enrichment)):
+            yield tasks
+
+    @staticmethod
+    def _resolve_enrichment(enrichment: Optional[EnrichmentOptions]) -> EnrichmentOptions:
         if enrichment is None:
             enrichment = EnrichmentOptions(
                 include_time_tracking=True,
                 worklog_transition_statuses=settings.METRICS_IN_PROGRESS_STATUS_CODES
             )
-        return await self._task_search_api.search(search_criteria, enrichment)
+        return enrichment
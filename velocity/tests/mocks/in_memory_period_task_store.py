@@ -0,0 +1,15 @@
+from typing import Dict, List, Optional
+
+from tasks.app.domain.model.task import Task
+from velocity.app.spi.period_task_store import PeriodTaskStore
+
+
+class InMemoryPeriodTaskStore(PeriodTaskStore):
+    def __init__(self):
+        self.entries: Dict[str, List[Task]] = {}
+
+    def get(self, key: str) -> Optional[List[Task]]:
+        return self.entries.get(key)
+
+    def put(self, key: str, tasks: List[Task]) -> None:
+        self.entries[key] = tasks
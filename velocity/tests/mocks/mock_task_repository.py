@@ -1,4 +1,4 @@
-from typing import List, Optional
+from typing import AsyncIterator, List, Optional
 from unittest.mock import AsyncMock
 
 from tasks.app.domain.model.task import Task, TaskSearchCriteria, EnrichmentOptions
@@ -13,6 +13,10 @@ class MockTaskRepository(TaskRepository):
                      enrichment: Optional[EnrichmentOptions] = None) -> List[Task]:
         return await self._mock.search(search_criteria, enrichment)
     
+    async def stream(self, search_criteria: TaskSearchCriteria,
+                     enrichment: Optional[EnrichmentOptions] = None) -> AsyncIterator[List[Task]]:
+        yield await self._mock.stream(search_criteria, enrichment)
+
     @property
     def mock(self) -> AsyncMock:
         return self._mock
\ No newline at end of file
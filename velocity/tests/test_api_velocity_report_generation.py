@@ -5,7 +5,7 @@ from datetime import datetime, timedelta
 from velocity.app.domain.calculation.member_group_resolver import MemberGroupResolver
 from velocity.app.domain.calculation.velocity_report_calculator import VelocityReportCalculator
 from velocity.app.domain.report_generation_service import ReportGenerationService
-from velocity.app.domain.model.velocity import TaskFilter
+from velocity.app.domain.model.velocity import TaskFilter, ReportGranularity
 from velocity.tests.fixtures.velocity_builders import (
     ReportParametersBuilder,
     VelocityConfigBuilder,
@@ -19,6 +19,8 @@ class MockVelocityReportCalculator:
         self.mock = AsyncMock()
         self.calculate_velocity_report_for_period = AsyncMock()
         self.calculate_scoped_velocity_reports_for_period = AsyncMock()
+        self.calculate_velocity_reports_by_granularity = AsyncMock()
+        self.calculate_scoped_velocity_reports_by_granularity = AsyncMock()
 
 
 class TestApiVelocityReportGeneration(unittest.IsolatedAsyncioTestCase):
@@ -114,6 +116,44 @@ class TestApiVelocityReportGeneration(unittest.IsolatedAsyncioTestCase):
         self.assertFalse(call_kwargs.kwargs["task_filter"].include_all_statuses)
         self.assertIsNone(call_kwargs.kwargs["task_filter"].custom_query)
 
+    async def test_shouldRebucketSingleWindowWhenGranularityRequested(self):
+        # Given
+        parameters = (ReportParametersBuilder.sprint_planning_report()
+                     .over_last_months(6)
+                     .for_scope("development-team")
+                     .build())
+        parameters.granularity = ReportGranularity.ITERATION
+
+        self.velocity_calculator.calculate_velocity_reports_by_granularity.return_value = [self._create_sample_report()]
+
+        # When
+        result = await self.report_service.generate_velocity_report(parameters)
+
+        # Then
+        self.assertEqual(1, len(result))
+        self.velocity_calculator.calculate_velocity_reports_by_granularity.assert_awaited_once()
+        call_args = self.velocity_calculator.calculate_velocity_reports_by_granularity.call_args
+        self.assertEqual((ReportGranularity.ITERATION, 6), call_args.args)
+        self.velocity_calculator.calculate_velocity_report_for_period.assert_not_called()
+
+    async def test_shouldFallBackToPeriodQueriesWhenAllStatusesRequestedForWeeklyGranularity(self):
+        # Given
+        parameters = (ReportParametersBuilder.retrospective_analysis()
+                     .over_last_weeks(4)
+                     .for_scope("development-team")
+                     .build())
+        parameters.granularity = ReportGranularity.WEEK
+        parameters.task_filter = TaskFilter(include_all_statuses=True)
+
+        self.velocity_calculator.calculate_scoped_velocity_reports_for_period.return_value = []
+
+        # When
+        await self.report_service.generate_velocity_report(parameters)
+
+        # Then
+        self.assertEqual(4, self.velocity_calculator.calculate_scoped_velocity_reports_for_period.call_count)
+        self.velocity_calculator.calculate_scoped_velocity_reports_by_granularity.assert_not_called()
+
     def _create_sample_report(self):
         from velocity.app.domain.model.velocity import VelocityReport
         return VelocityReport(
@@ -5,7 +5,7 @@ from tasks.app.domain.model.task import TaskSearchCriteria
 
 from velocity.app.domain.calculation.member_group_resolver import MemberGroupResolver
 from velocity.app.domain.calculation.velocity_report_calculator import VelocityReportCalculator
-from velocity.app.domain.model.velocity import TaskFilter
+from velocity.app.domain.model.velocity import ReportGranularity, TaskFilter
 from velocity.tests.fixtures.velocity_builders import VelocityConfigBuilder
 from velocity.tests.mocks.mock_task_repository import MockTaskRepository
 
@@ -42,6 +42,17 @@ class TestApiVelocitySearchCriteria(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(captured_criteria.status_filter, self.status_filter)
         self.assertIsNone(captured_criteria.state_change_date_range)
 
+    async def test_shouldFetchGranularityWindowThroughCachedSearch(self):
+        # Given
+        self.task_repository.mock.search.return_value = []
+
+        # When
+        await self.calculator.calculate_velocity_reports_by_granularity(ReportGranularity.WEEK, 4)
+
+        # Then
+        self.task_repository.mock.search.assert_awaited_once()
+        self.task_repository.mock.stream.assert_not_called()
+
     async def test_shouldUseStateChangeDateRangeWhenIncludeAllStatusesIsTrue(self):
         # Given
         start_date = datetime(2024, 1, 1)
@@ -0,0 +1,93 @@
+import unittest
+from datetime import datetime, timedelta, timezone
+
+from sd_metrics_lib.utils.time import Duration, TimeUnit
+
+from tasks.app.domain.model.task import Task, SystemMetadata, Assignment, TimeTracking
+from velocity.app.domain.calculation.period_bucketing import PeriodBucketing
+from velocity.app.domain.calculation.task_frame_builder import TaskFrameBuilder
+from velocity.app.domain.model.velocity import ReportGranularity
+
+
+def _build_task(task_id: str, resolved_at: datetime, iteration: str = None) -> Task:
+    return Task(
+        id=task_id,
+        title=task_id,
+        system_metadata=SystemMetadata(original_status="Done", project_key="PROJ", url=""),
+        assignment=Assignment(),
+        time_tracking=TimeTracking(
+            total_spent_time=Duration.of(8, TimeUnit.HOUR),
+            spent_time_by_assignee={"alice": Duration.of(8, TimeUnit.HOUR)}
+        ),
+        story_points=3.0,
+        iteration=iteration,
+        resolved_at=resolved_at
+    )
+
+
+class TestPeriodBucketing(unittest.TestCase):
+
+    def setUp(self):
+        self.now = datetime.now(timezone.utc)
+        self.tasks = [
+            _build_task("T-1", self.now - timedelta(days=40), "Sprint 1"),
+            _build_task("T-2", self.now - timedelta(days=30), "Sprint 1"),
+            _build_task("T-3", self.now - timedelta(days=12), "Sprint 2"),
+            _build_task("T-4", self.now - timedelta(hours=1), "Sprint 3"),
+            _build_task("T-5", self.now - timedelta(hours=2)),
+        ]
+        self.frame = TaskFrameBuilder.from_tasks(self.tasks)
+
+    def test_shouldAssignEveryResolvedTaskToExactlyOneMonth(self):
+        # When
+        buckets = PeriodBucketing.build_buckets(self.frame, ReportGranularity.MONTH, 3)
+
+        # Then
+        self.assertEqual(3, len(buckets))
+        self.assertEqual([1, 1, 1, 1, 1], sum(bucket.task_mask.astype(int) for bucket in buckets).tolist())
+        tomorrow = self.now + timedelta(days=1)
+        self.assertEqual(f"{tomorrow.year}-{tomorrow.month:02d}", buckets[0].name)
+
+    def test_shouldNameWeeklyBucketsByIsoWeek(self):
+        # When
+        buckets = PeriodBucketing.build_buckets(self.frame, ReportGranularity.WEEK, 2)
+
+        # Then
+        latest_task_bucket = next(bucket for bucket in buckets if bucket.task_mask[3])
+        iso_year, iso_week, _ = self.tasks[3].resolved_at.isocalendar()
+        self.assertEqual(f"{iso_year}-W{iso_week:02d}", latest_task_bucket.name)
+        self.assertFalse(any(bucket.task_mask[0] for bucket in buckets))
+
+    def test_shouldGroupByIterationNewestFirstAndSkipTasksWithoutIteration(self):
+        # When
+        buckets = PeriodBucketing.build_buckets(self.frame, ReportGranularity.ITERATION, 2)
+
+        # Then
+        self.assertEqual(["Sprint 3", "Sprint 2"], [bucket.name for bucket in buckets])
+        self.assertEqual([False, False, False, True, False], buckets[0].task_mask.tolist())
+
+    def test_shouldBucketByUtcMonthWhenResolvedAtCarriesAnotherOffset(self):
+        # Given
+        month_start = datetime.now(timezone.utc).replace(day=1, hour=0, minute=30, second=0, microsecond=0)
+        resolved_at = month_start.astimezone(timezone(timedelta(hours=-5)))
+        frame = TaskFrameBuilder.from_tasks([_build_task("T-1", resolved_at)])
+
+        # When
+        buckets = PeriodBucketing.build_buckets(frame, ReportGranularity.MONTH, 2)
+
+        # Then
+        self.assertEqual([True, False], [bool(bucket.task_mask[0]) for bucket in buckets])
+        self.assertEqual(timezone.utc, buckets[0].start_date.tzinfo)
+
+    def test_shouldResolveWindowCoveringRequestedNumberOfMonths(self):
+        # When
+        window_start, window_end = PeriodBucketing.resolve_window(3)
+
+        # Then
+        self.assertEqual(1, window_start.day)
+        self.assertLess(window_start, self.now - timedelta(days=40))
+        self.assertGreater(window_end, self.now)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,113 @@
+import unittest
+from datetime import datetime, timezone
+
+from django.core.cache.backends.locmem import LocMemCache
+
+from metrics import version_stamps
+from metrics.version_stamps import VersionStamps
+
+from tasks.app.domain.model.task import Task, SystemMetadata, Assignment, TimeTracking, TaskSearchCriteria
+from velocity.app.domain.calculation.member_group_resolver import MemberGroupResolver
+from velocity.app.domain.calculation.velocity_report_calculator import VelocityReportCalculator
+from velocity.app.domain.model.velocity import TaskFilter
+from velocity.app.domain.period_task_registry import PeriodTaskRegistry
+from velocity.tests.fixtures.velocity_builders import VelocityConfigBuilder
+from velocity.tests.mocks.in_memory_period_task_store import InMemoryPeriodTaskStore
+from velocity.tests.mocks.mock_task_repository import MockTaskRepository
+
+
+def _build_task(task_id: str) -> Task:
+    return Task(
+        id=task_id,
+        title=task_id,
+        system_metadata=SystemMetadata(original_status="Done", project_key="PROJ", url=""),
+        assignment=Assignment(),
+        time_tracking=TimeTracking(spent_time_by_assignee={}),
+        story_points=3.0
+    )
+
+
+class TestPeriodTaskRegistry(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.store = InMemoryPeriodTaskStore()
+        self.registry = PeriodTaskRegistry(self.store)
+
+    def test_shouldFindRememberedTasksForSamePeriodDatesRegardlessOfTimeOfDay(self):
+        # Given
+        tasks = [_build_task("PROJ-1")]
+        self.registry.remember_period_tasks(datetime(2024, 3, 1, 14, 30), datetime(2024, 3, 31, 14, 30), tasks,
+                                            "backend-team", TaskFilter(custom_query="project = PROJ"))
+
+        # When
+        result = self.registry.find_period_tasks(
+            datetime(2024, 3, 1, tzinfo=timezone.utc), datetime(2024, 3, 31, 23, 59, tzinfo=timezone.utc),
+            "backend-team", TaskFilter(custom_query="project = PROJ")
+        )
+
+        # Then
+        self.assertEqual(["PROJ-1"], [task.id for task in result])
+
+    def test_shouldMissWhenTaskFilterDiffers(self):
+        # Given
+        self.registry.remember_period_tasks(datetime(2024, 3, 1), datetime(2024, 3, 31), [_build_task("PROJ-1")],
+                                            "backend-team", TaskFilter())
+
+        # When
+        result = self.registry.find_period_tasks(datetime(2024, 3, 1), datetime(2024, 3, 31), "backend-team",
+                                                 TaskFilter(worklog_transition_statuses=["Development"]))
+
+        # Then
+        self.assertIsNone(result)
+
+    def test_shouldKeyIterationPeriodsByIterationName(self):
+        # Given
+        self.registry.remember_period_tasks(datetime(2024, 3, 4), datetime(2024, 3, 15), [_build_task("PROJ-2")],
+                                            iteration="Sprint 7")
+
+        # When
+        result = self.registry.find_period_tasks(datetime(2023, 4, 1), datetime(2024, 3, 31), iteration="Sprint 7")
+
+        # Then
+        self.assertEqual(["PROJ-2"], [task.id for task in result])
+
+    async def test_shouldRememberFetchedTasksWhenCalculatingPeriodReport(self):
+        # Given
+        task_repository = MockTaskRepository()
+        task_repository.mock.search.return_value = [_build_task("PROJ-3")]
+        config = VelocityConfigBuilder.sprint_planning_team().build()
+        calculator = VelocityReportCalculator(
+            task_repository=task_repository,
+            configuration=config,
+            member_group_resolver=MemberGroupResolver(config),
+            velocity_search_criteria_factory=lambda: TaskSearchCriteria(),
+            period_task_registry=self.registry
+        )
+
+        # When
+        await calculator.calculate_velocity_report_for_period(datetime(2024, 3, 1), datetime(2024, 3, 31))
+
+        # Then
+        result = self.registry.find_period_tasks(datetime(2024, 3, 1), datetime(2024, 3, 31))
+        self.assertEqual(["PROJ-3"], [task.id for task in result])
+
+    def test_shouldMissOnlyScopeWhoseMemberGroupStampWasBumped(self):
+        # Given
+        stamps_cache = LocMemCache("period-task-version-stamps", {})
+        stamps_cache.clear()
+        stamps = VersionStamps(stamps_cache)
+        registry = PeriodTaskRegistry(self.store, stamps, ["PROJ"])
+        for scope_id in ("backend-team", "frontend-team"):
+            registry.remember_period_tasks(datetime(2024, 3, 1), datetime(2024, 3, 31), [_build_task("PROJ-4")],
+                                           scope_id)
+
+        # When
+        stamps.bump(version_stamps.MEMBER_GROUP, ["backend-team"])
+
+        # Then
+        self.assertIsNone(registry.find_period_tasks(datetime(2024, 3, 1), datetime(2024, 3, 31), "backend-team"))
+        self.assertIsNotNone(registry.find_period_tasks(datetime(2024, 3, 1), datetime(2024, 3, 31), "frontend-team"))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,106 @@
+import unittest
+
+from sd_metrics_lib.calculators.velocity import GeneralizedTeamVelocityCalculator, UserVelocityCalculator
+from sd_metrics_lib.sources.story_points import FunctionStoryPointExtractor
+from sd_metrics_lib.sources.tasks import ProxyTaskProvider
+from sd_metrics_lib.sources.worklog import FunctionWorklogExtractor, FunctionTotalSpentTimeExtractor
+
+from velocity.app.domain.calculation.proxy_extractors import (
+    extract_story_points,
+    extract_worklog_by_assignee,
+    extract_total_spent_time
+)
+from velocity.app.domain.calculation.task_frame_builder import TaskFrameBuilder
+from velocity.app.domain.calculation.vectorized_velocity_calculator import VectorizedVelocityCalculator
+from velocity.tests.fixtures.velocity_builders import TaskBuilder
+
+
+class TestTaskFrame(unittest.TestCase):
+
+    def setUp(self):
+        self.calculator = VectorizedVelocityCalculator()
+        self.tasks = [
+            TaskBuilder.sprint_task().with_id("T-1").with_story_points(5.0)
+            .with_distributed_time_spent({"alice": 6.0, "bob": 2.0}).build(),
+            TaskBuilder.sprint_task().with_id("T-2").with_story_points(3.0)
+            .with_distributed_time_spent({"bob": 4.0}).build(),
+            TaskBuilder.sprint_task().with_id("T-3").with_story_points(0.0)
+            .with_distributed_time_spent({"carol": 10.0}).build(),
+            TaskBuilder.sprint_task().with_id("T-4").with_story_points(8.0).with_no_time_tracking().build(),
+            TaskBuilder.capacity_planning_task().with_id("T-5")
+            .with_distributed_time_spent({"alice": 3.0}).build(),
+        ]
+
+    def test_shouldStoreWorklogAsSparseColumns(self):
+        # Given
+        tasks = self.tasks
+
+        # When
+        frame = TaskFrameBuilder.from_tasks(tasks)
+
+        # Then
+        self.assertEqual(5, len(frame))
+        self.assertEqual(["alice", "bob", "carol"], frame.assignee_ids)
+        self.assertEqual([0, 0, 1, 2, 4], frame.worklog_task_index.tolist())
+        self.assertEqual([0, 1, 1, 2, 0], frame.worklog_assignee_index.tolist())
+        self.assertEqual([21600.0, 7200.0, 14400.0, 36000.0, 10800.0], frame.worklog_seconds.tolist())
+        self.assertEqual([5.0, 3.0, 0.0, 8.0, 0.0], frame.story_points.tolist())
+
+    def test_shouldBuildEmptyFrameWhenNoTasks(self):
+        # When
+        frame = TaskFrameBuilder.from_tasks([])
+
+        # Then
+        self.assertTrue(frame.is_empty())
+        self.assertEqual((0, 0.0), self.calculator.calculate_team_velocity(frame))
+        self.assertEqual(({}, {}), self.calculator.calculate_user_velocity(frame))
+
+    def test_shouldMatchGeneralizedTeamVelocityCalculator(self):
+        # Given
+        reference = GeneralizedTeamVelocityCalculator(
+            task_provider=ProxyTaskProvider(self.tasks),
+            story_point_extractor=FunctionStoryPointExtractor(extract_story_points),
+            time_extractor=FunctionTotalSpentTimeExtractor(extract_total_spent_time)
+        )
+        reference.calculate()
+
+        # When
+        velocity, story_points = self.calculator.calculate_team_velocity(TaskFrameBuilder.from_tasks(self.tasks))
+
+        # Then
+        self.assertAlmostEqual(reference.get_metric(), velocity)
+        self.assertAlmostEqual(reference.get_story_points(), story_points)
+
+    def test_shouldMatchUserVelocityCalculator(self):
+        # Given
+        reference = UserVelocityCalculator(
+            task_provider=ProxyTaskProvider(self.tasks),
+            story_point_extractor=FunctionStoryPointExtractor(extract_story_points),
+            worklog_extractor=FunctionWorklogExtractor(extract_worklog_by_assignee)
+        )
+        expected_velocities = reference.calculate()
+
+        # When
+        velocities, story_points = self.calculator.calculate_user_velocity(TaskFrameBuilder.from_tasks(self.tasks))
+
+        # Then
+        self.assertEqual(set(expected_velocities), set(velocities))
+        for assignee_id, expected_velocity in expected_velocities.items():
+            self.assertAlmostEqual(expected_velocity, velocities[assignee_id])
+        self.assertEqual(set(reference.get_story_points()), set(story_points))
+        for assignee_id, expected_story_points in reference.get_story_points().items():
+            self.assertAlmostEqual(expected_story_points, story_points[assignee_id])
+
+    def test_shouldSplitStoryPointsProportionallyToWorklog(self):
+        # Given
+        frame = TaskFrameBuilder.from_tasks(self.tasks)
+
+        # When
+        result = VectorizedVelocityCalculator.proportional_story_points(frame)
+
+        # Then
+        self.assertEqual([3.75, 1.25, 3.0, 0.0, 0.0], result.tolist())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,15 @@
+from abc import ABC, abstractmethod
+from typing import Mapping
+
+from ..domain.model.webhook import ChangeNotice, WebhookSource
+
+
+class ApiForWebhookIngestion(ABC):
+
+    @abstractmethod
+    def is_enabled(self, source: WebhookSource) -> bool:
+        pass
+
+    @abstractmethod
+    def ingest(self, source: WebhookSource, headers: Mapping[str, str], body: bytes) -> ChangeNotice:
+        pass
@@ -0,0 +1,21 @@
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, Optional, Set
+
+
+@dataclass(slots=True)
+class WebhookConfig:
+    jira_secret: Optional[str]
+    bitbucket_secret: Optional[str]
+    azure_username: Optional[str]
+    azure_password: Optional[str]
+    members: Dict[str, Dict[str, Any]]
+    default_member_group_when_missing: Optional[str] = None
+
+    def get_member_groups(self, assignee_names: Iterable[str]) -> Set[str]:
+        member_groups = set()
+        for assignee_name in assignee_names:
+            member_groups_of_member = self.members.get(assignee_name, {}).get('member_groups', [])
+            if not member_groups_of_member and self.default_member_group_when_missing:
+                member_groups_of_member = [self.default_member_group_when_missing]
+            member_groups.update(member_groups_of_member)
+        return member_groups
@@ -0,0 +1,29 @@
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Optional, Set
+
+
+class WebhookSource(Enum):
+    JIRA = "jira"
+    AZURE = "azure"
+    BITBUCKET = "bitbucket"
+
+    @staticmethod
+    def from_value(value: str) -> Optional["WebhookSource"]:
+        for source in WebhookSource:
+            if source.value == value:
+                return source
+        return None
+
+
+@dataclass(slots=True)
+class ChangeNotice:
+    source: WebhookSource
+    event_type: str
+    project_keys: Set[str] = field(default_factory=set)
+    issue_keys: Set[str] = field(default_factory=set)
+    assignee_names: Set[str] = field(default_factory=set)
+    pull_request_ids: Set[str] = field(default_factory=set)
+
+    def is_empty(self) -> bool:
+        return not (self.project_keys or self.issue_keys or self.assignee_names or self.pull_request_ids)
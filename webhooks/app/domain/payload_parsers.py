@@ -0,0 +1,110 @@
+import json
+from typing import Any, Dict, Mapping, Optional, Set
+
+from .model.webhook import ChangeNotice, WebhookSource
+
+
+class PayloadParsers:
+
+    @staticmethod
+    def parse(source: WebhookSource, headers: Mapping[str, str], body: bytes) -> ChangeNotice:
+        try:
+            payload = json.loads(body.decode('utf-8'))
+        except (UnicodeDecodeError, json.JSONDecodeError) as e:
+            raise ValueError(f"Webhook payload is not valid JSON: {e}")
+        if not isinstance(payload, dict):
+            raise ValueError("Webhook payload must be a JSON object")
+
+        if source is WebhookSource.JIRA:
+            return PayloadParsers._parse_jira(payload)
+        if source is WebhookSource.AZURE:
+            return PayloadParsers._parse_azure(payload)
+        return PayloadParsers._parse_bitbucket(headers, payload)
+
+    @staticmethod
+    def _parse_jira(payload: Dict[str, Any]) -> ChangeNotice:
+        event_type = payload.get('webhookEvent')
+        issue = payload.get('issue')
+        if not event_type or not isinstance(issue, dict) or not issue.get('key'):
+            raise ValueError("Jira webhook payload has no webhookEvent or issue key")
+
+        notice = ChangeNotice(source=WebhookSource.JIRA, event_type=event_type, issue_keys={issue['key']})
+        fields = issue.get('fields') or {}
+        project_key = (fields.get('project') or {}).get('key') or issue['key'].rsplit('-', 1)[0]
+        notice.project_keys.add(project_key)
+        PayloadParsers._add(notice.assignee_names, (fields.get('assignee') or {}).get('displayName'))
+
+        for item in (payload.get('changelog') or {}).get('items') or []:
+            if item.get('field') == 'assignee':
+                PayloadParsers._add(notice.assignee_names, item.get('fromString'))
+                PayloadParsers._add(notice.assignee_names, item.get('toString'))
+        return notice
+
+    @staticmethod
+    def _parse_azure(payload: Dict[str, Any]) -> ChangeNotice:
+        event_type = payload.get('eventType')
+        resource = payload.get('resource')
+        if not event_type or not isinstance(resource, dict):
+            raise ValueError("Azure DevOps webhook payload has no eventType or resource")
+
+        notice = ChangeNotice(source=WebhookSource.AZURE, event_type=event_type)
+        if event_type.startswith('git.pullrequest.'):
+            if not resource.get('pullRequestId'):
+                raise ValueError("Azure DevOps pull request event has no pullRequestId")
+            notice.pull_request_ids.add(str(resource['pullRequestId']))
+            project_name = ((resource.get('repository') or {}).get('project') or {}).get('name')
+            if project_name:
+                notice.project_keys.add(project_name)
+            return notice
+
+        if event_type.startswith('workitem.'):
+            work_item_id = resource.get('workItemId') or resource.get('id')
+            if not work_item_id:
+                raise ValueError("Azure DevOps work item event has no work item id")
+            notice.issue_keys.add(str(work_item_id))
+            revision_fields = (resource.get('revision') or {}).get('fields') or resource.get('fields') or {}
+            project_name = PayloadParsers._azure_field(revision_fields, 'System.TeamProject')
+            PayloadParsers._add(notice.project_keys, project_name)
+            assignee = (resource.get('fields') or {}).get('System.AssignedTo')
+            if isinstance(assignee, dict) and ('oldValue' in assignee or 'newValue' in assignee):
+                PayloadParsers._add(notice.assignee_names, PayloadParsers._azure_identity(assignee.get('oldValue')))
+                PayloadParsers._add(notice.assignee_names, PayloadParsers._azure_identity(assignee.get('newValue')))
+            current_assignee = revision_fields.get('System.AssignedTo')
+            PayloadParsers._add(notice.assignee_names, PayloadParsers._azure_identity(current_assignee))
+            return notice
+
+        raise ValueError(f"Unsupported Azure DevOps event type: {event_type}")
+
+    @staticmethod
+    def _parse_bitbucket(headers: Mapping[str, str], payload: Dict[str, Any]) -> ChangeNotice:
+        event_type = headers.get('X-Event-Key')
+        pull_request = payload.get('pullrequest')
+        if not event_type or not isinstance(pull_request, dict) or not pull_request.get('id'):
+            raise ValueError("Bitbucket webhook payload has no X-Event-Key or pull request id")
+
+        notice = ChangeNotice(source=WebhookSource.BITBUCKET, event_type=event_type,
+                              pull_request_ids={str(pull_request['id'])})
+        repository_slug = (payload.get('repository') or {}).get('name')
+        if repository_slug:
+            notice.project_keys.add(repository_slug)
+        return notice
+
+    @staticmethod
+    def _azure_field(fields: Dict[str, Any], name: str) -> Optional[str]:
+        value = fields.get(name)
+        if isinstance(value, dict):
+            return value.get('newValue')
+        return value
+
+    @staticmethod
+    def _azure_identity(value: Any) -> Optional[str]:
+        if isinstance(value, dict):
+            return value.get('displayName')
+        if isinstance(value, str):
+            return value.split(' <', 1)[0]
+        return None
+
+    @staticmethod
+    def _add(values: Set[str], value: Optional[str]) -> None:
+        if value:
+            values.add(value)
@@ -0,0 +1,49 @@
+import base64
+import hashlib
+import hmac
+from typing import Mapping
+
+from .model.config import WebhookConfig
+from .model.webhook import WebhookSource
+
+SIGNATURE_HEADER = 'X-Hub-Signature'
+
+
+class WebhookAuthenticator:
+
+    def __init__(self, config: WebhookConfig):
+        self._config = config
+
+    def is_enabled(self, source: WebhookSource) -> bool:
+        if source is WebhookSource.JIRA:
+            return bool(self._config.jira_secret)
+        if source is WebhookSource.BITBUCKET:
+            return bool(self._config.bitbucket_secret)
+        return bool(self._config.azure_username and self._config.azure_password)
+
+    def is_authentic(self, source: WebhookSource, headers: Mapping[str, str], body: bytes) -> bool:
+        if source is WebhookSource.JIRA:
+            return self._has_valid_signature(headers, body, self._config.jira_secret)
+        if source is WebhookSource.BITBUCKET:
+            return self._has_valid_signature(headers, body, self._config.bitbucket_secret)
+        return self._has_valid_basic_auth(headers)
+
+    @staticmethod
+    def sign(body: bytes, secret: str) -> str:
+        return "sha256=" + hmac.new(secret.encode('utf-8'), body, hashlib.sha256).hexdigest()
+
+    @staticmethod
+    def _has_valid_signature(headers: Mapping[str, str], body: bytes, secret: str) -> bool:
+        signature = headers.get(SIGNATURE_HEADER) or ''
+        return bool(secret) and hmac.compare_digest(signature, WebhookAuthenticator.sign(body, secret))
+
+    def _has_valid_basic_auth(self, headers: Mapping[str, str]) -> bool:
+        authorization = headers.get('Authorization') or ''
+        if not authorization.lower().startswith('basic '):
+            return False
+        try:
+            username, password = base64.b64decode(authorization.split(' ', 1)[1]).decode('utf-8').split(':', 1)
+        except (ValueError, UnicodeDecodeError):
+            return False
+        return (hmac.compare_digest(username, self._config.azure_username or '')
+                and hmac.compare_digest(password, self._config.azure_password or ''))
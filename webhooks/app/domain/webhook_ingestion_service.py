@@ -0,0 +1,35 @@
+import logging
+from typing import List, Mapping
+
+from ..api.api_for_webhook_ingestion import ApiForWebhookIngestion
+from ..spi.change_listener import ChangeListener
+from .model.webhook import ChangeNotice, WebhookSource
+from .payload_parsers import PayloadParsers
+from .webhook_authenticator import WebhookAuthenticator
+
+logger = logging.getLogger(__name__)
+
+
+class WebhookIngestionService(ApiForWebhookIngestion):
+
+    def __init__(self, authenticator: WebhookAuthenticator, listeners: List[ChangeListener]):
+        self._authenticator = authenticator
+        self._listeners = listeners
+
+    def is_enabled(self, source: WebhookSource) -> bool:
+        return self._authenticator.is_enabled(source)
+
+    def ingest(self, source: WebhookSource, headers: Mapping[str, str], body: bytes) -> ChangeNotice:
+        if not self._authenticator.is_authentic(source, headers, body):
+            raise PermissionError(f"Webhook from {source.value} failed authentication")
+
+        notice = PayloadParsers.parse(source, headers, body)
+        if notice.is_empty():
+            return notice
+
+        for listener in self._listeners:
+            try:
+                listener.on_change(notice)
+            except Exception:
+                logger.exception("Change listener %s failed for %s event", type(listener).__name__, notice.event_type)
+        return notice
@@ -0,0 +1,10 @@
+from abc import ABC, abstractmethod
+
+from ..domain.model.webhook import ChangeNotice
+
+
+class ChangeListener(ABC):
+
+    @abstractmethod
+    def on_change(self, notice: ChangeNotice) -> None:
+        pass
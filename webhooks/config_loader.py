@@ -0,0 +1,14 @@
+from django.conf import settings
+
+from .app.domain.model.config import WebhookConfig
+
+
+def load_webhook_config() -> WebhookConfig:
+    return WebhookConfig(
+        jira_secret=settings.METRICS_WEBHOOK_JIRA_SECRET or None,
+        bitbucket_secret=settings.METRICS_WEBHOOK_BITBUCKET_SECRET or None,
+        azure_username=settings.METRICS_WEBHOOK_AZURE_USERNAME or None,
+        azure_password=settings.METRICS_WEBHOOK_AZURE_PASSWORD or None,
+        members=settings.METRICS_MEMBERS,
+        default_member_group_when_missing=settings.METRICS_MEMBER_GROUP_WHEN_MISSING
+    )
@@ -0,0 +1,34 @@
+from typing import List
+
+from django.core.cache import caches
+
+from metrics.version_stamps import VersionStamps
+
+from .app.api.api_for_webhook_ingestion import ApiForWebhookIngestion
+from .app.domain.webhook_authenticator import WebhookAuthenticator
+from .app.domain.webhook_ingestion_service import WebhookIngestionService
+from .app.spi.change_listener import ChangeListener
+from .config_loader import load_webhook_config
+from .out.version_stamp_change_listener import VersionStampChangeListener
+
+
+class WebhooksContainer:
+
+    def __init__(self):
+        self._config = load_webhook_config()
+        self._service = None
+
+    @property
+    def webhook_ingestion_api(self) -> ApiForWebhookIngestion:
+        if self._service is None:
+            self._service = WebhookIngestionService(
+                authenticator=WebhookAuthenticator(self._config),
+                listeners=self._build_listeners()
+            )
+        return self._service
+
+    def _build_listeners(self) -> List[ChangeListener]:
+        return [VersionStampChangeListener(VersionStamps(caches['version_stamps']), self._config)]
+
+
+webhooks_container = WebhooksContainer()
@@ -0,0 +1,31 @@
+from django.core.cache import caches
+from django.core.management.base import BaseCommand, CommandError
+
+from metrics import version_stamps
+from metrics.version_stamps import VersionStamps
+
+
+class Command(BaseCommand):
+    help = "Invalidates cached entries that depend on the given projects, member groups, issues or pull requests."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--project', action='append', default=[], dest='projects')
+        parser.add_argument('--member-group', action='append', default=[], dest='member_groups')
+        parser.add_argument('--issue', action='append', default=[], dest='issues')
+        parser.add_argument('--pull-requests', action='store_true')
+
+    def handle(self, *args, **options):
+        keys_by_scope = {
+            version_stamps.PROJECT: options['projects'],
+            version_stamps.MEMBER_GROUP: options['member_groups'],
+            version_stamps.ISSUE: options['issues'],
+            version_stamps.PULL_REQUESTS: [version_stamps.ALL] if options['pull_requests'] else []
+        }
+        if not any(keys_by_scope.values()):
+            raise CommandError("Nothing to bump: pass --project, --member-group, --issue or --pull-requests")
+
+        stamps = VersionStamps(caches['version_stamps'])
+        for scope, keys in keys_by_scope.items():
+            stamps.bump(scope, keys)
+            for key in keys:
+                self.stdout.write(f"Bumped {scope} {key}")
@@ -0,0 +1,71 @@
+import base64
+import json
+import urllib.error
+import urllib.request
+from pathlib import Path
+from typing import Dict
+
+from django.core.management.base import BaseCommand, CommandError
+
+from webhooks.app.domain.model.config import WebhookConfig
+from webhooks.app.domain.model.webhook import WebhookSource
+from webhooks.app.domain.webhook_authenticator import SIGNATURE_HEADER, WebhookAuthenticator
+from webhooks.config_loader import load_webhook_config
+from webhooks.urls import WEBHOOKS_PATH_PREFIX
+
+
+class Command(BaseCommand):
+    help = ("Replays recorded webhook deliveries against a running instance. Each file holds either the raw "
+            "payload or {\"headers\": {...}, \"payload\": {...}} as captured from the sender.")
+
+    def add_arguments(self, parser):
+        parser.add_argument('source', choices=[source.value for source in WebhookSource])
+        parser.add_argument('files', nargs='+', type=Path)
+        parser.add_argument('--url', default='http://localhost:8000/', help="Root URL of the metrics instance")
+
+    def handle(self, *args, **options):
+        source = WebhookSource.from_value(options['source'])
+        config = load_webhook_config()
+        if not WebhookAuthenticator(config).is_enabled(source):
+            raise CommandError(f"Webhook credentials for {source.value} are not configured")
+
+        endpoint = options['url'].rstrip('/') + '/' + WEBHOOKS_PATH_PREFIX + source.value + '/'
+        for path in options['files']:
+            headers, body = self._load_delivery(path)
+            headers.update(self._authentication_headers(source, config, body))
+            status, response = self._post(endpoint, headers, body)
+            self.stdout.write(f"{path.name}: {status} {response}")
+
+    @staticmethod
+    def _load_delivery(path: Path):
+        try:
+            recorded = json.loads(path.read_text(encoding='utf-8'))
+        except (OSError, json.JSONDecodeError) as e:
+            raise CommandError(f"Cannot read {path}: {e}")
+        if isinstance(recorded, dict) and 'payload' in recorded:
+            headers = dict(recorded.get('headers') or {})
+            recorded = recorded['payload']
+        else:
+            headers = {}
+        headers['Content-Type'] = 'application/json'
+        return headers, json.dumps(recorded).encode('utf-8')
+
+    @staticmethod
+    def _authentication_headers(source: WebhookSource, config: WebhookConfig, body: bytes) -> Dict[str, str]:
+        if source is WebhookSource.JIRA:
+            return {SIGNATURE_HEADER: WebhookAuthenticator.sign(body, config.jira_secret)}
+        if source is WebhookSource.BITBUCKET:
+            return {SIGNATURE_HEADER: WebhookAuthenticator.sign(body, config.bitbucket_secret)}
+        credentials = f"{config.azure_username}:{config.azure_password}".encode('utf-8')
+        return {'Authorization': 'Basic ' + base64.b64encode(credentials).decode('ascii')}
+
+    @staticmethod
+    def _post(endpoint: str, headers: Dict[str, str], body: bytes):
+        request = urllib.request.Request(endpoint, data=body, headers=headers, method='POST')
+        try:
+            with urllib.request.urlopen(request, timeout=30) as response:
+                return response.status, response.read().decode('utf-8')
+        except urllib.error.HTTPError as e:
+            return e.code, e.read().decode('utf-8')
+        except urllib.error.URLError as e:
+            raise CommandError(f"Cannot reach {endpoint}: {e.reason}")
@@ -0,0 +1,19 @@
+from metrics import version_stamps
+from metrics.version_stamps import VersionStamps
+
+from ..app.domain.model.config import WebhookConfig
+from ..app.domain.model.webhook import ChangeNotice
+from ..app.spi.change_listener import ChangeListener
+
+
+class VersionStampChangeListener(ChangeListener):
+    def __init__(self, stamps: VersionStamps, config: WebhookConfig):
+        self._stamps = stamps
+        self._config = config
+
+    def on_change(self, notice: ChangeNotice) -> None:
+        self._stamps.bump(version_stamps.ISSUE, notice.issue_keys)
+        self._stamps.bump(version_stamps.PROJECT, notice.project_keys)
+        self._stamps.bump(version_stamps.MEMBER_GROUP, self._config.get_member_groups(notice.assignee_names))
+        if notice.pull_request_ids:
+            self._stamps.bump(version_stamps.PULL_REQUESTS, [version_stamps.ALL])
@@ -0,0 +1,166 @@
+import base64
+import json
+import unittest
+from pathlib import Path
+from typing import List
+
+from django.core.cache.backends.locmem import LocMemCache
+
+from metrics import version_stamps
+from metrics.version_stamps import VersionStamps
+from webhooks.app.domain.model.config import WebhookConfig
+from webhooks.app.domain.model.webhook import ChangeNotice, WebhookSource
+from webhooks.app.domain.webhook_authenticator import SIGNATURE_HEADER, WebhookAuthenticator
+from webhooks.app.domain.webhook_ingestion_service import WebhookIngestionService
+from webhooks.app.spi.change_listener import ChangeListener
+from webhooks.out.version_stamp_change_listener import VersionStampChangeListener
+
+PAYLOADS = Path(__file__).parent / "payloads"
+
+
+class RecordingChangeListener(ChangeListener):
+
+    def __init__(self):
+        self.notices: List[ChangeNotice] = []
+
+    def on_change(self, notice: ChangeNotice) -> None:
+        self.notices.append(notice)
+
+
+def _config() -> WebhookConfig:
+    return WebhookConfig(
+        jira_secret="jira-secret",
+        bitbucket_secret="bitbucket-secret",
+        azure_username="hook",
+        azure_password="azure-secret",
+        members={"Alice": {"member_groups": ["backend"]}, "Bob": {"member_groups": ["frontend"]}},
+        default_member_group_when_missing="unassigned"
+    )
+
+
+def _delivery(name: str):
+    recorded = json.loads((PAYLOADS / name).read_text(encoding='utf-8'))
+    if 'payload' in recorded:
+        return dict(recorded['headers']), json.dumps(recorded['payload']).encode('utf-8')
+    return {}, json.dumps(recorded).encode('utf-8')
+
+
+def _basic_auth(username: str, password: str) -> str:
+    return 'Basic ' + base64.b64encode(f"{username}:{password}".encode('utf-8')).decode('ascii')
+
+
+class TestWebhookIngestionService(unittest.TestCase):
+
+    def setUp(self):
+        self.listener = RecordingChangeListener()
+        self.service = WebhookIngestionService(WebhookAuthenticator(_config()), [self.listener])
+
+    def test_shouldAcceptSignedJiraIssueUpdate(self):
+        # given
+        headers, body = _delivery("jira_issue_updated.json")
+        headers[SIGNATURE_HEADER] = WebhookAuthenticator.sign(body, "jira-secret")
+
+        # when
+        notice = self.service.ingest(WebhookSource.JIRA, headers, body)
+
+        # then
+        self.assertEqual("jira:issue_updated", notice.event_type)
+        self.assertEqual({"PROJ-42"}, notice.issue_keys)
+        self.assertEqual({"PROJ"}, notice.project_keys)
+        self.assertEqual({"Alice", "Bob"}, notice.assignee_names)
+        self.assertEqual([notice], self.listener.notices)
+
+    def test_shouldRejectJiraPayloadWithWrongSignature(self):
+        # given
+        headers, body = _delivery("jira_issue_updated.json")
+        headers[SIGNATURE_HEADER] = WebhookAuthenticator.sign(body, "other-secret")
+
+        # when / then
+        with self.assertRaises(PermissionError):
+            self.service.ingest(WebhookSource.JIRA, headers, body)
+        self.assertEqual([], self.listener.notices)
+
+    def test_shouldAcceptAzureWorkItemUpdateWithBasicAuth(self):
+        # given
+        headers, body = _delivery("azure_workitem_updated.json")
+        headers['Authorization'] = _basic_auth("hook", "azure-secret")
+
+        # when
+        notice = self.service.ingest(WebhookSource.AZURE, headers, body)
+
+        # then
+        self.assertEqual({"1234"}, notice.issue_keys)
+        self.assertEqual({"PROJ"}, notice.project_keys)
+        self.assertEqual({"Alice", "Bob"}, notice.assignee_names)
+
+    def test_shouldRejectAzureDeliveryWithWrongPassword(self):
+        # given
+        headers, body = _delivery("azure_pullrequest_updated.json")
+        headers['Authorization'] = _basic_auth("hook", "guess")
+
+        # when / then
+        with self.assertRaises(PermissionError):
+            self.service.ingest(WebhookSource.AZURE, headers, body)
+
+    def test_shouldReadPullRequestIdFromAzureAndBitbucketEvents(self):
+        # given
+        azure_headers, azure_body = _delivery("azure_pullrequest_updated.json")
+        azure_headers['Authorization'] = _basic_auth("hook", "azure-secret")
+        bitbucket_headers, bitbucket_body = _delivery("bitbucket_pullrequest_updated.json")
+        bitbucket_headers[SIGNATURE_HEADER] = WebhookAuthenticator.sign(bitbucket_body, "bitbucket-secret")
+
+        # when
+        azure_notice = self.service.ingest(WebhookSource.AZURE, azure_headers, azure_body)
+        bitbucket_notice = self.service.ingest(WebhookSource.BITBUCKET, bitbucket_headers, bitbucket_body)
+
+        # then
+        self.assertEqual({"77"}, azure_notice.pull_request_ids)
+        self.assertEqual("pullrequest:updated", bitbucket_notice.event_type)
+        self.assertEqual({"9"}, bitbucket_notice.pull_request_ids)
+
+    def test_shouldRejectMalformedPayload(self):
+        # given
+        body = b'{"webhookEvent": "jira:issue_updated"}'
+        headers = {SIGNATURE_HEADER: WebhookAuthenticator.sign(body, "jira-secret")}
+
+        # when / then
+        with self.assertRaises(ValueError):
+            self.service.ingest(WebhookSource.JIRA, headers, body)
+
+    def test_shouldDisableSourceWithoutCredentials(self):
+        # given
+        config = _config()
+        config.bitbucket_secret = None
+
+        # when
+        authenticator = WebhookAuthenticator(config)
+
+        # then
+        self.assertFalse(authenticator.is_enabled(WebhookSource.BITBUCKET))
+        self.assertTrue(authenticator.is_enabled(WebhookSource.JIRA))
+
+
+class TestVersionStampChangeListener(unittest.TestCase):
+
+    def test_shouldBumpStampsOfAffectedKeysOnly(self):
+        # given
+        cache = LocMemCache("webhook-version-stamps", {})
+        cache.clear()
+        stamps = VersionStamps(cache)
+        listener = VersionStampChangeListener(stamps, _config())
+        notice = ChangeNotice(source=WebhookSource.JIRA, event_type="jira:issue_updated",
+                              project_keys={"PROJ"}, issue_keys={"PROJ-42"}, assignee_names={"Alice", "Carol"})
+
+        # when
+        listener.on_change(notice)
+
+        # then
+        self.assertNotEqual(0, stamps.current(version_stamps.ISSUE, ["PROJ-42"])["PROJ-42"])
+        self.assertEqual(0, stamps.current(version_stamps.ISSUE, ["PROJ-43"])["PROJ-43"])
+        member_group_stamps = stamps.current(version_stamps.MEMBER_GROUP, ["backend", "frontend", "unassigned"])
+        self.assertEqual({"frontend"}, {group for group, stamp in member_group_stamps.items() if stamp == 0})
+        self.assertEqual(0, stamps.current(version_stamps.PULL_REQUESTS, ["all"])["all"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,13 @@
+from django.conf import settings
+from django.urls import path
+
+from ui_web.utils.url_utils import django_normalized_base_url
+from .views import WebhookView
+
+app_name = 'webhooks'
+
+WEBHOOKS_PATH_PREFIX = django_normalized_base_url(settings.METRICS_BASE_URL) + 'webhooks/'
+
+urlpatterns = [
+    path(WEBHOOKS_PATH_PREFIX + '<str:source>/', WebhookView.as_view(), name='webhook'),
+]
@@ -0,0 +1,39 @@
+import logging
+
+from django.http import Http404, JsonResponse
+from django.utils.decorators import method_decorator
+from django.views import View
+from django.views.decorators.csrf import csrf_exempt
+
+from .app.domain.model.webhook import WebhookSource
+from .container import webhooks_container
+
+logger = logging.getLogger(__name__)
+
+
+@method_decorator(csrf_exempt, name='dispatch')
+class WebhookView(View):
+    http_method_names = ['post']
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.webhook_ingestion_api = webhooks_container.webhook_ingestion_api
+
+    def post(self, request, source: str):
+        webhook_source = WebhookSource.from_value(source)
+        if webhook_source is None or not self.webhook_ingestion_api.is_enabled(webhook_source):
+            raise Http404("Unknown webhook source")
+
+        try:
+            notice = self.webhook_ingestion_api.ingest(webhook_source, request.headers, request.body)
+        except PermissionError:
+            return JsonResponse({"error": "unauthorized"}, status=401)
+        except ValueError as e:
+            logger.warning("Rejected %s webhook: %s", source, e)
+            return JsonResponse({"error": str(e)}, status=400)
+
+        return JsonResponse({
+            "event": notice.event_type,
+            "issues": sorted(notice.issue_keys),
+            "pull_requests": sorted(notice.pull_request_ids)
+        }, status=202)